@@ -168,23 +168,14 @@ def _outcome_feedback_roi(feedback_log_path: str) -> dict:
 def _sentinel_bridge_stats(principles_path: str) -> dict:
     """Load sentinel bridge stats from principles JSONL.
 
-    Reads principles directly (no import needed) to count sentinel-sourced
-    and counter-principles without importing the full registry.
+    Counts sentinel-sourced and counter-principles over the latest row of
+    each principle, as read by the registry.
     """
-    principles = []
-    if os.path.exists(principles_path):
-        with open(principles_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    principles.append(json.loads(line))
-
-    # Deduplicate by id (latest entry wins, same as principle_registry)
-    by_id = {}
-    for p in principles:
-        pid = p.get("id", "")
-        if pid:
-            by_id[pid] = p
+    sl_dir = os.path.join(SCRIPT_DIR, "self-learning")
+    if sl_dir not in sys.path:
+        sys.path.append(sl_dir)
+    from principle_registry import load_principle_rows
+    by_id = load_principle_rows(principles_path)
 
     total = len(by_id)
     counter = sum(1 for p in by_id.values()
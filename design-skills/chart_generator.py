@@ -42,13 +42,30 @@ Usage:
     chart = BarChart([("S45", 800), ("S48", 1686)], title="Tests")
     svg_string = render_svg(chart)
     save_svg(chart, "tests.svg")
+
+    # Many charts at once: cache misses render across a process pool
+    paths = save_batch({"tests": chart, "trend": other}, "/tmp/charts")
+
+Rendered SVGs are cached by chart_key() — a hash of the chart's type and
+fields plus the design tokens — so identical charts render once. Pass
+RenderCache(directory=...) to keep renders across runs.
 """
 
+import dataclasses
+import hashlib
 import math
 import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 
 import design_tokens
+from chart_kernels import (
+    box_stats, gaussian_kde, histogram, lttb_indices, quantile,
+    silverman_bandwidth, sorted_floats,
+)
 
 # ---------------------------------------------------------------------------
 # CCA Design Language colors (sourced from canonical design_tokens)
@@ -64,6 +81,9 @@ SERIES_PALETTE = design_tokens.SERIES_COLORS[:5]
 
 SVG_NS = "http://www.w3.org/2000/svg"
 
+# Line/area series longer than this are downsampled (LTTB) before drawing
+MAX_SERIES_POINTS = 1000
+
 # Font stack matching design guide
 FONT_FAMILY = "'Source Sans 3', 'Helvetica Neue', Arial, sans-serif"
 CODE_FONT = "'Source Code Pro', 'Courier New', monospace"
@@ -239,6 +259,7 @@ class LineChart:
     show_points: bool = False
     extra_series: list = field(default_factory=list)
     # extra_series: [("name", [(label, value)], color), ...]
+    max_points: int = MAX_SERIES_POINTS  # per series; 0 draws every point
 
     def __post_init__(self):
         if not self.color:
@@ -287,6 +308,7 @@ class AreaChart:
     y_label: str = ""
     show_points: bool = False
     fill_opacity: float = 0.3
+    max_points: int = MAX_SERIES_POINTS  # 0 draws every point
 
     def __post_init__(self):
         if not self.color:
@@ -1147,7 +1169,8 @@ def _render_line_chart(chart: LineChart) -> str:
             return [(margin_left + plot_w / 2,
                      margin_top + plot_h - (series_data[0][1] / max_val) * plot_h)]
         points = []
-        for i, (_, value) in enumerate(series_data):
+        for i in lttb_indices([v for _, v in series_data], chart.max_points):
+            value = series_data[i][1]
             x = margin_left + (i / (n - 1)) * plot_w
             y = margin_top + plot_h - (value / max_val) * plot_h
             points.append((x, y))
@@ -1169,9 +1192,12 @@ def _render_line_chart(chart: LineChart) -> str:
         for px, py in points:
             parts.append(_circle(px, py, 3, chart.color))
 
-    # X-axis labels
+    # X-axis labels (at most ~10 once the series is downsampled)
     n = len(chart.data)
+    step = max(1, n // 10) if chart.max_points and n > chart.max_points else 1
     for i, (label, _) in enumerate(chart.data):
+        if i % step and i != n - 1:
+            continue
         if n == 1:
             x = margin_left + plot_w / 2
         else:
@@ -1433,7 +1459,8 @@ def _render_area_chart(chart: AreaChart) -> str:
     # Compute points
     n = len(chart.data)
     points = []
-    for i, (_, value) in enumerate(chart.data):
+    for i in lttb_indices(values, chart.max_points):
+        value = values[i]
         if n == 1:
             x = margin_left + plot_w / 2
         else:
@@ -2911,33 +2938,13 @@ def _render_box_plot(chart: BoxPlot) -> str:
     all_vals = []
     for item in chart.data:
         label = item[0]
-        values = sorted([float(v) for v in item[1]])
+        values = sorted_floats(item[1])
         if not values:
             continue
-        n = len(values)
-        q1_idx = n * 0.25
-        q2_idx = n * 0.5
-        q3_idx = n * 0.75
-
-        def percentile(vals, p):
-            k = (len(vals) - 1) * p
-            f = int(k)
-            c = f + 1 if f + 1 < len(vals) else f
-            d = k - f
-            return vals[f] + d * (vals[c] - vals[f])
-
-        q1 = percentile(values, 0.25)
-        median = percentile(values, 0.5)
-        q3 = percentile(values, 0.75)
-        iqr = q3 - q1
-        whisker_lo = max(min(values), q1 - 1.5 * iqr)
-        whisker_hi = min(max(values), q3 + 1.5 * iqr)
-        # Find actual whisker endpoints (nearest data point within range)
-        whisker_lo = min(v for v in values if v >= q1 - 1.5 * iqr)
-        whisker_hi = max(v for v in values if v <= q3 + 1.5 * iqr)
-        outliers = [v for v in values if v < whisker_lo or v > whisker_hi]
-        stats.append((label, q1, median, q3, whisker_lo, whisker_hi, outliers))
-        all_vals.extend(values)
+        # Whiskers snap to the furthest data point within 1.5 IQR
+        stats.append((label, *box_stats(values)))
+        all_vals.append(values[0])
+        all_vals.append(values[-1])
 
     if not stats:
         parts.append(_text(chart.width / 2, chart.height / 2, "No data",
@@ -3071,18 +3078,8 @@ def _render_histogram_chart(chart: HistogramChart) -> str:
         # Sturges' rule: ceil(1 + log2(n))
         n_bins = max(1, int(math.ceil(1 + math.log2(len(vals)))) if len(vals) > 1 else 1)
 
-    v_min = min(vals)
-    v_max = max(vals)
-    v_range = v_max - v_min if v_max != v_min else 1
-    bin_width = v_range / n_bins
-
     # Count values per bin
-    counts = [0] * n_bins
-    for v in vals:
-        idx = int((v - v_min) / bin_width)
-        if idx >= n_bins:
-            idx = n_bins - 1
-        counts[idx] = counts[idx] + 1
+    counts, v_min, bin_width = histogram(vals, n_bins)
 
     max_count = max(counts) if counts else 1
 
@@ -3156,20 +3153,6 @@ def _render_histogram_chart(chart: HistogramChart) -> str:
     return "".join(parts)
 
 
-def _gaussian_kde(values, grid, bandwidth):
-    """Compute Gaussian KDE on a grid. Returns density values."""
-    n = len(values)
-    densities = []
-    coeff = 1.0 / (n * bandwidth * math.sqrt(2 * math.pi))
-    for x in grid:
-        total = 0.0
-        for v in values:
-            z = (x - v) / bandwidth
-            total += math.exp(-0.5 * z * z)
-        densities.append(coeff * total)
-    return densities
-
-
 def _render_violin_plot(chart: ViolinPlot) -> str:
     """Render a violin plot to SVG."""
     parts = [_svg_header(chart.width, chart.height)]
@@ -3200,10 +3183,11 @@ def _render_violin_plot(chart: ViolinPlot) -> str:
     all_vals = []
     for item in chart.data:
         label = item[0]
-        values = sorted([float(v) for v in item[1]])
+        values = sorted_floats(item[1])
         if values:
             categories.append((label, values))
-            all_vals.extend(values)
+            all_vals.append(values[0])
+            all_vals.append(values[-1])
 
     if not categories:
         parts.append(_text(chart.width / 2, chart.height / 2, "No data",
@@ -3256,20 +3240,17 @@ def _render_violin_plot(chart: ViolinPlot) -> str:
 
     for i, (label, values) in enumerate(categories):
         cx = margin_left + cat_w * i + cat_w / 2
-        n = len(values)
-
         # Silverman bandwidth
-        std = (sum((v - sum(values) / n) ** 2 for v in values) / n) ** 0.5 if n > 1 else 1
-        bw = 1.06 * std * n ** (-0.2) if std > 0 else 1
+        bw = silverman_bandwidth(values)
 
         # KDE on a grid of 50 points spanning the data range
-        v_min, v_max = min(values), max(values)
+        v_min, v_max = values[0], values[-1]
         v_range_local = v_max - v_min if v_max != v_min else 1
         grid_lo = v_min - v_range_local * 0.15
         grid_hi = v_max + v_range_local * 0.15
         n_grid = 50
         grid = [grid_lo + (grid_hi - grid_lo) * j / (n_grid - 1) for j in range(n_grid)]
-        densities = _gaussian_kde(values, grid, bw)
+        densities = gaussian_kde(values, grid, bw)
 
         max_density = max(densities) if densities else 1
 
@@ -3295,17 +3276,10 @@ def _render_violin_plot(chart: ViolinPlot) -> str:
         parts.append(f'<path d="{path_d}" fill="{base_color}" '
                      f'fill-opacity="0.3" stroke="{base_color}" stroke-width="1"/>')
 
-        # Quartile lines
-        def percentile(vals, p):
-            k = (len(vals) - 1) * p
-            f = int(k)
-            c = f + 1 if f + 1 < len(vals) else f
-            d = k - f
-            return vals[f] + d * (vals[c] - vals[f])
-
-        q1 = percentile(values, 0.25)
-        median = percentile(values, 0.5)
-        q3 = percentile(values, 0.75)
+        # Quartile lines (values are already sorted)
+        q1 = quantile(values, 0.25)
+        median = quantile(values, 0.5)
+        q3 = quantile(values, 0.75)
 
         # Width at each quartile (interpolate from KDE)
         def width_at(val):
@@ -4072,68 +4046,245 @@ def _render_slope_chart(chart: SlopeChart) -> str:
     return "".join(parts)
 
 
-def render_svg(chart) -> str:
-    """Render any chart object to an SVG string."""
-    if isinstance(chart, BarChart):
-        return _render_bar_chart(chart)
-    elif isinstance(chart, HorizontalBarChart):
-        return _render_horizontal_bar_chart(chart)
-    elif isinstance(chart, LineChart):
-        return _render_line_chart(chart)
-    elif isinstance(chart, Sparkline):
-        return _render_sparkline(chart)
-    elif isinstance(chart, DonutChart):
-        return _render_donut_chart(chart)
-    elif isinstance(chart, AreaChart):
-        return _render_area_chart(chart)
-    elif isinstance(chart, StackedBarChart):
-        return _render_stacked_bar_chart(chart)
-    elif isinstance(chart, HeatmapChart):
-        return _render_heatmap_chart(chart)
-    elif isinstance(chart, StackedAreaChart):
-        return _render_stacked_area_chart(chart)
-    elif isinstance(chart, GroupedBarChart):
-        return _render_grouped_bar_chart(chart)
-    elif isinstance(chart, WaterfallChart):
-        return _render_waterfall_chart(chart)
-    elif isinstance(chart, RadarChart):
-        return _render_radar_chart(chart)
-    elif isinstance(chart, GaugeChart):
-        return _render_gauge_chart(chart)
-    elif isinstance(chart, BubbleChart):
-        return _render_bubble_chart(chart)
-    elif isinstance(chart, TreemapChart):
-        return _render_treemap_chart(chart)
-    elif isinstance(chart, SankeyChart):
-        return _render_sankey_chart(chart)
-    elif isinstance(chart, FunnelChart):
-        return _render_funnel_chart(chart)
-    elif isinstance(chart, ScatterPlot):
-        return _render_scatter_plot(chart)
-    elif isinstance(chart, BoxPlot):
-        return _render_box_plot(chart)
-    elif isinstance(chart, HistogramChart):
-        return _render_histogram_chart(chart)
-    elif isinstance(chart, ViolinPlot):
-        return _render_violin_plot(chart)
-    elif isinstance(chart, CalibrationPlot):
-        return _render_calibration_plot(chart)
-    elif isinstance(chart, CandlestickChart):
-        return _render_candlestick_chart(chart)
-    elif isinstance(chart, ForestPlot):
-        return _render_forest_plot(chart)
-    elif isinstance(chart, BulletChart):
-        return _render_bullet_chart(chart)
-    elif isinstance(chart, SlopeChart):
-        return _render_slope_chart(chart)
-    elif isinstance(chart, LollipopChart):
-        return _render_lollipop_chart(chart)
-    elif isinstance(chart, DumbbellChart):
-        return _render_dumbbell_chart(chart)
-    elif isinstance(chart, ParetoChart):
-        return _render_pareto_chart(chart)
+# ---------------------------------------------------------------------------
+# Dispatch and render cache
+# ---------------------------------------------------------------------------
+
+_RENDERERS = {
+    BarChart: _render_bar_chart,
+    HorizontalBarChart: _render_horizontal_bar_chart,
+    LineChart: _render_line_chart,
+    Sparkline: _render_sparkline,
+    DonutChart: _render_donut_chart,
+    AreaChart: _render_area_chart,
+    StackedBarChart: _render_stacked_bar_chart,
+    HeatmapChart: _render_heatmap_chart,
+    StackedAreaChart: _render_stacked_area_chart,
+    GroupedBarChart: _render_grouped_bar_chart,
+    WaterfallChart: _render_waterfall_chart,
+    RadarChart: _render_radar_chart,
+    GaugeChart: _render_gauge_chart,
+    BubbleChart: _render_bubble_chart,
+    TreemapChart: _render_treemap_chart,
+    SankeyChart: _render_sankey_chart,
+    FunnelChart: _render_funnel_chart,
+    ScatterPlot: _render_scatter_plot,
+    BoxPlot: _render_box_plot,
+    HistogramChart: _render_histogram_chart,
+    ViolinPlot: _render_violin_plot,
+    CalibrationPlot: _render_calibration_plot,
+    CandlestickChart: _render_candlestick_chart,
+    ForestPlot: _render_forest_plot,
+    BulletChart: _render_bullet_chart,
+    SlopeChart: _render_slope_chart,
+    LollipopChart: _render_lollipop_chart,
+    DumbbellChart: _render_dumbbell_chart,
+    ParetoChart: _render_pareto_chart,
+}
+
+# Bump when a renderer's output changes so cached SVGs are not reused
+RENDER_VERSION = 2
+
+# Renderers read colors/fonts at import time, so the tokens are fixed per process
+_TOKENS_KEY = hashlib.sha256(repr((
+    sorted(design_tokens.CCA_PALETTE.items()),
+    list(design_tokens.SERIES_COLORS),
+    FONT_FAMILY, CODE_FONT, RENDER_VERSION,
+)).encode()).hexdigest()[:16]
+
+RENDER_CACHE_SIZE = 256
+
+
+def _renderer_for(chart):
+    renderer = _RENDERERS.get(type(chart))
+    if renderer is None:
+        # Subclasses of a chart type render like their base
+        for base in type(chart).__mro__[1:]:
+            renderer = _RENDERERS.get(base)
+            if renderer is not None:
+                break
+        else:
+            raise TypeError(f"Unknown chart type: {type(chart)}")
+    return renderer
+
+
+def chart_key(chart) -> str:
+    """Content hash of a chart (type + every field) and the design tokens."""
+    _renderer_for(chart)
+    cls = type(chart)
+    if dataclasses.is_dataclass(chart):
+        values = tuple(getattr(chart, f.name) for f in dataclasses.fields(chart))
     else:
-        raise TypeError(f"Unknown chart type: {type(chart)}")
+        values = tuple(sorted(vars(chart).items()))
+    payload = repr((cls.__module__, cls.__qualname__, values, _TOKENS_KEY))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RenderCache:
+    """Content-addressed SVG cache: chart_key -> SVG string.
+
+    Keeps the most recent max_entries renders in memory. With a directory,
+    renders are also stored as <key>.svg so later runs (report rebuilds)
+    only render charts whose data actually changed.
+    """
+
+    def __init__(self, directory: str = None, max_entries: int = RENDER_CACHE_SIZE):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.svg")
+
+    def get(self, key: str):
+        svg = self._memory.get(key)
+        if svg is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return svg
+        if self.directory:
+            try:
+                with open(self._path(key)) as f:
+                    svg = f.read()
+            except OSError:
+                svg = None
+            if svg is not None:
+                self._remember(key, svg)
+                self.hits += 1
+                return svg
+        self.misses += 1
+        return None
+
+    def put(self, key: str, svg: str) -> None:
+        self._remember(key, svg)
+        if self.directory:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = f"{self._path(key)}.{os.getpid()}.tmp"
+                with open(tmp, "w") as f:
+                    f.write(svg)
+                os.replace(tmp, self._path(key))
+            except OSError:
+                pass  # the cache is an optimization only
+
+    def _remember(self, key: str, svg: str) -> None:
+        self._memory[key] = svg
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+# Process-wide cache used when render_svg is not given one
+DEFAULT_RENDER_CACHE = RenderCache()
+
+
+def render_svg(chart, cache: RenderCache = None) -> str:
+    """Render any chart object to an SVG string.
+
+    Identical charts (same type, data and options) are rendered once and
+    served from the cache afterwards.
+    """
+    renderer = _renderer_for(chart)
+    cache = DEFAULT_RENDER_CACHE if cache is None else cache
+    key = chart_key(chart)
+    svg = cache.get(key)
+    if svg is None:
+        svg = renderer(chart)
+        cache.put(key, svg)
+    return svg
+
+
+def _render_uncached(chart) -> str:
+    return _renderer_for(chart)(chart)
+
+
+def render_batch(charts, cache: RenderCache = None, workers: int = None) -> list:
+    """Render a list of charts, spreading cache misses over a process pool.
+
+    Args:
+        charts: Chart objects, in any mix of types.
+        cache: RenderCache to consult and fill (default: process-wide cache).
+        workers: Pool size; defaults to the CPU count. 1 renders in-process.
+
+    Returns:
+        SVG strings in the same order as charts.
+    """
+    cache = DEFAULT_RENDER_CACHE if cache is None else cache
+    keys = [chart_key(c) for c in charts]
+    results = [cache.get(k) for k in keys]
+
+    # Render each distinct missing chart once
+    todo = {}
+    for i, (key, svg) in enumerate(zip(keys, results)):
+        if svg is None and key not in todo:
+            todo[key] = charts[i]
+
+    if todo:
+        workers = min(workers or os.cpu_count() or 1, len(todo))
+        pending = list(todo.items())
+        rendered = None
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    rendered = list(pool.map(_render_uncached, [c for _, c in pending]))
+            except (OSError, BrokenProcessPool, pickle.PicklingError):
+                rendered = None  # no usable pool here: render in-process
+        if rendered is None:
+            rendered = [_render_uncached(c) for _, c in pending]
+        fresh = {}
+        for (key, _), svg in zip(pending, rendered):
+            cache.put(key, svg)
+            fresh[key] = svg
+        results = [svg if svg is not None else fresh[key] for key, svg in zip(keys, results)]
+    return results
+
+
+def save_batch(charts: dict, directory: str, cache: RenderCache = None,
+               workers: int = None) -> dict:
+    """Render {name: chart} with render_batch and write <name>.svg files.
+
+    Files whose content is unchanged are left untouched.
+
+    Returns:
+        {name: path} for every chart.
+    """
+    os.makedirs(directory, exist_ok=True)
+    names = list(charts)
+    svgs = render_batch([charts[n] for n in names], cache=cache, workers=workers)
+    return write_svgs(dict(zip(names, svgs)), directory)
+
+
+def write_svgs(svgs: dict, directory: str) -> dict:
+    """Write {name: svg} to <directory>/<name>.svg, skipping unchanged files."""
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, svg in svgs.items():
+        path = os.path.join(directory, f"{name}.svg")
+        try:
+            with open(path) as f:
+                unchanged = f.read() == svg
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            with open(path, "w") as f:
+                f.write(svg)
+        paths[name] = path
+    return paths
 
 
 def generate_grouped_bar(data: list, series_names: list, title: str = "", **kwargs) -> str:
@@ -0,0 +1,284 @@
+"""Numeric kernels behind the distribution and series charts.
+
+chart_generator's violin, box, histogram, line and area renderers call
+these instead of open-coding the math, so large samples (e.g. 50k trade
+P&Ls) render in milliseconds rather than seconds:
+
+    sorted_floats / quantile / box_stats
+        one sort per sample; quartiles, whiskers and outliers are then
+        read off by index and bisection
+    histogram
+        linear-time binning (same bin rule the histogram renderer used)
+    silverman_bandwidth / gaussian_kde
+        exact Gaussian KDE for small inputs, linearly binned KDE
+        (convolution on a fixed grid) for large ones
+    lttb_indices
+        Largest-Triangle-Three-Buckets downsampling so a line/area
+        chart's SVG stays bounded however long the series is
+
+Every kernel has a stdlib implementation; when NumPy is installed it is
+used for large inputs (NUMPY_MIN_SIZE and up) and the two paths agree to
+floating-point rounding.
+
+Usage:
+    from chart_kernels import box_stats, gaussian_kde, histogram, sorted_floats
+    values = sorted_floats(pnls)
+    stats = box_stats(values)                   # BoxStats(q1, median, q3, ...)
+    counts, v_min, bin_width = histogram(values, 20)
+    keep = lttb_indices(series_values, 500)     # indices to plot
+
+Stdlib only. NumPy optional.
+"""
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+NUMPY_MIN_SIZE = 2000        # below this, list -> array conversion costs more than it saves
+EXACT_KDE_LIMIT = 100_000    # samples x grid points evaluated exactly before switching to binned
+KDE_BINS = 512               # fine grid size for the binned KDE
+KDE_TRUNCATE = 5.0           # kernel treated as zero beyond this many bandwidths
+
+
+def _use_numpy(n: int, use_numpy: Optional[bool]) -> bool:
+    if use_numpy is None:
+        return NUMPY_AVAILABLE and n >= NUMPY_MIN_SIZE
+    return use_numpy and NUMPY_AVAILABLE
+
+
+# ── Quantiles ───────────────────────────────────────────────────────────
+
+
+class BoxStats(NamedTuple):
+    q1: float
+    median: float
+    q3: float
+    whisker_lo: float
+    whisker_hi: float
+    outliers: List[float]
+
+
+def sorted_floats(values: Sequence, use_numpy: Optional[bool] = None) -> List[float]:
+    """Values as floats, sorted ascending (the one sort the other kernels reuse)."""
+    if _use_numpy(len(values), use_numpy):
+        return np.sort(np.asarray(values, dtype=float)).tolist()
+    return sorted(float(v) for v in values)
+
+
+def quantile(sorted_vals: Sequence[float], p: float) -> float:
+    """Linearly interpolated quantile of already-sorted values."""
+    k = (len(sorted_vals) - 1) * p
+    f = int(k)
+    c = f + 1 if f + 1 < len(sorted_vals) else f
+    d = k - f
+    return sorted_vals[f] + d * (sorted_vals[c] - sorted_vals[f])
+
+
+def box_stats(sorted_vals: Sequence[float]) -> BoxStats:
+    """Quartiles, Tukey whiskers (1.5 IQR, snapped to data) and outliers."""
+    q1 = quantile(sorted_vals, 0.25)
+    median = quantile(sorted_vals, 0.5)
+    q3 = quantile(sorted_vals, 0.75)
+    iqr = q3 - q1
+    lo = bisect_left(sorted_vals, q1 - 1.5 * iqr)
+    hi = bisect_right(sorted_vals, q3 + 1.5 * iqr)
+    outliers = list(sorted_vals[:lo]) + list(sorted_vals[hi:])
+    return BoxStats(q1, median, q3, sorted_vals[lo], sorted_vals[hi - 1], outliers)
+
+
+# ── Histogram ───────────────────────────────────────────────────────────
+
+
+def histogram(values: Sequence[float], n_bins: int,
+              use_numpy: Optional[bool] = None) -> Tuple[List[int], float, float]:
+    """Equal-width bin counts over [min, max]. Returns (counts, v_min, bin_width).
+
+    The maximum lands in the last bin; a constant sample uses a range of 1.
+    """
+    v_min = min(values)
+    v_max = max(values)
+    v_range = v_max - v_min if v_max != v_min else 1
+    bin_width = v_range / n_bins
+    if _use_numpy(len(values), use_numpy):
+        idx = ((np.asarray(values, dtype=float) - v_min) / bin_width).astype(np.int64)
+        np.minimum(idx, n_bins - 1, out=idx)
+        return np.bincount(idx, minlength=n_bins).tolist(), v_min, bin_width
+    counts = [0] * n_bins
+    last = n_bins - 1
+    for v in values:
+        idx = int((v - v_min) / bin_width)
+        counts[idx if idx < last else last] += 1
+    return counts, v_min, bin_width
+
+
+# ── Kernel density ──────────────────────────────────────────────────────
+
+
+def silverman_bandwidth(values: Sequence[float]) -> float:
+    """Rule-of-thumb bandwidth 1.06 * std * n^(-1/5) (1 for degenerate samples)."""
+    n = len(values)
+    if n > 1:
+        mean = math.fsum(values) / n
+        std = (math.fsum((v - mean) ** 2 for v in values) / n) ** 0.5
+    else:
+        std = 1
+    return 1.06 * std * n ** (-0.2) if std > 0 else 1
+
+
+def gaussian_kde(values: Sequence[float], grid: Sequence[float], bandwidth: float,
+                 binned: Optional[bool] = None,
+                 use_numpy: Optional[bool] = None) -> List[float]:
+    """Gaussian KDE of values evaluated at grid points.
+
+    binned=None picks the exact O(n x grid) sum for small inputs and the
+    binned approximation (O(n + KDE_BINS x kernel width)) for large ones.
+    """
+    n = len(values)
+    if n == 0 or not grid:
+        return [0.0] * len(grid)
+    if binned is None:
+        binned = n * len(grid) > EXACT_KDE_LIMIT
+    numpy_path = _use_numpy(n, use_numpy)
+    if binned:
+        lo = min(min(grid), min(values))
+        hi = max(max(grid), max(values))
+        if hi > lo:
+            if numpy_path:
+                return _binned_kde_numpy(values, grid, bandwidth, lo, hi)
+            return _binned_kde(values, grid, bandwidth, lo, hi)
+    if numpy_path:
+        v = np.asarray(values, dtype=float)
+        g = np.asarray(grid, dtype=float)
+        z = (g[:, None] - v[None, :]) / bandwidth
+        coeff = 1.0 / (n * bandwidth * math.sqrt(2 * math.pi))
+        return (coeff * np.exp(-0.5 * z * z).sum(axis=1)).tolist()
+    return _exact_kde(values, grid, bandwidth)
+
+
+def _exact_kde(values, grid, bandwidth):
+    n = len(values)
+    coeff = 1.0 / (n * bandwidth * math.sqrt(2 * math.pi))
+    inv_bw = 1.0 / bandwidth
+    exp = math.exp
+    densities = []
+    for x in grid:
+        total = 0.0
+        for v in values:
+            z = (x - v) * inv_bw
+            total += exp(-0.5 * z * z)
+        densities.append(coeff * total)
+    return densities
+
+
+def _kernel_halfwidth(bandwidth: float, delta: float) -> int:
+    return min(KDE_BINS - 1, int(KDE_TRUNCATE * bandwidth / delta) + 1)
+
+
+def _binned_kde(values, grid, bandwidth, lo, hi):
+    m = KDE_BINS
+    delta = (hi - lo) / (m - 1)
+    # Linear binning: each sample split between its two neighbouring grid nodes
+    weights = [0.0] * m
+    for v in values:
+        t = (v - lo) / delta
+        j = int(t)
+        if j >= m - 1:
+            weights[m - 1] += 1.0
+        else:
+            f = t - j
+            weights[j] += 1.0 - f
+            weights[j + 1] += f
+
+    half = _kernel_halfwidth(bandwidth, delta)
+    kernel = [math.exp(-0.5 * (d * delta / bandwidth) ** 2) for d in range(half + 1)]
+    fine = [0.0] * m
+    for j, w in enumerate(weights):
+        if not w:
+            continue
+        fine[j] += w * kernel[0]
+        for d in range(1, min(half, m - 1 - j) + 1):
+            fine[j + d] += w * kernel[d]
+        for d in range(1, min(half, j) + 1):
+            fine[j - d] += w * kernel[d]
+
+    coeff = 1.0 / (len(values) * bandwidth * math.sqrt(2 * math.pi))
+    out = []
+    for x in grid:
+        t = (x - lo) / delta
+        j = min(int(t), m - 2)
+        f = t - j
+        out.append(coeff * (fine[j] * (1.0 - f) + fine[j + 1] * f))
+    return out
+
+
+def _binned_kde_numpy(values, grid, bandwidth, lo, hi):
+    m = KDE_BINS
+    delta = (hi - lo) / (m - 1)
+    t = (np.asarray(values, dtype=float) - lo) / delta
+    j = np.minimum(t.astype(np.int64), m - 1)
+    f = np.where(j >= m - 1, 0.0, t - j)
+    weights = np.bincount(j, weights=1.0 - f, minlength=m + 1)
+    weights[1:] += np.bincount(j, weights=f, minlength=m + 1)[:-1]
+    weights = weights[:m]
+
+    half = _kernel_halfwidth(bandwidth, delta)
+    d = np.arange(-half, half + 1)
+    kernel = np.exp(-0.5 * (d * delta / bandwidth) ** 2)
+    # FFT convolution of the binned counts with the sampled kernel
+    size = 1 << (m + 2 * half).bit_length()
+    full = np.fft.irfft(np.fft.rfft(weights, size) * np.fft.rfft(kernel, size), size)
+    fine = full[half:half + m]
+
+    coeff = 1.0 / (len(values) * bandwidth * math.sqrt(2 * math.pi))
+    nodes = lo + delta * np.arange(m)
+    return (coeff * np.interp(np.asarray(grid, dtype=float), nodes, fine)).tolist()
+
+
+# ── Downsampling ────────────────────────────────────────────────────────
+
+
+def lttb_indices(ys: Sequence[float], threshold: int,
+                 xs: Optional[Sequence[float]] = None) -> List[int]:
+    """Largest-Triangle-Three-Buckets: indices of the points worth drawing.
+
+    Always keeps the first and last points. Returns every index when the
+    series already has threshold points or fewer (or threshold < 3).
+    """
+    n = len(ys)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    if xs is None:
+        xs = range(n)
+    kept = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        # Average of the next bucket is the triangle's third vertex
+        nxt_start = end
+        nxt_end = min(int((i + 2) * every) + 1, n)
+        if nxt_start >= nxt_end:
+            avg_x, avg_y = xs[n - 1], ys[n - 1]
+        else:
+            span = nxt_end - nxt_start
+            avg_x = sum(xs[k] for k in range(nxt_start, nxt_end)) / span
+            avg_y = sum(ys[k] for k in range(nxt_start, nxt_end)) / span
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for k in range(start, min(end, n - 1)):
+            area = abs((ax - avg_x) * (ys[k] - ay) - (ax - xs[k]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = k, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
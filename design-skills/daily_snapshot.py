@@ -5,7 +5,10 @@ daily_snapshot.py — Daily state snapshots for CCA progress tracking.
 Captures a point-in-time snapshot of project metrics and stores it as JSON.
 Supports diffing any two snapshots to show what changed.
 
-Storage: .cca-daily-snapshots/YYYY-MM-DD.json (gitignored, local only)
+Storage: .cca-daily-snapshots/YYYY-MM-DD.json (gitignored, local only), plus
+an append-only delta archive in .cca-daily-snapshots/archive/ (see
+snapshot_archive.py) that serves history, trends and dates whose day file
+has been pruned.
 
 Usage:
     python3 design-skills/daily_snapshot.py capture              # Capture today's snapshot
@@ -13,6 +16,8 @@ Usage:
     python3 design-skills/daily_snapshot.py diff 2026-03-19       # Today vs specific date
     python3 design-skills/daily_snapshot.py diff 2026-03-18 2026-03-19  # Two specific dates
     python3 design-skills/daily_snapshot.py history               # List all snapshots
+    python3 design-skills/daily_snapshot.py trend totals.tests --days 90 [--svg out.svg]
+    python3 design-skills/daily_snapshot.py compact --keep 14     # Archive day files, prune old ones
 
 Stdlib only. No external dependencies.
 """
@@ -20,15 +25,18 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import subprocess
 import sys
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
+from project_census import ProjectCensus, count_test_methods, take_census
+from snapshot_archive import SnapshotArchive
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 SNAPSHOT_DIR = os.path.join(PROJECT_ROOT, ".cca-daily-snapshots")
+ARCHIVE_SUBDIR = "archive"
 
 
 def _read_file(relative_path: str) -> str:
@@ -48,31 +56,8 @@ def _count_test_methods(filepath: str) -> int:
     """
     if not os.path.exists(filepath):
         return 0
-    try:
-        import ast
-        with open(filepath) as f:
-            tree = ast.parse(f.read(), filename=filepath)
-        count = 0
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test_"):
-                        count += 1
-            elif isinstance(node, ast.Module):
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test_"):
-                        count += 1
-        return count
-    except SyntaxError:
-        # Fallback: count def test_ at method indentation (4-8 spaces)
-        count = 0
-        with open(filepath) as f:
-            for line in f:
-                stripped = line.lstrip()
-                indent = len(line) - len(stripped)
-                if stripped.startswith("def test_") and 4 <= indent <= 8:
-                    count += 1
-        return count
+    with open(filepath) as f:
+        return count_test_methods(f.read())
 
 
 def _count_python_loc(dirpath: str) -> int:
@@ -89,13 +74,16 @@ def _count_python_loc(dirpath: str) -> int:
     return total
 
 
-def capture_snapshot(snapshot_date: str = None) -> dict:
+def capture_snapshot(snapshot_date: str = None, census: ProjectCensus = None) -> dict:
     """Capture a point-in-time snapshot of CCA project metrics.
 
-    Returns a dict with all measurable project state.
+    Returns a dict with all measurable project state. Pass a census to
+    reuse a walk another generator already made.
     """
     if snapshot_date is None:
         snapshot_date = date.today().isoformat()
+    if census is None:
+        census = take_census(PROJECT_ROOT, git=False)
 
     snapshot = {
         "date": snapshot_date,
@@ -107,21 +95,9 @@ def capture_snapshot(snapshot_date: str = None) -> dict:
     }
 
     # ── Test counts per suite ──
-    total_tests = 0
-    total_suites = 0
-    test_files = []
-    for root, _, files in os.walk(PROJECT_ROOT):
-        # Skip hidden dirs and __pycache__
-        if any(part.startswith(".") or part == "__pycache__" for part in root.split(os.sep)):
-            continue
-        for fn in sorted(files):
-            if fn.startswith("test_") and fn.endswith(".py"):
-                fp = os.path.join(root, fn)
-                count = _count_test_methods(fp)
-                rel_path = os.path.relpath(fp, PROJECT_ROOT)
-                test_files.append({"file": rel_path, "count": count})
-                total_tests += count
-                total_suites += 1
+    test_files = [{"file": f.path, "count": f.tests} for f in census.files if f.is_test]
+    total_tests = sum(tf["count"] for tf in test_files)
+    total_suites = len(test_files)
 
     snapshot["tests"]["suites"] = test_files
     snapshot["tests"]["total_tests"] = total_tests
@@ -143,39 +119,26 @@ def capture_snapshot(snapshot_date: str = None) -> dict:
     total_loc = 0
     total_py_files = 0
     for mod_path, mod_name in modules:
-        full_path = os.path.join(PROJECT_ROOT, mod_path)
-        if not os.path.isdir(full_path):
+        if not os.path.isdir(os.path.join(census.root, mod_path)):
             continue
 
-        loc = _count_python_loc(full_path)
-        py_files = 0
-        for root, _, files in os.walk(full_path):
-            py_files += sum(1 for f in files if f.endswith(".py") and not f.startswith("test_"))
-
-        # Count module-specific tests
-        mod_tests = 0
-        for tf in test_files:
-            if tf["file"].startswith(mod_path):
-                mod_tests += tf["count"]
+        stats = census.module_stats(mod_path)
+        loc = stats["loc"]
+        py_files = stats["files"]
 
         snapshot["modules"][mod_name] = {
             "path": mod_path,
             "loc": loc,
             "py_files": py_files,
-            "tests": mod_tests,
+            "tests": stats["tests"],
         }
         total_loc += loc
         total_py_files += py_files
 
     # Root-level files
-    root_loc = 0
-    root_files = 0
-    for fn in os.listdir(PROJECT_ROOT):
-        fp = os.path.join(PROJECT_ROOT, fn)
-        if fn.endswith(".py") and not fn.startswith("test_") and os.path.isfile(fp):
-            with open(fp) as f:
-                root_loc += sum(1 for _ in f)
-            root_files += 1
+    root_stats = census.module_stats("")
+    root_loc = root_stats["loc"]
+    root_files = root_stats["files"]
     if root_loc > 0:
         snapshot["modules"]["Root"] = {"path": "./", "loc": root_loc, "py_files": root_files, "tests": 0}
         total_loc += root_loc
@@ -215,41 +178,48 @@ def capture_snapshot(snapshot_date: str = None) -> dict:
         pass
 
     # ── Session number from SESSION_STATE ──
-    state = _read_file("SESSION_STATE.md")
-    session_match = re.search(r"Session (\d+)", state)
-    if session_match:
-        snapshot["totals"]["session_number"] = int(session_match.group(1))
+    if census.session_number:
+        snapshot["totals"]["session_number"] = census.session_number
 
     return snapshot
 
 
+def open_archive(snapshot_dir: str = SNAPSHOT_DIR) -> SnapshotArchive:
+    """The delta archive that sits alongside the day files."""
+    return SnapshotArchive(os.path.join(snapshot_dir, ARCHIVE_SUBDIR))
+
+
 def save_snapshot(snapshot: dict, snapshot_dir: str = SNAPSHOT_DIR) -> str:
-    """Save a snapshot to disk. Returns the file path."""
+    """Save a snapshot to disk and append it to the archive. Returns the file path."""
     os.makedirs(snapshot_dir, exist_ok=True)
     filename = f"{snapshot['date']}.json"
     filepath = os.path.join(snapshot_dir, filename)
     with open(filepath, "w") as f:
         json.dump(snapshot, f, indent=2)
+    try:
+        open_archive(snapshot_dir).append(snapshot["date"], snapshot)
+    except (OSError, ValueError):
+        pass  # the day file is authoritative; the archive can be rebuilt with compact
     return filepath
 
 
 def load_snapshot(snapshot_date: str, snapshot_dir: str = SNAPSHOT_DIR) -> dict | None:
-    """Load a snapshot by date string (YYYY-MM-DD)."""
+    """Load a snapshot by date string (YYYY-MM-DD), from its day file or the archive."""
     filepath = os.path.join(snapshot_dir, f"{snapshot_date}.json")
     if not os.path.exists(filepath):
-        return None
+        return open_archive(snapshot_dir).get(snapshot_date)
     with open(filepath) as f:
         return json.load(f)
 
 
 def list_snapshots(snapshot_dir: str = SNAPSHOT_DIR) -> list[str]:
-    """List all snapshot dates, sorted newest first."""
+    """List all snapshot dates (day files and archive), sorted newest first."""
     if not os.path.isdir(snapshot_dir):
         return []
-    dates = []
+    dates = set(open_archive(snapshot_dir).keys())
     for fn in os.listdir(snapshot_dir):
         if fn.endswith(".json"):
-            dates.append(fn.replace(".json", ""))
+            dates.add(fn.replace(".json", ""))
     return sorted(dates, reverse=True)
 
 
@@ -262,6 +232,50 @@ def find_previous_snapshot(before_date: str, snapshot_dir: str = SNAPSHOT_DIR) -
     return None
 
 
+def compact_snapshots(snapshot_dir: str = SNAPSHOT_DIR, keep: int | None = None) -> dict:
+    """Append day files missing from the archive, then optionally prune old ones.
+
+    keep=N deletes every day file except the newest N once it is safely in
+    the archive (load_snapshot falls back to the archive for those dates).
+    Returns {"archived": [...dates], "pruned": [...dates]}.
+    """
+    archive = open_archive(snapshot_dir)
+    archived, pruned = [], []
+    day_files = sorted(fn[:-5] for fn in os.listdir(snapshot_dir) if fn.endswith(".json")) \
+        if os.path.isdir(snapshot_dir) else []
+    for d in day_files:
+        if d in archive:
+            continue
+        with open(os.path.join(snapshot_dir, f"{d}.json")) as f:
+            archive.append(d, json.load(f))
+        archived.append(d)
+    if keep is not None:
+        for d in day_files[:max(0, len(day_files) - keep)]:
+            if d in archive:
+                os.remove(os.path.join(snapshot_dir, f"{d}.json"))
+                pruned.append(d)
+    return {"archived": archived, "pruned": pruned}
+
+
+def metric_series(path: str, start: str = None, end: str = None,
+                  snapshot_dir: str = SNAPSHOT_DIR) -> list[tuple[str, object]]:
+    """[(date, value)] of a dotted metric path (e.g. "totals.tests") over a date range.
+
+    Reads the archive in one pass; day files not yet archived are not
+    included (run compact_snapshots first when migrating old directories).
+    """
+    return open_archive(snapshot_dir).series(path, start=start, end=end)
+
+
+def diff_dates(date1: str, date2: str, snapshot_dir: str = SNAPSHOT_DIR) -> dict | None:
+    """diff_snapshots between two stored dates, or None if either is missing."""
+    old = load_snapshot(date1, snapshot_dir)
+    new = load_snapshot(date2, snapshot_dir)
+    if old is None or new is None:
+        return None
+    return diff_snapshots(old, new)
+
+
 def diff_snapshots(old: dict, new: dict) -> dict:
     """Compare two snapshots and produce a structured diff.
 
@@ -426,12 +440,14 @@ def format_diff_markdown(diff: dict) -> str:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: daily_snapshot.py {capture|diff|history}")
+        print("Usage: daily_snapshot.py {capture|diff|history|trend|compact}")
         print("")
         print("Commands:")
         print("  capture              Capture today's snapshot")
         print("  diff [date1] [date2] Compare snapshots (default: today vs previous)")
         print("  history              List all snapshots")
+        print("  trend <metric> [--days N] [--svg out.svg]  Metric over time from the archive")
+        print("  compact [--keep N]   Archive day files; keep only the newest N on disk")
         sys.exit(1)
 
     cmd = sys.argv[1]
@@ -481,16 +497,52 @@ def main():
         if not snapshots:
             print("No snapshots found. Run 'capture' to create one.")
         else:
+            archived_totals = dict(metric_series("totals"))  # one archive pass
             print(f"Snapshots ({len(snapshots)}):")
             for d in snapshots:
-                snap = load_snapshot(d)
-                if snap:
-                    t = snap.get("totals", {})
+                t = archived_totals.get(d)
+                if t is None:
+                    snap = load_snapshot(d)
+                    t = snap.get("totals", {}) if snap else None
+                if t is not None:
                     print(f"  {d}: {t.get('tests', '?')} tests, {t.get('loc', '?')} LOC, "
                           f"session {t.get('session_number', '?')}")
                 else:
                     print(f"  {d}: (corrupt)")
 
+    elif cmd == "trend":
+        if len(sys.argv) < 3:
+            print("Usage: daily_snapshot.py trend <metric.path> [--days N] [--svg out.svg]")
+            sys.exit(1)
+        metric = sys.argv[2]
+        opts = sys.argv[3:]
+        start = None
+        if "--days" in opts:
+            days = int(opts[opts.index("--days") + 1])
+            start = (date.today() - timedelta(days=days)).isoformat()
+        points = [(d, v) for d, v in metric_series(metric, start=start)
+                  if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        if not points:
+            print(f"No archived values for {metric}. Run 'capture' or 'compact' first.")
+            sys.exit(1)
+        for d, v in points:
+            print(f"  {d}: {v}")
+        first, last = points[0][1], points[-1][1]
+        print(f"{metric}: {first} -> {last} ({last - first:+g}) over {len(points)} snapshots")
+        if "--svg" in opts:
+            from chart_generator import LineChart, render_svg
+            out = opts[opts.index("--svg") + 1]
+            with open(out, "w") as f:
+                f.write(render_svg(LineChart(data=points, title=metric, y_label=metric)))
+            print(f"Chart: {out}")
+
+    elif cmd == "compact":
+        keep = None
+        if "--keep" in sys.argv:
+            keep = int(sys.argv[sys.argv.index("--keep") + 1])
+        result = compact_snapshots(keep=keep)
+        print(f"Archived {len(result['archived'])} day files, pruned {len(result['pruned'])}")
+
     else:
         print(f"Unknown command: {cmd}")
         sys.exit(1)
@@ -14,6 +14,7 @@ All output is XSS-safe (HTML entities escaped).
 Usage:
     python3 dashboard_generator.py generate --output dashboard.html
     python3 dashboard_generator.py generate --output dashboard.html --demo
+    python3 dashboard_generator.py serve --port 8765    # live mode (dashboard_server.py)
 
 Stdlib only. No external dependencies.
 """
@@ -28,6 +29,8 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import List, Optional
 
+from project_census import ProjectCensus, take_census
+
 # Import chart generator (same module)
 try:
     from chart_generator import (
@@ -259,6 +262,128 @@ class DashboardRenderer:
             f.write(content)
         os.replace(tmp, path)
 
+    # ── Live (server) mode ──────────────────────────────────────────────
+
+    SECTIONS = ("metrics", "daily_diff", "charts", "modules", "master_tasks")
+
+    def render_section(self, data: DashboardData, section: str) -> str:
+        """HTML fragment for one dashboard section (used by dashboard_server)."""
+        if section == "metrics":
+            return self._render_metrics(data.metrics)
+        if section == "daily_diff":
+            return self._render_daily_diff(data.daily_diff)
+        if section == "charts":
+            return self._render_charts(data)
+        if section == "modules":
+            return self._render_modules(data.modules)
+        if section == "master_tasks":
+            return self._render_master_tasks(data.master_tasks)
+        raise ValueError(f"Unknown dashboard section: {section}")
+
+    def render_panel(self, title: str, payload: dict) -> str:
+        """Key/value card for a non-dashboard source's scalar fields."""
+        rows = []
+        for key, value in (payload or {}).items():
+            if isinstance(value, (dict, list)):
+                continue
+            if isinstance(value, float):
+                value = f"{value:.3f}"
+            rows.append(f"    <tr><td>{_e(key)}</td><td>{_e(value)}</td></tr>")
+        if not rows:
+            return ""
+        return f"""<h2 class="section-header">{_e(title)}</h2>
+<table class="tasks-table">
+<tbody>
+{chr(10).join(rows)}
+</tbody>
+</table>"""
+
+    def render_shell(self, title: str, sections: dict, theme: str = "light") -> str:
+        """Static page for dashboard_server: empty section containers filled over HTTP.
+
+        sections maps a source name to the fragment names it feeds; the page
+        fetches /fragment/<name> on load and again whenever /events reports
+        that the source changed (conditional requests, so unchanged
+        fragments cost a 304).
+        """
+        containers = "\n".join(
+            f'  <div id="section-{_e(name)}" class="live-section"></div>'
+            for names in sections.values() for name in names
+        )
+        initial_theme = "dark" if theme == "dark" else "light"
+        sections_json = json.dumps(sections).replace("<", "\\u003c").replace(">", "\\u003e")
+        return f"""<!DOCTYPE html>
+<html lang="en" data-theme="{initial_theme}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{_e(title)}</title>
+<style>
+{self._css()}
+</style>
+</head>
+<body>
+<div class="container" role="main">
+  <header>
+    <div class="header-flex">
+      <div>
+        <h1>{_e(title)}</h1>
+        <p class="subtitle">Live <span id="live-status">connecting&hellip;</span></p>
+      </div>
+      <button id="theme-toggle" onclick="toggleTheme()" aria-label="Toggle dark/light mode" title="Toggle dark/light mode" style="background:var(--surface);border:1px solid var(--border);border-radius:4px;padding:6px 12px;cursor:pointer;font-size:14px;color:var(--text-primary)">&#9789;</button>
+    </div>
+  </header>
+
+{containers}
+</div>
+<script id="live-sections" type="application/json">{sections_json}</script>
+<script>
+{self._js()}
+{self._live_js()}
+</script>
+</body>
+</html>"""
+
+    def _live_js(self) -> str:
+        """Client for dashboard_server: conditional fragment fetches driven by SSE."""
+        return """
+/* Live updates (dashboard_server) */
+var liveSections = JSON.parse(document.getElementById('live-sections').textContent);
+var liveEtags = {};
+function loadFragment(name) {
+  var headers = liveEtags[name] ? {'If-None-Match': liveEtags[name]} : {};
+  return fetch('/fragment/' + name, {headers: headers}).then(function(r) {
+    if (r.status !== 200) return;
+    liveEtags[name] = r.headers.get('ETag');
+    return r.text().then(function(html) {
+      var search = document.getElementById('module-search');
+      var query = search ? search.value : '';
+      document.getElementById('section-' + name).innerHTML = html;
+      search = document.getElementById('module-search');
+      if (search && query) { search.value = query; filterModules(); }
+    });
+  });
+}
+function loadSource(source) {
+  (liveSections[source] || []).forEach(loadFragment);
+}
+function setLiveStatus(text) {
+  var el = document.getElementById('live-status');
+  if (el) el.textContent = text;
+}
+Object.keys(liveSections).forEach(loadSource);
+if (window.EventSource) {
+  var events = new EventSource('/events');
+  events.addEventListener('update', function(e) {
+    var msg = JSON.parse(e.data);
+    loadSource(msg.source);
+    setLiveStatus('\\u2014 updated ' + new Date().toLocaleTimeString());
+  });
+  events.onopen = function() { setLiveStatus('\\u2014 connected'); };
+  events.onerror = function() { setLiveStatus('\\u2014 reconnecting\\u2026'); };
+}
+"""
+
     def _css(self) -> str:
         return f"""
 /* ── Theme custom properties ── */
@@ -1100,6 +1225,7 @@ def cli_main(args: list = None):
     if not args:
         print(
             "Usage: python3 dashboard_generator.py generate --output FILE [--demo]\n"
+            "       python3 dashboard_generator.py serve [--port 8765] [--interval 2]\n"
             "\n"
             "Options:\n"
             "  --output FILE  Output HTML file path\n"
@@ -1151,65 +1277,40 @@ def cli_main(args: list = None):
         renderer.render_to_file(data, output, theme=theme, refresh_seconds=refresh, interactive=interactive)
         print(f"Dashboard written to {output}")
 
+    elif cmd == "serve":
+        # Live mode: static shell + JSON/fragment endpoints + SSE (dashboard_server.py)
+        from dashboard_server import main as serve_main
+        serve_main(args[1:])
+
     else:
         print(f"Unknown command: {cmd}")
 
 
-def _collect_project_data() -> DashboardData:
+def _collect_project_data(census: Optional[ProjectCensus] = None) -> DashboardData:
     """Collect real CCA project data from PROJECT_INDEX, MASTER_TASKS, SESSION_STATE."""
     import re as _re
     project_root = str(Path(__file__).parent.parent)
+    if census is None:
+        census = take_census(project_root, git=False, scan_files=False)
     data = DashboardData()
 
-    # ── Parse PROJECT_INDEX.md for modules ──
-    index_path = os.path.join(project_root, "PROJECT_INDEX.md")
-    if os.path.exists(index_path):
-        with open(index_path) as f:
-            content = f.read()
-        in_module_table = False
-        for line in content.split("\n"):
-            line = line.strip()
-            if "| Module " in line or "| Module|" in line:
-                in_module_table = True
-                continue
-            if in_module_table and line.startswith("|---"):
-                continue
-            if in_module_table and line.startswith("|"):
-                parts = [p.strip() for p in line.split("|")]
-                parts = [p for p in parts if p]
-                if len(parts) >= 4:
-                    name = parts[0]
-                    path = parts[1].strip("`")
-                    items = parts[2]
-                    try:
-                        tests = int(parts[3])
-                    except ValueError:
-                        continue
-                    status = "COMPLETE" if "COMPLETE" in items.upper() else "ACTIVE"
-                    data.modules.append(ModuleCard(
-                        name=name, path=path, status=status,
-                        tests=tests, items=items,
-                    ))
-            elif in_module_table and not line.startswith("|"):
-                in_module_table = False
-
-        # Extract total test count from "Total: NNNN tests" line
-        total_match = _re.search(r"\*\*Total:\s*~?([\d,]+)\s*tests\s*\(~?(\d+)\s*suites\)", content)
-        if total_match:
-            total_tests = int(total_match.group(1).replace(",", ""))
-            total_suites = int(total_match.group(2))
-        else:
-            total_tests = sum(m.tests for m in data.modules)
-            total_suites = len(data.modules)
+    # ── Modules from the PROJECT_INDEX.md table ──
+    for row in census.index_modules:
+        data.modules.append(ModuleCard(
+            name=row.name, path=row.path, status=row.status,
+            tests=row.tests, items=row.items,
+        ))
+
+    if census.index_total_tests is not None and census.index_total_suites is not None:
+        total_tests = census.index_total_tests
+        total_suites = census.index_total_suites
     else:
         total_tests = sum(m.tests for m in data.modules)
         total_suites = len(data.modules)
 
     # ── Parse MASTER_TASKS.md priority table ──
-    mt_path = os.path.join(project_root, "MASTER_TASKS.md")
-    if os.path.exists(mt_path):
-        with open(mt_path) as f:
-            mt_content = f.read()
+    mt_content = census.doc("MASTER_TASKS.md")
+    if mt_content:
         # Look for priority table rows: | rank | MT-N | name | base | ... | **score** | status |
         for line in mt_content.split("\n"):
             mt_match = _re.match(
@@ -1224,14 +1325,9 @@ def _collect_project_data() -> DashboardData:
                     status=mt_match.group(4).strip(),
                 ))
 
-    # ── Parse SESSION_STATE.md for session number ──
-    state_path = os.path.join(project_root, "SESSION_STATE.md")
-    if os.path.exists(state_path):
-        with open(state_path) as f:
-            state_content = f.read()
-        session_match = _re.search(r"Session\s+(\d+)", state_content)
-        if session_match:
-            data.session_number = int(session_match.group(1))
+    # ── Session number from SESSION_STATE.md ──
+    if census.session_number:
+        data.session_number = census.session_number
 
     # ── Daily diff ──
     try:
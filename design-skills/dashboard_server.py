@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+dashboard_server.py — Live dashboard: static shell + JSON/fragment endpoints + SSE.
+
+`dashboard_generator.py generate` re-collects everything and rewrites one
+large HTML file per refresh (and the efficiency / hivemind / coordination
+dashboards regenerate their whole output the same way). Server mode keeps
+the collectors in memory instead:
+
+    GET /                       static shell, rendered once at startup
+    GET /api/sources            every source with its current ETag
+    GET /api/<source>           source payload as JSON (ETag / If-None-Match -> 304)
+        ?section=<list key>&offset=N&limit=M   one page of a list field
+    GET /fragment/<section>     HTML for one section, ETag'd the same way
+    GET /events                 server-sent events: "update" {source, etag}
+                                whenever a source's payload changes
+
+Each DataSource re-runs its collector only when one of its watched files
+(JSONL logs, PROJECT_INDEX.md, SESSION_STATE.md, the snapshot archive
+index) changes size or mtime, or when its ttl expires for sources with
+nothing to watch. A background thread polls those stats — a few os.stat
+calls per interval — and pushes an event only when the serialized payload
+actually differs, so an idle dashboard costs nothing to keep open.
+
+Usage:
+    python3 design-skills/dashboard_generator.py serve --port 8765
+    python3 design-skills/dashboard_server.py --port 8765 --interval 2
+
+    from dashboard_server import DashboardServer, DataSource
+    server = DashboardServer([DataSource("hivemind", collect_fn, paths=[...])])
+    server.serve_forever()
+
+Stdlib only. No external dependencies.
+"""
+
+import argparse
+import hashlib
+import http.server
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dashboard_generator import DashboardRenderer, _collect_project_data
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_INTERVAL = 2.0       # seconds between watched-file polls
+HEARTBEAT_SECONDS = 15       # SSE comment keeps proxies from closing idle streams
+MAX_PAGE_SIZE = 500
+
+
+# ── Cached collectors ────────────────────────────────────────────────────────
+
+
+class DataSource:
+    """A collector whose result is cached until its watched files change.
+
+    collect() returns the payload; to_json (default: identity, or
+    .to_dict() when present) turns it into something json.dumps accepts.
+    sections lists the /fragment names this source feeds; render(value,
+    section) produces their HTML.
+    """
+
+    def __init__(self, name: str, collect: Callable[[], object],
+                 paths: Sequence[str] = (), ttl: Optional[float] = None,
+                 sections: Sequence[str] = (),
+                 render: Optional[Callable[[object, str], str]] = None,
+                 to_json: Optional[Callable[[object], object]] = None):
+        self.name = name
+        self.collect = collect
+        self.paths = list(paths)
+        self.ttl = ttl
+        self.sections = list(sections) or [name]
+        self.render = render
+        self.to_json = to_json
+        self.value = None
+        self.body = b""
+        self.etag = ""
+        self.error = ""
+        self._stamp = None
+        self._collected_at = 0.0
+        self._fragments: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _file_stamp(self) -> tuple:
+        stamp = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                stamp.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append((path, None, None))
+        return tuple(stamp)
+
+    def stale(self) -> bool:
+        if self._stamp is None:
+            return True
+        if self.ttl is not None and time.monotonic() - self._collected_at >= self.ttl:
+            return True
+        return self._file_stamp() != self._stamp
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-collect if stale. Returns True if the payload changed."""
+        with self._lock:
+            if not force and not self.stale():
+                return False
+            stamp = self._file_stamp()
+            try:
+                value = self.collect()
+                data = self.to_json(value) if self.to_json else (
+                    value.to_dict() if hasattr(value, "to_dict") else value)
+                body = json.dumps(data, default=str, sort_keys=True).encode("utf-8")
+                self.error = ""
+            except Exception as e:
+                # Keep serving the last good payload; report the failure
+                value, body = self.value, self.body
+                self.error = f"{type(e).__name__}: {e}"
+            self._stamp = stamp
+            self._collected_at = time.monotonic()
+            if body == self.body and self.etag:
+                return False
+            self.value = value
+            self.body = body
+            self.etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            self._fragments.clear()
+            return True
+
+    def fragment(self, section: str) -> bytes:
+        """Rendered HTML for one of this source's sections (cached per payload)."""
+        with self._lock:
+            cached = self._fragments.get(section)
+            if cached is None:
+                renderer = self.render or _render_panel
+                cached = renderer(self.value, section).encode("utf-8")
+                self._fragments[section] = cached
+            return cached
+
+
+def _render_panel(value, section: str) -> str:
+    title = section.replace("_", " ").title()
+    payload = value.to_dict() if hasattr(value, "to_dict") else value
+    return DashboardRenderer().render_panel(title, payload if isinstance(payload, dict) else {})
+
+
+def page(items: list, offset: int = 0, limit: int = 50) -> dict:
+    """One page of a list: {"items", "total", "offset", "limit", "next_offset"}."""
+    offset = max(0, offset)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    chunk = items[offset:offset + limit]
+    end = offset + len(chunk)
+    return {"items": chunk, "total": len(items), "offset": offset, "limit": limit,
+            "next_offset": end if end < len(items) else None}
+
+
+# ── Default sources ──────────────────────────────────────────────────────────
+
+
+def default_sources(project_root: str = PROJECT_ROOT) -> List[DataSource]:
+    """The project dashboard plus whichever root-level dashboards import cleanly."""
+    renderer = DashboardRenderer()
+    snapshot_index = os.path.join(project_root, ".cca-daily-snapshots", "archive", "index.json")
+    sources = [DataSource(
+        "dashboard", _collect_project_data,
+        paths=[os.path.join(project_root, name)
+               for name in ("PROJECT_INDEX.md", "SESSION_STATE.md", "MASTER_TASKS.md")]
+        + [snapshot_index],
+        sections=DashboardRenderer.SECTIONS,
+        render=renderer.render_section,
+    )]
+
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    try:
+        import efficiency_dashboard as eff
+
+        def collect_efficiency():
+            data = eff.load_session_data()
+            return eff.compute_dashboard_stats(
+                eff.merge_timing_and_outcomes(data["timings"], data["outcomes"]))
+
+        sources.append(DataSource("efficiency", collect_efficiency,
+                                  paths=[eff.DEFAULT_TIMING_PATH, eff.DEFAULT_OUTCOME_PATH]))
+    except ImportError:
+        pass
+    try:
+        import hivemind_dashboard as hd
+        sources.append(DataSource("hivemind", hd.phase1_report,
+                                  paths=[hd.DEFAULT_SESSIONS_PATH, hd.DEFAULT_METRICS_PATH,
+                                         hd.DEFAULT_OVERHEAD_PATH]))
+    except ImportError:
+        pass
+    try:
+        import coordination_dashboard as cd
+        # Shells out to git and cca_comm; nothing to stat, so refresh on a timer
+        sources.append(DataSource("coordination", cd.build_dashboard, ttl=30.0))
+    except ImportError:
+        pass
+    return sources
+
+
+# ── HTTP ─────────────────────────────────────────────────────────────────────
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Routes requests to the owning DashboardServer (self.server.app)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        app = self.server.app
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        try:
+            if not parts:
+                self._send(200, app.shell, "text/html; charset=utf-8", app.shell_etag)
+            elif parts == ["events"]:
+                self._stream_events(app)
+            elif parts == ["api", "sources"]:
+                body = json.dumps({s.name: {"etag": s.etag, "sections": s.sections,
+                                            "error": s.error}
+                                   for s in app.sources.values()}).encode("utf-8")
+                self._send(200, body, "application/json")
+            elif len(parts) == 2 and parts[0] == "api" and parts[1] in app.sources:
+                self._send_api(app.sources[parts[1]], parse_qs(url.query))
+            elif len(parts) == 2 and parts[0] == "fragment" and parts[1] in app.fragments:
+                source = app.fragments[parts[1]]
+                etag = f'"{source.etag.strip(chr(34))}-{parts[1]}"'
+                if self._not_modified(etag):
+                    return
+                self._send(200, source.fragment(parts[1]), "text/html; charset=utf-8", etag)
+            else:
+                self._send(404, b'{"error": "Not found"}', "application/json")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_api(self, source: DataSource, query: dict):
+        section = query.get("section", [None])[0]
+        if section is None:
+            if not self._not_modified(source.etag):
+                self._send(200, source.body, "application/json", source.etag)
+            return
+        etag = f'"{source.etag.strip(chr(34))}-{section}-{query.get("offset", ["0"])[0]}-{query.get("limit", ["50"])[0]}"'
+        if self._not_modified(etag):
+            return
+        payload = json.loads(source.body or b"{}")
+        items = payload.get(section) if isinstance(payload, dict) else None
+        if not isinstance(items, list):
+            self._send(404, json.dumps({"error": f"No list section {section!r}"}).encode(),
+                       "application/json")
+            return
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", ["50"])[0])
+        except ValueError:
+            self._send(400, b'{"error": "offset and limit must be integers"}', "application/json")
+            return
+        self._send(200, json.dumps(page(items, offset, limit), default=str).encode("utf-8"),
+                   "application/json", etag)
+
+    def _not_modified(self, etag: str) -> bool:
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return True
+        return False
+
+    def _send(self, code: int, body: bytes, content_type: str, etag: str = ""):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self, app: "DashboardServer"):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        q = app.subscribe()
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            self.wfile.flush()
+            while not app.stopped.is_set():
+                try:
+                    event = q.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    if event is None:
+                        break
+                    self.wfile.write(f"event: update\ndata: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            app.unsubscribe(q)
+
+    def log_message(self, format, *args):
+        """Suppress default request logging to stderr."""
+        pass
+
+
+class DashboardServer:
+    """Serves DataSources over HTTP and pushes changes to SSE subscribers."""
+
+    def __init__(self, sources: Optional[List[DataSource]] = None,
+                 host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 interval: float = DEFAULT_INTERVAL, title: str = "CCA Live Dashboard",
+                 theme: str = "light"):
+        if sources is None:
+            sources = default_sources()
+        self.sources: Dict[str, DataSource] = {s.name: s for s in sources}
+        self.fragments: Dict[str, DataSource] = {}
+        for source in sources:
+            for section in source.sections:
+                self.fragments[section] = source
+        self.interval = interval
+        self.stopped = threading.Event()
+        self._subscribers: List[queue.Queue] = []
+        self._sub_lock = threading.Lock()
+
+        self.shell = DashboardRenderer().render_shell(
+            title, {s.name: s.sections for s in sources}, theme=theme).encode("utf-8")
+        self.shell_etag = '"' + hashlib.sha1(self.shell).hexdigest()[:16] + '"'
+        for source in sources:
+            source.refresh(force=True)
+
+        self.httpd = http.server.ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = self
+        self._poller = threading.Thread(target=self._poll, daemon=True)
+
+    @property
+    def address(self):
+        return self.httpd.server_address[:2]
+
+    # ── Subscribers ─────────────────────────────────────────────────────
+
+    def subscribe(self) -> queue.Queue:
+        q = queue.Queue()
+        with self._sub_lock:
+            self._subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue):
+        with self._sub_lock:
+            if q in self._subscribers:
+                self._subscribers.remove(q)
+
+    def publish(self, event: Optional[dict]):
+        with self._sub_lock:
+            subscribers = list(self._subscribers)
+        for q in subscribers:
+            q.put(event)
+
+    # ── Polling ─────────────────────────────────────────────────────────
+
+    def poll_once(self) -> List[str]:
+        """Refresh stale sources; publish and return the names that changed."""
+        changed = []
+        for source in self.sources.values():
+            if source.refresh():
+                changed.append(source.name)
+                self.publish({"source": source.name, "etag": source.etag})
+        return changed
+
+    def _poll(self):
+        while not self.stopped.wait(self.interval):
+            self.poll_once()
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def start(self):
+        """Serve in background threads (returns immediately)."""
+        self._poller.start()
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def serve_forever(self):
+        self._poller.start()
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        self.publish(None)
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="CCA live dashboard server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help="Seconds between checks of the watched files")
+    parser.add_argument("--theme", default="light", choices=["light", "dark"])
+    args = parser.parse_args(argv)
+
+    server = DashboardServer(host=args.host, port=args.port, interval=args.interval,
+                             theme=args.theme)
+    host, port = server.address
+    print(f"Dashboard server on http://{host}:{port}/ (sources: {', '.join(server.sources)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -31,7 +31,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 # Import chart rendering from sibling module
-from chart_generator import render_svg, _escape, SVG_NS, FONT_FAMILY, CCA_COLORS
+from chart_generator import render_svg, RenderCache, _escape, SVG_NS, FONT_FAMILY, CCA_COLORS
 
 
 # ---------------------------------------------------------------------------
@@ -171,10 +171,10 @@ def _render_annotation(ann: Annotation, offset_x: float = 0, offset_y: float = 0
     return "".join(parts)
 
 
-def _render_panel_svg_content(panel: FigurePanel) -> str:
+def _render_panel_svg_content(panel: FigurePanel, cache: Optional[RenderCache] = None) -> str:
     """Render a panel's chart as SVG content (inner elements only, no wrapper)."""
     # Get the full SVG of the chart
-    chart_svg = render_svg(panel.chart)
+    chart_svg = render_svg(panel.chart, cache=cache)
     # Extract inner content between <svg...> and </svg>
     # Find the end of the opening <svg> tag
     start = chart_svg.find(">")
@@ -187,8 +187,11 @@ def _render_panel_svg_content(panel: FigurePanel) -> str:
     return chart_svg[start:end]
 
 
-def render_figure(fig: Figure) -> str:
-    """Render a Figure to a complete SVG string."""
+def render_figure(fig: Figure, cache: Optional[RenderCache] = None) -> str:
+    """Render a Figure to a complete SVG string.
+
+    Panel charts go through render_svg's cache (or the given RenderCache).
+    """
     cols = fig._effective_cols()
     rows = math.ceil(len(fig.panels) / cols)
     pad = fig.padding
@@ -277,7 +280,7 @@ def render_figure(fig: Figure) -> str:
         parts.append(
             f'<g transform="translate({px},{panel_y}) scale({scale:.4f})">\n'
         )
-        parts.append(_render_panel_svg_content(panel))
+        parts.append(_render_panel_svg_content(panel, cache))
         parts.append('</g>\n')
 
         # Panel-level annotations
@@ -0,0 +1,330 @@
+"""Project census — one filesystem pass shared by every CCA generator.
+
+The report, dashboard, website, slide and daily-snapshot generators all
+need the same facts: Python LOC and file counts per module, test counts
+per test file, the PROJECT_INDEX.md module table and totals, the session
+number and the commit count. Each used to walk the tree (or shell out to
+find | wc) on its own. take_census() does it once:
+
+    - a single os.scandir walk (hidden dirs, __pycache__ and node_modules
+      skipped), with per-file line/test counts cached by (mtime, size) —
+      in memory and in .cca-census-cache.json — so unchanged files are
+      only stat'ed, never re-read
+    - PROJECT_INDEX.md, SESSION_STATE.md and MASTER_TASKS.md read and
+      parsed once
+    - one `git rev-list --count HEAD`
+
+and returns a ProjectCensus that the generators consume.
+
+Usage:
+    from project_census import take_census
+    census = take_census()                       # project root by default
+    census.module_stats("memory-system/")        # {"loc", "files", "tests", "test_files"}
+    census.index_module("Memory System").tests   # from PROJECT_INDEX.md
+    census.source_loc, census.test_files, census.session_number
+
+Stdlib only. No external dependencies.
+"""
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+CACHE_FILENAME = ".cca-census-cache.json"
+DOC_FILES = ("PROJECT_INDEX.md", "SESSION_STATE.md", "MASTER_TASKS.md")
+SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+# abs path -> (mtime_ns, size, lines, tests); shared by every census in this process
+_FILE_CACHE: Dict[str, Tuple[int, int, int, int]] = {}
+
+
+# ── Typed snapshot ──────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """One Python file: path relative to the project root, with counts."""
+    path: str
+    lines: int
+    tests: int = 0
+
+    @property
+    def is_test(self) -> bool:
+        return os.path.basename(self.path).startswith("test_")
+
+
+@dataclass(frozen=True)
+class IndexModule:
+    """A row of the PROJECT_INDEX.md module table."""
+    name: str
+    path: str
+    items: str
+    tests: int
+
+    @property
+    def status(self) -> str:
+        return "COMPLETE" if "COMPLETE" in self.items.upper() else "ACTIVE"
+
+
+@dataclass
+class ProjectCensus:
+    """Everything the generators read from the project, gathered in one pass."""
+    root: str
+    files: List[SourceFile] = field(default_factory=list)
+    docs: Dict[str, str] = field(default_factory=dict)
+    index_modules: List[IndexModule] = field(default_factory=list)
+    index_total_tests: Optional[int] = None
+    index_total_suites: Optional[int] = None
+    session_number: int = 0
+    git_commits: int = 0
+    taken_at: float = 0.0
+    files_read: int = 0     # files (re)counted this pass; the rest came from cache
+
+    def doc(self, name: str) -> str:
+        return self.docs.get(name, "")
+
+    def index_module(self, name: str) -> Optional[IndexModule]:
+        for module in self.index_modules:
+            if module.name == name:
+                return module
+        return None
+
+    def under(self, prefix: str) -> List[SourceFile]:
+        """Files below a directory prefix such as "memory-system/" ("" = root level only)."""
+        if not prefix or prefix in (".", "./"):
+            return [f for f in self.files if "/" not in f.path]
+        prefix = prefix.rstrip("/") + "/"
+        return [f for f in self.files if f.path.startswith(prefix)]
+
+    def module_stats(self, prefix: str) -> dict:
+        files = self.under(prefix)
+        source = [f for f in files if not f.is_test]
+        tests = [f for f in files if f.is_test]
+        return {
+            "loc": sum(f.lines for f in source),
+            "files": len(source),
+            "tests": sum(f.tests for f in tests),
+            "test_files": len(tests),
+        }
+
+    @property
+    def source_files(self) -> int:
+        return sum(1 for f in self.files if not f.is_test)
+
+    @property
+    def test_files(self) -> int:
+        return sum(1 for f in self.files if f.is_test)
+
+    @property
+    def source_loc(self) -> int:
+        return sum(f.lines for f in self.files if not f.is_test)
+
+    @property
+    def test_loc(self) -> int:
+        return sum(f.lines for f in self.files if f.is_test)
+
+    @property
+    def scanned_tests(self) -> int:
+        return sum(f.tests for f in self.files if f.is_test)
+
+    @property
+    def total_tests(self) -> int:
+        """PROJECT_INDEX.md total (authoritative) or the scanned count."""
+        return self.index_total_tests if self.index_total_tests is not None else self.scanned_tests
+
+    def test_counts(self) -> List[int]:
+        """Test methods per test file, sorted by path, zero-test files omitted."""
+        return [f.tests for f in self.files if f.is_test and f.tests > 0]
+
+
+# ── Counting ────────────────────────────────────────────────────────────
+
+
+def count_test_methods(source: str) -> int:
+    """Count test_ functions/methods (AST; line-based fallback on syntax errors)."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        count = 0
+        for line in source.splitlines():
+            stripped = line.lstrip()
+            if stripped.startswith("def test_") and 4 <= len(line) - len(stripped) <= 8:
+                count += 1
+        return count
+    count = 0
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.ClassDef, ast.Module)):
+            count += sum(1 for item in node.body
+                         if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                         and item.name.startswith("test_"))
+    return count
+
+
+def _count_file(path: str, is_test: bool) -> Tuple[int, int]:
+    with open(path, "rb") as f:
+        data = f.read()
+    lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+    tests = count_test_methods(data.decode("utf-8", errors="replace")) if is_test else 0
+    return lines, tests
+
+
+# ── Index parsing ───────────────────────────────────────────────────────
+
+
+def parse_index(content: str) -> Tuple[List[IndexModule], Optional[int], Optional[int]]:
+    """Module table rows plus the "**Total: N tests (M suites)**" figures."""
+    modules = []
+    in_table = False
+    for line in content.split("\n"):
+        line = line.strip()
+        if "| Module " in line or "| Module|" in line:
+            in_table = True
+            continue
+        if in_table and line.startswith("|---"):
+            continue
+        if in_table and line.startswith("|"):
+            parts = [p.strip() for p in line.split("|")]
+            parts = [p for p in parts if p]
+            if len(parts) >= 4:
+                try:
+                    tests = int(parts[3].replace(",", ""))
+                except ValueError:
+                    continue
+                modules.append(IndexModule(name=parts[0], path=parts[1].strip("`"),
+                                           items=parts[2], tests=tests))
+        elif in_table:
+            in_table = False
+
+    total_match = re.search(r"\*\*Total:\s*~?(\d[\d,]*)\s*tests", content)
+    suite_match = re.search(r"\(~?(\d+)\s*suites?\)", content)
+    total = int(total_match.group(1).replace(",", "")) if total_match else None
+    suites = int(suite_match.group(1)) if suite_match else None
+    return modules, total, suites
+
+
+# ── Census ──────────────────────────────────────────────────────────────
+
+
+def _load_disk_cache(path: str) -> Dict[str, list]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _git_commit_count(root: str) -> int:
+    try:
+        result = subprocess.run(["git", "rev-list", "--count", "HEAD"],
+                                capture_output=True, text=True, timeout=10, cwd=root)
+        return int(result.stdout.strip()) if result.returncode == 0 else 0
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return 0
+
+
+def take_census(root: Optional[str] = None, use_disk_cache: bool = True,
+                git: bool = True, scan_files: bool = True) -> ProjectCensus:
+    """Walk the project once and return a ProjectCensus.
+
+    scan_files=False skips the tree walk for consumers that only need the
+    parsed docs; git=False skips the commit count.
+    """
+    root = os.path.abspath(root or PROJECT_ROOT)
+    census = ProjectCensus(root=root, taken_at=time.time())
+    if not os.path.isdir(root):
+        return census
+    if scan_files:
+        census.files, census.files_read = _scan_files(root, use_disk_cache)
+    _read_docs(census)
+    if git:
+        census.git_commits = _git_commit_count(root)
+    return census
+
+
+def _scan_files(root: str, use_disk_cache: bool) -> Tuple[List[SourceFile], int]:
+    """One scandir pass over root; (mtime, size)-cached line and test counts."""
+
+    cache_path = os.path.join(root, CACHE_FILENAME)
+    disk = _load_disk_cache(cache_path) if use_disk_cache else {}
+    disk_dirty = False
+
+    files: List[SourceFile] = []
+    files_read = 0
+    stack = [(root, "")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(dirpath))
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name in SKIP_DIRS:
+                continue
+            rel = f"{rel_dir}{name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + "/"))
+                    continue
+                if not name.endswith(".py") or not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            cached = _FILE_CACHE.get(entry.path)
+            if cached is None or cached[:2] != key:
+                on_disk = disk.get(rel)
+                if on_disk and tuple(on_disk[:2]) == key:
+                    cached = (key[0], key[1], on_disk[2], on_disk[3])
+                else:
+                    try:
+                        lines, tests = _count_file(entry.path, name.startswith("test_"))
+                    except OSError:
+                        continue
+                    cached = (key[0], key[1], lines, tests)
+                    files_read += 1
+                _FILE_CACHE[entry.path] = cached
+            if list(cached) != disk.get(rel):
+                disk[rel] = list(cached)
+                disk_dirty = True
+            files.append(SourceFile(path=rel, lines=cached[2], tests=cached[3]))
+    files.sort(key=lambda f: f.path)
+
+    if use_disk_cache:
+        seen = {f.path for f in files}
+        stale = [k for k in disk if k not in seen]
+        for k in stale:
+            del disk[k]
+        if disk_dirty or stale:
+            try:
+                tmp = cache_path + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump(disk, f, separators=(",", ":"))
+                os.replace(tmp, cache_path)
+            except OSError:
+                pass  # cache is an optimization only
+    return files, files_read
+
+
+def _read_docs(census: ProjectCensus) -> None:
+    for name in DOC_FILES:
+        path = os.path.join(census.root, name)
+        try:
+            with open(path) as f:
+                census.docs[name] = f.read()
+        except OSError:
+            census.docs[name] = ""
+    (census.index_modules, census.index_total_tests,
+     census.index_total_suites) = parse_index(census.doc("PROJECT_INDEX.md"))
+    session_match = re.search(r"Session\s+(\d+)", census.doc("SESSION_STATE.md"))
+    census.session_number = int(session_match.group(1)) if session_match else 0
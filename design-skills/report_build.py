@@ -0,0 +1,435 @@
+"""Incremental report builds — recompile a Typst PDF only when its inputs change.
+
+ReportRenderer.render() is a cold `typst compile` every time, and the
+generate command used to rewrite the data JSON and every chart SVG before
+calling it. ReportBuilder sits in front of the renderer and fingerprints
+each input of a report job:
+
+    data      one hash per top-level section of the report JSON (the same
+              dict the sidecar archives), so a build can say *what* changed
+    charts    the data hash plus the chart renderer's version and design
+              tokens; unchanged -> the chart step is skipped outright,
+              changed -> ReportChartGenerator re-renders through its
+              content-keyed RenderCache and rewrites only the SVGs that differ
+    template  every .typ file in the template's directory (templates may
+              #import siblings)
+
+The fingerprints and the size/mtime of each PDF are kept in
+<build_dir>/manifest.json. A job whose fingerprints and output all match
+is reported "up-to-date" without starting Typst. Data files are rewritten
+only when their bytes change, so Typst sees stable inputs.
+
+Jobs run in parallel (one Typst process each). With watch=True every job
+gets a persistent `typst watch` process instead of a cold compile, so
+rebuilds after a small data change reuse Typst's in-memory incremental
+compilation; call close() (or use the builder as a context manager) to
+stop them.
+
+Usage:
+    from report_build import ReportBuilder, ReportJob
+    with ReportBuilder(build_dir="/tmp/cca_report_build") as builder:
+        results = builder.build([
+            ReportJob("report", "cca-report", "CCA_REPORT.pdf", data),
+            ReportJob("kalshi", "cca-report", "KALSHI_REPORT.pdf", kalshi_data),
+        ])
+    for r in results:
+        print(r.name, r.status, r.changed)
+
+Stdlib only. Requires the `typst` CLI for anything but up-to-date builds.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from chart_generator import RENDER_VERSION, RenderCache, _TOKENS_KEY
+from report_charts import RENDER_CACHE_DIR, ReportChartGenerator
+from report_generator import ReportRenderer
+
+DEFAULT_BUILD_DIR = os.path.join(tempfile.gettempdir(), "cca_report_build")
+MANIFEST_FILENAME = "manifest.json"
+WATCH_TIMEOUT = 120          # seconds to wait for a `typst watch` recompile
+WATCH_SETTLE = 0.3           # quiet period that ends a burst of watch recompiles
+
+_COMPILED_RE = re.compile(r"compiled (successfully|with warnings|with errors)")
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _dump(data: dict) -> str:
+    return json.dumps(data, indent=2, default=str)
+
+
+def section_hashes(data: dict) -> Dict[str, str]:
+    """One fingerprint per top-level key of the report data."""
+    return {key: _digest(json.dumps(value, sort_keys=True, default=str).encode())
+            for key, value in data.items()}
+
+
+def template_hash(typ_path: str) -> str:
+    """Fingerprint of every .typ file next to the template (imports included)."""
+    h = hashlib.sha256()
+    for path in sorted(Path(typ_path).parent.glob("*.typ")):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _write_if_changed(path: str, text: str) -> bool:
+    """Write text to path unless it already holds exactly that. True if written.
+
+    Written in place rather than via rename so a running `typst watch`
+    keeps watching the same file.
+    """
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, "w") as f:
+        f.write(text)
+    return True
+
+
+def _output_stamp(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+# ── Jobs and results ────────────────────────────────────────────────────
+
+
+@dataclass
+class ReportJob:
+    """One PDF to build: a template rendered against a data dict."""
+    name: str
+    template: str
+    output: str
+    data: dict
+    charts: bool = True
+
+
+@dataclass
+class BuildResult:
+    name: str
+    output: str
+    status: str                                   # "up-to-date", "compiled" or "failed"
+    changed: List[str] = field(default_factory=list)   # sections / "template" / "charts" / "output"
+    charts_rendered: bool = False
+    seconds: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+# ── Persistent Typst process ────────────────────────────────────────────
+
+
+class TypstWatcher:
+    """A `typst watch` process; counts the compiles it reports on stderr."""
+
+    def __init__(self, typ_path, data_path, output_path, chart_dir=None):
+        self.cmd = ["typst", "watch", "--root", "/",
+                    "--input", f"data={os.path.abspath(data_path)}"]
+        if chart_dir:
+            self.cmd.extend(["--input", f"chart_dir={os.path.abspath(chart_dir)}"])
+        self.cmd.extend([typ_path, output_path])
+        self.compiles = 0
+        self.last_ok = True
+        self._proc = None
+        self._exited = False
+        self._log = deque(maxlen=200)
+        self._cond = threading.Condition()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self):
+        self._proc = subprocess.Popen(self.cmd, stdin=subprocess.DEVNULL,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                      text=True, bufsize=1)
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self._proc.stderr:
+            line = _ANSI_RE.sub("", line).rstrip()
+            match = _COMPILED_RE.search(line)
+            with self._cond:
+                self._log.append(line)
+                if match:
+                    self.compiles += 1
+                    self.last_ok = match.group(1) != "with errors"
+                    self._cond.notify_all()
+        with self._cond:
+            self._exited = True
+            self._cond.notify_all()
+
+    def wait(self, after: int, timeout: float = WATCH_TIMEOUT, settle: float = 0.0) -> bool:
+        """Block until a compile newer than `after` finishes; True if it succeeded.
+
+        With settle > 0, keep waiting while further compiles follow within
+        settle seconds, so several input writes that Typst picked up in
+        separate passes all land before returning.
+        """
+        with self._cond:
+            done = self._cond.wait_for(
+                lambda: self.compiles > after or self._exited, timeout)
+            if self.compiles > after:
+                seen = self.compiles
+                while settle > 0 and self._cond.wait_for(
+                        lambda: self.compiles > seen or self._exited, settle):
+                    if self.compiles == seen:
+                        break
+                    seen = self.compiles
+                return self.last_ok
+            output = "\n".join(self._log)
+        reason = "exited" if done else f"did not recompile within {timeout}s"
+        raise RuntimeError(f"typst watch {reason}: {output}")
+
+    def stop(self):
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        self._proc = None
+
+
+# ── Builder ─────────────────────────────────────────────────────────────
+
+
+class ReportBuilder:
+    """Builds ReportJobs incrementally; see the module docstring."""
+
+    def __init__(self, build_dir=None, renderer=None, watch=False, workers=None,
+                 watch_timeout=WATCH_TIMEOUT):
+        self.build_dir = build_dir or DEFAULT_BUILD_DIR
+        self.renderer = renderer or ReportRenderer()
+        self.watch = watch
+        self.workers = workers
+        self.watch_timeout = watch_timeout
+        self.manifest_path = os.path.join(self.build_dir, MANIFEST_FILENAME)
+        self.chart_cache = RenderCache(directory=os.path.join(self.build_dir, RENDER_CACHE_DIR))
+        self._watchers: Dict[str, TypstWatcher] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Stop any `typst watch` processes."""
+        for watcher in self._watchers.values():
+            watcher.stop()
+        self._watchers.clear()
+
+    def job_dir(self, job: ReportJob) -> str:
+        return os.path.join(self.build_dir, job.name)
+
+    def data_path(self, job: ReportJob) -> str:
+        return os.path.join(self.job_dir(job), "data.json")
+
+    def chart_dir(self, job: ReportJob) -> Optional[str]:
+        return os.path.join(self.job_dir(job), "charts") if job.charts else None
+
+    # ── Manifest ────────────────────────────────────────────────────────
+
+    def load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict):
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    # ── Building ────────────────────────────────────────────────────────
+
+    def build(self, jobs: List[ReportJob], force: bool = False) -> List[BuildResult]:
+        """Bring every job's PDF up to date, compiling changed jobs in parallel."""
+        names = [job.name for job in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate report job names: {names}")
+        os.makedirs(self.build_dir, exist_ok=True)
+        manifest = self.load_manifest()
+
+        # Assets are prepared serially (chart rendering already fans out to
+        # processes); only the Typst compiles run concurrently.
+        plans = [self._prepare(job, manifest.get(job.name, {}), force) for job in jobs]
+        pending = [p for p in plans if p["result"].status != "up-to-date"]
+        if pending:
+            workers = self.workers or min(len(pending), os.cpu_count() or 1)
+            if workers > 1 and len(pending) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(self._compile, pending))
+            else:
+                for plan in pending:
+                    self._compile(plan)
+
+        for plan in plans:
+            result = plan["result"]
+            if result.ok:
+                entry = plan["entry"]
+                entry["output_stamp"] = _output_stamp(result.output)
+                manifest[result.name] = entry
+            else:
+                manifest.pop(result.name, None)
+        self._save_manifest(manifest)
+        return [plan["result"] for plan in plans]
+
+    def _prepare(self, job: ReportJob, previous: dict, force: bool) -> dict:
+        start = time.perf_counter()
+        os.makedirs(self.job_dir(job), exist_ok=True)
+        output = os.path.abspath(job.output)
+        typ_path = self.renderer.template_path(job.template)
+        result = BuildResult(name=job.name, output=output, status="compiled")
+        plan = {"job": job, "result": result, "typ_path": typ_path,
+                "touched": False, "start": start}
+
+        try:
+            tmpl = template_hash(typ_path) if os.path.exists(typ_path) else ""
+            text = _dump(job.data)
+            data_hash = _digest(text.encode())
+            sections = section_hashes(job.data)
+        except (OSError, TypeError, ValueError) as e:
+            result.status, result.error = "failed", str(e)
+            return plan
+        charts_key = _digest(f"{data_hash}:{RENDER_VERSION}:{_TOKENS_KEY}".encode()) if job.charts else ""
+        entry = {"template": tmpl, "template_name": job.template, "sections": sections,
+                 "charts": charts_key, "output": output}
+        plan["entry"] = entry
+
+        old_sections = previous.get("sections", {})
+        result.changed = sorted(k for k in set(sections) | set(old_sections)
+                                if sections.get(k) != old_sections.get(k))
+        if tmpl != previous.get("template") or job.template != previous.get("template_name"):
+            result.changed.append("template")
+            plan["touched"] = True
+        if output != previous.get("output") or _output_stamp(output) is None \
+                or _output_stamp(output) != previous.get("output_stamp"):
+            result.changed.append("output")
+
+        watcher = self._live_watcher(job, output)
+        plan["compiles_before"] = watcher.compiles if watcher else 0
+
+        if _write_if_changed(self.data_path(job), text):
+            plan["touched"] = True
+
+        chart_dir = self.chart_dir(job)
+        if chart_dir:
+            stale = charts_key != previous.get("charts") or not os.path.isdir(chart_dir)
+            if stale or force:
+                before = _dir_stamps(chart_dir)
+                try:
+                    ReportChartGenerator(output_dir=chart_dir, cache=self.chart_cache).save_all(job.data)
+                except Exception as e:
+                    # Charts are optional — the template renders without them
+                    print(f"Charts skipped for {job.name}: {e}")
+                result.charts_rendered = True
+                if _dir_stamps(chart_dir) != before:
+                    result.changed.append("charts")
+                    plan["touched"] = True
+
+        if not result.changed and not force:
+            result.status = "up-to-date"
+            result.seconds = time.perf_counter() - start
+        return plan
+
+    def _compile(self, plan: dict):
+        job, result = plan["job"], plan["result"]
+        if result.status == "failed":
+            return
+        try:
+            if self.watch:
+                self._compile_watched(plan)
+            else:
+                self._render(plan)
+        except (RuntimeError, OSError) as e:
+            result.status, result.error = "failed", str(e)
+        result.seconds = time.perf_counter() - plan["start"]
+
+    def _render(self, plan: dict):
+        job = plan["job"]
+        self.renderer.render(job.template, self.data_path(job), plan["result"].output,
+                             chart_dir=self.chart_dir(job))
+
+    def _live_watcher(self, job: ReportJob, output: str) -> Optional[TypstWatcher]:
+        watcher = self._watchers.get(job.name)
+        if watcher is not None and watcher.running and watcher.cmd[-1] == output:
+            return watcher
+        return None
+
+    def _compile_watched(self, plan: dict):
+        job, result = plan["job"], plan["result"]
+        watcher = self._live_watcher(job, result.output)
+        if watcher is not None:
+            if plan["touched"]:
+                # Inputs were rewritten after compiles_before was read, so
+                # the next reported compile is the one that picked them up.
+                ok = watcher.wait(plan["compiles_before"], self.watch_timeout,
+                                  settle=WATCH_SETTLE)
+            else:
+                # Nothing the watcher would notice changed (e.g. the PDF was
+                # deleted); a one-off compile restores it.
+                ok = False
+            if not ok:
+                self._render(plan)   # raises with Typst's full error output
+            return
+
+        if not shutil.which("typst"):
+            raise RuntimeError("Typst is not installed. Install with: brew install typst")
+        if not os.path.exists(plan["typ_path"]):
+            raise RuntimeError(f"Template not found: {plan['typ_path']}")
+        old = self._watchers.pop(job.name, None)
+        if old is not None:
+            old.stop()
+        watcher = TypstWatcher(plan["typ_path"], self.data_path(job), result.output,
+                               chart_dir=self.chart_dir(job))
+        watcher.start()
+        self._watchers[job.name] = watcher
+        # A fresh watcher compiles the current inputs on startup
+        if not watcher.wait(0, self.watch_timeout):
+            self._render(plan)
+
+
+def _dir_stamps(directory: str) -> Dict[str, int]:
+    try:
+        return {e.name: e.stat().st_mtime_ns for e in os.scandir(directory)
+                if e.name.endswith(".svg")}
+    except OSError:
+        return {}
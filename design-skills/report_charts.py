@@ -8,8 +8,14 @@ Usage:
     gen = ReportChartGenerator(output_dir="/tmp/charts")
     charts = gen.generate_all(report_data)  # dict of name -> SVG string
     paths = gen.save_all(report_data)        # dict of name -> file path
+
+Rendering goes through chart_generator's content-addressed RenderCache
+(kept in output_dir/.render-cache when output_dir is set), so a rebuild
+only re-renders charts whose data changed; generate_all() renders the
+remaining ones in one render_batch() call.
 """
 import os
+import re
 import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
@@ -36,7 +42,10 @@ from chart_generator import (
     SlopeChart,
     StackedBarChart,
     TreemapChart,
+    RenderCache,
+    render_batch,
     render_svg,
+    write_svgs,
 )
 from figure_generator import (
     Figure,
@@ -46,11 +55,28 @@ from figure_generator import (
 )
 
 
+RENDER_CACHE_DIR = ".render-cache"
+_DEFERRED = "<!--deferred-chart:{}-->"
+_DEFERRED_RE = re.compile(r"<!--deferred-chart:(\d+)-->")
+
+
 class ReportChartGenerator:
     """Generates SVG charts from CCA report data for PDF embedding."""
 
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, cache=None, workers=None):
         self.output_dir = output_dir
+        if cache is None and output_dir:
+            cache = RenderCache(directory=os.path.join(output_dir, RENDER_CACHE_DIR))
+        self.cache = cache
+        self.workers = workers
+        self._deferred = None
+
+    def _render(self, chart):
+        """Render now, or queue for generate_all's batch and return a placeholder."""
+        if self._deferred is None:
+            return render_svg(chart, cache=self.cache)
+        self._deferred.append(chart)
+        return _DEFERRED.format(len(self._deferred) - 1)
 
     # ── Individual charts ───────────────────────────────────────────────
 
@@ -65,7 +91,7 @@ class ReportChartGenerator:
         items = [(m["name"], m["tests"]) for m in sorted_mods]
 
         chart = HorizontalBarChart(items, title="Tests per Module", show_values=True)
-        return render_svg(chart)
+        return self._render(chart)
 
     def intelligence_chart(self, data):
         """Donut chart of intelligence verdict distribution."""
@@ -99,7 +125,7 @@ class ReportChartGenerator:
             return self._empty_chart("Intelligence Verdicts")
 
         chart = DonutChart(segments, title="Intelligence Verdicts")
-        return render_svg(chart)
+        return self._render(chart)
 
     def mt_status_chart(self, data):
         """Bar chart of MT status breakdown (complete/active/pending)."""
@@ -116,7 +142,7 @@ class ReportChartGenerator:
             ("Pending", pending),
         ]
         chart = BarChart(items, title="Master Task Status")
-        return render_svg(chart)
+        return self._render(chart)
 
     def loc_chart(self, data):
         """Bar chart of source LOC vs test LOC."""
@@ -129,7 +155,7 @@ class ReportChartGenerator:
 
         items = [("Source", source), ("Test", test)]
         chart = BarChart(items, title="Lines of Code")
-        return render_svg(chart)
+        return self._render(chart)
 
     def mt_progress_chart(self, data):
         """Stacked bar chart showing phase progress for active MTs."""
@@ -151,7 +177,7 @@ class ReportChartGenerator:
             series_names=["Done", "Remaining"],
             title="MT Phase Progress",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def frontier_chart(self, data):
         """Horizontal bar chart of frontier test coverage."""
@@ -161,7 +187,7 @@ class ReportChartGenerator:
 
         items = [(f["name"], f.get("tests", 0)) for f in frontiers]
         chart = HorizontalBarChart(items, title="Frontier Test Coverage", width=600)
-        return render_svg(chart)
+        return self._render(chart)
 
     def module_loc_treemap(self, data):
         """Treemap of source LOC per module — visual size comparison."""
@@ -181,7 +207,7 @@ class ReportChartGenerator:
             return self._empty_chart("Module Size (LOC)")
 
         chart = TreemapChart(data=items, title="Module Size (LOC)")
-        return render_svg(chart)
+        return self._render(chart)
 
     # ── CCA statistical charts (MT-32) ─────────────────────────────────
 
@@ -205,7 +231,7 @@ class ReportChartGenerator:
             height=400,
             show_trend=True,
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def module_composition(self, data):
         """StackedBarChart: source LOC vs test LOC — code composition."""
@@ -221,7 +247,7 @@ class ReportChartGenerator:
             series_names=["Source", "Test"],
             title="Code Composition (LOC)",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def test_distribution(self, data):
         """HistogramChart: distribution of test counts per file.
@@ -240,7 +266,7 @@ class ReportChartGenerator:
             y_label="Number of Files",
             bins=10,
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def coverage_ratio_chart(self, data):
         """HorizontalBarChart: tests per 100 LOC per module — test density comparison.
@@ -268,7 +294,7 @@ class ReportChartGenerator:
             show_values=True,
             width=600,
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def hook_coverage_chart(self, data):
         """BarChart: hook count per lifecycle event — shows hook chain distribution."""
@@ -289,7 +315,7 @@ class ReportChartGenerator:
         items = sorted(event_counts.items(), key=lambda x: x[1], reverse=True)
 
         chart = BarChart(items, title="Hooks per Lifecycle Event", show_values=True)
-        return render_svg(chart)
+        return self._render(chart)
 
     def module_tests_lollipop(self, data):
         """LollipopChart: test counts per module — cleaner alternative to bar chart."""
@@ -300,7 +326,7 @@ class ReportChartGenerator:
         items = [(m["name"], m["tests"]) for m in sorted_mods]
         chart = LollipopChart(items, title="Tests per Module", show_values=True,
                               color=CCA_COLORS["accent"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def module_tests_pareto(self, data):
         """ParetoChart: test counts per module — 80/20 analysis of test distribution."""
@@ -310,7 +336,7 @@ class ReportChartGenerator:
         sorted_mods = sorted(modules, key=lambda m: m.get("tests", 0), reverse=True)
         items = [(m["name"], m["tests"]) for m in sorted_mods]
         chart = ParetoChart(data=items, title="Test Distribution — 80/20 Analysis")
-        return render_svg(chart)
+        return self._render(chart)
 
     def test_pass_gauge(self, data):
         """GaugeChart: test pass rate as a speedometer gauge."""
@@ -328,7 +354,7 @@ class ReportChartGenerator:
             title="Test Pass Rate",
             label=f"{passed}/{total}",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_wr_dumbbell(self, data):
         """DumbbellChart: per-asset WR range (min bucket WR to max bucket WR).
@@ -350,7 +376,7 @@ class ReportChartGenerator:
             right_label="Max Bucket WR",
             title="Win Rate Range by Asset",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     # ── Kalshi financial charts (MT-33) ─────────────────────────────────
 
@@ -369,7 +395,7 @@ class ReportChartGenerator:
         items = list(zip(thinned, values))
         chart = LineChart(items, title="Cumulative P&L ($)", show_points=True,
                           color=CCA_COLORS["success"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_strategy_winrate(self, data):
         """HorizontalBarChart: win rate by strategy."""
@@ -385,7 +411,7 @@ class ReportChartGenerator:
         items = list(zip(labels[:10], values[:10]))
         chart = HorizontalBarChart(items, title="Win Rate by Strategy (%)",
                                    show_values=True, color=CCA_COLORS["primary"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_daily_pnl_histogram(self, data):
         """HistogramChart: daily P&L distribution."""
@@ -398,7 +424,7 @@ class ReportChartGenerator:
             return self._empty_chart("Daily P&L Distribution")
         chart = HistogramChart(values, title="Daily P&L Distribution ($)",
                                color=CCA_COLORS["accent"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_strategy_pnl_box(self, data):
         """BoxPlot: P&L distribution per strategy."""
@@ -416,7 +442,7 @@ class ReportChartGenerator:
         paired = paired[:8]
         box_data = [(p[0], p[1]) for p in paired]
         chart = BoxPlot(box_data, title="P&L Distribution by Strategy ($)")
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_winrate_vs_profit(self, data):
         """ScatterPlot: win rate vs avg profit per strategy."""
@@ -432,7 +458,7 @@ class ReportChartGenerator:
                     "data": [(p["x"], p["y"]) for p in points]}]
         chart = ScatterPlot(series, title="Win Rate vs Avg Profit",
                             x_label="Win Rate (%)", y_label="Avg P&L ($)")
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_trade_volume(self, data):
         """DonutChart: trade count by strategy."""
@@ -455,7 +481,7 @@ class ReportChartGenerator:
         palette = SERIES_PALETTE[:len(labels)]
         items = [(l, v, c) for l, v, c in zip(labels, values, palette)]
         chart = DonutChart(items, title="Trade Volume by Strategy")
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_bankroll(self, data):
         """AreaChart: bankroll balance over time."""
@@ -470,7 +496,7 @@ class ReportChartGenerator:
         thinned = self._thin_labels(labels, max_labels=12)
         items = list(zip(thinned, values))
         chart = AreaChart(items, title="Bankroll ($)", color=CCA_COLORS["primary"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_calibration(self, data):
         """CalibrationPlot: predicted probability vs actual win rate (FLB analysis).
@@ -500,7 +526,7 @@ class ReportChartGenerator:
             x_label="Contract Price",
             y_label="Actual Win Rate",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_price_candles(self, data):
         """CandlestickChart: OHLC price bars for contract price movement.
@@ -523,7 +549,7 @@ class ReportChartGenerator:
             data=items,
             title=candle_data.get("title", "Contract Price Movement"),
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_edge_forest(self, data):
         """ForestPlot: per-asset/price alpha with confidence intervals.
@@ -547,7 +573,7 @@ class ReportChartGenerator:
             title="Alpha by Asset/Price Bucket",
             reference_value=0.0,
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_bankroll_bullet(self, data):
         """BulletChart: bankroll actual vs target with qualitative ranges.
@@ -577,7 +603,7 @@ class ReportChartGenerator:
             subtitle=bullet_data.get("subtitle", "vs target"),
             unit=" USD",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     def kalshi_guard_slope(self, data):
         """SlopeChart: win rate before vs after guard deployment per asset.
@@ -604,7 +630,7 @@ class ReportChartGenerator:
             right_label=slope_data.get("right_label", "Post-Guard"),
             title="Win Rate: Guard Impact",
         )
-        return render_svg(chart)
+        return self._render(chart)
 
     # ── Self-learning charts (MT-33 Phase 5) ────────────────────────────
 
@@ -621,7 +647,7 @@ class ReportChartGenerator:
         items = list(zip(labels[:10], values[:10]))
         chart = BarChart(items, title="Journal Event Types", show_values=True,
                          color=CCA_COLORS["accent"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def learning_apf_trend(self, data):
         """LineChart: APF score over sessions."""
@@ -636,7 +662,7 @@ class ReportChartGenerator:
         items = list(zip(labels, values))
         chart = LineChart(items, title="Actionable Post Fraction (%)",
                           show_points=True, color=CCA_COLORS["primary"])
-        return render_svg(chart)
+        return self._render(chart)
 
     def learning_domain_distribution(self, data):
         """DonutChart: journal entries by domain."""
@@ -651,7 +677,7 @@ class ReportChartGenerator:
         palette = SERIES_PALETTE[:len(labels)]
         items = [(l, v, c) for l, v, c in zip(labels, values, palette)]
         chart = DonutChart(items, title="Events by Domain")
-        return render_svg(chart)
+        return self._render(chart)
 
     def _thin_labels(self, labels, max_labels=12):
         """Thin labels for chart readability — show every Nth."""
@@ -664,6 +690,29 @@ class ReportChartGenerator:
 
     def generate_all(self, data):
         """Generate all charts, return dict of name -> SVG string."""
+        self._deferred = []
+        try:
+            charts = self._build_all(data)
+        finally:
+            deferred, self._deferred = self._deferred, None
+        svgs = render_batch(deferred, cache=self.cache, workers=self.workers)
+
+        def resolve(svg):
+            m = _DEFERRED_RE.fullmatch(svg)
+            return svgs[int(m.group(1))] if m else svg
+
+        charts = {k: resolve(v) for k, v in charts.items()}
+        # Summary figure (MT-32 Phase 7)
+        charts["summary_figure"] = self.generate_summary_figure(data)
+        # Replace empty "No data" charts with a minimal invisible SVG
+        # so Typst embed-chart() calls don't error on missing files
+        _invisible = '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"/>'
+        charts = {k: (v if "No data</text>" not in v else _invisible)
+                  for k, v in charts.items()}
+        return charts
+
+    def _build_all(self, data):
+        """Call every chart method; with deferral on, values are placeholders."""
         charts = {
             "module_tests": self.module_tests_chart(data),
             "intelligence": self.intelligence_chart(data),
@@ -709,13 +758,6 @@ class ReportChartGenerator:
                 "learning_apf_trend": self.learning_apf_trend(data),
                 "learning_domain_distribution": self.learning_domain_distribution(data),
             })
-        # Summary figure (MT-32 Phase 7)
-        charts["summary_figure"] = self.generate_summary_figure(data)
-        # Replace empty "No data" charts with a minimal invisible SVG
-        # so Typst embed-chart() calls don't error on missing files
-        _invisible = '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"/>'
-        charts = {k: (v if "No data</text>" not in v else _invisible)
-                  for k, v in charts.items()}
         return charts
 
     def save_all(self, data):
@@ -724,16 +766,7 @@ class ReportChartGenerator:
             raise ValueError("output_dir must be set to save charts")
 
         os.makedirs(self.output_dir, exist_ok=True)
-        charts = self.generate_all(data)
-        paths = {}
-
-        for name, svg in charts.items():
-            path = os.path.join(self.output_dir, f"{name}.svg")
-            with open(path, "w") as f:
-                f.write(svg)
-            paths[name] = path
-
-        return paths
+        return write_svgs(self.generate_all(data), self.output_dir)
 
     # ── Multi-panel figures (MT-32 Phase 7) ─────────────────────────────
 
@@ -798,7 +831,7 @@ class ReportChartGenerator:
         title = f"Project Overview — S{session_num}"
 
         fig = Figure(panels=panels, cols=2, title=title)
-        return render_figure(fig)
+        return render_figure(fig, cache=self.cache)
 
     def save_summary_figure(self, data, filename="summary_figure.svg"):
         """Generate and save summary figure to output_dir.
@@ -11,6 +11,10 @@ Usage:
 
     # Or from files:
     diff = differ.diff_from_files("old.json", "new.json")
+
+    # Or from the delta-encoded report history (ReportSidecar.history()):
+    diff = differ.diff_from_archive(archive, "2026-03-20_S120", "2026-03-22_S122")
+    trend = differ.summary_trend(archive, "total_tests", start="2026-01-01")
 """
 import json
 import os
@@ -59,6 +63,21 @@ class ReportDiffer:
         except (json.JSONDecodeError, OSError):
             return None
 
+    def diff_from_archive(self, archive, old_key, new_key):
+        """Diff two reports held in a SnapshotArchive. Returns None if either is missing."""
+        old = archive.get(old_key)
+        new = archive.get(new_key)
+        if old is None or new is None:
+            return None
+        return self.diff_reports(old, new)
+
+    def summary_trend(self, archive, field, start=None, end=None):
+        """[(key, value)] of one summary field across archived reports, oldest first.
+
+        Walks the archive's delta log once instead of loading each report.
+        """
+        return archive.series(f"summary.{field}", start=start, end=end)
+
     def _diff_sessions(self, old, new):
         return {
             "old": old.get("session"),
@@ -3,9 +3,12 @@
 Usage:
     python3 design-skills/report_generator.py generate --output report.pdf
     python3 design-skills/report_generator.py generate --output report.pdf --session 52
+    python3 design-skills/report_generator.py generate --output report.pdf --also cca-report=archive.pdf
+    python3 design-skills/report_generator.py generate --output report.pdf --every 300
     python3 design-skills/report_generator.py templates
 
 Pipeline: Python collects CCA data -> JSON -> Typst template -> PDF
+(incremental: report_build.ReportBuilder recompiles only when inputs change)
 """
 import argparse
 import json
@@ -14,7 +17,7 @@ import re
 import shutil
 import subprocess
 import sys
-import tempfile
+import time
 from datetime import date
 from pathlib import Path
 
@@ -23,19 +26,31 @@ from report_charts import ReportChartGenerator
 from kalshi_data_collector import KalshiDataCollector
 from learning_data_collector import LearningDataCollector
 from report_differ import ReportDiffer
+from project_census import DOC_FILES, take_census
+from snapshot_archive import SnapshotArchive
 
 
 class CCADataCollector:
     """Collects CCA project data for comprehensive report generation."""
 
-    def __init__(self, project_root=None):
+    def __init__(self, project_root=None, census=None):
         if project_root is None:
             self.project_root = str(Path(__file__).parent.parent)
         else:
             self.project_root = project_root
+        self._census = census
+
+    @property
+    def census(self):
+        """ProjectCensus for this root, taken on first use (or the one passed in)."""
+        if self._census is None:
+            self._census = take_census(self.project_root)
+        return self._census
 
     def _read_file(self, relative_path):
         """Read a project file, return empty string if missing."""
+        if self._census is not None and relative_path in DOC_FILES:
+            return self._census.doc(relative_path)
         path = os.path.join(self.project_root, relative_path)
         if os.path.exists(path):
             with open(path) as f:
@@ -182,58 +197,30 @@ class CCADataCollector:
 
     def collect_module_stats(self):
         """Collect test count, LOC, and file count per module."""
+        census = self.census
+        state_content = census.doc("SESSION_STATE.md")
         modules = []
         for mod_def in self.MODULE_DEFINITIONS:
             mod_path = os.path.join(self.project_root, mod_def["path"])
             if not os.path.isdir(mod_path):
                 continue
 
-            # Count tests from PROJECT_INDEX.md (more reliable than scanning)
-            tests = 0
-            loc = 0
-            files = 0
-
-            # Count .py files (excluding tests)
-            for root, _, filenames in os.walk(mod_path):
-                for fn in filenames:
-                    if fn.endswith(".py"):
-                        fp = os.path.join(root, fn)
-                        line_count = self._count_lines(fp)
-                        if fn.startswith("test_"):
-                            tests_in_file = 0
-                            with open(fp) as f:
-                                for line in f:
-                                    if line.strip().startswith("def test_"):
-                                        tests_in_file += 1
-                            tests += tests_in_file
-                        else:
-                            loc += line_count
-                            files += 1
-
-            # Parse test count from PROJECT_INDEX.md (authoritative)
-            index_content = self._read_file("PROJECT_INDEX.md")
-            idx_match = re.search(
-                rf"\|\s*{re.escape(mod_def['name'])}\s*\|.*?\|\s*(\d+)\s*\|",
-                index_content,
-            )
-            if idx_match:
-                tests = int(idx_match.group(1))
+            # LOC/files/tests from the shared census walk
+            stats = census.module_stats(mod_def["path"])
+            tests = stats["tests"]
+            loc = stats["loc"]
+            files = stats["files"]
 
-            # Determine status from PROJECT_INDEX
+            # Test count and status from PROJECT_INDEX.md (authoritative)
             status = "ACTIVE"
-            status_match = re.search(
-                rf"\|\s*{re.escape(mod_def['name'])}\s*\|.*?\|\s*(.+?)\s*\|\s*\d+\s*\|",
-                index_content,
-            )
-            if status_match:
-                status_text = status_match.group(1).strip()
-                if "COMPLETE" in status_text.upper():
-                    status = "COMPLETE"
+            index_row = census.index_module(mod_def["name"])
+            if index_row is not None:
+                tests = index_row.tests
+                status = index_row.status
 
             # Determine next action for active modules
             next_action = ""
             if status != "COMPLETE":
-                state_content = self._read_file("SESSION_STATE.md")
                 # Look for module-related next items
                 mod_name_lower = mod_def["name"].lower()
                 for line in state_content.split("\n"):
@@ -526,20 +513,17 @@ class CCADataCollector:
         principle_scores = []
         sentinel_count = 0
         if os.path.exists(principles_path):
-            with open(principles_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        p = json.loads(line)
-                        principles_total += 1
-                        if "score" in p:
-                            principle_scores.append(p["score"])
-                        if "sentinel" in str(p.get("source", "")).lower():
-                            sentinel_count += 1
-                    except (json.JSONDecodeError, KeyError):
-                        continue
+            # Latest row per principle, with usage-log counters folded in
+            sl_dir = os.path.dirname(principles_path)
+            if sl_dir not in sys.path:
+                sys.path.append(sl_dir)
+            from principle_registry import load_principle_rows
+            for p in load_principle_rows(principles_path).values():
+                principles_total += 1
+                if "score" in p:
+                    principle_scores.append(p["score"])
+                if "sentinel" in str(p.get("source_context", "")).lower():
+                    sentinel_count += 1
 
         avg_principle_score = sum(principle_scores) / len(principle_scores) if principle_scores else 0
         sentinel_pct = f"{sentinel_count / principles_total * 100:.0f}%" if principles_total > 0 else "0%"
@@ -1047,34 +1031,18 @@ class CCADataCollector:
         the number of `def test_` methods found in that file. Files with zero
         test methods are excluded.
         """
-        counts = []
-        root = Path(self.project_root)
-        if not root.is_dir():
-            return counts
-        for test_file in sorted(root.rglob("test_*.py")):
-            # Skip .claude/ and .planning/ directories
-            parts = test_file.parts
-            if ".claude" in parts or ".planning" in parts:
-                continue
-            try:
-                content = test_file.read_text(errors="replace")
-                n = sum(1 for line in content.splitlines()
-                        if line.strip().startswith("def test_"))
-                if n > 0:
-                    counts.append(n)
-            except (OSError, PermissionError):
-                continue
-        return counts
+        if not os.path.isdir(self.project_root):
+            return []
+        return self.census.test_counts()
 
     # ── Main collection ─────────────────────────────────────────────────
 
     def collect_from_project(self, session=None):
         """Collect all data from the actual CCA project files."""
-        # Get session number
-        state_content = self._read_file("SESSION_STATE.md")
+        # One walk of the tree; every collector below reads from it
+        census = self.census
         if not session:
-            session_match = re.search(r"Session (\d+)", state_content)
-            session = int(session_match.group(1)) if session_match else 0
+            session = census.session_number
 
         # Collect all data
         modules = self.collect_module_stats()
@@ -1088,71 +1056,21 @@ class CCADataCollector:
         priority_queue = self.collect_priority_queue()
 
         # Use authoritative test count from PROJECT_INDEX.md
-        index_content = self._read_file("PROJECT_INDEX.md")
-        total_match = re.search(r"\*\*Total:\s*~?(\d[\d,]*)\s*tests", index_content)
-        total_tests = int(total_match.group(1).replace(",", "")) if total_match else sum(m["tests"] for m in modules)
-
-        # Also extract suite count
-        suite_match = re.search(r"\(~?(\d+)\s*suites?\)", index_content)
-        test_suites = int(suite_match.group(1)) if suite_match else len([m for m in modules if m["tests"] > 0])
-
-        source_loc = sum(m["loc"] for m in modules)
-        source_files = sum(m["files"] for m in modules)
-
-        # Get LOC from actual file scan for accuracy
-        try:
-            result = subprocess.run(
-                ["bash", "-c",
-                 '/usr/bin/find . -name "*.py" ! -path "./.claude/*" ! -path "./.planning/*" '
-                 '! -name "test_*" -exec cat {} + | wc -l'],
-                capture_output=True, text=True, cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                source_loc = int(result.stdout.strip())
-        except Exception:
-            pass
-
-        try:
-            result = subprocess.run(
-                ["bash", "-c",
-                 '/usr/bin/find . -name "test_*.py" ! -path "./.claude/*" -exec cat {} + | wc -l'],
-                capture_output=True, text=True, cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                test_loc = int(result.stdout.strip())
-        except Exception:
-            test_loc = 0
-
-        try:
-            result = subprocess.run(
-                ["bash", "-c", '/usr/bin/find . -name "*.py" ! -path "./.claude/*" '
-                 '! -path "./.planning/*" ! -name "test_*" | wc -l'],
-                capture_output=True, text=True, cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                source_files = int(result.stdout.strip())
-        except Exception:
-            pass
-
-        try:
-            result = subprocess.run(
-                ["bash", "-c", '/usr/bin/find . -name "test_*.py" ! -path "./.claude/*" | wc -l'],
-                capture_output=True, text=True, cwd=self.project_root,
-            )
-            if result.returncode == 0:
-                test_files = int(result.stdout.strip())
-        except Exception:
-            test_files = 0
+        if census.index_total_tests is not None:
+            total_tests = census.index_total_tests
+        else:
+            total_tests = sum(m["tests"] for m in modules)
+        if census.index_total_suites is not None:
+            test_suites = census.index_total_suites
+        else:
+            test_suites = len([m for m in modules if m["tests"] > 0])
 
-        # Git stats
-        try:
-            result = subprocess.run(
-                ["git", "rev-list", "--count", "HEAD"],
-                capture_output=True, text=True, cwd=self.project_root,
-            )
-            git_commits = int(result.stdout.strip()) if result.returncode == 0 else 0
-        except Exception:
-            git_commits = 0
+        # Project-wide LOC and file counts from the census walk
+        source_loc = census.source_loc
+        test_loc = census.test_loc
+        source_files = census.source_files
+        test_files = census.test_files
+        git_commits = census.git_commits
 
         # Project age — hardcoded start since git history may be squashed
         from datetime import datetime
@@ -1233,6 +1151,7 @@ class CCADataCollector:
 
 
 DEFAULT_ARCHIVE_DIR = os.path.expanduser("~/.cca-reports")
+HISTORY_SUBDIR = "history"
 
 
 class ReportSidecar:
@@ -1281,8 +1200,16 @@ class ReportSidecar:
         path = os.path.join(self.archive_dir, filename)
         with open(path, "w") as f:
             json.dump(data, f, indent=2)
+        try:
+            self.history().append(filename[:-len(".json")], data)
+        except (OSError, TypeError, ValueError):
+            pass  # the JSON file above is authoritative
         return path
 
+    def history(self):
+        """Delta-encoded archive of every report, keyed "{date}_S{session}"."""
+        return SnapshotArchive(os.path.join(self.archive_dir, HISTORY_SUBDIR))
+
     def list_archived_reports(self):
         """List all archived report JSON files, newest first."""
         if not os.path.isdir(self.archive_dir):
@@ -1403,12 +1330,85 @@ def parse_args(args=None):
     gen.add_argument("--template", "-t", default="cca-report", help="Template name")
     gen.add_argument("--session", "-s", type=int, help="Session number")
     gen.add_argument("--data", "-d", help="Custom JSON data file (skip collection)")
+    gen.add_argument("--also", action="append", default=[], metavar="TEMPLATE=OUTPUT",
+                     help="Build another PDF from the same data (repeatable, built in parallel)")
+    gen.add_argument("--build-dir", help="Incremental build directory (default: temp dir)")
+    gen.add_argument("--force", action="store_true", help="Recompile even if inputs are unchanged")
+    gen.add_argument("--every", type=float, metavar="SECONDS",
+                     help="Keep running: re-collect and rebuild on this interval "
+                          "through persistent `typst watch` processes")
 
     subparsers.add_parser("templates", help="List available templates")
 
     return parser.parse_args(args)
 
 
+def _collect_report_data(args):
+    """Report data from --data, or collected from the project with a cross-report diff."""
+    if args.data:
+        with open(args.data) as f:
+            return json.load(f)
+
+    project_root = str(Path(__file__).parent.parent)
+    collector = CCADataCollector(project_root=project_root)
+    data = collector.collect_from_project(session=args.session)
+
+    # Compute cross-report diff against most recent archived sidecar
+    try:
+        sidecar_mgr = ReportSidecar()
+        archives = sidecar_mgr.list_archived_reports()
+        if archives:
+            old_data = sidecar_mgr.load_report(archives[0])
+            if old_data:
+                differ = ReportDiffer()
+                data["report_diff"] = differ.diff_reports(old_data, data)
+                print(f"Report diff computed against {os.path.basename(archives[0])}")
+    except Exception as e:
+        print(f"Report diff skipped: {e}")
+
+    print(f"Data collected: {data['summary']['total_tests']} tests, "
+          f"{data['summary']['total_modules']} modules, "
+          f"{data['summary']['master_tasks']} master tasks, "
+          f"{data['summary']['total_findings']} findings")
+    return data
+
+
+def _report_jobs(args, data):
+    """The main report plus one job per --also TEMPLATE=OUTPUT."""
+    from report_build import ReportJob
+
+    jobs = [ReportJob("report", args.template, args.output, data)]
+    for spec in args.also:
+        template, sep, output = spec.partition("=")
+        if not sep or not template or not output:
+            raise SystemExit(f"--also expects TEMPLATE=OUTPUT, got {spec!r}")
+        stem = os.path.splitext(os.path.basename(output))[0]
+        jobs.append(ReportJob(f"{template}-{stem}", template, output, data))
+    return jobs
+
+
+def _build_reports(builder, args):
+    """One collect + incremental build pass. Returns True if every job succeeded."""
+    data = _collect_report_data(args)
+    results = builder.build(_report_jobs(args, data), force=args.force)
+    for result in results:
+        if not result.ok:
+            print(f"Report failed: {result.output}: {result.error}")
+            continue
+        changed = ", ".join(result.changed) or "nothing"
+        print(f"Report {result.status}: {result.output} "
+              f"({result.seconds:.2f}s; changed: {changed})")
+        print(f"Size: {os.path.getsize(result.output) / 1024:.1f} KB")
+
+    # JSON sidecar export (MT-33 Phase 6)
+    sidecar = ReportSidecar()
+    sidecar_path = sidecar.save_alongside_pdf(data, args.output)
+    archive_path = sidecar.save_to_archive(data)
+    print(f"Sidecar: {sidecar_path}")
+    print(f"Archived: {archive_path}")
+    return all(result.ok for result in results)
+
+
 def main():
     """CLI entry point."""
     args = parse_args()
@@ -1422,63 +1422,18 @@ def main():
         return
 
     if args.command == "generate":
-        renderer = ReportRenderer()
-        chart_dir = None
-
-        if args.data:
-            data_path = args.data
-            # Try to generate charts from provided data
-            try:
-                with open(data_path) as f:
-                    data = json.load(f)
-                chart_dir = os.path.join(tempfile.gettempdir(), "cca_report_charts")
-                chart_gen = ReportChartGenerator(output_dir=chart_dir)
-                chart_paths = chart_gen.save_all(data)
-                print(f"Charts generated: {len(chart_paths)} SVGs in {chart_dir}")
-            except Exception:
-                chart_dir = None  # Fall back to no charts
-        else:
-            project_root = str(Path(__file__).parent.parent)
-            collector = CCADataCollector(project_root=project_root)
-            data = collector.collect_from_project(session=args.session)
-
-            # Compute cross-report diff against most recent archived sidecar
-            try:
-                sidecar_mgr = ReportSidecar()
-                archives = sidecar_mgr.list_archived_reports()
-                if archives:
-                    old_data = sidecar_mgr.load_report(archives[0])
-                    if old_data:
-                        differ = ReportDiffer()
-                        data["report_diff"] = differ.diff_reports(old_data, data)
-                        print(f"Report diff computed against {os.path.basename(archives[0])}")
-            except Exception as e:
-                print(f"Report diff skipped: {e}")
-
-            data_path = os.path.join(tempfile.gettempdir(), "cca_report_data.json")
-            with open(data_path, "w") as f:
-                json.dump(data, f, indent=2)
-            print(f"Data collected: {data['summary']['total_tests']} tests, "
-                  f"{data['summary']['total_modules']} modules, "
-                  f"{data['summary']['master_tasks']} master tasks, "
-                  f"{data['summary']['total_findings']} findings")
-
-            # Generate charts from collected data
-            chart_dir = os.path.join(tempfile.gettempdir(), "cca_report_charts")
-            chart_gen = ReportChartGenerator(output_dir=chart_dir)
-            chart_paths = chart_gen.save_all(data)
-            print(f"Charts generated: {len(chart_paths)} SVGs in {chart_dir}")
-
-        output = renderer.render(args.template, data_path, args.output, chart_dir=chart_dir)
-        print(f"Report generated: {output}")
-        print(f"Size: {os.path.getsize(output) / 1024:.1f} KB")
-
-        # JSON sidecar export (MT-33 Phase 6)
-        sidecar = ReportSidecar()
-        sidecar_path = sidecar.save_alongside_pdf(data, args.output)
-        archive_path = sidecar.save_to_archive(data)
-        print(f"Sidecar: {sidecar_path}")
-        print(f"Archived: {archive_path}")
+        from report_build import ReportBuilder
+
+        with ReportBuilder(build_dir=args.build_dir, watch=bool(args.every)) as builder:
+            ok = _build_reports(builder, args)
+            while args.every:
+                try:
+                    time.sleep(args.every)
+                    ok = _build_reports(builder, args)
+                except KeyboardInterrupt:
+                    break
+        if not ok:
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -168,13 +168,16 @@ class SlideGenerator:
             os.unlink(data_path)
 
 
-def collect_slides_from_project(collector, session=None):
-    """Build slide deck from real CCA project data."""
+def collect_slides_from_project(collector, session=None, census=None):
+    """Build slide deck from real CCA project data.
+
+    census: optional ProjectCensus to reuse instead of walking the tree again.
+    """
     # Import the report data collector for real metrics
     sys.path.insert(0, os.path.dirname(__file__))
     from report_generator import CCADataCollector
 
-    data_collector = CCADataCollector(project_root=collector.project_root)
+    data_collector = CCADataCollector(project_root=collector.project_root, census=census)
     report_data = data_collector.collect_from_project(session=session)
 
     s = report_data["summary"]
@@ -0,0 +1,362 @@
+"""Snapshot archive — append-only history of JSON snapshots stored as deltas.
+
+Daily snapshots and report sidecars change a little from one day to the
+next, yet every reader (diffs, "history", trend charts) used to load one
+full JSON file per day. SnapshotArchive keeps the whole history in one
+append-only log instead:
+
+    <directory>/log.jsonl     one record per line: either a full "base"
+                              document or a "delta" (RFC 6902 JSON Patch
+                              against the record it follows)
+    <directory>/index.json    key -> byte offset of its latest record, so a
+                              lookup seeks straight to it
+
+A new base is written every REBASE_EVERY records (or whenever a delta would
+be more than half the size of the document), so rebuilding any key applies
+at most REBASE_EVERY - 1 patches. Range reads walk the log once, applying
+each delta to the running state, so a 90-day metric series costs one base
+plus 90 small patches rather than 90 full documents.
+
+Keys sort lexically (ISO dates, or "2026-03-22_S122" sidecar names).
+
+Usage:
+    from snapshot_archive import SnapshotArchive
+    archive = SnapshotArchive(".cca-daily-snapshots/archive")
+    archive.append("2026-03-20", snapshot)
+    archive.get("2026-03-20")                              # full dict
+    archive.series("totals.tests", start="2026-01-01")     # [(key, value), ...]
+    for key, snap in archive.iter_range("2026-03-01", "2026-03-31"): ...
+
+Stdlib only. No external dependencies.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+LOG_FILENAME = "log.jsonl"
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+REBASE_EVERY = 30       # records per delta chain before a fresh base is written
+
+_MISSING = object()
+
+
+# ── JSON Patch (RFC 6902 add / remove / replace) ────────────────────────
+
+
+def _escape(token) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[dict]:
+    """Operations that turn old into new (applied in order by apply_patch)."""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, f"{path}/{_escape(key)}"))
+        return ops
+    if isinstance(old, list):
+        return _list_patch(old, new, path)
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def _list_patch(old: list, new: list, path: str) -> List[dict]:
+    # Trim the common head and tail; lists such as test suites mostly grow
+    # or change in place, so what remains is small.
+    head = 0
+    limit = min(len(old), len(new))
+    while head < limit and old[head] == new[head]:
+        head += 1
+    tail = 0
+    while (tail < limit - head
+           and old[len(old) - 1 - tail] == new[len(new) - 1 - tail]):
+        tail += 1
+    old_mid = old[head:len(old) - tail]
+    new_mid = new[head:len(new) - tail]
+    ops = []
+    common = min(len(old_mid), len(new_mid))
+    for i in range(common):
+        ops.extend(make_patch(old_mid[i], new_mid[i], f"{path}/{head + i}"))
+    for i in range(len(old_mid) - 1, common - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{head + i}"})
+    for i in range(common, len(new_mid)):
+        ops.append({"op": "add", "path": f"{path}/{head + i}", "value": new_mid[i]})
+    return ops
+
+
+def apply_patch(doc: Any, patch: List[dict]) -> Any:
+    """Apply patch operations to doc in place; returns the (possibly new) root."""
+    for op in patch:
+        path = op["path"]
+        if not path:
+            doc = op["value"]
+            continue
+        tokens = [_unescape(t) for t in path.split("/")[1:]]
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        kind = op["op"]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if kind == "add":
+                parent.insert(index, op["value"])
+            elif kind == "remove":
+                del parent[index]
+            else:
+                parent[index] = op["value"]
+        else:
+            if kind == "remove":
+                del parent[last]
+            else:
+                parent[last] = op["value"]
+    return doc
+
+
+def get_path(doc: Any, dotted: str, default: Any = None) -> Any:
+    """Value at a dotted path such as "totals.tests" or "modules.Root.loc"."""
+    value = doc
+    for part in dotted.split("."):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return default
+    return value
+
+
+# ── Archive ─────────────────────────────────────────────────────────────
+
+
+class SnapshotArchive:
+    """Append-only base + delta log of JSON documents, indexed by key."""
+
+    def __init__(self, directory: str, rebase_every: int = REBASE_EVERY):
+        self.directory = directory
+        self.rebase_every = max(1, rebase_every)
+        self.log_path = os.path.join(directory, LOG_FILENAME)
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self._index: Optional[dict] = None
+        self._last_doc: Any = _MISSING     # decoded document at index["last"]
+
+    # ── Index ───────────────────────────────────────────────────────────
+
+    def _log_size(self) -> int:
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def _empty_index(self) -> dict:
+        return {"version": INDEX_VERSION, "log_size": 0, "keys": {},
+                "last": None, "since_base": 0}
+
+    def _load_index(self) -> dict:
+        size = self._log_size()
+        if self._index is not None and self._index["log_size"] == size:
+            return self._index
+        index = None
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if (not isinstance(index, dict) or index.get("version") != INDEX_VERSION
+                or index.get("log_size") != size):
+            # Missing, stale (e.g. a crash between log append and index
+            # write) or written by another version: rebuild from the log.
+            index = self.rebuild_index()
+        if self._index is None or self._index.get("last") != index.get("last"):
+            self._last_doc = _MISSING
+        self._index = index
+        return index
+
+    def _save_index(self, index: dict):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
+        self._index = index
+
+    def rebuild_index(self) -> dict:
+        """Re-derive the index by scanning the log (drops a torn final line)."""
+        index = self._empty_index()
+        if not os.path.exists(self.log_path):
+            return index
+        good_size = 0
+        with open(self.log_path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                index["keys"][record["key"]] = offset
+                index["last"] = offset
+                index["since_base"] = 0 if record["kind"] == "base" else index["since_base"] + 1
+                offset += len(line)
+                good_size = offset
+        if good_size != self._log_size():
+            with open(self.log_path, "r+b") as f:
+                f.truncate(good_size)
+        index["log_size"] = good_size
+        try:
+            self._save_index(index)
+        except OSError:
+            pass  # read-only archive: the in-memory index still works
+        return index
+
+    # ── Reading ─────────────────────────────────────────────────────────
+
+    def keys(self) -> List[str]:
+        """All keys, oldest first."""
+        return sorted(self._load_index()["keys"])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load_index()["keys"]
+
+    def __len__(self) -> int:
+        return len(self._load_index()["keys"])
+
+    @staticmethod
+    def _read_record(f, offset: int) -> dict:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+    def _materialize(self, f, offset: int, cache: Optional[Tuple[int, Any]] = None) -> Any:
+        """Document at a record offset. cache=(offset, doc) may be consumed (mutated)."""
+        chain = []
+        while True:
+            if cache is not None and offset == cache[0]:
+                doc = cache[1]
+                break
+            record = self._read_record(f, offset)
+            if record["kind"] == "base":
+                doc = record["doc"]
+                break
+            chain.append(record["patch"])
+            offset = record["prev"]
+        for patch in reversed(chain):
+            doc = apply_patch(doc, patch)
+        return doc
+
+    def get(self, key: str) -> Optional[dict]:
+        """The document stored under key, or None."""
+        index = self._load_index()
+        offset = index["keys"].get(key)
+        if offset is None:
+            return None
+        if offset == index["last"] and self._last_doc is not _MISSING:
+            return copy.deepcopy(self._last_doc)
+        with open(self.log_path, "rb") as f:
+            return self._materialize(f, offset)
+
+    def _walk(self, start: Optional[str], end: Optional[str]) -> Iterator[Tuple[str, Any]]:
+        # Yields shared state: callers must read, not mutate, each document.
+        index = self._load_index()
+        selected = sorted((k, o) for k, o in index["keys"].items()
+                          if (start is None or k >= start) and (end is None or k <= end))
+        if not selected:
+            return
+        with open(self.log_path, "rb") as f:
+            cache = None
+            for key, offset in selected:
+                if cache is not None and offset < cache[0]:
+                    cache = None     # keys appended out of order: rebuild from base
+                if cache is not None:
+                    # Roll the running state forward through the records
+                    # between the previous key and this one.
+                    doc = self._roll_forward(f, cache, offset)
+                else:
+                    doc = self._materialize(f, offset)
+                cache = (offset, doc)
+                yield key, doc
+
+    def _roll_forward(self, f, cache: Tuple[int, Any], target: int) -> Any:
+        chain = []
+        offset = target
+        while offset != cache[0]:
+            record = self._read_record(f, offset)
+            if record["kind"] == "base":
+                doc = record["doc"]
+                for patch in reversed(chain):
+                    doc = apply_patch(doc, patch)
+                return doc
+            chain.append(record["patch"])
+            offset = record["prev"]
+            if offset < cache[0]:
+                # Chain branches off before the cached record; start over.
+                return self._materialize(f, target)
+        doc = cache[1]
+        for patch in reversed(chain):
+            doc = apply_patch(doc, patch)
+        return doc
+
+    def iter_range(self, start: Optional[str] = None,
+                   end: Optional[str] = None) -> Iterator[Tuple[str, dict]]:
+        """(key, document) for every key in [start, end], oldest first."""
+        for key, doc in self._walk(start, end):
+            yield key, copy.deepcopy(doc)
+
+    def series(self, path: str, start: Optional[str] = None,
+               end: Optional[str] = None, default: Any = None) -> List[Tuple[str, Any]]:
+        """[(key, value at dotted path)] over [start, end] without copying documents."""
+        return [(key, copy.deepcopy(get_path(doc, path, default)))
+                for key, doc in self._walk(start, end)]
+
+    # ── Writing ─────────────────────────────────────────────────────────
+
+    def append(self, key: str, doc: dict) -> int:
+        """Add doc under key (replacing any earlier version). Returns its offset."""
+        os.makedirs(self.directory, exist_ok=True)
+        index = self._load_index()
+        last = index["last"]
+        previous = None
+        if last is not None:
+            if self._last_doc is _MISSING:
+                with open(self.log_path, "rb") as f:
+                    self._last_doc = self._materialize(f, last)
+            previous = self._last_doc
+
+        record: Dict[str, Any] = {"key": key}
+        if previous is not None and index["since_base"] + 1 < self.rebase_every:
+            patch = make_patch(previous, doc)
+            if not patch and index["keys"].get(key) == last:
+                return last
+            if len(json.dumps(patch)) * 2 <= len(json.dumps(doc)):
+                record.update(kind="delta", prev=last, patch=patch)
+        if "kind" not in record:
+            record.update(kind="base", doc=doc)
+
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        offset = self._log_size()
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+        index = dict(index, keys=dict(index["keys"]))
+        index["keys"][key] = offset
+        index["last"] = offset
+        index["since_base"] = 0 if record["kind"] == "base" else index["since_base"] + 1
+        index["log_size"] = offset + len(line)
+        self._save_index(index)
+        self._last_doc = copy.deepcopy(doc)
+        return offset
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+test_chart_kernels.py — Tests for chart_kernels.py numeric kernels.
+
+Covers: quantiles/box stats against the naive definitions, histogram binning,
+Silverman bandwidth, exact vs binned KDE parity, NumPy vs stdlib parity (when
+NumPy is installed), LTTB downsampling, and bounded SVG output for large series.
+"""
+
+import math
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import chart_kernels as ck
+from chart_generator import AreaChart, LineChart, ViolinPlot, render_svg, RenderCache
+
+
+def naive_kde(values, grid, bw):
+    coeff = 1.0 / (len(values) * bw * math.sqrt(2 * math.pi))
+    return [coeff * sum(math.exp(-0.5 * ((x - v) / bw) ** 2) for v in values) for x in grid]
+
+
+class TestQuantiles(unittest.TestCase):
+
+    def test_quantile_interpolates(self):
+        self.assertEqual(ck.quantile([1.0, 2.0, 3.0, 4.0], 0.5), 2.5)
+        self.assertEqual(ck.quantile([7.0], 0.75), 7.0)
+
+    def test_box_stats_match_naive_definition(self):
+        rng = random.Random(4)
+        values = ck.sorted_floats([rng.gauss(0, 1) for _ in range(400)] + [9, -9, 12])
+        stats = ck.box_stats(values)
+        iqr = stats.q3 - stats.q1
+        self.assertEqual(stats.whisker_lo, min(v for v in values if v >= stats.q1 - 1.5 * iqr))
+        self.assertEqual(stats.whisker_hi, max(v for v in values if v <= stats.q3 + 1.5 * iqr))
+        self.assertEqual(stats.outliers,
+                         [v for v in values if v < stats.whisker_lo or v > stats.whisker_hi])
+        self.assertIn(12.0, stats.outliers)
+
+    def test_single_value(self):
+        stats = ck.box_stats([3.0])
+        self.assertEqual((stats.q1, stats.median, stats.whisker_hi, stats.outliers), (3.0, 3.0, 3.0, []))
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_counts_and_edges(self):
+        counts, v_min, width = ck.histogram([0, 1, 2, 3, 4, 10], 5)
+        self.assertEqual((v_min, width), (0, 2.0))
+        self.assertEqual(counts, [2, 2, 1, 0, 1])  # max lands in the last bin
+
+    def test_constant_sample(self):
+        counts, _, width = ck.histogram([5, 5, 5], 3)
+        self.assertEqual((counts, width), ([3, 0, 0], 1 / 3))
+
+
+class TestKde(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.values = [rng.gauss(0, 1) for _ in range(3000)] + [rng.gauss(5, 0.5) for _ in range(1000)]
+        self.grid = [-4 + 11 * i / 49 for i in range(50)]
+        self.bw = ck.silverman_bandwidth(self.values)
+
+    def test_silverman_matches_formula(self):
+        n = len(self.values)
+        mean = sum(self.values) / n
+        std = (sum((v - mean) ** 2 for v in self.values) / n) ** 0.5
+        self.assertAlmostEqual(self.bw, 1.06 * std * n ** (-0.2))
+        self.assertEqual(ck.silverman_bandwidth([2.0, 2.0]), 1)
+
+    def test_exact_matches_naive(self):
+        exact = ck.gaussian_kde(self.values[:200], self.grid, 0.4, binned=False, use_numpy=False)
+        for a, b in zip(exact, naive_kde(self.values[:200], self.grid, 0.4)):
+            self.assertAlmostEqual(a, b, places=12)
+
+    def test_binned_close_to_exact(self):
+        exact = ck.gaussian_kde(self.values, self.grid, self.bw, binned=False, use_numpy=False)
+        binned = ck.gaussian_kde(self.values, self.grid, self.bw, binned=True, use_numpy=False)
+        peak = max(exact)
+        for a, b in zip(exact, binned):
+            self.assertLess(abs(a - b), 1e-3 * peak)
+
+    def test_large_input_uses_binned(self):
+        self.assertGreater(len(self.values) * len(self.grid), ck.EXACT_KDE_LIMIT)
+        auto = ck.gaussian_kde(self.values, self.grid, self.bw, use_numpy=False)
+        binned = ck.gaussian_kde(self.values, self.grid, self.bw, binned=True, use_numpy=False)
+        self.assertEqual(auto, binned)
+
+
+@unittest.skipUnless(ck.NUMPY_AVAILABLE, "NumPy not installed")
+class TestNumpyParity(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.values = [rng.gauss(0, 2) for _ in range(5000)]
+        self.grid = [-8 + 16 * i / 49 for i in range(50)]
+
+    def test_sort_and_histogram(self):
+        self.assertEqual(ck.sorted_floats(self.values, use_numpy=True),
+                         ck.sorted_floats(self.values, use_numpy=False))
+        self.assertEqual(ck.histogram(self.values, 17, use_numpy=True),
+                         ck.histogram(self.values, 17, use_numpy=False))
+
+    def test_kde(self):
+        bw = ck.silverman_bandwidth(self.values)
+        for binned in (False, True):
+            fast = ck.gaussian_kde(self.values, self.grid, bw, binned=binned, use_numpy=True)
+            slow = ck.gaussian_kde(self.values, self.grid, bw, binned=binned, use_numpy=False)
+            for a, b in zip(fast, slow):
+                self.assertAlmostEqual(a, b, places=9)
+
+
+class TestLttb(unittest.TestCase):
+
+    def test_short_series_untouched(self):
+        self.assertEqual(ck.lttb_indices([1, 2, 3], 10), [0, 1, 2])
+        self.assertEqual(ck.lttb_indices([1, 2, 3, 4], 0), [0, 1, 2, 3])
+
+    def test_keeps_endpoints_and_spike(self):
+        ys = [0.0] * 1000
+        ys[437] = 50.0
+        keep = ck.lttb_indices(ys, 20)
+        self.assertEqual(len(keep), 20)
+        self.assertEqual((keep[0], keep[-1]), (0, 999))
+        self.assertIn(437, keep)
+        self.assertEqual(keep, sorted(keep))
+
+
+class TestLargeCharts(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(2)
+        self.values = [rng.gauss(0, 1) for _ in range(20000)]
+
+    def test_line_and_area_svg_bounded(self):
+        data = [(str(i), v + 5) for i, v in enumerate(self.values)]
+        for cls in (LineChart, AreaChart):
+            small = render_svg(cls(data[:500]), cache=RenderCache())
+            big = render_svg(cls(data, max_points=500), cache=RenderCache())
+            self.assertLess(len(big), 2 * len(small), cls.__name__)
+
+    def test_violin_renders_large_sample(self):
+        svg = render_svg(ViolinPlot([("pnl", self.values)]), cache=RenderCache())
+        self.assertIn("<path", svg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+test_chart_render_cache.py — Tests for chart_generator's render cache and batch API.
+
+Covers: dict dispatch (including subclasses), chart_key stability, RenderCache
+memory/disk behavior, render_batch ordering and dedup, save_batch skipping
+unchanged files, and ReportChartGenerator re-rendering only changed charts.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import chart_generator as cg
+from chart_generator import (
+    BarChart,
+    DonutChart,
+    LineChart,
+    RenderCache,
+    chart_key,
+    render_batch,
+    render_svg,
+    save_batch,
+)
+
+
+class TestDispatch(unittest.TestCase):
+
+    def test_every_chart_type_registered(self):
+        chart_types = [obj for name, obj in vars(cg).items()
+                       if isinstance(obj, type) and name.endswith(("Chart", "Plot", "Sparkline"))]
+        for cls in chart_types:
+            self.assertIn(cls, cg._RENDERERS, cls.__name__)
+
+    def test_subclass_renders_like_base(self):
+        class MyBar(BarChart):
+            pass
+        chart = MyBar([("a", 1)], title="Sub")
+        self.assertEqual(render_svg(chart, cache=RenderCache()),
+                         render_svg(BarChart([("a", 1)], title="Sub"), cache=RenderCache()))
+
+
+class TestChartKey(unittest.TestCase):
+
+    def test_equal_charts_equal_keys(self):
+        self.assertEqual(chart_key(BarChart([("a", 1)], title="T")),
+                         chart_key(BarChart([("a", 1)], title="T")))
+
+    def test_data_type_and_options_change_key(self):
+        base = chart_key(BarChart([("a", 1)], title="T"))
+        self.assertNotEqual(base, chart_key(BarChart([("a", 2)], title="T")))
+        self.assertNotEqual(base, chart_key(BarChart([("a", 1)], title="U")))
+        self.assertNotEqual(base, chart_key(LineChart([("a", 1)], title="T")))
+
+    def test_tokens_are_part_of_key(self):
+        chart = BarChart([("a", 1)])
+        before = chart_key(chart)
+        with patch.object(cg, "_TOKENS_KEY", "other-tokens"):
+            self.assertNotEqual(chart_key(chart), before)
+
+    def test_unknown_type_raises(self):
+        with self.assertRaises(TypeError):
+            chart_key("not a chart")
+
+
+class TestRenderCache(unittest.TestCase):
+
+    def test_second_render_is_a_hit(self):
+        cache = RenderCache()
+        chart = BarChart([("a", 1)])
+        with patch.object(cg, "_render_bar_chart", wraps=cg._render_bar_chart) as renderer:
+            cg._RENDERERS[BarChart] = renderer
+            try:
+                first = render_svg(chart, cache=cache)
+                second = render_svg(BarChart([("a", 1)]), cache=cache)
+            finally:
+                cg._RENDERERS[BarChart] = cg._render_bar_chart
+        self.assertEqual(first, second)
+        self.assertEqual(renderer.call_count, 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_memory_is_bounded(self):
+        cache = RenderCache(max_entries=2)
+        for i in range(4):
+            render_svg(BarChart([("a", i)]), cache=cache)
+        self.assertEqual(cache.stats()["entries"], 2)
+
+    def test_disk_cache_shared_between_instances(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            chart = DonutChart([("A", 1, "#abc")])
+            svg = render_svg(chart, cache=RenderCache(directory=tmp))
+            fresh = RenderCache(directory=tmp)
+            self.assertEqual(fresh.get(chart_key(chart)), svg)
+            self.assertEqual(fresh.stats()["hits"], 1)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_order_preserved_and_duplicates_rendered_once(self):
+        cache = RenderCache()
+        charts = [BarChart([("a", 1)]), LineChart([("a", 1), ("b", 2)]), BarChart([("a", 1)])]
+        svgs = render_batch(charts, cache=cache, workers=1)
+        self.assertEqual(svgs, [render_svg(c, cache=RenderCache()) for c in charts])
+        self.assertEqual(cache.stats()["entries"], 2)
+
+    def test_process_pool_matches_serial(self):
+        charts = [BarChart([("a", i)]) for i in range(3)]
+        pooled = render_batch(charts, cache=RenderCache(), workers=2)
+        serial = render_batch(charts, cache=RenderCache(), workers=1)
+        self.assertEqual(pooled, serial)
+
+    def test_save_batch_skips_unchanged_files(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            charts = {"a": BarChart([("a", 1)]), "b": BarChart([("b", 2)])}
+            paths = save_batch(charts, tmp, cache=RenderCache(), workers=1)
+            self.assertEqual(sorted(paths), ["a", "b"])
+            mtime = os.stat(paths["a"]).st_mtime_ns
+            os.utime(paths["a"], ns=(mtime - 10**9, mtime - 10**9))
+            save_batch(charts, tmp, cache=RenderCache(), workers=1)
+            self.assertEqual(os.stat(paths["a"]).st_mtime_ns, mtime - 10**9)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+class TestReportChartsCache(unittest.TestCase):
+
+    DATA = {
+        "modules": [
+            {"name": "Memory", "tests": 340, "loc": 1200, "files": 8, "status": "COMPLETE"},
+            {"name": "Spec", "tests": 205, "loc": 900, "files": 5, "status": "ACTIVE"},
+        ],
+        "summary": {"total_tests": 545, "passing_tests": 545, "source_loc": 2100, "test_loc": 900},
+        "intelligence": {"findings_total": 10, "build": 3, "adapt": 2, "reference": 4, "skip": 1},
+        "session": 12,
+    }
+
+    def test_rebuild_renders_only_changed_charts(self):
+        from report_charts import ReportChartGenerator
+        tmp = tempfile.mkdtemp()
+        try:
+            first = ReportChartGenerator(output_dir=tmp, workers=1)
+            charts = first.generate_all(self.DATA)
+            self.assertTrue(first.cache.stats()["misses"] > 0)
+
+            second = ReportChartGenerator(output_dir=tmp, workers=1)
+            self.assertEqual(second.generate_all(self.DATA), charts)
+            self.assertEqual(second.cache.stats()["misses"], 0)
+
+            changed = dict(self.DATA, intelligence={"findings_total": 16, "build": 9, "adapt": 2, "reference": 4, "skip": 1})
+            third = ReportChartGenerator(output_dir=tmp, workers=1)
+            third.generate_all(changed)
+            self.assertEqual(third.cache.stats()["misses"], 1)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+test_dashboard_server.py — Tests for the live dashboard server.
+
+Covers: DataSource caching (re-collect only on watched-file change or ttl),
+ETag / If-None-Match handling on /api and /fragment, list pagination, the
+static shell, and server-sent events pushed when a watched JSONL changes.
+
+Run: python3 design-skills/tests/test_dashboard_server.py
+"""
+
+import http.client
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from dashboard_generator import DashboardRenderer
+from dashboard_server import DashboardServer, DataSource, page
+
+
+def _jsonl_source(path, name="sessions"):
+    calls = []
+
+    def collect():
+        calls.append(1)
+        with open(path) as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        return {"count": len(rows), "rows": rows}
+
+    return DataSource(name, collect, paths=[path]), calls
+
+
+def _bump(path, line):
+    # Distinct size guarantees a changed stat even on coarse-mtime filesystems
+    with open(path, "a") as f:
+        f.write(line + "\n")
+
+
+class TestDataSource(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "sessions.jsonl")
+        _bump(self.path, '{"id": 1}')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_collects_once_until_file_changes(self):
+        source, calls = _jsonl_source(self.path)
+        self.assertTrue(source.refresh())
+        self.assertFalse(source.refresh())
+        self.assertEqual(len(calls), 1)
+        etag = source.etag
+        _bump(self.path, '{"id": 2}')
+        self.assertTrue(source.refresh())
+        self.assertEqual(len(calls), 2)
+        self.assertNotEqual(source.etag, etag)
+
+    def test_same_payload_keeps_etag(self):
+        source = DataSource("const", lambda: {"a": 1}, ttl=0)
+        source.refresh()
+        etag = source.etag
+        self.assertFalse(source.refresh())
+        self.assertEqual(source.etag, etag)
+
+    def test_collector_error_keeps_last_payload(self):
+        state = {"fail": False}
+
+        def collect():
+            if state["fail"]:
+                raise ValueError("boom")
+            return {"ok": True}
+
+        source = DataSource("flaky", collect, ttl=0)
+        source.refresh()
+        state["fail"] = True
+        self.assertFalse(source.refresh())
+        self.assertEqual(json.loads(source.body), {"ok": True})
+        self.assertIn("boom", source.error)
+
+    def test_page(self):
+        result = page(list(range(10)), offset=8, limit=5)
+        self.assertEqual(result["items"], [8, 9])
+        self.assertIsNone(result["next_offset"])
+        self.assertEqual(page(list(range(10)), 0, 4)["next_offset"], 4)
+
+
+class TestDashboardServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "sessions.jsonl")
+        for i in range(7):
+            _bump(self.path, json.dumps({"id": i}))
+        source, self.calls = _jsonl_source(self.path)
+        self.server = DashboardServer([source], port=0, interval=0.05)
+        self.server.start()
+        self.host, self.port = self.server.address
+
+    def tearDown(self):
+        self.server.shutdown()
+        shutil.rmtree(self.tmpdir)
+
+    def get(self, path, headers=None):
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=5)
+        conn.request("GET", path, headers=headers or {})
+        resp = conn.getresponse()
+        body = resp.read()
+        conn.close()
+        return resp, body
+
+    def test_shell_lists_sections(self):
+        resp, body = self.get("/")
+        self.assertEqual(resp.status, 200)
+        self.assertIn(b'id="section-sessions"', body)
+        self.assertIn(b"EventSource", body)
+
+    def test_api_etag_round_trip(self):
+        resp, body = self.get("/api/sessions")
+        self.assertEqual(json.loads(body)["count"], 7)
+        etag = resp.getheader("ETag")
+        resp, body = self.get("/api/sessions", {"If-None-Match": etag})
+        self.assertEqual(resp.status, 304)
+        self.assertEqual(body, b"")
+
+    def test_api_pagination(self):
+        resp, body = self.get("/api/sessions?section=rows&offset=5&limit=5")
+        result = json.loads(body)
+        self.assertEqual([r["id"] for r in result["items"]], [5, 6])
+        self.assertEqual(result["total"], 7)
+        resp, _ = self.get("/api/sessions?section=count")
+        self.assertEqual(resp.status, 404)
+
+    def test_fragment_and_unknown_paths(self):
+        resp, body = self.get("/fragment/sessions")
+        self.assertEqual(resp.status, 200)
+        self.assertIn(b"count", body)
+        resp, _ = self.get("/fragment/sessions", {"If-None-Match": resp.getheader("ETag")})
+        self.assertEqual(resp.status, 304)
+        self.assertEqual(self.get("/api/nope")[0].status, 404)
+
+    def test_event_pushed_when_watched_file_changes(self):
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=5)
+        conn.request("GET", "/events")
+        resp = conn.getresponse()
+        self.assertEqual(resp.getheader("Content-Type"), "text/event-stream")
+        self.assertEqual(resp.fp.readline(), b"retry: 3000\n")
+        resp.fp.readline()
+
+        time.sleep(0.1)
+        _bump(self.path, '{"id": 99}')
+        self.assertEqual(resp.fp.readline(), b"event: update\n")
+        data = json.loads(resp.fp.readline().decode()[len("data: "):])
+        conn.close()
+        self.assertEqual(data["source"], "sessions")
+        self.assertEqual(data["etag"], self.server.sources["sessions"].etag)
+        self.assertEqual(json.loads(self.get("/api/sessions")[1])["count"], 8)
+
+    def test_idle_poll_does_not_recollect(self):
+        time.sleep(0.3)
+        self.assertEqual(len(self.calls), 1)
+
+
+class TestRendererSections(unittest.TestCase):
+
+    def test_unknown_section_rejected(self):
+        from dashboard_generator import _demo_data
+        renderer = DashboardRenderer()
+        self.assertIn("module-card", renderer.render_section(_demo_data(), "modules"))
+        with self.assertRaises(ValueError):
+            renderer.render_section(_demo_data(), "nope")
+
+    def test_panel_escapes_values(self):
+        html = DashboardRenderer().render_panel("Hivemind", {"gate": "<b>", "nested": {"x": 1}})
+        self.assertIn("&lt;b&gt;", html)
+        self.assertNotIn("nested", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for project_census.py — single-pass project census shared by the generators.
+Run: python3 design-skills/tests/test_project_census.py
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import project_census as pc
+
+INDEX = """\
+| Module | Path | Status | Tests |
+|--------|------|--------|-------|
+| Memory System | `memory-system/` | MEM-1-5 COMPLETE | 340 |
+| Spec System | `spec-system/` | SPEC-1-5 + plan | 1,205 |
+
+**Total: ~1,545 tests (~12 suites).**
+"""
+
+FILES = {
+    "PROJECT_INDEX.md": INDEX,
+    "SESSION_STATE.md": "# State\nSession 42 wrap-up\n",
+    "memory-system/store.py": "a = 1\nb = 2\nc = 3\n",
+    "memory-system/tests/test_store.py": (
+        "import unittest\n"
+        "class TestStore(unittest.TestCase):\n"
+        "    def test_one(self): pass\n"
+        "    def test_two(self): pass\n"
+        "    def helper(self): pass\n"
+    ),
+    "spec-system/spec.py": "x = 1",
+    "tool.py": "print('hi')\n",
+    ".hidden/skip.py": "x = 1\n",
+    "memory-system/__pycache__/store.py": "x = 1\n",
+}
+
+
+def make_tree(files):
+    root = tempfile.mkdtemp()
+    for rel, content in files.items():
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+    return root
+
+
+class TestTakeCensus(unittest.TestCase):
+
+    def setUp(self):
+        self.root = make_tree(FILES)
+        pc._FILE_CACHE.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_walk_skips_hidden_and_pycache(self):
+        census = pc.take_census(self.root, git=False)
+        paths = [f.path for f in census.files]
+        self.assertEqual(paths, [
+            "memory-system/store.py", "memory-system/tests/test_store.py",
+            "spec-system/spec.py", "tool.py",
+        ])
+
+    def test_module_stats(self):
+        census = pc.take_census(self.root, git=False)
+        stats = census.module_stats("memory-system/")
+        self.assertEqual(stats, {"loc": 3, "files": 1, "tests": 2, "test_files": 1})
+        self.assertEqual(census.module_stats("spec-system")["loc"], 1)
+        self.assertEqual(census.module_stats("")["files"], 1)  # root level only
+
+    def test_totals(self):
+        census = pc.take_census(self.root, git=False)
+        self.assertEqual(census.source_files, 3)
+        self.assertEqual(census.test_files, 1)
+        self.assertEqual(census.source_loc, 5)
+        self.assertEqual(census.test_loc, 5)
+        self.assertEqual(census.test_counts(), [2])
+
+    def test_index_and_session_parsed(self):
+        census = pc.take_census(self.root, git=False)
+        self.assertEqual(census.index_total_tests, 1545)
+        self.assertEqual(census.index_total_suites, 12)
+        self.assertEqual(census.total_tests, 1545)
+        self.assertEqual(census.session_number, 42)
+        mem = census.index_module("Memory System")
+        self.assertEqual((mem.path, mem.tests, mem.status), ("memory-system/", 340, "COMPLETE"))
+        spec = census.index_module("Spec System")
+        self.assertEqual((spec.tests, spec.status), (1205, "ACTIVE"))
+        self.assertIsNone(census.index_module("Nope"))
+
+    def test_unchanged_files_not_reread(self):
+        first = pc.take_census(self.root, git=False)
+        self.assertEqual(first.files_read, 4)
+        second = pc.take_census(self.root, git=False)
+        self.assertEqual(second.files_read, 0)
+        self.assertEqual(second.files, first.files)
+
+    def test_disk_cache_survives_new_process(self):
+        pc.take_census(self.root, git=False)
+        self.assertTrue(os.path.exists(os.path.join(self.root, pc.CACHE_FILENAME)))
+        pc._FILE_CACHE.clear()  # as if a new process
+        census = pc.take_census(self.root, git=False)
+        self.assertEqual(census.files_read, 0)
+        self.assertEqual(census.module_stats("memory-system")["tests"], 2)
+
+    def test_changed_file_recounted(self):
+        pc.take_census(self.root, git=False)
+        path = os.path.join(self.root, "spec-system", "spec.py")
+        with open(path, "w") as f:
+            f.write("x = 1\ny = 2\nz = 3\n")
+        census = pc.take_census(self.root, git=False)
+        self.assertEqual(census.files_read, 1)
+        self.assertEqual(census.module_stats("spec-system")["loc"], 3)
+
+    def test_scan_files_false_reads_docs_only(self):
+        census = pc.take_census(self.root, git=False, scan_files=False)
+        self.assertEqual(census.files, [])
+        self.assertEqual(len(census.index_modules), 2)
+
+    def test_nonexistent_root(self):
+        census = pc.take_census("/tmp/nonexistent_census_root_xyz")
+        self.assertEqual(census.files, [])
+        self.assertEqual(census.test_counts(), [])
+
+    def test_git_counted_once(self):
+        with patch("project_census.subprocess.run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = "123\n"
+            census = pc.take_census(self.root)
+        self.assertEqual(census.git_commits, 123)
+        self.assertEqual(run.call_count, 1)
+
+
+class TestCountTestMethods(unittest.TestCase):
+
+    def test_ast_ignores_strings(self):
+        src = 'X = """\ndef test_fake(): pass\n"""\ndef test_real(): pass\n'
+        self.assertEqual(pc.count_test_methods(src), 1)
+
+    def test_syntax_error_fallback(self):
+        src = "class T:\n    def test_a(self):\n        x = (\n    def test_b(self): pass\n"
+        self.assertEqual(pc.count_test_methods(src), 2)
+
+
+class TestConsumers(unittest.TestCase):
+    """Generators read from a shared census instead of rescanning."""
+
+    def setUp(self):
+        self.root = make_tree(FILES)
+        pc._FILE_CACHE.clear()
+        self.census = pc.take_census(self.root, git=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_report_collector_uses_census(self):
+        from report_generator import CCADataCollector
+        collector = CCADataCollector(project_root=self.root, census=self.census)
+        modules = collector.collect_module_stats()
+        mem = next(m for m in modules if m["name"] == "Memory System")
+        self.assertEqual((mem["tests"], mem["loc"], mem["files"]), (340, 3, 1))
+        self.assertEqual(collector.collect_test_distribution(), [2])
+        self.assertIn("Session 42", collector._read_file("SESSION_STATE.md"))
+
+    def test_daily_snapshot_uses_census(self):
+        import daily_snapshot as ds
+        with patch.object(ds, "PROJECT_ROOT", self.root):
+            snap = ds.capture_snapshot("2026-01-01", census=self.census)
+        self.assertEqual(snap["tests"]["total_tests"], 2)
+        self.assertEqual(snap["modules"]["Memory System"]["loc"], 3)
+        self.assertEqual(snap["modules"]["Root"]["py_files"], 1)
+        self.assertEqual(snap["totals"]["session_number"], 42)
+
+    def test_dashboard_uses_census(self):
+        from dashboard_generator import _collect_project_data
+        data = _collect_project_data(census=self.census)
+        self.assertEqual([m.name for m in data.modules], ["Memory System", "Spec System"])
+        self.assertEqual(data.session_number, 42)
+        self.assertEqual(data.metrics[0].value, "1,545")
+
+    def test_website_uses_census(self):
+        from website_generator import _collect_landing_page
+        page = _collect_landing_page(census=self.census)
+        values = {m.label: m.value for m in page.metrics}
+        self.assertEqual(values["Tests"], "1545")
+        self.assertEqual(values["Sessions"], "42")
+
+
+if __name__ == "__main__":
+    unittest.main()
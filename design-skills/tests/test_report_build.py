@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+test_report_build.py — Tests for report_build's incremental Typst pipeline.
+
+Typst is replaced by a small fake `typst` executable on PATH that supports
+`compile` and `watch` and logs every cold compile, so the tests can check
+which builds actually reached Typst.
+
+Covers: per-section fingerprints, up-to-date skips, template and output
+change detection, failed builds retried, parallel jobs, chart regeneration
+only on data change, and `typst watch` reuse.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from report_build import ReportBuilder, ReportJob, section_hashes, template_hash
+from report_generator import ReportRenderer, parse_args
+
+FAKE_TYPST = textwrap.dedent('''\
+    #!{python}
+    import os, sys, time
+    args = sys.argv[1:]
+    mode = args.pop(0)
+    inputs = {{}}
+    while args[0].startswith("--"):
+        flag = args.pop(0)
+        value = args.pop(0)
+        if flag == "--input":
+            key, _, val = value.partition("=")
+            inputs[key] = val
+    typ, out = args
+
+    def compile_once():
+        with open(inputs["data"]) as f:
+            data = f.read()
+        if "FAIL" in data:
+            sys.stderr.write("error: forced failure\\n")
+            return False
+        with open(out, "w") as f:
+            f.write(data)
+        return True
+
+    def stamps():
+        paths = [inputs["data"], typ]
+        return [os.stat(p).st_mtime_ns for p in paths]
+
+    if mode == "compile":
+        with open(os.environ["FAKE_TYPST_LOG"], "a") as f:
+            f.write(out + "\\n")
+        sys.exit(0 if compile_once() else 1)
+
+    last = None
+    while True:
+        now = stamps()
+        if now != last:
+            last = now
+            ok = compile_once()
+            sys.stderr.write("[00:00:00] compiled " + ("successfully" if ok else "with errors") + " in 1 ms\\n")
+            sys.stderr.flush()
+        time.sleep(0.02)
+''')
+
+
+class BuildTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        bin_dir = os.path.join(self.tmp, "bin")
+        os.makedirs(bin_dir)
+        typst = os.path.join(bin_dir, "typst")
+        with open(typst, "w") as f:
+            f.write(FAKE_TYPST.format(python=sys.executable))
+        os.chmod(typst, 0o755)
+        self.log = os.path.join(self.tmp, "typst.log")
+        open(self.log, "w").close()
+        env = {"PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+               "FAKE_TYPST_LOG": self.log}
+        self.env_patch = patch.dict(os.environ, env)
+        self.env_patch.start()
+
+        self.renderer = ReportRenderer()
+        self.renderer.templates_dir = os.path.join(self.tmp, "templates")
+        os.makedirs(self.renderer.templates_dir)
+        with open(self.renderer.template_path("report"), "w") as f:
+            f.write("#let data = json(sys.inputs.data)\n")
+        self.build_dir = os.path.join(self.tmp, "build")
+        self.data = {"title": "CCA", "summary": {"total_tests": 10}, "modules": []}
+
+    def tearDown(self):
+        self.env_patch.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def builder(self, **kwargs):
+        return ReportBuilder(build_dir=self.build_dir, renderer=self.renderer, **kwargs)
+
+    def job(self, name="report", data=None, charts=False):
+        return ReportJob(name, "report", os.path.join(self.tmp, f"{name}.pdf"),
+                         self.data if data is None else data, charts=charts)
+
+    def cold_compiles(self):
+        with open(self.log) as f:
+            return len(f.read().splitlines())
+
+
+class TestFingerprints(BuildTestCase):
+
+    def test_section_hashes_change_per_section(self):
+        before = section_hashes(self.data)
+        after = section_hashes(dict(self.data, summary={"total_tests": 11}))
+        self.assertEqual(set(before), {"title", "summary", "modules"})
+        self.assertNotEqual(before["summary"], after["summary"])
+        self.assertEqual(before["modules"], after["modules"])
+
+    def test_template_hash_covers_sibling_files(self):
+        path = self.renderer.template_path("report")
+        before = template_hash(path)
+        with open(os.path.join(self.renderer.templates_dir, "shared.typ"), "w") as f:
+            f.write("#let x = 1\n")
+        self.assertNotEqual(template_hash(path), before)
+
+
+class TestIncrementalBuild(BuildTestCase):
+
+    def test_unchanged_inputs_skip_typst(self):
+        builder = self.builder()
+        first, = builder.build([self.job()])
+        second, = builder.build([self.job()])
+        self.assertEqual(first.status, "compiled")
+        self.assertEqual(second.status, "up-to-date")
+        self.assertEqual(self.cold_compiles(), 1)
+
+    def test_changed_section_is_reported_and_recompiled(self):
+        builder = self.builder()
+        builder.build([self.job()])
+        data = dict(self.data, summary={"total_tests": 11})
+        result, = builder.build([self.job(data=data)])
+        self.assertEqual(result.status, "compiled")
+        self.assertEqual(result.changed, ["summary"])
+        with open(result.output) as f:
+            self.assertEqual(json.load(f)["summary"]["total_tests"], 11)
+
+    def test_template_edit_triggers_rebuild(self):
+        builder = self.builder()
+        builder.build([self.job()])
+        with open(self.renderer.template_path("report"), "a") as f:
+            f.write("// edited\n")
+        result, = builder.build([self.job()])
+        self.assertEqual(result.changed, ["template"])
+        self.assertEqual(self.cold_compiles(), 2)
+
+    def test_missing_output_triggers_rebuild(self):
+        builder = self.builder()
+        first, = builder.build([self.job()])
+        os.remove(first.output)
+        result, = builder.build([self.job()])
+        self.assertEqual(result.status, "compiled")
+        self.assertIn("output", result.changed)
+        self.assertTrue(os.path.exists(result.output))
+
+    def test_force_recompiles(self):
+        builder = self.builder()
+        builder.build([self.job()])
+        result, = builder.build([self.job()], force=True)
+        self.assertEqual(result.status, "compiled")
+        self.assertEqual(self.cold_compiles(), 2)
+
+    def test_failed_build_is_retried(self):
+        builder = self.builder()
+        data = dict(self.data, title="FAIL")
+        failed, = builder.build([self.job(data=data)])
+        self.assertFalse(failed.ok)
+        self.assertIn("Typst compilation failed", failed.error)
+        self.assertNotIn("report", builder.load_manifest())
+        retried, = builder.build([self.job(data=data)])
+        self.assertEqual(retried.status, "failed")
+        self.assertEqual(self.cold_compiles(), 2)
+
+    def test_manifest_persists_across_builders(self):
+        self.builder().build([self.job()])
+        result, = self.builder().build([self.job()])
+        self.assertEqual(result.status, "up-to-date")
+
+    def test_duplicate_job_names_rejected(self):
+        with self.assertRaises(ValueError):
+            self.builder().build([self.job(), self.job()])
+
+
+class TestParallelBuild(BuildTestCase):
+
+    def test_jobs_built_together_and_independently(self):
+        builder = self.builder(workers=3)
+        jobs = [self.job("daily"), self.job("detailed"), self.job("kalshi")]
+        results = builder.build(jobs)
+        self.assertEqual([r.status for r in results], ["compiled"] * 3)
+        self.assertTrue(all(os.path.exists(r.output) for r in results))
+
+        jobs[2] = self.job("kalshi", data=dict(self.data, kalshi={"pnl": 5}))
+        results = builder.build(jobs)
+        self.assertEqual([r.status for r in results], ["up-to-date", "up-to-date", "compiled"])
+        self.assertEqual(self.cold_compiles(), 4)
+
+
+class TestChartAssets(BuildTestCase):
+
+    def test_charts_regenerated_only_on_data_change(self):
+        builder = self.builder()
+        with patch("report_build.ReportChartGenerator") as gen:
+            gen.side_effect = lambda output_dir, cache: os.makedirs(output_dir, exist_ok=True) or gen.return_value
+            builder.build([self.job(charts=True)])
+            builder.build([self.job(charts=True)])
+            self.assertEqual(gen.return_value.save_all.call_count, 1)
+            builder.build([self.job(data=dict(self.data, title="New"), charts=True)])
+            self.assertEqual(gen.return_value.save_all.call_count, 2)
+
+
+class TestWatchMode(BuildTestCase):
+
+    def test_rebuild_reuses_watch_process(self):
+        with self.builder(watch=True) as builder:
+            first, = builder.build([self.job()])
+            self.assertEqual(first.status, "compiled")
+            watcher = builder._watchers["report"]
+            self.assertTrue(watcher.running)
+
+            time.sleep(0.05)  # let the fake watcher's mtime poll settle
+            data = dict(self.data, summary={"total_tests": 12})
+            second, = builder.build([self.job(data=data)])
+            self.assertEqual(second.status, "compiled", second.error)
+            self.assertIs(builder._watchers["report"], watcher)
+            with open(second.output) as f:
+                self.assertEqual(json.load(f)["summary"]["total_tests"], 12)
+        self.assertFalse(watcher.running)
+        self.assertEqual(self.cold_compiles(), 0)
+
+
+class TestCli(unittest.TestCase):
+
+    def test_also_and_build_flags(self):
+        args = parse_args(["generate", "-o", "/tmp/r.pdf", "--also", "cca-report=/tmp/k.pdf",
+                           "--force", "--build-dir", "/tmp/b"])
+        self.assertEqual(args.also, ["cca-report=/tmp/k.pdf"])
+        self.assertTrue(args.force)
+        self.assertEqual(args.build_dir, "/tmp/b")
+        self.assertIsNone(args.every)
+
+
+if __name__ == "__main__":
+    unittest.main()
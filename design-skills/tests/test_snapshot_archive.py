@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+test_snapshot_archive.py — Tests for the delta-encoded snapshot archive.
+
+Covers: JSON Patch round trips, base/delta records and rebasing, range and
+series reads, out-of-order keys, index recovery after a torn append, and
+the daily_snapshot / ReportSidecar / ReportDiffer integrations.
+
+Run: python3 design-skills/tests/test_snapshot_archive.py
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import daily_snapshot as ds
+from report_differ import ReportDiffer
+from report_generator import ReportSidecar
+from snapshot_archive import SnapshotArchive, apply_patch, get_path, make_patch
+
+
+def _snap(day, tests, suites=None):
+    if suites is None:
+        suites = [{"file": "tests/test_a.py", "count": tests}] + [
+            {"file": f"module-{n}/tests/test_module_{n}.py", "count": 40 + n} for n in range(20)]
+    return {
+        "date": day,
+        "totals": {"tests": tests, "suites": len(suites), "loc": 1000 + tests},
+        "modules": {"Design Skills": {"tests": tests, "loc": 500}},
+        "tests": {"suites": suites},
+    }
+
+
+def _records(archive):
+    with open(archive.log_path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestJsonPatch(unittest.TestCase):
+
+    def assertRoundTrip(self, old, new):
+        patch = make_patch(old, new)
+        self.assertEqual(apply_patch(json.loads(json.dumps(old)), patch), new)
+        return patch
+
+    def test_nested_dict_changes(self):
+        patch = self.assertRoundTrip(
+            {"a": {"b": 1, "c": 2}, "gone": 1},
+            {"a": {"b": 2, "c": 2}, "new": [1]},
+        )
+        self.assertIn({"op": "replace", "path": "/a/b", "value": 2}, patch)
+
+    def test_list_insert_remove_and_edit(self):
+        self.assertRoundTrip([1, 2, 3, 4, 5], [1, 9, 3, 5, 6, 7])
+        self.assertRoundTrip([{"f": "a"}, {"f": "b"}], [{"f": "a"}, {"f": "x"}, {"f": "b"}])
+        self.assertRoundTrip([1, 2, 3], [])
+
+    def test_keys_needing_escapes(self):
+        self.assertRoundTrip({"a/b": 1, "c~d": {"e": 1}}, {"a/b": 2, "c~d": {}})
+
+    def test_type_change_and_identical(self):
+        self.assertRoundTrip({"a": [1]}, {"a": {"b": 1}})
+        self.assertEqual(make_patch({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}), [])
+
+    def test_get_path(self):
+        doc = {"totals": {"tests": 5}, "suites": [{"count": 3}]}
+        self.assertEqual(get_path(doc, "totals.tests"), 5)
+        self.assertEqual(get_path(doc, "suites.0.count"), 3)
+        self.assertIsNone(get_path(doc, "totals.missing"))
+
+
+class TestSnapshotArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.archive = SnapshotArchive(self.tmpdir, rebase_every=4)
+        self.days = [f"2026-03-{d:02d}" for d in range(1, 11)]
+        for i, day in enumerate(self.days):
+            self.archive.append(day, _snap(day, 100 + i))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_get_reconstructs_every_key(self):
+        fresh = SnapshotArchive(self.tmpdir)
+        for i, day in enumerate(self.days):
+            self.assertEqual(fresh.get(day), _snap(day, 100 + i))
+        self.assertIsNone(fresh.get("1999-01-01"))
+
+    def test_deltas_with_periodic_rebase(self):
+        kinds = [r["kind"] for r in _records(self.archive)]
+        self.assertEqual(kinds, ["base", "delta", "delta", "delta"] * 2 + ["base", "delta"])
+
+    def test_large_change_written_as_base(self):
+        suites = [{"file": f"tests/test_renamed_{n}.py", "count": n} for n in range(50)]
+        self.archive.append("2026-03-11", _snap("2026-03-11", 200, suites))
+        self.assertEqual(_records(self.archive)[-1]["kind"], "base")
+
+    def test_series_and_range(self):
+        series = self.archive.series("totals.tests", start="2026-03-03", end="2026-03-06")
+        self.assertEqual(series, [("2026-03-03", 102), ("2026-03-04", 103),
+                                  ("2026-03-05", 104), ("2026-03-06", 105)])
+        keys = [k for k, _ in self.archive.iter_range(start="2026-03-09")]
+        self.assertEqual(keys, ["2026-03-09", "2026-03-10"])
+
+    def test_iter_range_yields_independent_copies(self):
+        docs = [doc for _, doc in self.archive.iter_range()]
+        docs[0]["totals"]["tests"] = -1
+        self.assertEqual(docs[1]["totals"]["tests"], 101)
+        self.assertEqual(self.archive.get(self.days[0])["totals"]["tests"], 100)
+
+    def test_reappending_key_replaces_it(self):
+        self.archive.append("2026-03-05", _snap("2026-03-05", 999))
+        self.assertEqual(self.archive.get("2026-03-05")["totals"]["tests"], 999)
+        self.assertEqual(len(self.archive), 10)
+        self.assertEqual(self.archive.get("2026-03-06")["totals"]["tests"], 105)
+
+    def test_out_of_order_keys(self):
+        self.archive.append("2026-02-15", _snap("2026-02-15", 50))
+        series = self.archive.series("totals.tests", end="2026-03-02")
+        self.assertEqual(series, [("2026-02-15", 50), ("2026-03-01", 100), ("2026-03-02", 101)])
+
+    def test_torn_append_is_dropped(self):
+        with open(self.archive.log_path, "a") as f:
+            f.write('{"key": "2026-03-11", "kind": "ba')
+        fresh = SnapshotArchive(self.tmpdir, rebase_every=4)
+        self.assertEqual(len(fresh), 10)
+        fresh.append("2026-03-11", _snap("2026-03-11", 110))
+        self.assertEqual(SnapshotArchive(self.tmpdir).get("2026-03-11")["totals"]["tests"], 110)
+
+    def test_missing_index_is_rebuilt(self):
+        os.remove(self.archive.index_path)
+        fresh = SnapshotArchive(self.tmpdir)
+        self.assertEqual(fresh.keys(), self.days)
+        self.assertTrue(os.path.exists(fresh.index_path))
+
+
+class TestDailySnapshotArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_save_appends_to_archive(self):
+        ds.save_snapshot(_snap("2026-03-19", 10), self.tmpdir)
+        ds.save_snapshot(_snap("2026-03-20", 12), self.tmpdir)
+        self.assertEqual(ds.metric_series("totals.tests", snapshot_dir=self.tmpdir),
+                         [("2026-03-19", 10), ("2026-03-20", 12)])
+
+    def test_pruned_day_files_served_from_archive(self):
+        for i in range(5):
+            ds.save_snapshot(_snap(f"2026-03-{15 + i}", 10 + i), self.tmpdir)
+        result = ds.compact_snapshots(self.tmpdir, keep=2)
+        self.assertEqual(result["pruned"], ["2026-03-15", "2026-03-16", "2026-03-17"])
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir, "2026-03-15.json")))
+        self.assertEqual(ds.list_snapshots(self.tmpdir)[-1], "2026-03-15")
+        self.assertEqual(ds.load_snapshot("2026-03-15", self.tmpdir)["totals"]["tests"], 10)
+        self.assertEqual(ds.find_previous_snapshot("2026-03-17", self.tmpdir), "2026-03-16")
+        diff = ds.diff_dates("2026-03-15", "2026-03-19", self.tmpdir)
+        self.assertEqual(diff["totals_delta"]["tests"]["delta"], 4)
+
+    def test_compact_imports_legacy_day_files(self):
+        for day, tests in [("2026-03-18", 5), ("2026-03-17", 4)]:
+            Path(self.tmpdir, f"{day}.json").write_text(json.dumps(_snap(day, tests)))
+        result = ds.compact_snapshots(self.tmpdir)
+        self.assertEqual(result, {"archived": ["2026-03-17", "2026-03-18"], "pruned": []})
+        self.assertEqual(ds.compact_snapshots(self.tmpdir)["archived"], [])
+        self.assertEqual(ds.metric_series("totals.tests", snapshot_dir=self.tmpdir),
+                         [("2026-03-17", 4), ("2026-03-18", 5)])
+
+
+class TestReportHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.sidecar = ReportSidecar(archive_dir=self.tmpdir)
+        for session, tests in [(120, 100), (121, 110), (122, 125)]:
+            self.sidecar.save_to_archive({
+                "date": f"2026-03-{session - 100}", "session": session,
+                "summary": {"total_tests": tests, "total_loc": 10 * tests},
+            })
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_history_does_not_show_up_as_report(self):
+        self.assertEqual(len(self.sidecar.list_archived_reports()), 3)
+
+    def test_diff_from_archive(self):
+        differ = ReportDiffer()
+        history = self.sidecar.history()
+        diff = differ.diff_from_archive(history, "2026-03-20_S120", "2026-03-22_S122")
+        self.assertEqual(diff["summary_changes"]["total_tests"]["delta"], 25)
+        self.assertIsNone(differ.diff_from_archive(history, "2026-03-20_S120", "nope"))
+
+    def test_summary_trend(self):
+        trend = ReportDiffer().summary_trend(self.sidecar.history(), "total_tests")
+        self.assertEqual([v for _, v in trend], [100, 110, 125])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,7 @@ from typing import List, Optional
 # ── Design tokens (from canonical design_tokens module) ──────────────────────
 
 import design_tokens
+from project_census import ProjectCensus, take_census
 
 COLORS = {
     **design_tokens.CCA_PALETTE,
@@ -650,19 +651,13 @@ def _demo_landing_page() -> LandingPage:
     )
 
 
-def _collect_landing_page() -> LandingPage:
+def _collect_landing_page(census: Optional[ProjectCensus] = None) -> LandingPage:
     """Build a LandingPage from real CCA project data."""
-    import re
-    project_root = str(Path(__file__).parent.parent)
+    if census is None:
+        project_root = str(Path(__file__).parent.parent)
+        census = take_census(project_root, git=False, scan_files=False)
 
-    # Read PROJECT_INDEX.md for module data
-    index_path = os.path.join(project_root, "PROJECT_INDEX.md")
-    index_content = ""
-    if os.path.exists(index_path):
-        with open(index_path) as f:
-            index_content = f.read()
-
-    # Parse module table
+    # Module table from PROJECT_INDEX.md
     features = []
     module_icons = {
         "Memory System": "🧠", "Spec System": "📋", "Context Monitor": "📊",
@@ -681,40 +676,16 @@ def _collect_landing_page() -> LandingPage:
         "Research": "R&D tools including iOS project generation.",
     }
 
-    in_table = False
-    for line in index_content.split("\n"):
-        stripped = line.strip()
-        if "| Module " in stripped or "| Module|" in stripped:
-            in_table = True
-            continue
-        if in_table and stripped.startswith("|---"):
-            continue
-        if in_table and stripped.startswith("|"):
-            parts = [p.strip() for p in stripped.split("|")]
-            parts = [p for p in parts if p]
-            if len(parts) >= 1:
-                name = parts[0]
-                desc = module_descriptions.get(name, "")
-                icon = module_icons.get(name, "")
-                if name and desc:
-                    features.append(FeatureCard(name, desc, icon))
-        elif in_table and not stripped.startswith("|"):
-            in_table = False
-
-    # Extract totals
-    total_match = re.search(r"\*\*Total:\s*([\d,]+)\s*tests\s*\((\d+)\s*suites\)", index_content)
-    total_tests = total_match.group(1).replace(",", "") if total_match else "0"
-    total_suites = total_match.group(2) if total_match else "0"
-
-    # Session number from SESSION_STATE.md
-    state_path = os.path.join(project_root, "SESSION_STATE.md")
-    session = "0"
-    if os.path.exists(state_path):
-        with open(state_path) as f:
-            state_content = f.read()
-        session_match = re.search(r"Session (\d+)", state_content)
-        if session_match:
-            session = session_match.group(1)
+    for row in census.index_modules:
+        desc = module_descriptions.get(row.name, "")
+        icon = module_icons.get(row.name, "")
+        if desc:
+            features.append(FeatureCard(row.name, desc, icon))
+
+    # Totals and session number
+    total_tests = str(census.index_total_tests or 0)
+    total_suites = str(census.index_total_suites or 0)
+    session = str(census.session_number)
 
     return LandingPage(
         title="ClaudeCodeAdvancements",
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""impact_selector.py — Change-impact test selection from the import graph.
+
+Instead of re-running every suite (or guessing suites from file names),
+select only the suites whose import closure contains a file that changed
+since the last green run:
+
+  1. Build the project import graph (AST, no imports executed). Per-file
+     imports and content hashes are memoized by (size, mtime_ns), so a warm
+     rebuild is one stat() per file.
+  2. Diff current content hashes against the snapshot taken at the last
+     all-green run; the changed set includes added and deleted files.
+  3. Selected = suites in the reverse import closure of the changed set,
+     plus suites that never passed. A selected suite whose closure hash
+     (test file + everything it transitively imports) still matches its
+     last pass is served from the result cache instead.
+  4. Schedule longest-first using recorded per-suite durations (LPT), which
+     minimizes makespan across pool workers.
+
+Import resolution follows how this repo's suites set up sys.path: a name
+resolves to the module in the importing file's directory, then its parent
+(tests/ -> package), then the project root, then any unique module in the
+tree. Names defined in several packages resolve to all of them, so the
+selection over- rather than under-approximates.
+
+Usage:
+    from impact_selector import ImpactSelector
+
+    sel = ImpactSelector(root)
+    plan = sel.plan()                    # what to run, and why
+    results = pool.run(plan.to_run)      # longest-first order
+    sel.record(results)                  # update history / green snapshot
+
+CLI:
+    python3 impact_selector.py plan      # Show impacted suites
+    python3 impact_selector.py run       # Run impacted suites (warm pool)
+    python3 impact_selector.py reset     # Forget history (next run = all)
+
+Stdlib only. No external dependencies.
+"""
+import ast
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = Path.home() / ".cca-test-impact.json"
+STATE_VERSION = 1
+
+# Weight of the newest duration sample in the per-suite moving average
+DURATION_ALPHA = 0.5
+
+_SKIP_DIRS = ("__pycache__", ".git", "node_modules", ".planning", ".venv", "venv", "reference_repos")
+
+
+def _walk_py(root: str) -> list:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")]
+        for f in filenames:
+            if f.endswith(".py"):
+                files.append(os.path.join(dirpath, f))
+    return sorted(files)
+
+
+def _is_test_file(path: str) -> bool:
+    name = os.path.basename(path)
+    return name.startswith("test_") and name.endswith(".py")
+
+
+def _parse_imports(data: bytes, path: str) -> list:
+    """Top-level module names imported anywhere in the file."""
+    try:
+        tree = ast.parse(data, filename=path)
+    except (SyntaxError, ValueError):
+        return []
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(a.name.split(".")[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                names.add(node.module.split(".")[0])  # from x import y / from .x import y
+            elif node.level:
+                names.update(a.name for a in node.names)  # from . import x
+    return sorted(names)
+
+
+@dataclass
+class ImpactPlan:
+    """Outcome of ImpactSelector.plan()."""
+    to_run: list = field(default_factory=list)        # longest-first
+    cached: list = field(default_factory=list)        # unaffected, last run passed
+    changed_files: list = field(default_factory=list)
+    reasons: dict = field(default_factory=dict)       # suite -> why selected
+    estimated_s: float = 0.0
+    first_run: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "to_run": self.to_run,
+            "cached": len(self.cached),
+            "changed_files": self.changed_files,
+            "reasons": self.reasons,
+            "estimated_s": round(self.estimated_s, 2),
+            "first_run": self.first_run,
+        }
+
+
+class ImpactSelector:
+    """Import graph + per-suite history for one project root."""
+
+    def __init__(self, root: str = SCRIPT_DIR, state_path: Path = STATE_PATH):
+        self.root = os.path.abspath(root)
+        self.state_path = Path(state_path)
+        self.state = self._load_state()
+        self._graph: Optional[dict] = None
+        self._hashes: dict = {}
+        self._closures: dict = {}
+
+    # ── State ────────────────────────────────────────────────────────────
+
+    def _empty_state(self) -> dict:
+        return {"version": STATE_VERSION, "root": self.root, "files": {},
+                "green": None, "suites": {}}
+
+    def _load_state(self) -> dict:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return self._empty_state()
+        if state.get("version") != STATE_VERSION or state.get("root") != self.root:
+            return self._empty_state()
+        return state
+
+    def save(self) -> None:
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(self.state), encoding="utf-8")
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass
+
+    def reset(self) -> None:
+        self.state = self._empty_state()
+        self._graph = None
+        self.save()
+
+    # ── Graph ────────────────────────────────────────────────────────────
+
+    def _scan(self) -> None:
+        """Refresh content hashes and import lists (memoized per stat)."""
+        memo = self.state["files"]
+        fresh = {}
+        self._hashes = {}
+        for path in _walk_py(self.root):
+            rel = os.path.relpath(path, self.root)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = memo.get(rel)
+            if not entry or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                except OSError:
+                    continue
+                entry = [st.st_size, st.st_mtime_ns,
+                         hashlib.sha1(data).hexdigest(), _parse_imports(data, path)]
+            fresh[rel] = entry
+            self._hashes[rel] = entry[2]
+        self.state["files"] = fresh
+
+    def graph(self) -> dict:
+        """rel path -> sorted list of project files it imports."""
+        if self._graph is not None:
+            return self._graph
+        self._scan()
+        by_name = defaultdict(list)
+        for rel in self.state["files"]:
+            by_name[os.path.splitext(os.path.basename(rel))[0]].append(rel)
+            if os.path.basename(rel) == "__init__.py":
+                pkg = os.path.dirname(rel)
+                if pkg:
+                    by_name[os.path.basename(pkg)].append(rel)
+
+        graph = {}
+        for rel, entry in self.state["files"].items():
+            here = os.path.dirname(rel)
+            search = [here, os.path.dirname(here), ""]
+            deps = set()
+            for name in entry[3]:
+                candidates = by_name.get(name)
+                if not candidates:
+                    continue  # stdlib or third-party
+                local = [c for c in candidates if os.path.dirname(c) in search
+                         or (os.path.basename(c) == "__init__.py"
+                             and os.path.dirname(os.path.dirname(c)) in search)]
+                deps.update(local or candidates)
+            deps.discard(rel)
+            graph[rel] = sorted(deps)
+        self._graph = graph
+        self._closures = {}
+        return graph
+
+    def closure(self, rel: str) -> set:
+        """rel plus every project file it transitively imports."""
+        cached = self._closures.get(rel)
+        if cached is not None:
+            return cached
+        graph = self.graph()
+        seen = {rel}
+        queue = deque([rel])
+        while queue:
+            for dep in graph.get(queue.popleft(), ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    queue.append(dep)
+        self._closures[rel] = seen
+        return seen
+
+    def reverse_closure(self, changed: set) -> set:
+        """Every file that transitively imports something in `changed`."""
+        graph = self.graph()
+        reverse = defaultdict(set)
+        for src, deps in graph.items():
+            for dep in deps:
+                reverse[dep].add(src)
+        # Deleted files are gone from the graph; their old importers still
+        # reference the name, so look them up in the last green snapshot.
+        green = self.state.get("green") or {}
+        for rel in changed:
+            for src in green.get("importers", {}).get(rel, ()):
+                reverse[rel].add(src)
+        seen = set(changed)
+        queue = deque(changed)
+        while queue:
+            for src in reverse.get(queue.popleft(), ()):
+                if src not in seen:
+                    seen.add(src)
+                    queue.append(src)
+        return seen
+
+    def suite_key(self, rel: str) -> str:
+        """Hash of the suite file and its whole import closure."""
+        h = hashlib.sha1()
+        for path in sorted(self.closure(rel)):
+            h.update(f"{path}\0{self._hashes.get(path, '')}\0".encode())
+        return h.hexdigest()
+
+    # ── Planning ─────────────────────────────────────────────────────────
+
+    def test_files(self) -> list:
+        self.graph()
+        return sorted(rel for rel in self.state["files"] if _is_test_file(rel))
+
+    def changed_since_green(self) -> Optional[list]:
+        """Files added, removed or modified since the last green run (None = no green run)."""
+        green = self.state.get("green")
+        self.graph()
+        if not green:
+            return None
+        old = green.get("hashes", {})
+        changed = {rel for rel, h in self._hashes.items() if old.get(rel) != h}
+        changed |= set(old) - set(self._hashes)
+        return sorted(changed)
+
+    def estimate(self, rel: str) -> Optional[float]:
+        rec = self.state["suites"].get(rel)
+        return rec.get("duration_s") if rec else None
+
+    def plan(self) -> ImpactPlan:
+        tests = self.test_files()
+        changed = self.changed_since_green()
+        plan = ImpactPlan(first_run=changed is None, changed_files=changed or [])
+        impacted = self.reverse_closure(set(changed)) if changed else set()
+
+        for rel in tests:
+            rec = self.state["suites"].get(rel)
+            key = self.suite_key(rel)
+            if rec is None:
+                reason = "no history"
+            elif not rec.get("passed"):
+                reason = "failed last run"
+            elif rel in impacted and rec.get("key") != key:
+                reason = "imports changed file"
+            elif rec.get("key") != key:
+                # Changed outside the green diff (e.g. history from a partial run)
+                reason = "closure changed"
+            else:
+                plan.cached.append(rel)
+                continue
+            plan.reasons[rel] = reason
+            plan.to_run.append(rel)
+
+        # Longest-first; suites with no timing history go first (unknown = expensive)
+        known = [d for d in (self.estimate(r) for r in tests) if d is not None]
+        default = max(known) if known else 1.0
+        durations = {r: (self.estimate(r) if self.estimate(r) is not None else default)
+                     for r in plan.to_run}
+        plan.to_run.sort(key=lambda r: (self.estimate(r) is not None, -durations[r], r))
+        plan.estimated_s = sum(durations.values())
+        self.save()  # persist the scan memo so the next plan is stat-only
+        return plan
+
+    # ── Recording ────────────────────────────────────────────────────────
+
+    def record(self, results: list) -> bool:
+        """Fold SuiteResults into history. Returns True if the tree is now green."""
+        self.graph()
+        now = time.time()
+        for r in results:
+            rel = os.path.relpath(os.path.abspath(r.path), self.root)
+            prev = self.state["suites"].get(rel, {})
+            duration = r.duration_s
+            if prev.get("duration_s") is not None:
+                duration = DURATION_ALPHA * r.duration_s + (1 - DURATION_ALPHA) * prev["duration_s"]
+            self.state["suites"][rel] = {
+                "key": self.suite_key(rel),
+                "passed": bool(r.passed),
+                "tests_run": r.tests_run,
+                "duration_s": round(duration, 3),
+                "at": now,
+            }
+        tests = set(self.test_files())
+        for rel in list(self.state["suites"]):
+            if rel not in tests:
+                del self.state["suites"][rel]
+        green = all(self.state["suites"].get(rel, {}).get("passed") for rel in tests)
+        if green:
+            importers = defaultdict(list)
+            for src, deps in self.graph().items():
+                for dep in deps:
+                    importers[dep].append(src)
+            self.state["green"] = {"at": now, "hashes": dict(self._hashes),
+                                   "importers": dict(importers)}
+        self.save()
+        return green
+
+    def content_fingerprint(self) -> str:
+        """Stable hash of every test file's import closure (content, not mtime)."""
+        h = hashlib.sha1()
+        for rel in self.test_files():
+            h.update(f"{rel}\0{self.suite_key(rel)}\0".encode())
+        return h.hexdigest()
+
+
+def run_impacted(root: str = SCRIPT_DIR, workers: int = 4,
+                 selector: Optional[ImpactSelector] = None) -> tuple:
+    """Plan, run the impacted suites longest-first, record. Returns (plan, results)."""
+    from warm_test_pool import WarmTestPool
+    sel = selector or ImpactSelector(root)
+    plan = sel.plan()
+    paths = [os.path.join(sel.root, rel) for rel in plan.to_run]
+    results = WarmTestPool(workers=workers, root=sel.root).run(paths) if paths else []
+    sel.record(results)
+    return plan, results
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Change-impact test selection")
+    parser.add_argument("command", choices=["plan", "run", "reset"])
+    parser.add_argument("--root", default=SCRIPT_DIR)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    sel = ImpactSelector(args.root)
+    if args.command == "reset":
+        sel.reset()
+        print("Impact history cleared.")
+        return
+
+    if args.command == "plan":
+        plan = sel.plan()
+        if args.json:
+            print(json.dumps(plan.to_dict(), indent=2))
+            return
+        label = "no green run yet" if plan.first_run else f"{len(plan.changed_files)} files changed"
+        print(f"Impact: {label} -> {len(plan.to_run)} suites to run, {len(plan.cached)} cached "
+              f"(~{plan.estimated_s:.1f}s serial)")
+        for rel in plan.to_run:
+            print(f"  {rel}  [{plan.reasons[rel]}]")
+        return
+
+    from parallel_test_runner import format_results
+    start = time.monotonic()
+    plan, results = run_impacted(args.root, workers=args.workers, selector=sel)
+    print(f"Impact: ran {len(plan.to_run)} suites, {len(plan.cached)} cached")
+    if results:
+        print(format_results(results))
+    print(f"\nWall time: {time.monotonic() - start:.1f}s")
+    sys.exit(0 if all(r.passed for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
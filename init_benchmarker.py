@@ -15,6 +15,7 @@ CLI:
     python3 init_benchmarker.py baseline     # Seed S95-S98 baseline data
     python3 init_benchmarker.py compare      # Compare trials vs baseline
     python3 init_benchmarker.py verdict      # Final recommendation
+    python3 init_benchmarker.py steps        # Per-step slim_init timings
 
 Stdlib only. No external dependencies.
 """
@@ -29,6 +30,7 @@ from session_id import normalize as normalize_session_id
 
 CCA_DIR = Path.home() / "Projects/ClaudeCodeAdvancements"
 BENCH_FILE = CCA_DIR / ".cca-init-benchmarks.jsonl"
+STEP_BENCH_FILE = CCA_DIR / ".cca-init-steps.jsonl"
 
 
 @dataclass
@@ -204,6 +206,100 @@ def format_comparison_table(baseline_avg: dict, trials: List[dict]) -> str:
     return "\n".join(lines)
 
 
+# ── Per-step slim_init timings ───────────────────────────────────────────
+
+
+def save_step_timings(
+    session_id: str,
+    wall_seconds: float,
+    steps: dict,
+    bench_file: Path = STEP_BENCH_FILE,
+) -> dict:
+    """Append one slim_init run's step timings.
+
+    steps maps step name -> {"seconds": float, "cached": bool}.
+    """
+    try:
+        session_id = normalize_session_id(session_id)
+    except (ValueError, TypeError):
+        pass
+    record = {
+        "session_id": session_id,
+        "wall_seconds": round(wall_seconds, 3),
+        "serial_seconds": round(sum(s.get("seconds", 0.0) for s in steps.values()), 3),
+        "steps": steps,
+    }
+    bench_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(bench_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def load_step_timings(bench_file: Path = STEP_BENCH_FILE) -> List[dict]:
+    """Load recorded slim_init step timing runs."""
+    if not bench_file.exists():
+        return []
+    runs = []
+    with open(bench_file) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                d = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(d, dict) and isinstance(d.get("steps"), dict):
+                runs.append(d)
+    return runs
+
+
+def summarize_step_timings(runs: List[dict]) -> dict:
+    """Average wall time, and per-step average seconds (uncached runs) and cache hit rate."""
+    if not runs:
+        return {"runs": 0, "avg_wall_seconds": 0, "avg_serial_seconds": 0, "steps": {}}
+    per_step: dict = {}
+    for run in runs:
+        for name, t in run["steps"].items():
+            s = per_step.setdefault(name, {"runs": 0, "cached": 0, "uncached_seconds": []})
+            s["runs"] += 1
+            if t.get("cached"):
+                s["cached"] += 1
+            else:
+                s["uncached_seconds"].append(t.get("seconds", 0.0))
+    steps = {}
+    for name, s in per_step.items():
+        uncached = s["uncached_seconds"]
+        steps[name] = {
+            "runs": s["runs"],
+            "cache_hit_rate": round(s["cached"] / s["runs"], 2),
+            "avg_seconds": round(sum(uncached) / len(uncached), 3) if uncached else 0.0,
+        }
+    n = len(runs)
+    return {
+        "runs": n,
+        "avg_wall_seconds": round(sum(r.get("wall_seconds", 0) for r in runs) / n, 3),
+        "avg_serial_seconds": round(sum(r.get("serial_seconds", 0) for r in runs) / n, 3),
+        "steps": steps,
+    }
+
+
+def format_step_table(summary: dict) -> str:
+    """Format per-step timings, slowest first."""
+    if not summary.get("runs"):
+        return "No step timings recorded."
+    lines = [
+        f"{summary['runs']} runs — avg wall {summary['avg_wall_seconds']:.1f}s "
+        f"(serial sum {summary['avg_serial_seconds']:.1f}s)",
+        f"{'Step':<24} {'Avg (s)':<10} {'Cache hits':<10}",
+        "-" * 44,
+    ]
+    ordered = sorted(summary["steps"].items(), key=lambda kv: kv[1]["avg_seconds"], reverse=True)
+    for name, s in ordered:
+        lines.append(f"{name:<24} {s['avg_seconds']:<10.2f} {s['cache_hit_rate'] * 100:.0f}%")
+    return "\n".join(lines)
+
+
 if __name__ == "__main__":
     args = sys.argv[1:]
     if not args:
@@ -212,6 +308,7 @@ if __name__ == "__main__":
         print("  python3 init_benchmarker.py baseline    # Seed S95-S98 data")
         print("  python3 init_benchmarker.py compare     # Show comparison table")
         print("  python3 init_benchmarker.py verdict     # Final recommendation")
+        print("  python3 init_benchmarker.py steps       # Per-step slim_init timings")
         sys.exit(0)
 
     cmd = args[0]
@@ -261,6 +358,9 @@ if __name__ == "__main__":
         verdict = compute_verdict(comparisons)
         print(verdict["recommendation"])
 
+    elif cmd == "steps":
+        print(format_step_table(summarize_step_timings(load_step_timings())))
+
     else:
         print(f"Unknown command: {cmd}")
         sys.exit(1)
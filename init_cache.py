@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import json
 import os
-import subprocess
 import sys
 import time
 from dataclasses import dataclass, asdict
@@ -27,6 +26,9 @@ from pathlib import Path
 CACHE_FILE = Path.home() / ".cca-test-cache.json"
 PROJECT_ROOT = Path(__file__).resolve().parent
 
+# Concurrent suites for smoke runs and test collection (warm_test_pool)
+SMOKE_WORKERS = 4
+
 # Critical suites for smoke test (most important, fastest)
 SMOKE_SUITES = [
     "agent-guard/tests/test_path_validator.py",
@@ -50,7 +52,7 @@ class TestCache:
     all_passed: bool = False
     timestamp: float = 0.0
     session: str = ""
-    test_file_hash: str = ""  # Hash of test file mtimes for staleness
+    test_file_hash: str = ""  # Content hash of test files + import closures
 
     def age_minutes(self) -> float:
         return (time.time() - self.timestamp) / 60
@@ -86,67 +88,44 @@ def _find_test_files() -> list[Path]:
 
 
 def _compute_test_file_hash() -> str:
-    """Hash of all test file modification times — detects any test file change."""
-    test_files = _find_test_files()
-    mtimes = []
-    for f in test_files:
-        try:
-            mtimes.append(f"{f.relative_to(PROJECT_ROOT)}:{f.stat().st_mtime:.0f}")
-        except OSError:
-            pass
-    return str(hash(tuple(mtimes)))
+    """Content hash of every test file and the project code it imports.
+
+    Stable across processes (sha1, not hash()) and insensitive to mtime-only
+    touches; any edit to a suite or a module in its import closure changes it.
+    """
+    from impact_selector import ImpactSelector
+    selector = ImpactSelector(str(PROJECT_ROOT))
+    fingerprint = selector.content_fingerprint()
+    selector.save()  # persist the (size, mtime) memo so the next call is stat-only
+    return fingerprint
 
 
 def _count_tests_and_suites() -> tuple[int, int]:
-    """Count test methods and suites by running unittest discovery."""
-    test_files = _find_test_files()
-    total_tests = 0
-    total_suites = len(test_files)
-
-    for f in test_files:
-        try:
-            result = subprocess.run(
-                [sys.executable, str(f)],
-                capture_output=True, text=True, timeout=30,
-            )
-            # Parse "Ran N tests" from stderr
-            for line in result.stderr.splitlines():
-                if line.startswith("Ran "):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        try:
-                            total_tests += int(parts[1])
-                        except ValueError:
-                            pass
-                    break
-        except (subprocess.TimeoutExpired, OSError):
-            pass
-
-    return total_tests, total_suites
+    """Count test methods and suites by collecting (not running) every suite."""
+    from warm_test_pool import WarmTestPool
+    test_files = [str(f) for f in _find_test_files()]
+    counts = WarmTestPool(workers=SMOKE_WORKERS, root=str(PROJECT_ROOT)).collect(test_files)
+    return sum(counts.values()), len(test_files)
 
 
 def _run_smoke_tests() -> tuple[bool, int, int]:
     """Run critical smoke suites only. Returns (all_passed, passed_count, total_count)."""
+    from warm_test_pool import WarmTestPool
+    suites = [s for s in SMOKE_SUITES if (PROJECT_ROOT / s).exists()]
+    pool = WarmTestPool(workers=SMOKE_WORKERS, root=str(PROJECT_ROOT), timeout_s=30)
+    results = pool.run([str(PROJECT_ROOT / s) for s in suites])
+
     passed = 0
     failed = 0
-
-    for suite in SMOKE_SUITES:
-        suite_path = PROJECT_ROOT / suite
-        if not suite_path.exists():
-            continue
-        try:
-            result = subprocess.run(
-                [sys.executable, str(suite_path)],
-                capture_output=True, text=True, timeout=30,
-            )
-            if result.returncode == 0:
-                passed += 1
-            else:
-                failed += 1
-                print(f"  FAIL: {suite}", file=sys.stderr)
-        except (subprocess.TimeoutExpired, OSError) as e:
+    for suite, result in zip(suites, results):
+        if result.passed:
+            passed += 1
+        elif result.error == "timeout":
+            failed += 1
+            print(f"  ERROR: {suite}: timeout", file=sys.stderr)
+        else:
             failed += 1
-            print(f"  ERROR: {suite}: {e}", file=sys.stderr)
+            print(f"  FAIL: {suite}", file=sys.stderr)
 
     total = passed + failed
     return failed == 0, passed, total
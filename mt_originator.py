@@ -20,6 +20,7 @@ import json
 import math
 import os
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, asdict, field
 from datetime import date
@@ -31,16 +32,6 @@ PROPOSALS_PATH = os.path.join(SCRIPT_DIR, "mt_proposals.jsonl")
 MASTER_TASKS_PATH = os.path.join(SCRIPT_DIR, "MASTER_TASKS.md")
 CROSS_CHAT_PATH = os.path.expanduser("~/.claude/cross-chat/POLYBOT_TO_CCA.md")
 
-# Pattern: [date] [VERDICT] [frontier/tag] title — url
-FINDING_RE = re.compile(
-    r'^\[(\d{4}-\d{2}-\d{2})\]\s+'
-    r'\[(\w+(?:-\w+)?)\]\s+'
-    r'\[([^\]]+)\]\s+'
-    r'(.+?)(?:\s*—\s*(https?://\S+))?$'
-)
-
-POINTS_RE = re.compile(r'\((\d+)pts')
-
 MT_HEADER_RE = re.compile(r'^## MT-(\d+):')
 
 
@@ -95,35 +86,42 @@ class MTProposal:
         return f"[{self.score:.1f}] {self.name}{cluster_tag} — {self.frontier}"
 
 
+def _findings_index():
+    """Import self-learning/findings_index.py (the shared FINDINGS_LOG parser).
+
+    Appended rather than prepended to sys.path so self-learning/ never
+    shadows root modules of the same name (e.g. session_metrics).
+    """
+    path = os.path.join(SCRIPT_DIR, "self-learning")
+    if path not in sys.path:
+        sys.path.append(path)
+    import findings_index
+    return findings_index
+
+
+def _finding(entry: dict) -> Finding:
+    return Finding(
+        date=entry["date"],
+        verdict=entry["verdict"],
+        frontier=entry["frontier"],
+        title=entry["headline"],
+        url=entry["url"],
+        points=entry["points"],
+    )
+
+
 def parse_findings_log(text: str) -> list[Finding]:
     """Parse FINDINGS_LOG.md text into Finding objects."""
-    findings = []
-    for line in text.splitlines():
-        line = line.strip()
-        m = FINDING_RE.match(line)
-        if not m:
-            continue
-        date_str, verdict, frontier, title, url = m.groups()
-        url = url or ""
-
-        # Extract points if present
-        pm = POINTS_RE.search(title)
-        points = int(pm.group(1)) if pm else 0
-
-        # Clean title — take first sentence/phrase
-        title_clean = title.split("—")[0].strip().rstrip(".")
-        if len(title_clean) > 120:
-            title_clean = title_clean[:117] + "..."
-
-        findings.append(Finding(
-            date=date_str,
-            verdict=verdict,
-            frontier=frontier,
-            title=title_clean,
-            url=url,
-            points=points,
-        ))
-    return findings
+    entries = _findings_index().parse_text(text)
+    return [_finding(e) for e in entries if e["frontier"] and e["rest"]]
+
+
+def load_findings(path: str = FINDINGS_LOG_PATH) -> list[Finding]:
+    """Findings from the shared FINDINGS_LOG.md index (only new lines re-parsed)."""
+    if not os.path.exists(path):
+        return []
+    rows = _findings_index().FindingsIndex.for_path(path).rows()
+    return [_finding(r) for r in rows if r["frontier"] and r["rest"]]
 
 
 def get_existing_mt_coverage() -> dict[int, list[str]]:
@@ -930,6 +928,7 @@ def unified_origination(
     findings_text: str = "",
     master_tasks_text: str = "",
     cross_chat_text: str = "",
+    findings: Optional[list[Finding]] = None,
 ) -> OriginationReport:
     """Run all 3 origination sources and produce a unified report.
 
@@ -939,9 +938,11 @@ def unified_origination(
     3. POLYBOT_TO_CCA.md — unresolved requests -> research priorities
 
     Also includes BUILD findings -> new MT proposals (existing Phase 1-3 logic).
+    Pass already-loaded `findings` to skip re-parsing findings_text.
     """
     # Source 1: ADAPT extensions
-    findings = parse_findings_log(findings_text)
+    if findings is None:
+        findings = parse_findings_log(findings_text)
     adapt_extensions = find_actionable_adapts(findings)
 
     # Source 2: Stalled MTs
@@ -982,8 +983,7 @@ def main():
     parser.add_argument("--top", type=int, default=3, help="Number of top proposals to show")
     args = parser.parse_args()
 
-    text = load_findings_log(args.findings)
-    findings = parse_findings_log(text)
+    findings = load_findings(args.findings)
     builds = [f for f in findings if f.verdict == "BUILD"]
 
     print(f"Parsed {len(findings)} findings ({len(builds)} BUILD)")
@@ -1001,9 +1001,9 @@ def main():
                 cc_text = f.read()
 
         report = unified_origination(
-            findings_text=text,
             master_tasks_text=mt_text,
             cross_chat_text=cc_text,
+            findings=findings,
         )
 
         if args.json:
@@ -10,8 +10,19 @@ Usage:
     python3 parallel_test_runner.py                  # Run all, 4 workers
     python3 parallel_test_runner.py --workers 8      # 8 workers
     python3 parallel_test_runner.py --json            # JSON output
-    python3 parallel_test_runner.py --changed-only    # Only suites for changed files
+    python3 parallel_test_runner.py --changed-only    # Only suites impacted since last green
     python3 parallel_test_runner.py --quick           # Smoke test (10 core suites)
+    python3 parallel_test_runner.py --cold            # Fresh interpreter per suite
+
+By default the CLI runs suites through warm_test_pool.WarmTestPool: one
+warm interpreter forks a child per suite, and the child runs it in-process
+with unittest. That skips interpreter startup and re-imports, and it
+returns per-test results. --cold runs each suite as a subprocess instead,
+as CI does.
+
+--changed-only selects suites through impact_selector: only those whose
+import closure contains a file changed since the last all-green run, run
+longest-first by recorded duration.
 
 Stdlib only. No external dependencies.
 """
@@ -51,6 +62,8 @@ class SuiteResult:
     duration_s: float
     output: str
     error: Optional[str] = None
+    # Per-test {"name", "outcome", "duration_s", "detail"} (warm runs only)
+    tests: list = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -131,17 +144,27 @@ def run_single_suite(path: str) -> SuiteResult:
 def run_all_parallel(
     test_files: list[str],
     workers: int = 4,
+    warm: bool = False,
 ) -> list[SuiteResult]:
-    """Run all test suites in parallel."""
+    """Run all test suites in parallel.
+
+    warm=True forks suites from a warm interpreter (see warm_test_pool)
+    instead of starting a subprocess per suite.
+    """
     if not test_files:
         return []
+    if warm:
+        from warm_test_pool import WarmTestPool
+        if WarmTestPool.supported():
+            return WarmTestPool(workers=workers).run(test_files)
     # Cap workers at file count
     actual_workers = min(workers, len(test_files))
     if actual_workers <= 1:
         return [run_single_suite(f) for f in test_files]
 
     with Pool(processes=actual_workers) as pool:
-        results = pool.map(run_single_suite, test_files)
+        # chunksize=1 dispatches in list order, so longest-first plans stay LPT
+        results = pool.map(run_single_suite, test_files, chunksize=1)
     return results
 
 
@@ -174,17 +197,31 @@ def main():
     parser.add_argument("--json", action="store_true", help="JSON output")
     parser.add_argument("--quick", action="store_true", help="Smoke test only (10 core suites)")
     parser.add_argument("--root", default=SCRIPT_DIR, help="Project root")
+    parser.add_argument("--cold", action="store_true", help="Fresh subprocess per suite (no warm pool)")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Only suites importing files changed since the last green run")
     args = parser.parse_args()
 
     start = time.monotonic()
 
+    selector = None
     if args.quick:
         test_files = [os.path.join(args.root, s) for s in SMOKE_SUITES
                      if os.path.exists(os.path.join(args.root, s))]
+    elif args.changed_only:
+        from impact_selector import ImpactSelector
+        selector = ImpactSelector(args.root)
+        plan = selector.plan()
+        test_files = [os.path.join(selector.root, rel) for rel in plan.to_run]  # longest-first
+        if not args.json:
+            label = "no green run yet" if plan.first_run else f"{len(plan.changed_files)} files changed"
+            print(f"Impact: {label} -> {len(plan.to_run)} suites to run, {len(plan.cached)} cached")
     else:
         test_files = discover_test_files(args.root)
 
-    results = run_all_parallel(test_files, workers=args.workers)
+    results = run_all_parallel(test_files, workers=args.workers, warm=not args.cold)
+    if selector is not None:
+        selector.record(results)
     wall_time = time.monotonic() - start
 
     if args.json:
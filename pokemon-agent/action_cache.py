@@ -11,6 +11,10 @@ Cache keys are derived from the game state (menu state, position, battle
 status). Cache entries expire after a configurable number of hits to
 prevent staleness.
 
+An optional ActionStore (action_store.py) backs the in-memory LRU with
+knowledge persisted across runs: misses fall through to the store, and
+puts/outcomes are written through to it.
+
 Inspired by mewtoo's ActionCache pattern.
 Stdlib only. No external dependencies.
 """
@@ -38,18 +42,22 @@ class ActionCache:
     the cache exceeds max_size.
     """
 
-    def __init__(self, max_size: int = 256, max_hits: int = 50):
+    def __init__(self, max_size: int = 256, max_hits: int = 50, store=None):
         """Initialize the cache.
 
         Args:
             max_size: Maximum number of cached state->action mappings.
             max_hits: After this many hits, expire the entry (forces re-evaluation).
+            store: Optional ActionStore consulted on misses and written through.
         """
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self.max_size = max_size
         self.max_hits = max_hits
+        self.store = store
+        self._expired: set = set()  # expired keys: not refilled from the store until put()
         self.total_hits = 0
         self.total_misses = 0
+        self.store_hits = 0
 
     def make_key(
         self,
@@ -74,20 +82,20 @@ class ActionCache:
         Increments hit counter and evicts if expired.
         """
         if key not in self._cache:
-            self.total_misses += 1
-            return None
+            if key in self._expired:
+                self.total_misses += 1
+                return None
+            return self._store_get(key)
 
         entry = self._cache[key]
 
-        # Expire if too many hits (force re-evaluation)
-        if entry.hits >= self.max_hits:
-            del self._cache[key]
-            self.total_misses += 1
-            return None
-
-        # Expire if success rate is poor (< 30% after 5+ uses)
-        if entry.hits >= 5 and entry.successes / entry.hits < 0.3:
+        # Expire if too many hits, or if success rate is poor (< 30% after
+        # 5+ uses). Either way the LLM re-evaluates, so the store must not
+        # hand the same action straight back.
+        if (entry.hits >= self.max_hits
+                or (entry.hits >= 5 and entry.successes / entry.hits < 0.3)):
             del self._cache[key]
+            self._expired.add(key)
             self.total_misses += 1
             return None
 
@@ -99,6 +107,19 @@ class ActionCache:
 
         return entry.buttons
 
+    def _store_get(self, key: str) -> Optional[List[str]]:
+        """Miss in memory: fall back to the persistent store, if any."""
+        buttons = self.store.lookup(key) if self.store is not None else None
+        if buttons is None or self.max_size <= 0:
+            self.total_misses += 1
+            return None
+        if len(self._cache) >= self.max_size:
+            self._cache.popitem(last=False)
+        self._cache[key] = CacheEntry(buttons=buttons, hits=1)
+        self.total_hits += 1
+        self.store_hits += 1
+        return buttons
+
     def put(self, key: str, buttons: List[str]) -> None:
         """Store an action for a state key.
 
@@ -107,6 +128,9 @@ class ActionCache:
         """
         if self.max_size <= 0:
             return
+        self._expired.discard(key)
+        if self.store is not None:
+            self.store.record(key, buttons)
         if key in self._cache:
             # Update existing entry
             self._cache[key].buttons = buttons
@@ -119,6 +143,8 @@ class ActionCache:
 
     def record_outcome(self, key: str, success: bool) -> None:
         """Record whether a cached action succeeded (state changed) or failed."""
+        if self.store is not None:
+            self.store.record_outcome(key, success)
         if key in self._cache:
             if success:
                 self._cache[key].successes += 1
@@ -144,8 +170,15 @@ class ActionCache:
             "total_hits": self.total_hits,
             "total_misses": self.total_misses,
             "hit_rate": round(self.hit_rate(), 3),
+            "store_hits": self.store_hits,
+            "llm_calls_saved": self.total_hits,
         }
 
+    def sync(self) -> None:
+        """Merge learned actions into the persistent store (no-op without one)."""
+        if self.store is not None:
+            self.store.save()
+
     def clear(self) -> None:
         """Clear all cached entries. Stats are preserved."""
         self._cache.clear()
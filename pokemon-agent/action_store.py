@@ -0,0 +1,312 @@
+"""Persistent action knowledge shared across runs and processes.
+
+ActionCache forgets everything when the process exits. ActionStore keeps
+the learned state -> buttons mappings on disk so every run (and every
+concurrent batch_eval worker) starts from what earlier runs learned.
+
+File format: a small header followed by fixed-size records sorted by a
+64-bit state hash. The file is memory-mapped at startup and looked up by
+binary search, so opening a large store costs nothing up front. Local
+changes are kept as deltas (successes/failures/hits since load) and
+merged into whatever is on disk at save time under an exclusive lock:
+concurrent writers add up instead of overwriting each other.
+
+Success and failure counts decay with a half-life, so knowledge that
+stops being confirmed fades; an action is served only while its
+confidence, (successes + 1) / (successes + failures + 2), stays above
+min_confidence.
+
+Usage:
+    from action_store import ActionStore
+
+    store = ActionStore("states/action_store_red.bin")
+    buttons = store.lookup(cache_key)         # None on miss / low confidence
+    store.record(cache_key, ["up", "a"])       # LLM chose this
+    store.record_outcome(cache_key, True)      # it changed the state
+    store.save()                               # merge-on-write
+    print(store.stats())
+
+Stdlib only. No external dependencies beyond project modules.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: saves are still atomic, just not merged under a lock
+    fcntl = None
+
+MAGIC = b"PKAS"
+VERSION = 1
+_HEADER = struct.Struct("<4sHxxI")    # magic, version, record count
+_RECORD = struct.Struct("<QIffId")    # hash, buttons, successes, failures, hits, updated
+
+HALF_LIFE_S = 3 * 24 * 3600    # counts halve after three days without updates
+MIN_CONFIDENCE = 0.6           # one fresh success serves; one failure after it doesn't
+SYNC_EVERY = 25                # local changes between automatic merge-on-write saves
+PUT_WEIGHT = 1.0               # an LLM choosing an action counts as one success
+
+BUTTON_CODES = {"a": 1, "b": 2, "start": 3, "select": 4,
+                "up": 5, "down": 6, "left": 7, "right": 8}
+_CODE_BUTTONS = {v: k for k, v in BUTTON_CODES.items()}
+MAX_BUTTONS = 8                # 4-bit codes packed into a u32
+
+
+def state_hash(key: str) -> int:
+    """Stable 64-bit hash of an ActionCache key (same in every process)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+
+
+def encode_buttons(buttons: List[str]) -> Optional[int]:
+    """Pack up to MAX_BUTTONS button names into an int, or None if not storable."""
+    if not buttons or len(buttons) > MAX_BUTTONS:
+        return None
+    code = 0
+    for i, button in enumerate(buttons):
+        value = BUTTON_CODES.get(button.lower())
+        if value is None:
+            return None
+        code |= value << (4 * i)
+    return code
+
+
+def decode_buttons(code: int) -> List[str]:
+    buttons = []
+    while code:
+        buttons.append(_CODE_BUTTONS[code & 0xF])
+        code >>= 4
+    return buttons
+
+
+@dataclass
+class ActionRecord:
+    """Stored knowledge for one state: the action and its (decaying) track record."""
+    buttons: int
+    successes: float = 0.0
+    failures: float = 0.0
+    hits: int = 0           # times served instead of calling the LLM
+    updated: float = 0.0
+
+    def decayed(self, now: float, half_life: float) -> Tuple[float, float]:
+        factor = 0.5 ** (max(0.0, now - self.updated) / half_life)
+        return self.successes * factor, self.failures * factor
+
+    def confidence(self, now: float, half_life: float) -> float:
+        s, f = self.decayed(now, half_life)
+        return (s + 1) / (s + f + 2)
+
+
+@dataclass
+class _Delta:
+    """Changes made in this process since the store was loaded."""
+    buttons: int
+    replace: bool = False   # buttons changed: discard the on-disk counts
+    successes: float = 0.0
+    failures: float = 0.0
+    hits: int = 0
+
+
+class ActionStore:
+    """Memory-mapped, merge-on-write store of state-hash -> action records."""
+
+    def __init__(self, path: str, half_life_s: float = HALF_LIFE_S,
+                 min_confidence: float = MIN_CONFIDENCE, sync_every: int = SYNC_EVERY):
+        self.path = path
+        self.half_life_s = half_life_s
+        self.min_confidence = min_confidence
+        self.sync_every = sync_every
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._pending: Dict[int, _Delta] = {}
+        self._changes = 0
+        self.lookups = 0
+        self.hits = 0
+        self.saves = 0
+        self._open()
+
+    # ── Disk view ──
+
+    def _open(self) -> None:
+        self._close_map()
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _HEADER.size:
+                    return
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # outlives f
+        except FileNotFoundError:
+            return
+        magic, version, count = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION or size < _HEADER.size + count * _RECORD.size:
+            mm.close()
+            return  # unknown/corrupt file: start empty, the next save replaces it
+        self._map, self._count = mm, count
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map, self._count = None, 0
+
+    def _disk_record(self, h: int) -> Optional[ActionRecord]:
+        """Binary search the mapped file for hash h."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key = struct.unpack_from("<Q", self._map, _HEADER.size + mid * _RECORD.size)[0]
+            if key < h:
+                lo = mid + 1
+            elif key > h:
+                hi = mid
+            else:
+                _, buttons, s, f, hits, updated = _RECORD.unpack_from(
+                    self._map, _HEADER.size + mid * _RECORD.size)
+                return ActionRecord(buttons, s, f, hits, updated)
+        return None
+
+    def _view(self, h: int, now: float) -> Optional[ActionRecord]:
+        """On-disk record (decayed to now) with this process's deltas applied."""
+        disk = self._disk_record(h) if self._map is not None else None
+        delta = self._pending.get(h)
+        if delta is None:
+            return disk
+        return self._apply(disk, delta, now)
+
+    def _apply(self, base: Optional[ActionRecord], delta: _Delta, now: float) -> ActionRecord:
+        if base is None or delta.replace or base.buttons != delta.buttons:
+            s = f = 0.0
+            hits = 0
+        else:
+            s, f = base.decayed(now, self.half_life_s)
+            hits = base.hits
+        return ActionRecord(delta.buttons, s + delta.successes, f + delta.failures,
+                            hits + delta.hits, now)
+
+    # ── Learning API ──
+
+    def lookup(self, key: str) -> Optional[List[str]]:
+        """Buttons for this state if known with enough confidence, else None."""
+        self.lookups += 1
+        h = state_hash(key)
+        now = time.time()
+        rec = self._view(h, now)
+        if rec is None or rec.confidence(now, self.half_life_s) < self.min_confidence:
+            return None
+        self.hits += 1
+        self._delta(h, rec.buttons).hits += 1
+        self._touch()
+        return decode_buttons(rec.buttons)
+
+    def record(self, key: str, buttons: List[str]) -> None:
+        """The LLM chose buttons in this state: reinforce, or replace a different action."""
+        code = encode_buttons(buttons)
+        if code is None:
+            return
+        h = state_hash(key)
+        current = self._view(h, time.time())
+        if current is not None and current.buttons != code:
+            self._pending[h] = _Delta(code, replace=True)
+        self._delta(h, code).successes += PUT_WEIGHT
+        self._touch()
+
+    def record_outcome(self, key: str, success: bool) -> None:
+        """Whether the stored action changed the game state when it was replayed."""
+        h = state_hash(key)
+        current = self._view(h, time.time())
+        if current is None:
+            return
+        delta = self._delta(h, current.buttons)
+        if success:
+            delta.successes += 1
+        else:
+            delta.failures += 1
+        self._touch()
+
+    def _delta(self, h: int, buttons: int) -> _Delta:
+        delta = self._pending.get(h)
+        if delta is None:
+            delta = self._pending[h] = _Delta(buttons)
+        return delta
+
+    def _touch(self) -> None:
+        self._changes += 1
+        if self.sync_every and self._changes >= self.sync_every:
+            self.save()
+
+    # ── Persistence ──
+
+    def save(self) -> int:
+        """Merge local deltas into the on-disk store. Returns records written."""
+        if not self._pending:
+            return self._count
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                self._open()  # another process may have saved since we loaded
+                now = time.time()
+                records = dict(self._iter_disk())
+                for h, delta in self._pending.items():
+                    records[h] = self._merge(records.get(h), delta, now)
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(_HEADER.pack(MAGIC, VERSION, len(records)))
+                    for h in sorted(records):
+                        r = records[h]
+                        f.write(_RECORD.pack(h, r.buttons, r.successes, r.failures, r.hits, r.updated))
+                os.replace(tmp, self.path)
+                self._pending.clear()
+                self._changes = 0
+                self.saves += 1
+                self._open()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        return self._count
+
+    def _merge(self, disk: Optional[ActionRecord], delta: _Delta, now: float) -> ActionRecord:
+        mine = self._apply(disk, delta, now)
+        if disk is None or disk.buttons == delta.buttons:
+            return mine
+        # Another run stored a different action for this state: keep the better one
+        if disk.confidence(now, self.half_life_s) > mine.confidence(now, self.half_life_s):
+            return disk
+        return mine
+
+    def _iter_disk(self):
+        for i in range(self._count):
+            h, buttons, s, f, hits, updated = _RECORD.unpack_from(
+                self._map, _HEADER.size + i * _RECORD.size)
+            yield h, ActionRecord(buttons, s, f, hits, updated)
+
+    def close(self) -> None:
+        self.save()
+        self._close_map()
+
+    # ── Reporting ──
+
+    def __len__(self) -> int:
+        return self._count + sum(1 for h in self._pending
+                                 if self._map is None or self._disk_record(h) is None)
+
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def stats(self) -> dict:
+        total_saved = sum(r.hits for _, r in self._iter_disk()) if self._map is not None else 0
+        total_saved += sum(d.hits for d in self._pending.values())
+        return {
+            "entries": len(self),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hit_rate(), 3),
+            "llm_calls_saved": self.hits,               # this process
+            "llm_calls_saved_all_runs": total_saved,    # persisted across runs
+        }
@@ -33,7 +33,7 @@ from agent_memory import AgentMemory, MapMarkers, Objectives
 from config import (
     MAX_HISTORY, MAX_TOKENS, MODEL_NAME, SAVE_INTERVAL,
     SCREENSHOT_UPSCALE, STUCK_THRESHOLD, STUCK_FORCE_NEW,
-    STUCK_STRATEGY_MEMORY,
+    STUCK_STRATEGY_MEMORY, STATE_FULL_EVERY,
     TEMPERATURE, STATE_DIR, SCREENSHOT_DIR, LOG_DIR,
 )
 from movement_validator import MovementValidator
@@ -43,13 +43,17 @@ from emulator_control import EmulatorControl
 from game_state import GameState, MapPosition, MenuState
 from memory_reader import MemoryReader
 from prompts import (
-    SYSTEM_PROMPT, build_user_message, build_summary_request,
+    SYSTEM_PROMPT, StateDeltaEncoder, build_user_message, build_summary_request,
     encode_screenshot_b64,
 )
 from tools import TOOLS, validate_tool_call
+from framebuffer import encode_png
 
 logger = logging.getLogger(__name__)
 
+# Tools that advance the game; each gets an in-memory savestate first
+REWINDABLE_TOOLS = frozenset({"press_buttons", "navigate_to", "wait"})
+
 
 # ── LLM client protocol (for testability) ───────────────────────────────────
 
@@ -209,6 +213,11 @@ class CrystalAgent:
     The model reasons and acts through tool calls.
     """
 
+    # Attach a screenshot to each LLM turn; batch evaluation turns this off
+    capture_screenshots: bool = True
+    # File name for screenshots when the backend has no raw framebuffer
+    screenshot_name: str = "crystal_screenshot"
+
     def __init__(
         self,
         emulator: EmulatorControl,
@@ -219,6 +228,7 @@ class CrystalAgent:
         save_interval: int = SAVE_INTERVAL,
         stuck_threshold: int = STUCK_THRESHOLD,
         model_name: str = MODEL_NAME,
+        state_full_every: int = STATE_FULL_EVERY,
     ):
         self.emulator = emulator
         self.reader = reader
@@ -234,6 +244,11 @@ class CrystalAgent:
         self.step_count: int = 0
         self.total_input_tokens: int = 0
         self.total_output_tokens: int = 0
+        self.llm_calls: int = 0
+        self.last_input_tokens: int = 0
+
+        # Game state in prompts: full snapshot every N turns, changes in between
+        self.state_encoder = StateDeltaEncoder(full_every=state_full_every)
 
         # Stuck detection
         self._last_positions: List[MapPosition] = []
@@ -254,6 +269,8 @@ class CrystalAgent:
 
         # Screen transition detection: skip LLM on blank/transition screens
         self.screen_detector = ScreenDetector()
+        self._sent_frame_digest: Optional[int] = None  # digest of the last screenshot sent
+        self.screenshots_skipped: int = 0
 
         # Action diversity: flag repetitive button presses (mewtoo pattern)
         self.diversity_checker = DiversityChecker()
@@ -534,9 +551,11 @@ class CrystalAgent:
 
         # 1.7. Screen transition detection: skip LLM on blank/transition screens
         screen_addrs = self._screen_detection_addresses()
-        joy_disabled = self.emulator.read_byte(screen_addrs["joy_disabled"])
-        battle_mode = self.emulator.read_byte(screen_addrs["battle_mode"])
-        window_stack = self.emulator.read_byte(screen_addrs["window_stack"])
+        # Served from the reader's RAM snapshot taken by read_game_state() above
+        joy_disabled = self.reader.peek(screen_addrs["joy_disabled"])
+        battle_mode = self.reader.peek(screen_addrs["battle_mode"])
+        window_stack = self.reader.peek(screen_addrs["window_stack"])
+        frame_digest = self.screen_detector.observe_frame(self.emulator.framebuffer())
         screen_state = self.screen_detector.classify(joy_disabled, battle_mode, window_stack)
         self.screen_detector.update(screen_state)
         if screen_state != ScreenState.ACTIVE:
@@ -562,8 +581,17 @@ class CrystalAgent:
             if cached_buttons is not None:
                 return self._cached_action_step(state, cached_buttons, cache_key)
 
-        # 3. Capture screenshot (if emulator supports it)
-        screenshot_b64 = self._capture_screenshot()
+        # 3. Capture screenshot (if emulator supports it) — unless the model
+        # already has this exact screen from an earlier turn
+        screenshot_b64 = None
+        screen_unchanged = False
+        if self.capture_screenshots:
+            if frame_digest is not None and frame_digest == self._sent_frame_digest:
+                screen_unchanged = True
+                self.screenshots_skipped += 1
+            else:
+                screenshot_b64 = self._capture_screenshot()
+                self._sent_frame_digest = frame_digest if screenshot_b64 else None
         blocked_info = self.movement_validator.format_for_prompt(state.position)
         diversity_info = self.diversity_checker.format_for_prompt()
         if blocked_info and diversity_info:
@@ -581,6 +609,8 @@ class CrystalAgent:
             stuck_threshold=self.stuck_threshold,
             blocked_directions=blocked_info,
             text_context=text_context,
+            state_text=self.state_encoder.encode(state, self.step_count),
+            screen_unchanged=screen_unchanged,
         )
         self.messages.append(user_msg)
 
@@ -592,6 +622,8 @@ class CrystalAgent:
             # Offline mode: press A to advance (title screen, dialogs, etc.)
             self.emulator.press("a")
             self.messages.pop()  # Remove the user message we just added
+            self.state_encoder.reset()  # ...so the model never saw that baseline
+            self._sent_frame_digest = None  # ...nor that screenshot
             return StepResult(
                 step_number=self.step_count, state=state,
                 llm_text="[offline: press a]",
@@ -610,6 +642,8 @@ class CrystalAgent:
 
         self.total_input_tokens += response.input_tokens
         self.total_output_tokens += response.output_tokens
+        self.llm_calls += 1
+        self.last_input_tokens = response.input_tokens
 
         # 6. Add assistant response to history
         assistant_msg = self._response_to_message(response)
@@ -718,13 +752,18 @@ class CrystalAgent:
         return count
 
     def _capture_screenshot(self) -> Optional[str]:
-        """Capture and encode a screenshot, or None if unavailable."""
+        """Capture and encode a screenshot, or None if unavailable.
+
+        Encodes the raw framebuffer in memory; backends without one fall
+        back to the emulator's PNG writer and a file round trip.
+        """
         try:
-            # Save to an in-memory buffer
-            tmp_path = "/tmp/crystal_screenshot.png"
-            self.emulator.screenshot("crystal_screenshot")
+            frame = self.emulator.framebuffer()
+            if frame is not None:
+                return encode_screenshot_b64(encode_png(*frame))
+            self.emulator.screenshot(self.screenshot_name)
             # Read it back and encode
-            path = self.emulator._state_path("crystal_screenshot", ext=".png")
+            path = self.emulator._state_path(self.screenshot_name, ext=".png")
             if os.path.exists(path):
                 with open(path, "rb") as f:
                     data = f.read()
@@ -761,6 +800,10 @@ class CrystalAgent:
         # Capture pre-action state for verification
         pre_state = self.reader.read_game_state()
 
+        # In-memory savestate so this action can be rewound (no file I/O)
+        if tool_use.name in REWINDABLE_TOOLS:
+            self.checkpoint_mgr.snapshot(self.step_count, label=tool_use.name)
+
         if tool_use.name == "press_buttons":
             result = self._tool_press_buttons(tool_use.input)
         elif tool_use.name == "navigate_to":
@@ -847,10 +890,9 @@ class CrystalAgent:
             return {"error": "No checkpoint available to reload"}
 
         try:
-            # Extract the state name from the path
-            name = os.path.basename(latest["path"]).replace(".state", "")
-            self.emulator.load_state(name)
-            logger.info("Reloaded checkpoint step %d: %s", latest["step"], reason)
+            source = self.checkpoint_mgr.restore_checkpoint(latest)
+            logger.info("Reloaded checkpoint step %d from %s: %s",
+                        latest["step"], source, reason)
             return {
                 "reloaded": True,
                 "checkpoint_step": latest["step"],
@@ -1033,6 +1075,7 @@ class CrystalAgent:
 
         self.total_input_tokens += response.input_tokens
         self.total_output_tokens += response.output_tokens
+        self.llm_calls += 1
 
         # Replace history with just the summary
         summary_text = response.text or "Summary unavailable."
@@ -1046,6 +1089,8 @@ class CrystalAgent:
             "role": "assistant",
             "content": [{"type": "text", "text": "Understood. I'll continue from this summary."}],
         }]
+        self.state_encoder.reset()  # the last full snapshot was summarized away
+        self._sent_frame_digest = None  # and so was the last screenshot
 
         logger.info("Summarized %d messages into summary", len(summary_messages))
 
@@ -1068,4 +1113,9 @@ class CrystalAgent:
             "total_tokens": self.total_input_tokens + self.total_output_tokens,
             "steps": self.step_count,
             "messages": len(self.messages),
+            "llm_calls": self.llm_calls,
+            "last_input_tokens": self.last_input_tokens,
+            "avg_input_tokens": (self.total_input_tokens // self.llm_calls) if self.llm_calls else 0,
+            "state_prompt": self.state_encoder.stats(),
+            "screenshots_skipped": self.screenshots_skipped,
         }
@@ -0,0 +1,394 @@
+"""Batch headless evaluation — N emulators, one savestate, no LLM, no throttle.
+
+Live play runs one emulator at wall-clock pace behind an LLM. For
+regression-testing navigation, boot sequences and the agent's
+deterministic layers that is hours of waiting. This harness launches
+one headless emulator per episode across a process pool, starting every
+episode from the same savestate, and drives it with a policy that needs
+no API calls:
+
+    scripted   - cycle a fixed button script
+    battle_ai  - the agent loop with llm=None: battle AI in battles,
+                 auto-advance/transition handling, press A otherwise
+    mock_llm   - the full agent loop with MockLLMClient answering with the
+                 button script (exercises the action cache, stuck
+                 detection and tool execution)
+
+Emulation is unthrottled, screenshots are off, and frames the policy
+never looks at are not rendered (mGBA frame-skip; RAM is still exact).
+Progress is read from RAM every observe_every steps and aggregated:
+badges, maps visited, steps-to-goal, frames and emulated fps.
+
+With --action-store every episode's ActionCache is backed by one
+persistent ActionStore file; workers merge what they learned into it as
+they go, and the summary reports cache hit rate and LLM calls saved.
+
+Usage:
+    from batch_eval import EpisodeSpec, run_batch, summarize
+
+    specs = [EpisodeSpec(rom="pokemon_red.gb", state="states/pallet.state",
+                         policy="battle_ai", steps=500, goal_map=12, seed=i)
+             for i in range(8)]
+    results = run_batch(specs, workers=4)
+    print(summarize(results))
+
+CLI:
+    python3 batch_eval.py --rom pokemon_red.gb --state states/pallet.state \\
+        --policy battle_ai --episodes 8 --steps 500 --goal-map 12
+    python3 batch_eval.py --rom pokemon_red.gb --boot --policy scripted \\
+        --script up,up,a --episodes 4 --json results.json
+    python3 batch_eval.py --policy mock_llm --script up,a --episodes 8 \
+        --action-store states/action_store_red.bin
+
+Stdlib only. No external dependencies beyond project modules.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+POLICIES = ("scripted", "battle_ai", "mock_llm")
+DEFAULT_SCRIPT = ["a"]
+DEFAULT_FRAMESKIP = 8       # render 1 frame in 9 while stepping
+SAVE_INTERVAL_OFF = 10 ** 9  # keep the agent's periodic saves out of batch runs
+
+
+# ── Specs and results ───────────────────────────────────────────────────────
+
+
+@dataclass
+class EpisodeSpec:
+    """One episode: where to start, how to act, when to stop."""
+    rom: str = ""                 # ROM path; "" runs on MockBackend (tests, dry runs)
+    state: str = ""               # savestate every episode starts from ("" = power on)
+    policy: str = "battle_ai"
+    steps: int = 200
+    seed: int = 0                 # shuffles the script start so episodes diverge
+    script: List[str] = field(default_factory=lambda: list(DEFAULT_SCRIPT))
+    boot: bool = False            # run the game's boot sequence before the policy
+    goal_map: Optional[int] = None
+    goal_badges: Optional[int] = None
+    observe_every: int = 1        # read progress from RAM every N steps
+    frameskip: int = DEFAULT_FRAMESKIP
+    stop_at_goal: bool = True
+    action_store: str = ""        # shared ActionStore path for agent policies ("" = off)
+
+    @property
+    def game(self) -> str:
+        return "crystal" if self.rom.lower().endswith(".gbc") else "red"
+
+
+@dataclass
+class EpisodeResult:
+    """Progress metrics for one finished (or failed) episode."""
+    index: int
+    policy: str
+    seed: int
+    steps: int = 0
+    frames: int = 0
+    wall_s: float = 0.0
+    badges_start: int = 0
+    badges_end: int = 0
+    maps_visited: List[int] = field(default_factory=list)
+    final_map: int = -1
+    final_position: tuple = (0, 0)
+    battle_steps: int = 0
+    reached_goal: bool = False
+    steps_to_goal: Optional[int] = None
+    boot_success: Optional[bool] = None
+    frameskip_active: bool = False
+    cache_lookups: int = 0
+    cache_hits: int = 0           # each hit is an LLM call not made
+    store_hits: int = 0           # of which answered from the persistent store
+    error: str = ""
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.wall_s if self.wall_s > 0 else 0.0
+
+
+# ── Episode runner (executes inside a pool worker) ──────────────────────────
+
+
+def _make_emulator(spec: EpisodeSpec, state_dir: str):
+    from emulator_control import EmulatorControl
+    if spec.rom:
+        emu = EmulatorControl.from_rom(spec.rom, headless=True, speed=0)
+    else:
+        emu = EmulatorControl.mock()
+    emu.set_state_dir(state_dir)
+    if spec.state:
+        emu.load_state(os.path.abspath(spec.state))
+    return emu
+
+
+def _make_reader(spec: EpisodeSpec, emu):
+    if spec.game == "crystal":
+        from memory_reader import MemoryReader
+        return MemoryReader(emu)
+    from memory_reader_red import MemoryReaderRed
+    return MemoryReaderRed(emu)
+
+
+def _run_boot(spec: EpisodeSpec, emu, reader) -> bool:
+    if spec.game == "crystal":
+        from boot_sequence_crystal import run_crystal_boot_sequence
+        return bool(run_crystal_boot_sequence(emu, reader)["success"])
+    from boot_sequence import run_boot_sequence
+    return bool(run_boot_sequence(emu, reader)["success"])
+
+
+def _make_agent(spec: EpisodeSpec, emu, reader, state_dir: str, llm):
+    if spec.game == "crystal":
+        from agent import CrystalAgent
+        agent = CrystalAgent(emu, reader, llm=llm, save_interval=SAVE_INTERVAL_OFF)
+    else:
+        from red_agent import RedAgent
+        agent = RedAgent(emu, llm=llm, save_interval=SAVE_INTERVAL_OFF)
+    agent.checkpoint_mgr.state_dir = state_dir  # episode-private checkpoints
+    agent.capture_screenshots = False
+    if spec.action_store:
+        from action_store import ActionStore
+        agent.action_cache.store = ActionStore(spec.action_store)
+    return agent
+
+
+def _make_policy(spec: EpisodeSpec, emu, reader, state_dir: str):
+    """Return (step, agent): a zero-argument callable that advances the episode
+    by one step, and the agent behind it (None for the scripted policy)."""
+    script = list(spec.script) or list(DEFAULT_SCRIPT)
+    offset = random.Random(spec.seed).randrange(len(script))
+
+    if spec.policy == "scripted":
+        counter = iter(range(offset, 1 << 62))
+        return lambda: emu.press(script[next(counter) % len(script)]), None
+
+    if spec.policy == "battle_ai":
+        agent = _make_agent(spec, emu, reader, state_dir, llm=None)
+        return agent.step, agent
+
+    if spec.policy == "mock_llm":
+        from agent import LLMResponse, MockLLMClient, ToolUse
+        responses = [
+            LLMResponse(text=f"[script {i}]",
+                        tool_uses=[ToolUse(id=f"s{i}", name="press_buttons",
+                                           input={"buttons": [script[(offset + i) % len(script)]]})])
+            for i in range(spec.steps)
+        ]
+        agent = _make_agent(spec, emu, reader, state_dir, llm=MockLLMClient(responses))
+        return agent.step, agent
+
+    raise ValueError(f"Unknown policy {spec.policy!r} (choose from {', '.join(POLICIES)})")
+
+
+def _goal_met(spec: EpisodeSpec, state) -> bool:
+    if spec.goal_map is None and spec.goal_badges is None:
+        return False
+    if spec.goal_map is not None and state.position.map_id != spec.goal_map:
+        return False
+    if spec.goal_badges is not None and state.badges.count() < spec.goal_badges:
+        return False
+    return True
+
+
+def run_episode(spec: EpisodeSpec, index: int = 0) -> EpisodeResult:
+    """Run one episode to completion; errors are captured in the result."""
+    result = EpisodeResult(index=index, policy=spec.policy, seed=spec.seed)
+    state_dir = tempfile.mkdtemp(prefix=f"batch_eval_{index}_")
+    emu = agent = None
+    start = time.perf_counter()
+    try:
+        emu = _make_emulator(spec, state_dir)
+        reader = _make_reader(spec, emu)
+        result.frameskip_active = emu.set_frameskip(spec.frameskip)
+        if spec.boot:
+            result.boot_success = _run_boot(spec, emu, reader)
+        step, agent = _make_policy(spec, emu, reader, state_dir)
+        frames_start = emu.frames
+
+        maps = set()
+        state = reader.read_game_state()
+        result.badges_start = state.badges.count()
+        maps.add(state.position.map_id)
+        observe_every = max(1, spec.observe_every)
+        for n in range(1, spec.steps + 1):
+            step()
+            result.steps = n
+            if n % observe_every and n != spec.steps:
+                continue
+            state = reader.read_game_state()
+            maps.add(state.position.map_id)
+            result.battle_steps += state.battle.in_battle
+            if result.steps_to_goal is None and _goal_met(spec, state):
+                result.reached_goal = True
+                result.steps_to_goal = n
+                if spec.stop_at_goal:
+                    break
+
+        result.frames = emu.frames - frames_start
+        result.badges_end = state.badges.count()
+        result.maps_visited = sorted(maps)
+        result.final_map = state.position.map_id
+        result.final_position = (state.position.x, state.position.y)
+    except Exception as e:  # one bad episode must not sink the batch
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        result.wall_s = time.perf_counter() - start
+        if agent is not None:
+            cache = agent.action_cache
+            result.cache_lookups = cache.total_hits + cache.total_misses
+            result.cache_hits = cache.total_hits
+            result.store_hits = cache.store_hits
+            try:
+                cache.sync()  # merge into the shared store for later episodes
+            except OSError as e:
+                result.error = result.error or f"action store: {e}"
+        if emu is not None:
+            emu.close()
+        shutil.rmtree(state_dir, ignore_errors=True)
+    return result
+
+
+def _run_indexed(args) -> EpisodeResult:
+    index, spec = args
+    logging.disable(logging.INFO)  # agent step logs would swamp the pool's stderr
+    return run_episode(spec, index)
+
+
+# ── Batch + aggregation ─────────────────────────────────────────────────────
+
+
+def run_batch(specs: List[EpisodeSpec], workers: Optional[int] = None,
+              on_result: Optional[Callable[[EpisodeResult], None]] = None) -> List[EpisodeResult]:
+    """Run every spec across a process pool; results come back in spec order."""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(specs) or 1))
+    jobs = list(enumerate(specs))
+    results: List[Optional[EpisodeResult]] = [None] * len(specs)
+    if workers == 1:
+        finished = map(_run_indexed, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        finished = pool.imap_unordered(_run_indexed, jobs, chunksize=1)
+    try:
+        for res in finished:
+            results[res.index] = res
+            if on_result:
+                on_result(res)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return results
+
+
+def summarize(results: List[EpisodeResult]) -> dict:
+    """Aggregate progress metrics across episodes (errored episodes counted apart)."""
+    ok = [r for r in results if not r.error]
+    to_goal = [r.steps_to_goal for r in ok if r.steps_to_goal is not None]
+    frames = sum(r.frames for r in ok)
+    busy = sum(r.wall_s for r in ok)
+    summary = {
+        "episodes": len(results),
+        "errors": len(results) - len(ok),
+        "goal_rate": round(len(to_goal) / len(ok), 3) if ok else 0.0,
+        "steps_to_goal": None,
+        "badges_gained_mean": round(statistics.fmean(r.badges_end - r.badges_start for r in ok), 2) if ok else 0.0,
+        "badges_max": max((r.badges_end for r in ok), default=0),
+        "maps_visited_mean": round(statistics.fmean(len(r.maps_visited) for r in ok), 2) if ok else 0.0,
+        "maps_visited_union": len({m for r in ok for m in r.maps_visited}),
+        "steps_total": sum(r.steps for r in ok),
+        "frames_total": frames,
+        "fps_per_worker": round(frames / busy, 1) if busy else 0.0,
+    }
+    if to_goal:
+        summary["steps_to_goal"] = {
+            "min": min(to_goal), "median": statistics.median(to_goal), "max": max(to_goal),
+        }
+    lookups = sum(r.cache_lookups for r in ok)
+    if lookups:
+        summary["cache_hit_rate"] = round(sum(r.cache_hits for r in ok) / lookups, 3)
+        summary["llm_calls_saved"] = sum(r.cache_hits for r in ok)
+        summary["store_hits"] = sum(r.store_hits for r in ok)
+    boots = [r.boot_success for r in ok if r.boot_success is not None]
+    if boots:
+        summary["boot_success_rate"] = round(sum(boots) / len(boots), 3)
+    return summary
+
+
+def format_summary(results: List[EpisodeResult], summary: dict) -> str:
+    lines = [f"{'#':>3}  {'policy':<9} {'steps':>6} {'goal@':>6} {'badges':>7} {'maps':>5} {'fps':>8}  note"]
+    for r in results:
+        goal = str(r.steps_to_goal) if r.steps_to_goal is not None else "-"
+        note = r.error or ("" if r.boot_success is None else f"boot={'ok' if r.boot_success else 'FAIL'}")
+        lines.append(f"{r.index:>3}  {r.policy:<9} {r.steps:>6} {goal:>6} "
+                     f"{r.badges_start}->{r.badges_end:<4} {len(r.maps_visited):>5} {r.fps:>8.0f}  {note}")
+    stg = summary["steps_to_goal"]
+    lines.append("")
+    lines.append(f"{summary['episodes']} episodes ({summary['errors']} errors) | "
+                 f"goal rate {summary['goal_rate']:.0%}"
+                 + (f" | steps-to-goal median {stg['median']} (min {stg['min']}, max {stg['max']})" if stg else "")
+                 + f" | {summary['frames_total']} frames @ {summary['fps_per_worker']:.0f} fps/worker"
+                 + (f" | cache hit rate {summary['cache_hit_rate']:.0%}, "
+                    f"{summary['llm_calls_saved']} LLM calls saved ({summary['store_hits']} from store)"
+                    if "cache_hit_rate" in summary else ""))
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Batch headless evaluation of agent policies")
+    parser.add_argument("--rom", default="", help="ROM path (omit for a MockBackend dry run)")
+    parser.add_argument("--state", default="", help="Savestate every episode starts from")
+    parser.add_argument("--policy", choices=POLICIES, default="battle_ai")
+    parser.add_argument("--episodes", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=200, help="Max steps per episode")
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (default: CPU count)")
+    parser.add_argument("--script", default="a", help="Comma-separated buttons for scripted/mock_llm")
+    parser.add_argument("--boot", action="store_true", help="Run the boot sequence first")
+    parser.add_argument("--goal-map", type=int, default=None, help="Goal map id")
+    parser.add_argument("--goal-badges", type=int, default=None, help="Goal badge count")
+    parser.add_argument("--observe-every", type=int, default=1, help="Read progress every N steps")
+    parser.add_argument("--frameskip", type=int, default=DEFAULT_FRAMESKIP,
+                        help="Frames skipped between rendered frames (0 = render all)")
+    parser.add_argument("--action-store", default="",
+                        help="Persistent action cache shared by all episodes (merged on write)")
+    parser.add_argument("--json", default=None, help="Write per-episode results + summary here")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    script = [b.strip() for b in args.script.split(",") if b.strip()]
+    specs = [EpisodeSpec(rom=args.rom, state=args.state, policy=args.policy, steps=args.steps,
+                         seed=i, script=script, boot=args.boot, goal_map=args.goal_map,
+                         goal_badges=args.goal_badges, observe_every=args.observe_every,
+                         frameskip=args.frameskip, action_store=args.action_store)
+             for i in range(args.episodes)]
+    results = run_batch(specs, workers=args.workers,
+                        on_result=lambda r: print(f"  episode {r.index} done "
+                                                  f"({r.steps} steps, {r.wall_s:.1f}s)",
+                                                  file=sys.stderr))
+    summary = summarize(results)
+    print(format_summary(results, summary))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"summary": summary,
+                       "episodes": [dict(asdict(r), fps=r.fps) for r in results]}, f, indent=2)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
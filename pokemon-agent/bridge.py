@@ -1,43 +1,50 @@
-"""Claude Code bridge — runs the emulator and communicates via files.
+"""Claude Code bridge — runs the emulator and exchanges state/actions with the brain.
 
-This script runs mGBA headlessly and exposes game state via files that
-Claude Code can read. Claude Code acts as the brain (via slash command),
-reads the state, and writes actions. This script picks up those actions
-and executes them. Zero API cost — uses your Max subscription.
+This script runs mGBA headlessly and exposes game state to Claude Code,
+which acts as the brain (via slash command): it reads the state, and
+sends actions. This script picks up those actions and executes them.
+Zero API cost — uses your Max subscription.
 
 Supports: Pokemon Red (.gb), Pokemon Crystal (.gbc)
 
 Architecture:
     bridge.py (this)          <-->  Claude Code session
-    - Runs mGBA emulator             - Reads state.json
-    - Writes state.json               - Reads screenshot.png
-    - Writes screenshot.png            - Writes action.json
-    - Reads action.json                - Reasons about game
-    - Executes the action              - Decides next move
+    - Runs mGBA emulator             - Reads state
+    - Publishes state + frame         - Reads screenshot
+    - Receives an action              - Sends an action
+    - Executes the action              - Reasons about game
     - Loop                             - Loop
 
+Transports (--transport):
+    file  (default) - state.json / screenshot.png / action.json in bridge_io/,
+                      polled. Works with nothing but a shell.
+    http            - local HTTP on --port (see bridge_transport.py): long-poll
+                      /state, SSE /events, raw /frame, /frame.png on request,
+                      POST /action with correlation ids. No files, no polling.
+    Either way the viewer (viewer.html) subscribes to the /events stream.
+
 Usage:
     # Terminal 1: Start the emulator bridge
     cd pokemon-agent
-    python3 bridge.py --rom pokemon_red.gb
+    python3 bridge.py --rom pokemon_red.gb [--transport http]
 
     # Terminal 2 (Claude Code): Run the brain
     /pokemon-play
 
-Files (in pokemon-agent/bridge_io/):
+Files (in pokemon-agent/bridge_io/, file transport):
     state.json      - Current game state (RAM data)
     screenshot.png  - Current screen capture
     action.json     - Next action from Claude Code
-    log.jsonl       - Step-by-step history
+    log.jsonl       - Step-by-step history (both transports)
 
 Stdlib + mgba-py only.
 """
 from __future__ import annotations
 
 import argparse
-import http.server
 import json
 import os
+import re
 import sys
 import threading
 import time
@@ -47,6 +54,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from config import DEFAULT_ROM, STATE_DIR
+from framebuffer import encode_png, frame_digest
 
 BRIDGE_DIR = os.path.join(os.path.dirname(__file__), "bridge_io")
 STATE_FILE = os.path.join(BRIDGE_DIR, "state.json")
@@ -56,11 +64,13 @@ LOG_FILE = os.path.join(BRIDGE_DIR, "log.jsonl")
 READY_FILE = os.path.join(BRIDGE_DIR, ".ready")
 STOP_FILE = os.path.join(BRIDGE_DIR, ".stop")
 
+# Savestate names accepted from actions: a bare name, resolved inside the
+# emulator's state dir (no separators, dots or extensions)
+STATE_NAME_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
 
-def write_state(reader, emu, step: int, text_reader=None) -> dict:
-    """Read game state from RAM and write to state.json + screenshot."""
-    from game_state import MenuState
 
+def build_state(reader, step: int, text_reader=None) -> dict:
+    """Read game state from RAM into the dict both transports publish."""
     state = reader.read_game_state()
 
     # Build state dict
@@ -111,13 +121,41 @@ def write_state(reader, emu, step: int, text_reader=None) -> dict:
         "text_on_screen": text_context,
         "play_time_minutes": state.play_time_minutes,
     }
+    return state_dict
+
+
+def write_state(reader, emu, step: int, text_reader=None) -> dict:
+    """Read game state from RAM and write to state.json + screenshot."""
+    state_dict = build_state(reader, step, text_reader)
+    _write_state_files(state_dict, emu)
+    return state_dict
 
-    # Write state
+
+def _write_state_files(state_dict: dict, emu, frame=None, screenshot: bool = True) -> None:
+    """File transport: state.json, screenshot.png, then the ready signal.
+
+    screenshot=False keeps the previous screenshot.png (the screen hasn't
+    changed); frame is an already-grabbed emu.framebuffer() result.
+    """
     with open(STATE_FILE, "w") as f:
         json.dump(state_dict, f, indent=2)
+    if screenshot:
+        _write_screenshot(emu, frame)
 
-    # Take screenshot
+    # Signal ready
+    Path(READY_FILE).touch()
+
+
+def _write_screenshot(emu, frame=None) -> None:
+    """Encode the raw framebuffer straight to screenshot.png, else use mGBA's writer."""
     try:
+        frame = frame or emu.framebuffer()
+        if frame is not None:
+            tmp = SCREENSHOT_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(encode_png(*frame))
+            os.replace(tmp, SCREENSHOT_FILE)
+            return
         emu.screenshot("bridge_screenshot")
         src = emu._state_path("bridge_screenshot", ext=".png")
         if os.path.exists(src):
@@ -126,11 +164,6 @@ def write_state(reader, emu, step: int, text_reader=None) -> dict:
     except Exception:
         pass  # Screenshot optional
 
-    # Signal ready
-    Path(READY_FILE).touch()
-
-    return state_dict
-
 
 def read_action() -> dict | None:
     """Read and consume action.json written by Claude Code."""
@@ -146,6 +179,62 @@ def read_action() -> dict | None:
         return None
 
 
+class FileTransport:
+    """Bridge-loop side of the file transport (bridge_io/ files, polled).
+
+    The stream counterpart is bridge_transport.HttpTransport. When a hub is
+    given, published states are mirrored into it so the viewer can follow
+    the /events stream even in file mode.
+    """
+
+    name = "file"
+
+    def __init__(self, hub=None, poll_interval: float = 0.5):
+        self.hub = hub
+        self.poll_interval = poll_interval
+        self._frame_digest = None
+        self.screenshots_skipped = 0
+
+    def publish(self, state_dict: dict, emu) -> None:
+        frame = emu.framebuffer()
+        digest = frame_digest(frame) if frame is not None else None
+        # Same screen as the screenshot already on disk: don't rewrite it
+        changed = (digest is None or digest != self._frame_digest
+                   or not os.path.exists(SCREENSHOT_FILE))
+        self._frame_digest = digest
+        self.screenshots_skipped += not changed
+        _write_state_files(state_dict, emu, frame, screenshot=changed)
+        if self.hub is not None:
+            self.hub.publish(state_dict, frame)
+
+    def next_action(self, timeout: float) -> tuple[None, dict] | None:
+        """Poll action.json; file actions carry no correlation id."""
+        waited = 0.0
+        while waited < timeout:
+            action = read_action()
+            if action is not None:
+                return None, action
+            time.sleep(self.poll_interval)
+            waited += self.poll_interval
+        return None
+
+    def complete(self, action_id, result: dict, step: int) -> None:
+        pass  # Results only go to log.jsonl
+
+    def stop_requested(self) -> bool:
+        return os.path.exists(STOP_FILE)
+
+    def close(self) -> None:
+        if self.hub is not None:
+            self.hub.close()
+        if os.path.exists(READY_FILE):
+            os.remove(READY_FILE)
+
+
+def _valid_state_name(name) -> bool:
+    return isinstance(name, str) and STATE_NAME_RE.fullmatch(name) is not None
+
+
 def execute_action(emu, action: dict, nav=None, collision_reader=None) -> dict:
     """Execute an action from Claude Code on the emulator.
 
@@ -174,8 +263,12 @@ def execute_action(emu, action: dict, nav=None, collision_reader=None) -> dict:
         emu.tick(frames)
         result = {"executed": "wait", "frames": frames}
 
+    elif action_type in ("save", "load") and not _valid_state_name(action.get("name", "bridge_save")):
+        result = {"executed": action_type,
+                  "error": "name must be a bare savestate name ([A-Za-z0-9_-], no path)"}
+
     elif action_type == "save":
-        name = action.get("name", f"bridge_save")
+        name = action.get("name", "bridge_save")
         path = emu.save_state(name)
         result = {"executed": "save", "path": path}
 
@@ -226,13 +319,10 @@ def _execute_navigate(emu, nav, collision_reader, target_x: int, target_y: int,
     if target_map is None:
         target_map = map_id
 
-    # Build fresh collision map
+    # Build fresh collision map (NPCs may have moved); re-adding
+    # unchanged tiles keeps the navigator's cached paths
     map_data = collision_reader.build_current_map()
-    if not nav.has_map(map_id):
-        nav.add_map(map_data)
-    else:
-        # Replace with fresh data (NPCs may have moved)
-        nav._maps[map_id] = map_data
+    nav.add_map(map_data)
 
     start = MapPosition(map_id=map_id, x=cur_x, y=cur_y)
     goal = MapPosition(map_id=target_map, x=target_x, y=target_y)
@@ -292,39 +382,25 @@ def maybe_checkpoint(prev_state, curr_state, checkpoint_mgr, step: int) -> list[
     return [r.value for r in reasons]
 
 
-def start_viewer_server(port: int = 8000) -> threading.Thread:
+def start_viewer_server(port: int = 8000, hub=None, accept_actions: bool = False) -> threading.Thread:
     """Start a background HTTP server to serve viewer.html and bridge_io/.
 
     Serves from the pokemon-agent/ directory so both viewer.html and
-    bridge_io/ are accessible. No-cache headers ensure live data.
+    bridge_io/ are accessible. No-cache headers ensure live data. With a
+    hub, the stream endpoints (/events, /state, /frame.png, ...) are
+    mounted too; accept_actions additionally enables POST /action.
 
     Args:
         port: Port to serve on. Use 0 for a random available port.
+        hub: bridge_transport.BridgeHub to expose, or None for files only.
+        accept_actions: Allow clients to submit actions (http transport).
 
     Returns:
         The daemon thread running the server.
     """
+    from bridge_transport import start_stream_server
     serve_dir = os.path.dirname(__file__) or "."
-
-    class NoCacheHandler(http.server.SimpleHTTPRequestHandler):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, directory=serve_dir, **kwargs)
-
-        def end_headers(self):
-            self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            super().end_headers()
-
-        def log_message(self, format, *args):
-            pass  # Silence request logs
-
-    server = http.server.HTTPServer(("127.0.0.1", port), NoCacheHandler)
-    actual_port = server.server_address[1]
-
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-    thread.actual_port = actual_port  # Store for callers to read
-    return thread
+    return start_stream_server(hub, port=port, directory=serve_dir, accept_actions=accept_actions)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -338,12 +414,16 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--no-boot", action="store_true", help="Skip boot sequence for Red games")
     parser.add_argument("--port", type=int, default=8000, help="Viewer HTTP server port (default: 8000)")
     parser.add_argument("--no-serve", action="store_true", help="Disable viewer HTTP server")
+    parser.add_argument("--transport", choices=("file", "http"), default="file",
+                        help="How the brain exchanges state/actions: bridge_io/ files or HTTP on --port")
     return parser
 
 
 def main():
     parser = build_parser()
     args = parser.parse_args()
+    if args.transport == "http" and args.no_serve:
+        parser.error("--transport http needs the HTTP server (drop --no-serve)")
 
     # Create bridge directory
     os.makedirs(BRIDGE_DIR, exist_ok=True)
@@ -425,14 +505,24 @@ def main():
             print(f"  Phases: {boot_result['phases_completed']}")
             print(f"  Position: map {boot_result['final_map']}, {boot_result['final_position']}")
 
-    # Start viewer HTTP server
+    # Start viewer HTTP server (and the stream the viewer subscribes to)
+    hub = None
     if not args.no_serve:
-        server_thread = start_viewer_server(port=args.port)
+        from bridge_transport import BridgeHub, HttpTransport
+        hub = BridgeHub()
+        server_thread = start_viewer_server(port=args.port, hub=hub,
+                                            accept_actions=args.transport == "http")
         print(f"\nViewer live at: http://127.0.0.1:{server_thread.actual_port}/viewer.html")
     else:
         print("\nViewer server disabled (--no-serve)")
 
-    print(f"Bridge running. Waiting for Claude Code actions in: {BRIDGE_DIR}/")
+    if args.transport == "http":
+        transport = HttpTransport(hub)
+        print(f"Bridge running. Waiting for Claude Code actions on: "
+              f"http://127.0.0.1:{server_thread.actual_port}/action")
+    else:
+        transport = FileTransport(hub)
+        print(f"Bridge running. Waiting for Claude Code actions in: {BRIDGE_DIR}/")
     print(f"Timeout: {args.timeout}s per step")
     print("To stop: create a .stop file or Ctrl+C\n")
 
@@ -441,15 +531,16 @@ def main():
 
     try:
         while True:
-            # Check for stop signal
-            if os.path.exists(STOP_FILE):
+            # Check for stop signal (.stop file, or POST /stop)
+            if os.path.exists(STOP_FILE) or transport.stop_requested():
                 print("Stop signal received.")
                 break
 
             step += 1
 
-            # Write current state
-            state_dict = write_state(reader, emu, step, text_reader)
+            # Publish current state
+            state_dict = build_state(reader, step, text_reader)
+            transport.publish(state_dict, emu)
 
             # Checkpoint check
             curr_gs = reader.read_game_state()
@@ -464,21 +555,19 @@ def main():
             lead_str = f"{party_lead['species']} Lv{party_lead['level']} HP:{party_lead['hp']}/{party_lead['hp_max']}" if party_lead else "no party"
             print(f"Step {step}: Map {pos['map_id']} ({pos['x']},{pos['y']}) | {lead_str} | Waiting for action...")
 
-            # Wait for Claude Code to write an action
-            waited = 0.0
-            poll_interval = 0.5
-            while waited < args.timeout:
-                action = read_action()
-                if action is not None:
-                    break
-                time.sleep(poll_interval)
-                waited += poll_interval
+            # Wait for Claude Code to send an action
+            received = transport.next_action(args.timeout)
+            if received is not None:
+                action_id, action = received
+            elif transport.stop_requested():
+                continue  # Exit at the top of the loop
             else:
                 print(f"  Timeout ({args.timeout}s) — pressing A as default")
-                action = {"type": "press_buttons", "buttons": ["a"]}
+                action_id, action = None, {"type": "press_buttons", "buttons": ["a"]}
 
             # Execute
             result = execute_action(emu, action, nav=nav, collision_reader=collision_reader)
+            transport.complete(action_id, result, step)
             buttons = action.get("buttons", [])
             print(f"  -> {action.get('type', '?')}: {buttons if buttons else action} | {result}")
 
@@ -493,10 +582,9 @@ def main():
     finally:
         # Save final state
         emu.save_state("bridge_final")
+        checkpoint_mgr.flush()  # milestone checkpoints are written in the background
         emu.close()
-        # Clean up ready signal
-        if os.path.exists(READY_FILE):
-            os.remove(READY_FILE)
+        transport.close()
         print(f"Bridge stopped after {step} steps. Final state saved.")
 
 
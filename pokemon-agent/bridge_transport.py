@@ -0,0 +1,434 @@
+"""Stream transport for the emulator bridge — local HTTP instead of file polling.
+
+The file bridge writes an indented state.json, copies a PNG screenshot and
+touches a ready file every step, then polls for action.json twice a second.
+BridgeHub keeps the latest state and raw framebuffer in memory and queues
+actions. It is served over a local HTTP server that also serves
+viewer.html, so the viewer and the brain watch the same stream:
+
+    GET  /state?after=N&timeout=S   long-poll: next state newer than seq N
+    GET  /events                    server-sent events, one per published state
+    GET  /frame                     raw RGB framebuffer (X-Frame-Width/-Height)
+    GET  /frame.png                 PNG, encoded only when asked for (cached per seq)
+    POST /action?wait=S             queue an action; with wait, block for its result
+    GET  /result?id=X&timeout=S     result for a correlation id
+    POST /stop                      ask the bridge loop to exit
+
+State payloads are compact JSON. Every action carries a correlation id
+(client-supplied "id" or server-assigned) that comes back with its result,
+so a client can fire an action and match the outcome without re-reading
+state.
+
+Only GET responses carry Access-Control-Allow-Origin, and POSTs must be
+Content-Type: application/json (415 otherwise). A web page can't send that
+cross-origin without a CORS preflight, which this server never answers, so
+an open browser tab can watch the stream but not drive the game.
+
+Usage:
+    from bridge_transport import BridgeClient
+
+    client = BridgeClient("http://127.0.0.1:8000")
+    snap = client.state()                        # {"seq": 12, "state": {...}}
+    out = client.act({"type": "press_buttons", "buttons": ["a"]})
+    png = client.png()
+
+CLI:
+    python3 bridge_transport.py state [--after N] [--timeout S]
+    python3 bridge_transport.py act '{"type": "press_buttons", "buttons": ["a"]}'
+    python3 bridge_transport.py png screen.png
+    python3 bridge_transport.py stop
+
+Stdlib only. No external dependencies beyond project modules.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import json
+import sys
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from collections import OrderedDict, deque
+from typing import Optional, Tuple
+
+from framebuffer import Frame, encode_png
+
+DEFAULT_URL = "http://127.0.0.1:8000"
+RESULT_HISTORY = 256      # completed action results kept for late /result lookups
+MAX_WAIT_S = 60.0         # cap on any long-poll so idle connections recycle
+SSE_KEEPALIVE_S = 15.0    # comment line sent on idle /events streams
+
+
+def dumps(obj) -> bytes:
+    """Compact JSON encoding used on the wire."""
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+# ── Hub (in-process state + action queue) ────────────────────────────────────
+
+
+class BridgeHub:
+    """Latest published state/frame and the pending action queue.
+
+    The bridge loop calls publish() / next_action() / complete(); HTTP
+    handler threads call wait_state() / submit() / wait_result().
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.seq = 0
+        self.state: Optional[dict] = None
+        self.frame: Optional[Frame] = None
+        self._png: Optional[Tuple[int, bytes]] = None
+        self._actions: deque = deque()
+        self._results: OrderedDict = OrderedDict()
+        self.stop_requested = False
+        self.closed = False
+
+    # bridge side
+
+    def publish(self, state: dict, frame: Optional[Frame] = None) -> int:
+        with self._cond:
+            self.seq += 1
+            self.state = state
+            self.frame = frame
+            self._cond.notify_all()
+            return self.seq
+
+    def next_action(self, timeout: float) -> Optional[Tuple[str, dict]]:
+        """Pop the oldest queued (id, action), waiting up to timeout seconds."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._actions or self.stop_requested, timeout)
+            return self._actions.popleft() if self._actions else None
+
+    def complete(self, action_id: Optional[str], result: dict, step: int) -> None:
+        if action_id is None:
+            return
+        with self._cond:
+            self._results[action_id] = {"id": action_id, "step": step, "result": result}
+            while len(self._results) > RESULT_HISTORY:
+                self._results.popitem(last=False)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    # client side
+
+    def wait_state(self, after: int, timeout: float) -> Optional[Tuple[int, dict]]:
+        """(seq, state) for the first state newer than after, or None on timeout."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq > after or self.closed, timeout)
+            if self.seq > after and self.state is not None:
+                return self.seq, self.state
+            return None
+
+    def submit(self, action: dict, action_id: Optional[str] = None) -> str:
+        action_id = str(action_id) if action_id else uuid.uuid4().hex[:12]
+        with self._cond:
+            self._actions.append((action_id, action))
+            self._cond.notify_all()
+        return action_id
+
+    def wait_result(self, action_id: str, timeout: float) -> Optional[dict]:
+        with self._cond:
+            self._cond.wait_for(lambda: action_id in self._results or self.closed, timeout)
+            return self._results.get(action_id)
+
+    def request_stop(self) -> None:
+        with self._cond:
+            self.stop_requested = True
+            self._cond.notify_all()
+
+    def png(self) -> Optional[Tuple[int, bytes]]:
+        """(seq, PNG bytes) of the current frame, encoded at most once per seq."""
+        with self._cond:
+            seq, frame, cached = self.seq, self.frame, self._png
+        if frame is None:
+            return None
+        if cached is None or cached[0] != seq:
+            cached = (seq, encode_png(*frame))
+            with self._cond:
+                if self.seq == seq:
+                    self._png = cached
+        return cached
+
+
+class HttpTransport:
+    """Bridge-loop side of the stream transport (the counterpart of FileTransport)."""
+
+    name = "http"
+
+    def __init__(self, hub: BridgeHub):
+        self.hub = hub
+
+    def publish(self, state: dict, emu) -> None:
+        self.hub.publish(state, emu.framebuffer())
+
+    def next_action(self, timeout: float) -> Optional[Tuple[str, dict]]:
+        return self.hub.next_action(timeout)
+
+    def complete(self, action_id: Optional[str], result: dict, step: int) -> None:
+        self.hub.complete(action_id, result, step)
+
+    def stop_requested(self) -> bool:
+        return self.hub.stop_requested
+
+    def close(self) -> None:
+        self.hub.close()
+
+
+# ── HTTP server ──────────────────────────────────────────────────────────────
+
+
+def _wait_param(query: dict, name: str, default: float = 0.0) -> float:
+    try:
+        value = float(query.get(name, [default])[0])
+    except ValueError:
+        value = default
+    return max(0.0, min(value, MAX_WAIT_S))
+
+
+class StreamHandler(http.server.SimpleHTTPRequestHandler):
+    """Static files (viewer.html, bridge_io/) plus the hub's stream endpoints."""
+
+    hub: Optional[BridgeHub] = None
+    accept_actions = True
+    _cors = False  # set per request: read-only GETs may be shared cross-origin
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+        if self._cors:
+            self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass  # Silence request logs
+
+    def _send(self, status: int, body: bytes = b"", ctype: str = "application/json",
+              headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, str(value))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._cors = True
+        url = urllib.parse.urlsplit(self.path)
+        route = self._GET_ROUTES.get(url.path)
+        if route is None or self.hub is None:
+            return super().do_GET()
+        route(self, urllib.parse.parse_qs(url.query))
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        route = self._POST_ROUTES.get(url.path)
+        if route is None or self.hub is None or not self.accept_actions:
+            return self._send(404, dumps({"error": "not found"}))
+        ctype = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if ctype != "application/json":
+            # Forces a browser preflight, so other origins can't post "simple" requests
+            return self._send(415, dumps({"error": "Content-Type must be application/json"}))
+        route(self, urllib.parse.parse_qs(url.query))
+
+    # GET
+
+    def _get_state(self, query):
+        after = int(query.get("after", [0])[0] or 0)
+        got = self.hub.wait_state(after, _wait_param(query, "timeout"))
+        if got is None:
+            return self._send(204)
+        seq, state = got
+        self._send(200, dumps({"seq": seq, "state": state}))
+
+    def _get_events(self, query):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        seq = int(query.get("after", [0])[0] or 0)
+        try:
+            while not self.hub.closed:
+                got = self.hub.wait_state(seq, SSE_KEEPALIVE_S)
+                if got is None:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    seq, state = got
+                    self.wfile.write(b"id: %d\nevent: state\ndata: " % seq + dumps(state) + b"\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Viewer tab closed
+        self.close_connection = True
+
+    def _get_frame(self, query):
+        seq, frame = self.hub.seq, self.hub.frame
+        if frame is None:
+            return self._send(404, dumps({"error": "no frame"}))
+        width, height, rgb = frame
+        self._send(200, rgb, "application/octet-stream",
+                   {"X-Frame-Width": width, "X-Frame-Height": height, "X-Seq": seq})
+
+    def _get_png(self, query):
+        got = self.hub.png()
+        if got is None:
+            return self._send(404, dumps({"error": "no frame"}))
+        seq, png = got
+        self._send(200, png, "image/png", {"X-Seq": seq})
+
+    def _get_result(self, query):
+        action_id = query.get("id", [""])[0]
+        result = self.hub.wait_result(action_id, _wait_param(query, "timeout"))
+        if result is None:
+            return self._send(404, dumps({"id": action_id, "error": "pending or unknown"}))
+        self._send(200, dumps(result))
+
+    # POST
+
+    def _post_action(self, query):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            return self._send(400, dumps({"error": f"invalid JSON: {e}"}))
+        if not isinstance(body, dict):
+            return self._send(400, dumps({"error": "action must be an object"}))
+        action = body.get("action", body)
+        action_id = self.hub.submit(action, body.get("id"))
+        wait = _wait_param(query, "wait")
+        if wait <= 0:
+            return self._send(202, dumps({"id": action_id}))
+        result = self.hub.wait_result(action_id, wait)
+        if result is None:
+            return self._send(202, dumps({"id": action_id, "pending": True}))
+        self._send(200, dumps(result))
+
+    def _post_stop(self, query):
+        self.hub.request_stop()
+        self._send(200, dumps({"stopping": True}))
+
+    _GET_ROUTES = {
+        "/state": _get_state,
+        "/events": _get_events,
+        "/frame": _get_frame,
+        "/frame.png": _get_png,
+        "/result": _get_result,
+    }
+    _POST_ROUTES = {
+        "/action": _post_action,
+        "/stop": _post_stop,
+    }
+
+
+def start_stream_server(hub: Optional[BridgeHub], port: int = 8000, directory: str = ".",
+                        accept_actions: bool = True) -> threading.Thread:
+    """Serve static files from directory plus the hub endpoints on 127.0.0.1:port.
+
+    Returns the daemon thread; its actual_port and server attributes hold
+    the bound port (useful with port=0) and the server object.
+    """
+    handler = type("BoundStreamHandler", (StreamHandler,),
+                   {"hub": hub, "accept_actions": accept_actions})
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", port), functools.partial(handler, directory=directory))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    thread.actual_port = server.server_address[1]
+    thread.server = server
+    return thread
+
+
+# ── Client ───────────────────────────────────────────────────────────────────
+
+
+class BridgeClient:
+    """Brain-side client for a bridge running with --transport http."""
+
+    def __init__(self, url: str = DEFAULT_URL):
+        self.url = url.rstrip("/")
+
+    def _request(self, path: str, data: Optional[bytes] = None, timeout: float = 0.0):
+        req = urllib.request.Request(self.url + path, data=data,
+                                     headers={"Content-Type": "application/json"} if data else {})
+        return urllib.request.urlopen(req, timeout=timeout + 10)
+
+    def state(self, after: int = 0, timeout: float = 0.0) -> Optional[dict]:
+        """{"seq", "state"} newer than after (long-polls up to timeout), else None."""
+        with self._request(f"/state?after={after}&timeout={timeout}", timeout=timeout) as resp:
+            return json.loads(resp.read()) if resp.status == 200 else None
+
+    def act(self, action: dict, wait: float = 30.0, action_id: Optional[str] = None) -> dict:
+        """Queue an action; returns {"id", "step", "result"} or {"id", "pending"}."""
+        body = {"action": action}
+        if action_id:
+            body["id"] = action_id
+        with self._request(f"/action?wait={wait}", dumps(body), timeout=wait) as resp:
+            return json.loads(resp.read())
+
+    def result(self, action_id: str, timeout: float = 0.0) -> Optional[dict]:
+        try:
+            with self._request(f"/result?id={urllib.parse.quote(action_id)}&timeout={timeout}",
+                               timeout=timeout) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def frame(self) -> Frame:
+        with self._request("/frame") as resp:
+            return (int(resp.headers["X-Frame-Width"]), int(resp.headers["X-Frame-Height"]),
+                    resp.read())
+
+    def png(self) -> bytes:
+        with self._request("/frame.png") as resp:
+            return resp.read()
+
+    def stop(self) -> None:
+        self._request("/stop", b"{}").close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Client for the bridge stream transport")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"Bridge URL (default: {DEFAULT_URL})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_state = sub.add_parser("state", help="Print the latest state as JSON")
+    p_state.add_argument("--after", type=int, default=0, help="Only return a state newer than this seq")
+    p_state.add_argument("--timeout", type=float, default=0.0, help="Long-poll seconds")
+    p_act = sub.add_parser("act", help="Send an action and print its result")
+    p_act.add_argument("action", help="Action JSON")
+    p_act.add_argument("--wait", type=float, default=30.0, help="Seconds to wait for the result")
+    p_png = sub.add_parser("png", help="Save the current frame as PNG")
+    p_png.add_argument("out", help="Output path")
+    sub.add_parser("stop", help="Stop the bridge loop")
+    args = parser.parse_args(argv)
+
+    client = BridgeClient(args.url)
+    if args.command == "state":
+        snap = client.state(args.after, args.timeout)
+        if snap is None:
+            print("No new state.", file=sys.stderr)
+            return 1
+        print(json.dumps(snap, indent=2))
+    elif args.command == "act":
+        print(json.dumps(client.act(json.loads(args.action), wait=args.wait), indent=2))
+    elif args.command == "png":
+        with open(args.out, "wb") as f:
+            f.write(client.png())
+        print(args.out)
+    elif args.command == "stop":
+        client.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,14 @@ could lose progress: trainer battles, gym leaders, low HP, map transitions.
 
 The agent can reload these checkpoints if things go wrong (e.g., party wipe).
 
+Every checkpoint is captured in memory first (a delta-compressed
+SavestateRing), so restoring one is a buffer copy rather than file I/O.
+Only milestone checkpoints (gym leader, badge, map transition, manual)
+are also flushed to disk, asynchronously. snapshot() puts cheap
+pre-action states into a second ring so a failed action can be rewound;
+checkpoints have a ring of their own, sized to max_checkpoints, so a
+burst of snapshots never evicts a memory-only checkpoint.
+
 Usage:
     from checkpoint import CheckpointManager
     mgr = CheckpointManager(emulator, state_dir="states")
@@ -14,6 +22,10 @@ Usage:
     if reasons:
         mgr.save_checkpoint(step=agent.step_count, reasons=reasons)
 
+    mgr.snapshot(step, label="press_buttons")   # before a risky action
+    mgr.rewind()                                 # undo it
+    mgr.restore_checkpoint()                     # back to the latest checkpoint
+
 Stdlib only. No external dependencies beyond project modules.
 """
 from __future__ import annotations
@@ -24,6 +36,7 @@ from typing import Dict, List, Optional, Set
 
 from emulator_control import EmulatorControl
 from game_state import GameState
+from savestate_ring import RING_CAPACITY, AsyncStateWriter, SavestateRing
 
 
 class CheckpointReason(Enum):
@@ -39,6 +52,14 @@ class CheckpointReason(Enum):
 # Default cooldown: minimum steps between checkpoints of the same reason
 DEFAULT_COOLDOWN = 10
 
+# Checkpoints worth surviving a restart: flushed to disk (others stay in memory)
+MILESTONE_REASONS = frozenset({
+    CheckpointReason.GYM_LEADER,
+    CheckpointReason.BADGE_EARNED,
+    CheckpointReason.MAP_TRANSITION,
+    CheckpointReason.MANUAL,
+})
+
 # Pokemon Crystal gym map IDs (group << 8 | number)
 # Source: pret/pokecrystal maps/
 CRYSTAL_GYM_MAPS = {
@@ -77,12 +98,21 @@ class CheckpointManager:
         low_hp_threshold: float = 0.25,
         cooldown: int = DEFAULT_COOLDOWN,
         max_checkpoints: int = 20,
+        ring_capacity: int = RING_CAPACITY,
+        flush_reasons: frozenset = MILESTONE_REASONS,
     ):
         self.emulator = emulator
         self.state_dir = state_dir
         self.low_hp_threshold = low_hp_threshold
         self.cooldown = cooldown
         self.max_checkpoints = max_checkpoints
+        self.flush_reasons = flush_reasons
+
+        # In-memory savestates: pre-action snapshots, and every checkpoint
+        # still in checkpoint_history
+        self.ring = SavestateRing(capacity=ring_capacity)
+        self.checkpoint_ring = SavestateRing(capacity=max_checkpoints)
+        self._writer = AsyncStateWriter()
 
         self._gym_maps: Set[int] = set()
         self._last_checkpoint_step: int = -100
@@ -151,20 +181,28 @@ class CheckpointManager:
     ) -> str:
         """Save an emulator state checkpoint.
 
-        Returns the path to the saved state file.
+        The state goes into the in-memory ring; milestone checkpoints are
+        also written to the returned path by a background thread (call
+        flush() to wait for it). Other checkpoints are memory-only and
+        the path is where they would be written.
         """
-        os.makedirs(self.state_dir, exist_ok=True)
-
         reason_str = "_".join(r.value for r in reasons)
         name = f"checkpoint_step_{step}_{reason_str}"
         path = os.path.join(self.state_dir, f"{name}.state")
-        self.emulator.save_state(name)
+        snapshot_id = self.ring.nth_latest(1)
+        ring_id = self.checkpoint_ring.push(self.emulator.snapshot_state(), step=step, label=name)
+        on_disk = any(r in self.flush_reasons for r in reasons)
+        if on_disk:
+            self._writer.submit(path, self.checkpoint_ring.get(ring_id))
 
         # Track history
         entry = {
             "step": step,
             "reasons": [r.value for r in reasons],
             "path": path,
+            "ring_id": ring_id,
+            "snapshot_id": snapshot_id,
+            "on_disk": on_disk,
         }
         self.checkpoint_history.append(entry)
         self._last_checkpoint_step = step
@@ -174,6 +212,65 @@ class CheckpointManager:
 
         return path
 
+    def snapshot(self, step: int, label: str = "") -> int:
+        """Capture the current state into the in-memory ring. Returns its ring id."""
+        return self.ring.push(self.emulator.snapshot_state(), step=step, label=label)
+
+    def rewind(self, n: int = 1) -> Optional[Dict]:
+        """Restore the nth most recent in-memory state (1 = newest).
+
+        Newer ring states are discarded. Returns {"ring_id", "step",
+        "label"} or None if the ring holds fewer than n states.
+        """
+        ring_id = self.ring.nth_latest(n)
+        if ring_id is None:
+            return None
+        info = next(e for e in self.ring.describe() if e["id"] == ring_id)
+        self._restore_ring(ring_id)
+        return {"ring_id": ring_id, "step": info["step"], "label": info["label"]}
+
+    def restore_checkpoint(self, entry: Optional[Dict] = None) -> str:
+        """Load a checkpoint (default: the latest) back into the emulator.
+
+        Uses the in-memory copy when it is still in the checkpoint ring,
+        otherwise the flushed file. Snapshots taken after the checkpoint
+        are discarded and the checkpoint becomes the newest snapshot.
+        Returns "memory" or "disk"; raises FileNotFoundError when neither
+        is available.
+        """
+        entry = entry or self.latest_checkpoint()
+        if entry is None:
+            raise FileNotFoundError("No checkpoint available")
+        ring_id = entry.get("ring_id")
+        state = self.checkpoint_ring.get(ring_id) if ring_id is not None else None
+        source = "memory"
+        if state is None:
+            if not entry.get("on_disk", True):
+                raise FileNotFoundError(
+                    f"Checkpoint at step {entry['step']} was memory-only and has been evicted")
+            self._writer.flush()
+            with open(entry["path"], "rb") as f:
+                state = f.read()
+            source = "disk"
+        self.emulator.restore_state(state)
+
+        snapshot_id = entry.get("snapshot_id")
+        if snapshot_id is not None and snapshot_id in self.ring:
+            self.ring.truncate_after(snapshot_id)
+        else:
+            self.ring.clear()
+        label = os.path.splitext(os.path.basename(entry["path"]))[0]
+        self.ring.push(state, step=entry["step"], label=label)
+        return source
+
+    def _restore_ring(self, ring_id: int) -> None:
+        self.emulator.restore_state(self.ring.get(ring_id))
+        self.ring.truncate_after(ring_id)
+
+    def flush(self) -> None:
+        """Wait for pending milestone writes to reach disk."""
+        self._writer.flush()
+
     def latest_checkpoint(self) -> Optional[Dict]:
         """Get the most recent checkpoint entry, or None."""
         if self.checkpoint_history:
@@ -17,6 +17,7 @@ SCREENSHOT_UPSCALE = 2     # Upscale Game Boy screenshots for better vision
 SAVE_INTERVAL = 50         # Save emulator state every N steps
 TICKS_PER_BUTTON = 4       # Frames to hold a button press
 TICKS_AFTER_BUTTON = 8     # Frames to wait after releasing
+STATE_FULL_EVERY = 10      # Full game state every N LLM turns, only changes between (1 = always full)
 
 # ── Stuck detection ──────────────────────────────────────────────────────────
 
@@ -43,3 +44,4 @@ DEFAULT_ROM = "pokemon_red.gb"
 STATE_DIR = "states"       # Directory for save states
 SCREENSHOT_DIR = "screenshots"  # Directory for screenshots
 LOG_DIR = "logs"           # Directory for agent logs
+ACTION_STORE_PATH = "states/action_store_{game}.bin"  # Persistent action cache, per game
@@ -25,7 +25,7 @@ import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 
 
 # ── Button mapping ───────────────────────────────────────────────────────────
@@ -45,6 +45,17 @@ BUTTONS = {
 DIRECTIONS = {"up", "down", "left", "right"}
 
 
+# Work RAM layout (GB/GBC): bank 0 at C000, switchable bank (CGB: 1-7 via SVBK) at D000
+WRAM_START = 0xC000
+WRAM_BANK_START = 0xD000
+WRAM_END = 0xE000
+SVBK = 0xFF70
+
+# LCD size in pixels; framebuffer() returns packed RGB rows of this shape
+SCREEN_WIDTH = 160
+SCREEN_HEIGHT = 144
+
+
 # ── Emulator interface (protocol for swappable backends) ─────────────────────
 
 
@@ -59,6 +70,8 @@ class EmulatorBackend(Protocol):
     def write_byte(self, address: int, value: int) -> None: ...
     def save_state(self, path: str) -> None: ...
     def load_state(self, path: str) -> None: ...
+    def save_state_bytes(self) -> bytes: ...
+    def load_state_bytes(self, data: bytes) -> None: ...
     def screenshot(self, path: str) -> None: ...
     def close(self) -> None: ...
 
@@ -122,6 +135,7 @@ class MGBABackend:
         self._ffi = ffi
         self._lib = mgba_lib
         self._mgba = mgba_mod
+        self._wram = self._map_wram()
 
         # Key mapping for mGBA
         self._key_map = {
@@ -155,8 +169,63 @@ class MGBABackend:
         return self._core.memory.u8[address]
 
     def read_bytes(self, address: int, length: int) -> bytes:
+        if self._wram is not None and WRAM_START <= address and address + length <= WRAM_END:
+            return self._read_wram(address, length)
         return bytes(self._core.memory.u8[address + i] for i in range(length))
 
+    @property
+    def bulk_reads(self) -> bool:
+        return self._wram is not None
+
+    @property
+    def frames(self) -> int:
+        return self._core.frame_counter
+
+    def _map_wram(self):
+        """Locate mGBA's WRAM block so ranges can be copied without per-byte FFI calls.
+
+        Returns (buffer, banked) or None when the bindings don't expose memory
+        blocks or the copy doesn't match bus reads — read_bytes then stays
+        byte-by-byte.
+        """
+        try:
+            native = self._core._core
+            blocks = self._ffi.new("struct mCoreMemoryBlock**")
+            for i in range(native.listMemoryBlocks(native, blocks)):
+                block = blocks[0][i]
+                if block.start != WRAM_START:
+                    continue
+                size = self._ffi.new("size_t*")
+                ptr = native.getMemoryBlock(native, block.id, size)
+                if ptr == self._ffi.NULL or size[0] < WRAM_END - WRAM_START:
+                    return None
+                wram = (self._ffi.buffer(ptr, size[0]), size[0] > WRAM_END - WRAM_START)
+                self._wram = wram
+                probe = [(WRAM_START, 16), (WRAM_BANK_START, 16)]
+                if all(self._read_wram(a, n) == bytes(self._core.memory.u8[a + k] for k in range(n))
+                       for a, n in probe):
+                    return wram
+                return None
+        except Exception:
+            pass
+        return None
+
+    def _read_wram(self, address: int, length: int) -> bytes:
+        buf, banked = self._wram
+        bank = 1
+        if banked and address + length > WRAM_BANK_START:
+            bank = (self._core.memory.u8[SVBK] & 0x07) or 1  # CGB: D000-DFFF is switchable
+        out = b""
+        if address < WRAM_BANK_START:
+            end = min(address + length, WRAM_BANK_START)
+            out = bytes(buf[address - WRAM_START:end - WRAM_START])
+            length -= end - address
+            address = end
+        if length > 0:
+            off = bank * 0x1000 + (address - WRAM_BANK_START)
+            out += bytes(buf[off:off + length])
+        return out
+
     def write_byte(self, address: int, value: int) -> None:
         self._core.memory.u8[address] = value
 
@@ -170,6 +239,16 @@ class MGBABackend:
             state = f.read()
         self._core.load_raw_state(state)
 
+    def save_state_bytes(self) -> bytes:
+        state = self._core.save_raw_state()
+        if state is None:
+            raise RuntimeError("mGBA failed to serialize state")
+        return bytes(self._ffi.buffer(state))
+
+    def load_state_bytes(self, data: bytes) -> None:
+        if not self._core.load_raw_state(bytes(data)):
+            raise RuntimeError("mGBA rejected savestate")
+
     def screenshot(self, path: str) -> None:
         try:
             pil_img = self._video.to_pil().convert("RGB")
@@ -177,6 +256,26 @@ class MGBABackend:
         except Exception:
             pass  # Screenshot is optional
 
+    def framebuffer(self) -> Optional[Tuple[int, int, bytes]]:
+        """(width, height, packed RGB bytes) copied straight from the video buffer."""
+        if self._ffi.sizeof("color_t") != 4:
+            return None  # 16-bit colour builds: fall back to screenshot()
+        raw = bytearray(self._ffi.buffer(self._video.buffer))
+        stride = self._video.stride * 4
+        if stride != self._width * 4:
+            raw = bytearray(b"".join(raw[row * stride:row * stride + self._width * 4]
+                                     for row in range(self._height)))
+        del raw[3::4]  # RGBX -> RGB
+        return self._width, self._height, bytes(raw)
+
+    def set_frameskip(self, frames: int) -> bool:
+        """Skip the video renderer on all but every (frames + 1)th frame."""
+        try:
+            self._core._native.video.frameskip = max(0, frames)
+        except (AttributeError, TypeError, self._ffi.error):
+            return False  # bindings don't expose the GB video struct
+        return True
+
     def close(self) -> None:
         if self._core:
             self._core = None
@@ -194,6 +293,7 @@ class MockBackend:
         self._buttons_pressed: List[str] = []
         self._states: Dict[str, bytes] = {}
         self._screenshots: List[str] = []
+        self._frame = bytearray(SCREEN_WIDTH * SCREEN_HEIGHT * 3)
         self._closed = False
 
     def press(self, button: str) -> None:
@@ -214,6 +314,8 @@ class MockBackend:
     def read_bytes(self, address: int, length: int) -> bytes:
         return bytes(self._ram[address:address + length])
 
+    bulk_reads = True
+
     def write_byte(self, address: int, value: int) -> None:
         self._ram[address] = value & 0xFF
 
@@ -225,9 +327,18 @@ class MockBackend:
             raise FileNotFoundError(f"No saved state: {path}")
         self._ram = bytearray(self._states[path])
 
+    def save_state_bytes(self) -> bytes:
+        return bytes(self._ram)
+
+    def load_state_bytes(self, data: bytes) -> None:
+        self._ram = bytearray(data)
+
     def screenshot(self, path: str) -> None:
         self._screenshots.append(path)
 
+    def framebuffer(self) -> Optional[Tuple[int, int, bytes]]:
+        return SCREEN_WIDTH, SCREEN_HEIGHT, bytes(self._frame)
+
     def close(self) -> None:
         self._closed = True
 
@@ -270,6 +381,7 @@ class EmulatorControl:
     def __init__(self, backend: EmulatorBackend):
         self._backend = backend
         self._state_dir = ""
+        self._generation = 0  # bumped by every call that can change RAM
 
     @classmethod
     def from_rom(cls, rom_path: str, headless: bool = True, speed: int = 0) -> "EmulatorControl":
@@ -299,14 +411,17 @@ class EmulatorControl:
         self._backend.tick(hold_frames)
         self._backend.release(button)
         self._backend.tick(wait_frames)
+        self._generation += 1
 
     def tick(self, frames: int = 1) -> None:
         """Advance the emulator by N frames."""
         self._backend.tick(frames)
+        self._generation += 1
 
     def wait(self, seconds: float) -> None:
         """Wait by advancing frames (60 fps)."""
         self._backend.tick(int(seconds * 60))
+        self._generation += 1
 
     # ── Input sequences ──
 
@@ -363,6 +478,21 @@ class EmulatorControl:
 
     # ── RAM access ──
 
+    @property
+    def bulk_reads(self) -> bool:
+        """True when read_bytes copies a range natively instead of byte by byte."""
+        return bool(getattr(self._backend, "bulk_reads", False))
+
+    @property
+    def frames(self) -> Optional[int]:
+        """Frames emulated so far, or None if the backend doesn't count them."""
+        return getattr(self._backend, "frames", None)
+
+    @property
+    def memory_epoch(self) -> tuple:
+        """Changes whenever RAM may have changed: frames run, writes, state loads."""
+        return (self.frames, self._generation)
+
     def read_byte(self, address: int) -> int:
         """Read a single byte from RAM."""
         return self._backend.read_byte(address)
@@ -373,19 +503,18 @@ class EmulatorControl:
 
     def read_word(self, address: int) -> int:
         """Read a 16-bit little-endian word from RAM."""
-        lo = self._backend.read_byte(address)
-        hi = self._backend.read_byte(address + 1)
+        lo, hi = self._backend.read_bytes(address, 2)
         return (hi << 8) | lo
 
     def read_word_be(self, address: int) -> int:
         """Read a 16-bit big-endian word from RAM."""
-        hi = self._backend.read_byte(address)
-        lo = self._backend.read_byte(address + 1)
+        hi, lo = self._backend.read_bytes(address, 2)
         return (hi << 8) | lo
 
     def write_byte(self, address: int, value: int) -> None:
         """Write a byte to RAM."""
         self._backend.write_byte(address, value)
+        self._generation += 1
 
     # ── State management ──
 
@@ -412,6 +541,16 @@ class EmulatorControl:
         else:
             path = self._state_path(name)
             self._backend.load_state(path)
+        self._generation += 1
+
+    def snapshot_state(self) -> bytes:
+        """Serialize the full emulator state to bytes (no file I/O)."""
+        return self._backend.save_state_bytes()
+
+    def restore_state(self, data: bytes) -> None:
+        """Restore a state produced by snapshot_state() or read from a .state file."""
+        self._backend.load_state_bytes(data)
+        self._generation += 1
 
     def screenshot(self, name: str) -> str:
         """Take a screenshot. Returns the path."""
@@ -419,6 +558,20 @@ class EmulatorControl:
         self._backend.screenshot(path)
         return path
 
+    def framebuffer(self) -> Optional[Tuple[int, int, bytes]]:
+        """Current frame as (width, height, RGB bytes), or None if unsupported."""
+        grab = getattr(self._backend, "framebuffer", None)
+        return grab() if grab is not None else None
+
+    def set_frameskip(self, frames: int) -> bool:
+        """Render only every (frames + 1)th frame; RAM stays exact.
+
+        For unattended runs that observe RAM rather than the screen.
+        Returns False when the backend can't skip rendering.
+        """
+        skip = getattr(self._backend, "set_frameskip", None)
+        return bool(skip(frames)) if skip is not None else False
+
     def _state_path(self, name: str, ext: str = ".state") -> str:
         """Build a state file path."""
         if self._state_dir:
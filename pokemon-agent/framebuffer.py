@@ -0,0 +1,51 @@
+"""Raw framebuffer helpers shared by the agent, the bridge and the stream server.
+
+EmulatorControl.framebuffer() returns (width, height, packed RGB bytes).
+encode_png turns that into a PNG in memory (no temp file, no Pillow), and
+frame_digest gives an exact fingerprint for "is this the screen I already
+sent?" checks. The digest covers every byte, so a one-tile cursor move or
+a single changed letter in a text box is a different frame.
+
+Usage:
+    from framebuffer import encode_png, frame_digest
+
+    frame = emu.framebuffer()          # (w, h, rgb) or None
+    if frame is not None and frame_digest(frame) != last_sent:
+        png = encode_png(*frame)
+
+Stdlib only. No external dependencies.
+"""
+from __future__ import annotations
+
+import hashlib
+import struct
+import zlib
+from typing import Tuple
+
+Frame = Tuple[int, int, bytes]
+
+
+def encode_png(width: int, height: int, rgb: bytes) -> bytes:
+    """Encode packed 8-bit RGB rows as a PNG (no filtering, zlib level 6)."""
+    row = width * 3
+    raw = b"".join(b"\x00" + rgb[y * row:(y + 1) * row] for y in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr)
+            + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+
+def frame_digest(frame: Frame) -> int:
+    """64-bit BLAKE2b digest of a frame's size and raw pixel bytes.
+
+    Equal digests mean identical frames (barring a 2**-64 collision);
+    hashing a 160x144 Game Boy frame costs a few microseconds.
+    """
+    width, height, rgb = frame
+    h = hashlib.blake2b(struct.pack(">II", width, height), digest_size=8)
+    h.update(rgb)
+    return int.from_bytes(h.digest(), "big")
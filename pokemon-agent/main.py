@@ -16,7 +16,7 @@ import os
 import sys
 import time
 
-from config import DEFAULT_ROM, LOG_DIR, STATE_DIR, SCREENSHOT_DIR
+from config import ACTION_STORE_PATH, DEFAULT_ROM, LOG_DIR, STATE_DIR, SCREENSHOT_DIR
 
 DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
 
@@ -78,6 +78,10 @@ def parse_args(argv=None) -> argparse.Namespace:
         choices=["anthropic", "gemini", "auto"],
         help="LLM backend: anthropic (default), gemini (free tier), auto (try gemini then anthropic).",
     )
+    parser.add_argument(
+        "--no-action-store", action="store_true",
+        help="Don't load or update the persistent action cache (ACTION_STORE_PATH).",
+    )
     return parser.parse_args(argv)
 
 
@@ -229,6 +233,13 @@ def main(argv=None) -> int:
             else:
                 logger.warning("Crystal boot partial: %s", boot_result["phases_completed"])
 
+    # Persistent action knowledge shared with earlier runs
+    if not args.no_action_store:
+        from action_store import ActionStore
+        agent.action_cache.store = ActionStore(ACTION_STORE_PATH.format(game=game_type))
+        logger.info("Action store: %s (%d entries)",
+                    agent.action_cache.store.path, len(agent.action_cache.store))
+
     # Step callback for live progress
     def on_step(result):
         pos = result.state.position
@@ -276,6 +287,7 @@ def main(argv=None) -> int:
         elapsed = time.time() - start_time
         usage = agent.token_usage
         mv_stats = agent.movement_validator.stats()
+        agent.action_cache.sync()
         cache_stats = agent.action_cache.stats()
         logger.info(
             "Done. Steps: %d, Time: %.1fs, Tokens: %d in + %d out = %d total",
@@ -287,8 +299,10 @@ def main(argv=None) -> int:
         print(f"Tokens: {usage['total_tokens']:,} total "
               f"({usage['input_tokens']:,} in + {usage['output_tokens']:,} out)")
         print(f"Auto-advances: {agent.auto_advance_count} | "
-              f"Cache: {cache_stats.get('hits', 0)} hits, "
-              f"{cache_stats.get('size', 0)} entries | "
+              f"Cache: {cache_stats['total_hits']} hits "
+              f"({cache_stats['hit_rate']:.0%}, {cache_stats['store_hits']} from store), "
+              f"{cache_stats['size']} entries, "
+              f"{cache_stats['llm_calls_saved']} LLM calls saved | "
               f"Blocked dirs: {mv_stats['blocked_directions']}")
         emu.close()
 
@@ -21,6 +21,7 @@ Stdlib only. No external dependencies beyond project modules.
 """
 from __future__ import annotations
 
+import struct
 from typing import List, Optional
 
 from emulator_control import EmulatorControl
@@ -114,6 +115,28 @@ MART_POINTER = 0xD100        # Non-zero when in mart/shop
 JOY_DISABLED = 0xCFA0        # Joypad disable flags (set during transitions/healing)
 
 
+# ── Snapshot layout ──────────────────────────────────────────────────────────
+
+# Party Pokemon block: species, item, 4 moves, (skip 25), level, status,
+# (skip 1), HP, max HP, Atk, Def, Spd, SpAtk, SpDef — big-endian words
+PARTY_MON_STRUCT = struct.Struct(">BB4B25xBBx7H")
+assert PARTY_MON_STRUCT.size == PARTY_MON_SIZE
+
+# Every WRAM range the reader touches, as [start, end) spans
+SNAPSHOT_SPANS = [
+    (WINDOW_STACK_SIZE, JOY_DISABLED + 1),
+    (MART_POINTER, MART_POINTER + 1),
+    (ENEMY_MON_SPECIES, BATTLE_MODE + 1),
+    (PLAY_TIME_HOURS, STEP_COUNT + 1),
+    (JOHTO_BADGES, JOHTO_BADGES + 1),
+    (MONEY_ADDR, MONEY_ADDR + 3),
+    (MAP_GROUP, PLAYER_X + 1),
+    (PARTY_COUNT, PARTY_DATA_START + 6 * PARTY_MON_SIZE),
+    (PARTY_PP_START, PARTY_PP_START + 6 * PARTY_PP_MON_SIZE),
+    (PARTY_NICKNAMES_START, PARTY_NICKNAMES_START + 6 * NICKNAME_SIZE),
+]
+
+
 # ── Character encoding (Pokemon text → ASCII) ───────────────────────────────
 
 # Pokemon Crystal uses a custom character encoding, not ASCII
@@ -148,6 +171,7 @@ from crystal_data import (
     SPECIES_NAMES, MOVE_NAMES, MOVE_DATA, ITEM_NAMES, TYPE_NAMES,
     MAP_NAMES, get_move_info, get_map_name,
 )
+from ram_snapshot import RamSnapshot
 
 
 # ── Status condition decoding ────────────────────────────────────────────────
@@ -192,53 +216,51 @@ def decode_bcd(data: bytes) -> int:
 
 
 class MemoryReader:
-    """Reads Pokemon Crystal game state from emulator RAM."""
+    """Reads Pokemon Crystal game state from emulator RAM.
+
+    All reads go through a RamSnapshot of SNAPSHOT_SPANS: the relevant WRAM
+    is copied once per memory epoch and decoded locally, so a full
+    read_game_state() costs one or two read_bytes() calls.
+    """
 
     def __init__(self, emu: EmulatorControl):
         self._emu = emu
+        self.snapshot = RamSnapshot(emu, SNAPSHOT_SPANS)
+
+    def peek(self, address: int) -> int:
+        """Byte at address from the current snapshot (live read if uncovered)."""
+        return self.snapshot.u8(address)
 
     def read_party_count(self) -> int:
         """Number of Pokemon in the party (0-6)."""
-        count = self._emu.read_byte(PARTY_COUNT)
+        count = self.snapshot.u8(PARTY_COUNT)
         return min(count, 6)
 
     def read_pokemon(self, slot: int) -> Pokemon:
         """Read a party Pokemon from RAM (slot 0-5)."""
+        snap = self.snapshot
         base = PARTY_DATA_START + (slot * PARTY_MON_SIZE)
-
-        species_id = self._emu.read_byte(base + OFF_SPECIES)
+        (species_id, held_item_id, m1, m2, m3, m4, level, status_byte,
+         hp, hp_max, attack, defense, speed, sp_atk, sp_def) = snap.unpack(PARTY_MON_STRUCT, base)
         species_name = SPECIES_NAMES.get(species_id, f"Pokemon#{species_id}")
 
         # Read nickname
         nick_base = PARTY_NICKNAMES_START + (slot * NICKNAME_SIZE)
-        nick_bytes = self._emu.read_bytes(nick_base, NICKNAME_SIZE)
-        nickname = decode_text(nick_bytes)
-
-        # Read stats (big-endian 16-bit values)
-        level = self._emu.read_byte(base + OFF_LEVEL)
-        hp = self._emu.read_word_be(base + OFF_HP_HI)
-        hp_max = self._emu.read_word_be(base + OFF_HP_MAX_HI)
-        attack = self._emu.read_word_be(base + OFF_ATTACK_HI)
-        defense = self._emu.read_word_be(base + OFF_DEFENSE_HI)
-        speed = self._emu.read_word_be(base + OFF_SPEED_HI)
-        sp_atk = self._emu.read_word_be(base + OFF_SP_ATK_HI)
-        sp_def = self._emu.read_word_be(base + OFF_SP_DEF_HI)
+        nickname = decode_text(snap.read(nick_base, NICKNAME_SIZE))
 
         # Status
-        status = decode_status(self._emu.read_byte(base + OFF_STATUS))
+        status = decode_status(status_byte)
 
         # Held item (full name from crystal_data — ported S218)
-        held_item_id = self._emu.read_byte(base + OFF_HELD_ITEM)
         held_item = ITEM_NAMES.get(held_item_id, f"item#{held_item_id}") if held_item_id > 0 else ""
 
         # Moves (with full data from crystal_data — ported S218)
         moves = []
-        pp_base = PARTY_PP_START + (slot * PARTY_PP_MON_SIZE)
-        for i in range(4):
-            move_id = self._emu.read_byte(base + OFF_MOVE1 + i)
+        pp_bytes = snap.read(PARTY_PP_START + (slot * PARTY_PP_MON_SIZE), PARTY_PP_MON_SIZE)
+        for move_id, pp_byte in zip((m1, m2, m3, m4), pp_bytes):
             if move_id == 0:
                 continue
-            pp = self._emu.read_byte(pp_base + i) & 0x3F  # lower 6 bits = current PP
+            pp = pp_byte & 0x3F  # lower 6 bits = current PP
             name, mtype, power, acc, cat = get_move_info(move_id)
             moves.append(Move(
                 name=name,
@@ -274,10 +296,10 @@ class MemoryReader:
 
     def read_position(self) -> MapPosition:
         """Read player map position (with map name from crystal_data)."""
-        map_group = self._emu.read_byte(MAP_GROUP)
-        map_number = self._emu.read_byte(MAP_NUMBER)
-        x = self._emu.read_byte(PLAYER_X)
-        y = self._emu.read_byte(PLAYER_Y)
+        map_group = self.snapshot.u8(MAP_GROUP)
+        map_number = self.snapshot.u8(MAP_NUMBER)
+        x = self.snapshot.u8(PLAYER_X)
+        y = self.snapshot.u8(PLAYER_Y)
         # Composite ID for unique map identification
         map_id = (map_group << 8) | map_number
         return MapPosition(
@@ -291,16 +313,16 @@ class MemoryReader:
 
     def read_battle_state(self) -> BattleState:
         """Read current battle state."""
-        mode = self._emu.read_byte(BATTLE_MODE)
+        mode = self.snapshot.u8(BATTLE_MODE)
         if mode == 0:
             return BattleState(in_battle=False)
 
-        enemy_species_id = self._emu.read_byte(ENEMY_MON_SPECIES)
+        enemy_species_id = self.snapshot.u8(ENEMY_MON_SPECIES)
         enemy_name = SPECIES_NAMES.get(enemy_species_id, f"Pokemon#{enemy_species_id}")
-        enemy_level = self._emu.read_byte(ENEMY_MON_LEVEL)
-        enemy_hp = self._emu.read_word_be(ENEMY_MON_HP_HI)
-        enemy_hp_max = self._emu.read_word_be(ENEMY_MON_HP_MAX_HI)
-        enemy_status = decode_status(self._emu.read_byte(ENEMY_MON_STATUS))
+        enemy_level = self.snapshot.u8(ENEMY_MON_LEVEL)
+        enemy_hp = self.snapshot.u16be(ENEMY_MON_HP_HI)
+        enemy_hp_max = self.snapshot.u16be(ENEMY_MON_HP_MAX_HI)
+        enemy_status = decode_status(self.snapshot.u8(ENEMY_MON_STATUS))
 
         enemy = Pokemon(
             species=enemy_name,
@@ -321,7 +343,7 @@ class MemoryReader:
 
     def read_badges(self) -> Badges:
         """Read gym badge flags."""
-        flags = self._emu.read_byte(JOHTO_BADGES)
+        flags = self.snapshot.u8(JOHTO_BADGES)
         return Badges(
             zephyr=bool(flags & 0x01),
             hive=bool(flags & 0x02),
@@ -335,13 +357,13 @@ class MemoryReader:
 
     def read_money(self) -> int:
         """Read player's money (BCD encoded, 3 bytes)."""
-        data = self._emu.read_bytes(MONEY_ADDR, 3)
+        data = self.snapshot.read(MONEY_ADDR, 3)
         return decode_bcd(data)
 
     def read_play_time_minutes(self) -> int:
         """Read total play time in minutes."""
-        hours = self._emu.read_word(PLAY_TIME_HOURS)
-        minutes = self._emu.read_byte(PLAY_TIME_MINUTES)
+        hours = self.snapshot.u16le(PLAY_TIME_HOURS)
+        minutes = self.snapshot.u8(PLAY_TIME_MINUTES)
         return hours * 60 + minutes
 
     def read_menu_state(self) -> MenuState:
@@ -354,12 +376,12 @@ class MemoryReader:
         overworld gameplay. They cannot reliably distinguish dialog/menu
         from overworld. Only battle mode is reliably detectable from RAM.
         """
-        battle_mode = self._emu.read_byte(BATTLE_MODE)
+        battle_mode = self.snapshot.u8(BATTLE_MODE)
         if battle_mode > 0:
             return MenuState.BATTLE
 
         # Shop detection — mart pointer is reliable
-        mart_ptr = self._emu.read_byte(MART_POINTER)
+        mart_ptr = self.snapshot.u8(MART_POINTER)
         if mart_ptr > 0:
             return MenuState.SHOP
 
@@ -376,6 +398,6 @@ class MemoryReader:
             badges=self.read_badges(),
             money=self.read_money(),
             play_time_minutes=self.read_play_time_minutes(),
-            step_count=self._emu.read_byte(STEP_COUNT),
+            step_count=self.snapshot.u8(STEP_COUNT),
             menu_state=self.read_menu_state(),
         )
@@ -16,6 +16,7 @@ from typing import List, Optional
 
 from emulator_control import EmulatorControl
 from move_data import get_move_data
+from ram_snapshot import RamSnapshot
 from species_types import get_species_types
 from game_state import (
     Badges,
@@ -114,6 +115,25 @@ JOY_DISABLED = 0xD730      # bit 0 = joypad disabled (dialog active)
 # Items
 ITEM_COUNT = 0xD31D
 ITEM_START = 0xD31E        # pairs of (item_id, quantity)
+MAX_ITEMS = 20
+
+# ── Snapshot layout ──────────────────────────────────────────────────────
+# Every WRAM range the reader touches, as [start, end) spans — copied once
+# per memory epoch by RamSnapshot instead of one FFI call per byte.
+
+PARTY_MON_SIZE = 0x2C
+SNAPSHOT_SPANS = [
+    (ENEMY_MON_SPECIES, ENEMY_MON_SPECIAL_LO + 1),
+    (BATTLE_MODE, BATTLE_MODE + 1),
+    (PARTY_COUNT, PARTY_BASE_ADDRS[-1] + PARTY_MON_SIZE),
+    (PARTY_NICK_ADDRS[0], PARTY_NICK_ADDRS[-1] + 11),
+    (ITEM_COUNT, ITEM_START + MAX_ITEMS * 2),
+    (MONEY_ADDR, MONEY_ADDR + 3),
+    (BADGES_ADDR, BADGES_ADDR + 1),
+    (MAP_ID, PLAYER_X + 1),
+    (JOY_DISABLED, JOY_DISABLED + 1),
+    (PLAY_TIME_HOURS_H, PLAY_TIME_MINUTES + 1),
+]
 
 # ── Text encoding (Gen 1 charset) ────────────────────────────────────────
 
@@ -386,14 +406,19 @@ class MemoryReaderRed:
 
     def __init__(self, emu: EmulatorControl):
         self.emu = emu
+        self.snapshot = RamSnapshot(emu, SNAPSHOT_SPANS)
 
     def _mem(self, addr: int) -> int:
-        """Read a single byte from RAM."""
-        return self.emu.read_byte(addr)
+        """Read a single byte from the RAM snapshot."""
+        return self.snapshot.u8(addr)
 
     def _mem_range(self, start: int, length: int) -> list:
-        """Read a range of bytes from RAM."""
-        return list(self.emu.read_bytes(start, length))
+        """Read a range of bytes from the RAM snapshot."""
+        return list(self.snapshot.read(start, length))
+
+    def peek(self, address: int) -> int:
+        """Byte at address from the current snapshot (live read if uncovered)."""
+        return self.snapshot.u8(address)
 
     def _read_money(self) -> int:
         """Read money in BCD format."""
@@ -630,7 +655,7 @@ class MemoryReaderRed:
 
     def _read_items(self) -> list:
         """Read bag inventory — pairs of (item_id, quantity)."""
-        count = min(self._mem(ITEM_COUNT), 20)  # Max 20 item slots
+        count = min(self._mem(ITEM_COUNT), MAX_ITEMS)
         items = []
         for i in range(count):
             item_id = self._mem(ITEM_START + i * 2)
@@ -3,6 +3,16 @@
 A* pathfinding on tile grids with multi-map support via warps and
 connections. Zero external dependencies — stdlib only.
 
+Each MapData compiles to a padded bytearray grid of cost classes, so the
+search works on flat indices with no per-node objects. Cross-map queries
+use a two-level (HPA*-style) search: the abstract graph's nodes are map
+entrances (the start tile and every tile a warp or connection lands on),
+its edges are that entrance's cached Dijkstra distances to the map's exits.
+Open map edges get one or two entrances per contiguous run, so cross-map
+paths can be a few steps longer than optimal; same-map paths are exact.
+Found paths are kept in an LRU cache; any tile, map, warp or connection
+change invalidates the derived data.
+
 Usage:
     from navigation import Navigator, MapData, TileType, Warp
     from game_state import MapPosition
@@ -24,9 +34,12 @@ Stdlib only. No external dependencies.
 from __future__ import annotations
 
 import heapq
+import itertools
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from game_state import MapPosition
 
@@ -80,6 +93,54 @@ class TileType(Enum):
         return 1.0
 
 
+# Compact cost classes for the search grid: 0 = blocked, then one code per
+# distinct (cost, cost when avoiding encounters) pair of walkable tile types.
+_COST_PAIRS: List[Tuple[float, float]] = []
+_TILE_CODE: Dict[TileType, int] = {}
+for _t in TileType:
+    if not _t.is_walkable():
+        _TILE_CODE[_t] = 0
+        continue
+    _pair = (_t.movement_cost(False), _t.movement_cost(True))
+    if _pair not in _COST_PAIRS:
+        _COST_PAIRS.append(_pair)
+    _TILE_CODE[_t] = _COST_PAIRS.index(_pair) + 1
+# code -> step cost, indexed by avoid_encounters
+_CODE_COST = {
+    avoid: (0.0,) + tuple(pair[avoid] for pair in _COST_PAIRS)
+    for avoid in (False, True)
+}
+
+# Monotonic content versions shared by all MapData instances
+_MAP_VERSIONS = itertools.count(1)
+
+
+class _MapGrid:
+    """Walkability/cost grid with a one-tile wall border (no bounds checks)."""
+
+    __slots__ = ("width", "height", "stride", "codes", "version")
+
+    def __init__(self, map_data: "MapData"):
+        self.width = map_data.width
+        self.height = map_data.height
+        self.stride = map_data.width + 2
+        self.codes = bytearray(self.stride * (map_data.height + 2))
+        self.version = map_data.version
+        for (x, y), tile_type in map_data.tiles.items():
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.codes[self.index(x, y)] = _TILE_CODE[tile_type]
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def xy(self, idx: int) -> Tuple[int, int]:
+        y, x = divmod(idx, self.stride)
+        return x - 1, y - 1
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+
 # ── Map data ─────────────────────────────────────────────────────────────────
 
 @dataclass
@@ -98,9 +159,24 @@ class MapData:
     width: int
     height: int
     tiles: Dict[Tuple[int, int], TileType] = field(default_factory=dict)
+    # Bumped on every tile change; edit tiles through set_tile() so cached
+    # grids and paths are invalidated.
+    version: int = field(default=0, init=False, compare=False, repr=False)
+    _grid: Optional[_MapGrid] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.version = next(_MAP_VERSIONS)
 
     def set_tile(self, x: int, y: int, tile_type: TileType) -> None:
-        self.tiles[(x, y)] = tile_type
+        if self.tiles.get((x, y)) is not tile_type:
+            self.tiles[(x, y)] = tile_type
+            self.version = next(_MAP_VERSIONS)
+
+    def grid(self) -> _MapGrid:
+        """Compiled search grid, rebuilt after tile changes."""
+        if self._grid is None or self._grid.version != self.version:
+            self._grid = _MapGrid(self)
+        return self._grid
 
     def get_tile(self, x: int, y: int) -> TileType:
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
@@ -165,18 +241,6 @@ class PathStep:
         return MapPosition(map_id=self.map_id, x=self.x, y=self.y)
 
 
-# ── A* node for priority queue ───────────────────────────────────────────────
-
-@dataclass(order=True)
-class _AStarNode:
-    f_score: float
-    g_score: float = field(compare=False)
-    map_id: int = field(compare=False)
-    x: int = field(compare=False)
-    y: int = field(compare=False)
-    parent: Optional[_AStarNode] = field(compare=False, default=None)
-    direction: str = field(compare=False, default="")
-    is_warp: bool = field(compare=False, default=False)
 
 
 # ── Navigator ────────────────────────────────────────────────────────────────
@@ -192,6 +256,41 @@ _DIR_DELTA = {
 # Reverse: (dx, dy) -> direction
 _DELTA_DIR = {v: k for k, v in _DIR_DELTA.items()}
 
+# Map edge -> button pressed to cross it
+_EDGE_DIR = {"north": "up", "south": "down", "west": "left", "east": "right"}
+
+_INF = float("inf")
+
+# Open edge runs at least this long get an entrance at each end instead of
+# one in the middle (Botea et al., HPA*)
+ENTRANCE_SPLIT_LEN = 6
+
+# Cache sizes (entries)
+PATH_CACHE_SIZE = 256
+TREE_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class _Portal:
+    """A tile on one map that leads to another (warp or edge connection)."""
+    src: int         # flat grid index on the source map
+    dest_map: int
+    dest_x: int
+    dest_y: int
+    direction: str
+    is_warp: bool
+
+
+class _Tree:
+    """Dijkstra shortest-path tree from one tile over one map grid."""
+
+    __slots__ = ("grid", "dist", "parent")
+
+    def __init__(self, grid: _MapGrid, dist: List[float], parent: array):
+        self.grid = grid
+        self.dist = dist
+        self.parent = parent
+
 
 class Navigator:
     """A* pathfinder with multi-map support via warps and connections."""
@@ -204,18 +303,36 @@ class Navigator:
         self._warp_index: Dict[Tuple[int, int, int], List[Warp]] = {}
         # Pre-built index: (direction, source_map) -> connection
         self._conn_index: Dict[Tuple[str, int], Connection] = {}
+        # Derived data, valid for one _revision()
+        self._topology = 0
+        self._cache_rev: Optional[tuple] = None
+        self._portal_cache: Dict[int, List[_Portal]] = {}
+        self._tree_cache: "OrderedDict[tuple, _Tree]" = OrderedDict()
+        self._path_cache: "OrderedDict[tuple, Optional[List[PathStep]]]" = OrderedDict()
 
     def add_map(self, map_data: MapData) -> None:
+        """Add or replace a map. Re-adding identical tiles keeps cached paths."""
+        old = self._maps.get(map_data.map_id)
+        if (old is not None and old is not map_data
+                and (old.width, old.height) == (map_data.width, map_data.height)
+                and old.tiles == map_data.tiles):
+            map_data.version = old.version
+            map_data._grid = old._grid
+        elif old is not map_data:
+            self._topology += 1
         self._maps[map_data.map_id] = map_data
+        map_data.grid()
 
     def add_warp(self, warp: Warp) -> None:
         self._warps.append(warp)
         key = (warp.source_map, warp.source_x, warp.source_y)
         self._warp_index.setdefault(key, []).append(warp)
+        self._topology += 1
 
     def add_connection(self, conn: Connection) -> None:
         self._connections.append(conn)
         self._conn_index[(conn.direction, conn.source_map)] = conn
+        self._topology += 1
 
     def has_map(self, map_id: int) -> bool:
         return map_id in self._maps
@@ -260,16 +377,39 @@ class Navigator:
             if not dest_map.is_walkable(goal.x, goal.y):
                 return None
 
-        # Same map: single-map A*
-        if start.map_id == goal.map_id and not self._has_cross_map_path(start.map_id, goal.map_id):
-            return self._astar_single(start, goal, avoid_encounters, max_iterations)
+        self._sync_caches()
+        key = (start.map_id, start.x, start.y, goal.map_id, goal.x, goal.y,
+               bool(avoid_encounters), max_iterations)
+        if key in self._path_cache:
+            self._path_cache.move_to_end(key)
+            cached = self._path_cache[key]
+            return None if cached is None else list(cached)
+
+        if start.map_id == goal.map_id:
+            path = self._astar_single(start, goal, avoid_encounters, max_iterations)
+        else:
+            path = self._astar_multi(start, goal, avoid_encounters, max_iterations)
 
-        # Cross-map: multi-map A*
-        return self._astar_multi(start, goal, avoid_encounters, max_iterations)
+        self._path_cache[key] = path
+        if len(self._path_cache) > PATH_CACHE_SIZE:
+            self._path_cache.popitem(last=False)
+        return None if path is None else list(path)
 
-    def _has_cross_map_path(self, src: int, dst: int) -> bool:
-        """Check if we might need to cross maps (different map IDs)."""
-        return src != dst
+    # ── Cache maintenance ──
+
+    def _revision(self) -> tuple:
+        return (self._topology, tuple((mid, m.version) for mid, m in self._maps.items()))
+
+    def _sync_caches(self) -> None:
+        """Drop derived data if any map, warp or connection changed."""
+        rev = self._revision()
+        if rev != self._cache_rev:
+            self._cache_rev = rev
+            self._portal_cache.clear()
+            self._tree_cache.clear()
+            self._path_cache.clear()
+
+    # ── Single-map search ──
 
     def _astar_single(
         self,
@@ -278,62 +418,138 @@ class Navigator:
         avoid_encounters: bool,
         max_iter: int,
     ) -> Optional[List[PathStep]]:
-        """A* on a single map."""
-        map_data = self._maps[start.map_id]
-        h = self.manhattan(start.x, start.y, goal.x, goal.y)
-
-        start_node = _AStarNode(
-            f_score=h, g_score=0,
-            map_id=start.map_id, x=start.x, y=start.y,
-        )
-
-        open_set: List[_AStarNode] = [start_node]
-        closed: Set[Tuple[int, int]] = set()
-        g_scores: Dict[Tuple[int, int], float] = {(start.x, start.y): 0}
+        """A* on a single map over the flat grid."""
+        grid = self._maps[start.map_id].grid()
+        if not grid.contains(start.x, start.y):
+            return None
+        codes = grid.codes
+        costs = _CODE_COST[bool(avoid_encounters)]
+        stride = grid.stride
+        deltas = (-stride, stride, -1, 1)
+        src = grid.index(start.x, start.y)
+        dst = grid.index(goal.x, goal.y)
+        gx, gy = goal.x + 1, goal.y + 1
+
+        g = [_INF] * len(codes)
+        parent = array("i", [-1]) * len(codes)
+        closed = bytearray(len(codes))
+        g[src] = 0.0
+        h = abs(start.x - goal.x) + abs(start.y - goal.y)
+        open_set = [(h, h, src)]
 
         iterations = 0
         while open_set and iterations < max_iter:
             iterations += 1
-            current = heapq.heappop(open_set)
-
-            if current.x == goal.x and current.y == goal.y:
-                return self._reconstruct(current)
-
-            pos_key = (current.x, current.y)
-            if pos_key in closed:
+            _, _, cur = heapq.heappop(open_set)
+            if cur == dst:
+                return self._walk_steps(start.map_id, grid, parent, src, dst)
+            if closed[cur]:
                 continue
-            closed.add(pos_key)
+            closed[cur] = 1
+            g_cur = g[cur]
+            for d in deltas:
+                nb = cur + d
+                code = codes[nb]
+                if not code or closed[nb]:
+                    continue
+                tentative_g = g_cur + costs[code]
+                if tentative_g < g[nb]:
+                    g[nb] = tentative_g
+                    parent[nb] = cur
+                    y, x = divmod(nb, stride)
+                    h = abs(x - gx) + abs(y - gy)
+                    heapq.heappush(open_set, (tentative_g + h, h, nb))
 
-            for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-                nx, ny = current.x + dx, current.y + dy
-                nkey = (nx, ny)
+        return None  # No path found
 
-                if nkey in closed:
+    def _tree(self, map_id: int, x: int, y: int, avoid_encounters: bool) -> _Tree:
+        """Cached Dijkstra tree from (x, y) over map_id (the tile itself may be blocked)."""
+        key = (map_id, x, y, bool(avoid_encounters))
+        tree = self._tree_cache.get(key)
+        if tree is not None:
+            self._tree_cache.move_to_end(key)
+            return tree
+
+        grid = self._maps[map_id].grid()
+        codes = grid.codes
+        costs = _CODE_COST[bool(avoid_encounters)]
+        stride = grid.stride
+        deltas = (-stride, stride, -1, 1)
+        dist = [_INF] * len(codes)
+        parent = array("i", [-1]) * len(codes)
+        if grid.contains(x, y):
+            src = grid.index(x, y)
+            dist[src] = 0.0
+            heap = [(0.0, src)]
+            while heap:
+                d_cur, cur = heapq.heappop(heap)
+                if d_cur > dist[cur]:
                     continue
-
-                tile = map_data.get_tile(nx, ny)
-                # Start position is always walkable (player is already there)
-                if not tile.is_walkable() and not (nx == start.x and ny == start.y):
+                for d in deltas:
+                    nb = cur + d
+                    code = codes[nb]
+                    if not code:
+                        continue
+                    nd = d_cur + costs[code]
+                    if nd < dist[nb]:
+                        dist[nb] = nd
+                        parent[nb] = cur
+                        heapq.heappush(heap, (nd, nb))
+
+        tree = _Tree(grid, dist, parent)
+        self._tree_cache[key] = tree
+        if len(self._tree_cache) > TREE_CACHE_SIZE:
+            self._tree_cache.popitem(last=False)
+        return tree
+
+    # ── Cross-map search ──
+
+    def _portals(self, map_id: int) -> List[_Portal]:
+        """Exits of a map: warp tiles plus one or two crossings per open edge run."""
+        portals = self._portal_cache.get(map_id)
+        if portals is not None:
+            return portals
+        portals = []
+        grid = self._maps[map_id].grid()
+        for (src_map, sx, sy), warps in self._warp_index.items():
+            if src_map != map_id or not grid.contains(sx, sy):
+                continue
+            for warp in warps:
+                portals.append(_Portal(grid.index(sx, sy), warp.dest_map,
+                                       warp.dest_x, warp.dest_y, "warp", True))
+        for edge, direction in _EDGE_DIR.items():
+            conn = self._conn_index.get((edge, map_id))
+            dest_map = self._maps.get(conn.dest_map) if conn else None
+            if dest_map is None:
+                continue
+            if edge in ("north", "south"):
+                y = 0 if edge == "north" else grid.height - 1
+                dest_y = dest_map.height - 1 if edge == "north" else 0
+                crossings = [(x, y, x + conn.offset, dest_y) for x in range(grid.width)]
+            else:
+                x = 0 if edge == "west" else grid.width - 1
+                dest_x = dest_map.width - 1 if edge == "west" else 0
+                crossings = [(x, y, dest_x, y + conn.offset) for y in range(grid.height)]
+            # HPA*-style entrances: each contiguous run of crossings open on
+            # both sides gets one transition (its middle), or two (its ends)
+            # if it is long.
+            src_map = self._maps[map_id]
+            runs: List[list] = [[]]
+            for crossing in crossings:
+                if (src_map.is_walkable(crossing[0], crossing[1])
+                        and dest_map.is_walkable(crossing[2], crossing[3])):
+                    runs[-1].append(crossing)
+                elif runs[-1]:
+                    runs.append([])
+            for run in runs:
+                if not run:
                     continue
-
-                cost = tile.movement_cost(avoid_encounters)
-                tentative_g = current.g_score + cost
-
-                if tentative_g < g_scores.get(nkey, float("inf")):
-                    g_scores[nkey] = tentative_g
-                    h = self.manhattan(nx, ny, goal.x, goal.y)
-                    direction = _DELTA_DIR.get((dx, dy), "")
-                    node = _AStarNode(
-                        f_score=tentative_g + h,
-                        g_score=tentative_g,
-                        map_id=start.map_id,
-                        x=nx, y=ny,
-                        parent=current,
-                        direction=direction,
-                    )
-                    heapq.heappush(open_set, node)
-
-        return None  # No path found
+                picks = [run[len(run) // 2]] if len(run) < ENTRANCE_SPLIT_LEN else [run[0], run[-1]]
+                for sx, sy, dx, dy in picks:
+                    portals.append(_Portal(grid.index(sx, sy), conn.dest_map,
+                                           dx, dy, direction, False))
+        self._portal_cache[map_id] = portals
+        return portals
 
     def _astar_multi(
         self,
@@ -342,189 +558,96 @@ class Navigator:
         avoid_encounters: bool,
         max_iter: int,
     ) -> Optional[List[PathStep]]:
-        """A* across multiple maps using warps and connections."""
-        h = 0 if start.map_id == goal.map_id else 10  # cross-map heuristic boost
-
-        start_node = _AStarNode(
-            f_score=h + self.manhattan(start.x, start.y, goal.x, goal.y)
-            if start.map_id == goal.map_id else h,
-            g_score=0,
-            map_id=start.map_id, x=start.x, y=start.y,
-        )
+        """Shortest path across maps on the abstract entrance graph.
 
-        open_set: List[_AStarNode] = [start_node]
-        closed: Set[Tuple[int, int, int]] = set()  # (map_id, x, y)
-        g_scores: Dict[Tuple[int, int, int], float] = {
-            (start.map_id, start.x, start.y): 0
-        }
-
-        iterations = 0
-        while open_set and iterations < max_iter:
-            iterations += 1
-            current = heapq.heappop(open_set)
-
-            if (current.map_id == goal.map_id and current.x == goal.x
-                    and current.y == goal.y):
-                return self._reconstruct(current)
-
-            pos_key = (current.map_id, current.x, current.y)
-            if pos_key in closed:
+        Nodes are (map_id, x, y) entrances; expanding one looks up its
+        cached Dijkstra tree for the distance to the goal (on the goal map)
+        and to every exit portal. The concrete path is read back from the
+        same trees, so no second grid search is needed.
+        """
+        goal_node = ("goal",)
+        goal_tile = (goal.map_id, goal.x, goal.y)
+        start_node = (start.map_id, start.x, start.y)
+        best: Dict[tuple, float] = {start_node: 0.0}
+        via: Dict[tuple, Tuple[tuple, Optional[_Portal]]] = {}
+        counter = itertools.count()
+        open_set = [(0.0, next(counter), start_node)]
+
+        expansions = 0
+        while open_set and expansions < max_iter:
+            g_cur, _, node = heapq.heappop(open_set)
+            if node == goal_node:
+                return self._unroll(goal_node, via, goal, avoid_encounters)
+            if g_cur > best.get(node, _INF):
                 continue
-            closed.add(pos_key)
-
-            cur_map = self._maps.get(current.map_id)
-            if cur_map is None:
+            expansions += 1
+            map_id, x, y = node
+            if map_id not in self._maps:
                 continue
-
-            # Normal walking neighbors
-            for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-                nx, ny = current.x + dx, current.y + dy
-                nkey = (current.map_id, nx, ny)
-
-                if nkey in closed:
-                    continue
-
-                tile = cur_map.get_tile(nx, ny)
-                if not tile.is_walkable():
-                    continue
-
-                cost = tile.movement_cost(avoid_encounters)
-                tentative_g = current.g_score + cost
-
-                if tentative_g < g_scores.get(nkey, float("inf")):
-                    g_scores[nkey] = tentative_g
-                    if current.map_id == goal.map_id:
-                        h_val = self.manhattan(nx, ny, goal.x, goal.y)
-                    else:
-                        h_val = 10  # heuristic for cross-map
-                    direction = _DELTA_DIR.get((dx, dy), "")
-                    node = _AStarNode(
-                        f_score=tentative_g + h_val,
-                        g_score=tentative_g,
-                        map_id=current.map_id, x=nx, y=ny,
-                        parent=current,
-                        direction=direction,
-                    )
-                    heapq.heappush(open_set, node)
-
-            # Warp transitions
-            warp_key = (current.map_id, current.x, current.y)
-            for warp in self._warp_index.get(warp_key, []):
-                dest_key = (warp.dest_map, warp.dest_x, warp.dest_y)
-                if dest_key in closed:
+            tree = self._tree(map_id, x, y, avoid_encounters)
+            dist = tree.dist
+
+            candidates = []
+            if map_id == goal.map_id and tree.grid.contains(goal.x, goal.y):
+                candidates.append((dist[tree.grid.index(goal.x, goal.y)], goal_node, None))
+            for portal in self._portals(map_id):
+                d = dist[portal.src]
+                if d == _INF:
                     continue
-
-                # Warp cost is 1 (one step through door)
-                tentative_g = current.g_score + 1.0
-
-                if tentative_g < g_scores.get(dest_key, float("inf")):
-                    g_scores[dest_key] = tentative_g
-                    if warp.dest_map == goal.map_id:
-                        h_val = self.manhattan(warp.dest_x, warp.dest_y, goal.x, goal.y)
-                    else:
-                        h_val = 10
-                    node = _AStarNode(
-                        f_score=tentative_g + h_val,
-                        g_score=tentative_g,
-                        map_id=warp.dest_map,
-                        x=warp.dest_x, y=warp.dest_y,
-                        parent=current,
-                        direction="warp",
-                        is_warp=True,
-                    )
-                    heapq.heappush(open_set, node)
-
-            # Connection transitions (map edge)
-            self._expand_connections(current, cur_map, goal, open_set, closed, g_scores)
+                dest = (portal.dest_map, portal.dest_x, portal.dest_y)
+                if portal.dest_map not in self._maps:
+                    if dest != goal_tile:
+                        continue
+                    dest = goal_node  # goal on a map we have no tiles for
+                candidates.append((d + 1.0, dest, portal))
+
+            for d, dest, portal in candidates:
+                tentative_g = g_cur + d
+                if tentative_g < best.get(dest, _INF):
+                    best[dest] = tentative_g
+                    via[dest] = (node, portal)
+                    heapq.heappush(open_set, (tentative_g, next(counter), dest))
 
         return None
 
-    def _expand_connections(
-        self,
-        current: _AStarNode,
-        cur_map: MapData,
-        goal: MapPosition,
-        open_set: List[_AStarNode],
-        closed: Set[Tuple[int, int, int]],
-        g_scores: Dict[Tuple[int, int, int], float],
-    ) -> None:
-        """Expand map edge connections."""
-        # Check if current position is at a map edge
-        edges = []
-        if current.y == 0:
-            edges.append("north")
-        if current.y == cur_map.height - 1:
-            edges.append("south")
-        if current.x == 0:
-            edges.append("west")
-        if current.x == cur_map.width - 1:
-            edges.append("east")
-
-        for direction in edges:
-            conn = self._conn_index.get((direction, current.map_id))
-            if conn is None:
-                continue
-
-            dest_map = self._maps.get(conn.dest_map)
-            if dest_map is None:
-                continue
-
-            # Calculate destination position on the connected map
-            if direction == "north":
-                dest_x = current.x + conn.offset
-                dest_y = dest_map.height - 1
-            elif direction == "south":
-                dest_x = current.x + conn.offset
-                dest_y = 0
-            elif direction == "west":
-                dest_x = dest_map.width - 1
-                dest_y = current.y + conn.offset
-            else:  # east
-                dest_x = 0
-                dest_y = current.y + conn.offset
-
-            dest_key = (conn.dest_map, dest_x, dest_y)
-            if dest_key in closed:
-                continue
+    def _unroll(self, goal_node: tuple, via: dict, goal: MapPosition,
+                avoid_encounters: bool) -> List[PathStep]:
+        """Expand the abstract route into concrete PathSteps."""
+        legs = []
+        node = goal_node
+        while node in via:
+            prev, portal = via[node]
+            legs.append((prev, portal))
+            node = prev
+        legs.reverse()
 
-            if not dest_map.is_walkable(dest_x, dest_y):
-                continue
+        steps: List[PathStep] = []
+        for (map_id, x, y), portal in legs:
+            tree = self._tree(map_id, x, y, avoid_encounters)
+            src = tree.grid.index(x, y)
+            dst = portal.src if portal is not None else tree.grid.index(goal.x, goal.y)
+            steps.extend(self._walk_steps(map_id, tree.grid, tree.parent, src, dst))
+            if portal is not None:
+                steps.append(PathStep(
+                    direction=portal.direction,
+                    map_id=portal.dest_map,
+                    x=portal.dest_x,
+                    y=portal.dest_y,
+                    is_warp=portal.is_warp,
+                ))
+        return steps
 
-            tentative_g = current.g_score + 1.0
-            if tentative_g < g_scores.get(dest_key, float("inf")):
-                g_scores[dest_key] = tentative_g
-                if conn.dest_map == goal.map_id:
-                    h_val = self.manhattan(dest_x, dest_y, goal.x, goal.y)
-                else:
-                    h_val = 10
-                # Direction of movement to cross the edge
-                dir_name = {
-                    "north": "up", "south": "down",
-                    "west": "left", "east": "right",
-                }[direction]
-                node = _AStarNode(
-                    f_score=tentative_g + h_val,
-                    g_score=tentative_g,
-                    map_id=conn.dest_map,
-                    x=dest_x, y=dest_y,
-                    parent=current,
-                    direction=dir_name,
-                    is_warp=False,
-                )
-                heapq.heappush(open_set, node)
-
-    def _reconstruct(self, node: _AStarNode) -> List[PathStep]:
-        """Reconstruct path from goal node back to start."""
+    @staticmethod
+    def _walk_steps(map_id: int, grid: _MapGrid, parent: array,
+                    src: int, dst: int) -> List[PathStep]:
+        """Follow parent links from dst back to src on one map."""
         steps: List[PathStep] = []
-        current = node
-        while current.parent is not None:
-            steps.append(PathStep(
-                direction=current.direction,
-                map_id=current.map_id,
-                x=current.x,
-                y=current.y,
-                is_warp=current.is_warp,
-            ))
-            current = current.parent
+        cur = dst
+        while cur != src:
+            prev = parent[cur]
+            x, y = grid.xy(cur)
+            px, py = grid.xy(prev)
+            steps.append(PathStep(direction=_DELTA_DIR[(x - px, y - py)], map_id=map_id, x=x, y=y))
+            cur = prev
         steps.reverse()
         return steps
@@ -14,7 +14,7 @@ from __future__ import annotations
 import base64
 from typing import List, Optional
 
-from config import STUCK_STRATEGY_MEMORY, STUCK_ENCOURAGE_LEVELS
+from config import STATE_FULL_EVERY, STUCK_STRATEGY_MEMORY, STUCK_ENCOURAGE_LEVELS
 from game_state import BattleState, GameState, MapPosition, MenuState, Party
 
 
@@ -174,23 +174,18 @@ def build_stuck_message(
 # ── Message formatting ───────────────────────────────────────────────────────
 
 
-def format_game_state(state: GameState) -> str:
-    """Format game state as readable text for the LLM.
+# Section order for state text: stable facts first, volatile ones last, so
+# consecutive snapshots share the longest possible prefix.
+STATE_SECTIONS = ("badges", "party", "location", "ui", "battle", "money", "clock")
+# Sections that change every turn on their own; only sent in full snapshots.
+VOLATILE_SECTIONS = frozenset({"clock"})
+STATE_HEADER = "=== GAME STATE (from RAM — ground truth) ==="
+CHARS_PER_TOKEN = 4  # rough English/ASCII estimate for savings accounting
 
-    This is what the model sees as the RAM ground truth each turn.
-    """
-    lines = ["=== GAME STATE (from RAM — ground truth) ==="]
-
-    # Position
-    pos = state.position
-    lines.append(f"Location: Map {pos.map_id} ({pos.map_name or 'unknown'}), "
-                 f"X={pos.x}, Y={pos.y}")
 
-    # Menu/UI state
-    if state.menu_state != MenuState.OVERWORLD:
-        lines.append(f"UI Mode: {state.menu_state.value.upper()}")
-    else:
-        lines.append("UI Mode: overworld (free movement)")
+def game_state_sections(state: GameState) -> dict:
+    """Render each part of the game state as text, keyed by STATE_SECTIONS name."""
+    sections = {}
 
     # Badges
     badge_count = state.badges.count()
@@ -204,27 +199,11 @@ def format_game_state(state: GameState) -> str:
         if has:
             badge_names.append(name)
     badges_str = ", ".join(badge_names) if badge_names else "none"
-    lines.append(f"Badges: {badge_count}/8 Johto [{badges_str}]")
-
-    # Money and time
-    lines.append(f"Money: ${state.money} | Play time: {state.play_time_minutes // 60}h {state.play_time_minutes % 60}m")
-
-    # Battle state
-    if state.battle.in_battle:
-        b = state.battle
-        btype = "Wild" if b.is_wild else "Trainer"
-        enemy = b.enemy
-        if enemy:
-            lines.append(f"BATTLE ({btype}): vs {enemy.species} Lv{enemy.level} "
-                         f"HP:{enemy.hp}/{enemy.hp_max} [{enemy.status}]")
-        else:
-            lines.append(f"BATTLE ({btype}): enemy data unavailable")
-    else:
-        lines.append("Not in battle")
+    sections["badges"] = f"Badges: {badge_count}/8 Johto [{badges_str}]"
 
     # Party
-    lines.append(f"\nPARTY ({state.party.size()} Pokemon, "
-                 f"{state.party.alive_count()} alive):")
+    lines = [f"PARTY ({state.party.size()} Pokemon, "
+             f"{state.party.alive_count()} alive):"]
     for i, mon in enumerate(state.party.pokemon):
         hp_pct = int(mon.hp_pct() * 100)
         moves_str = ", ".join(
@@ -236,8 +215,108 @@ def format_game_state(state: GameState) -> str:
             f"HP:{mon.hp}/{mon.hp_max} ({hp_pct}%){status} "
             f"| {moves_str}"
         )
+    sections["party"] = "\n".join(lines)
 
-    return "\n".join(lines)
+    # Position
+    pos = state.position
+    sections["location"] = (f"Location: Map {pos.map_id} ({pos.map_name or 'unknown'}), "
+                            f"X={pos.x}, Y={pos.y}")
+
+    # Menu/UI state
+    if state.menu_state != MenuState.OVERWORLD:
+        sections["ui"] = f"UI Mode: {state.menu_state.value.upper()}"
+    else:
+        sections["ui"] = "UI Mode: overworld (free movement)"
+
+    # Battle state
+    if state.battle.in_battle:
+        b = state.battle
+        btype = "Wild" if b.is_wild else "Trainer"
+        enemy = b.enemy
+        if enemy:
+            sections["battle"] = (f"BATTLE ({btype}): vs {enemy.species} Lv{enemy.level} "
+                                  f"HP:{enemy.hp}/{enemy.hp_max} [{enemy.status}]")
+        else:
+            sections["battle"] = f"BATTLE ({btype}): enemy data unavailable"
+    else:
+        sections["battle"] = "Not in battle"
+
+    # Money and time
+    sections["money"] = f"Money: ${state.money}"
+    sections["clock"] = f"Play time: {state.play_time_minutes // 60}h {state.play_time_minutes % 60}m"
+    return sections
+
+
+def _join_sections(sections: dict) -> str:
+    return "\n".join([STATE_HEADER] + [sections[name] for name in STATE_SECTIONS])
+
+
+def format_game_state(state: GameState) -> str:
+    """Format game state as readable text for the LLM.
+
+    This is what the model sees as the RAM ground truth each turn.
+    """
+    return _join_sections(game_state_sections(state))
+
+
+class StateDeltaEncoder:
+    """Turn successive game states into full snapshots or change lists.
+
+    The conversation history already holds the last state the model saw,
+    so most turns only need the sections that differ from it. A full
+    snapshot goes out every full_every turns (and after reset(), e.g. when
+    the history is summarized away) so the model never drifts far from
+    ground truth.
+    """
+
+    def __init__(self, full_every: int = STATE_FULL_EVERY):
+        self.full_every = full_every
+        self._last: Optional[dict] = None
+        self._last_step = 0
+        self._since_full = 0
+        self.full_snapshots = 0
+        self.delta_turns = 0
+        self.chars_sent = 0
+        self.chars_full = 0  # what sending a full snapshot every turn would cost
+
+    def reset(self) -> None:
+        """Forget the baseline: the next encode() sends a full snapshot."""
+        self._last = None
+
+    def encode(self, state: GameState, step_number: int = 0) -> str:
+        sections = game_state_sections(state)
+        full_text = _join_sections(sections)
+        self.chars_full += len(full_text)
+
+        if self._last is None or self.full_every <= 1 or self._since_full + 1 >= self.full_every:
+            text = full_text
+            self._since_full = 0
+            self.full_snapshots += 1
+        else:
+            changed = [name for name in STATE_SECTIONS
+                       if name not in VOLATILE_SECTIONS and sections[name] != self._last[name]]
+            if changed:
+                text = "\n".join([f"=== STATE CHANGES since step {self._last_step} "
+                                  f"(everything else unchanged) ==="]
+                                 + [sections[name] for name in changed])
+            else:
+                text = f"=== NO STATE CHANGES since step {self._last_step} ==="
+            self._since_full += 1
+            self.delta_turns += 1
+
+        self._last = sections
+        self._last_step = step_number
+        self.chars_sent += len(text)
+        return text
+
+    def stats(self) -> dict:
+        return {
+            "full_snapshots": self.full_snapshots,
+            "delta_turns": self.delta_turns,
+            "state_chars_sent": self.chars_sent,
+            "state_chars_full": self.chars_full,
+            "est_tokens_saved": (self.chars_full - self.chars_sent) // CHARS_PER_TOKEN,
+        }
 
 
 def build_user_message(
@@ -249,10 +328,15 @@ def build_user_message(
     stuck_threshold: int = 10,
     blocked_directions: str = "",
     text_context: str = "",
+    state_text: Optional[str] = None,
+    screen_unchanged: bool = False,
 ) -> dict:
     """Build a user message with game state + optional screenshot.
 
-    Returns a message dict in Claude API format.
+    state_text overrides the full format_game_state() rendering (e.g. with
+    a StateDeltaEncoder change list). screen_unchanged notes that the screenshot
+    was left out because the screen matches the last one sent. Returns a
+    message dict in Claude API format.
     """
     content = []
 
@@ -268,7 +352,11 @@ def build_user_message(
         })
 
     # Game state text
-    state_text = format_game_state(state)
+    if state_text is None:
+        state_text = format_game_state(state)
+
+    if screen_unchanged:
+        state_text += "\n\nSCREEN: unchanged since your last screenshot."
 
     # Add RAM text context (dialog, signs, menus — more reliable than OCR)
     if text_context:
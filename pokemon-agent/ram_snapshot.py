@@ -0,0 +1,119 @@
+"""Frame-keyed RAM snapshots for the memory readers.
+
+Every read_byte() on the mGBA backend is a separate FFI call, and a full
+read_game_state() used to make well over a hundred of them. RamSnapshot
+copies the WRAM ranges a reader needs with one read_bytes() call per
+span, then decodes from the local buffer. The copy is reused until
+EmulatorControl.memory_epoch changes (frames advanced, RAM written,
+state loaded), so repeated reads within one agent step cost nothing.
+
+Spans are loaded lazily: a refresh only marks them stale, and a span is
+copied the first time something inside it is read. When the backend can
+copy large ranges cheaply (EmulatorControl.bulk_reads), nearby spans are
+merged so one observation is a single round trip; otherwise they stay
+tight so the per-byte fallback reads only what is needed.
+
+Usage:
+    from ram_snapshot import RamSnapshot
+
+    snap = RamSnapshot(emu, [(0xDCB5, 0xDCB9), (0xDCD7, 0xDE83)])
+    x = snap.u8(0xDCB8)
+    hp = snap.u16be(0xDCE1)
+    fields = snap.unpack(PARTY_MON_STRUCT, 0xDCDF)
+
+Stdlib only. No external dependencies beyond project modules.
+"""
+from __future__ import annotations
+
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from emulator_control import EmulatorControl
+
+# Largest gap (bytes) bridged when merging spans
+BULK_MERGE_GAP = 0x1000   # backend copies ranges natively — one big read
+BYTEWISE_MERGE_GAP = 16   # backend reads byte by byte — keep spans tight
+
+_U16BE = struct.Struct(">H")
+_U16LE = struct.Struct("<H")
+
+
+def merge_spans(spans: Sequence[Tuple[int, int]], max_gap: int) -> List[Tuple[int, int]]:
+    """Sort and merge [start, end) spans whose gap is at most max_gap."""
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        if merged and start - merged[-1][1] <= max_gap:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(s, e) for s, e in merged]
+
+
+class RamSnapshot:
+    """Lazily-copied view of selected RAM spans, valid for one memory epoch."""
+
+    def __init__(self, emu: EmulatorControl, spans: Sequence[Tuple[int, int]],
+                 max_gap: Optional[int] = None):
+        self._emu = emu
+        if max_gap is None:
+            max_gap = BULK_MERGE_GAP if emu.bulk_reads else BYTEWISE_MERGE_GAP
+        self.spans = merge_spans(spans, max_gap)
+        self._starts = [s for s, _ in self.spans]
+        self._views: List[Optional[memoryview]] = [None] * len(self.spans)
+        self._epoch = None
+        self.reads = 0  # read_bytes() calls issued (for profiling/tests)
+
+    def _sync(self) -> None:
+        epoch = self._emu.memory_epoch
+        if epoch != self._epoch:
+            self._epoch = epoch
+            self._views = [None] * len(self.spans)
+
+    def _locate(self, address: int, length: int) -> Optional[Tuple[memoryview, int]]:
+        """(buffer, offset) for [address, address+length), or None if uncovered."""
+        self._sync()
+        for i, (start, end) in enumerate(self.spans):
+            if start <= address and address + length <= end:
+                view = self._views[i]
+                if view is None:
+                    view = memoryview(self._emu.read_bytes(start, end - start))
+                    self._views[i] = view
+                    self.reads += 1
+                return view, address - start
+        return None
+
+    def covers(self, address: int, length: int = 1) -> bool:
+        return any(s <= address and address + length <= e for s, e in self.spans)
+
+    def read(self, address: int, length: int) -> bytes:
+        """Bytes at [address, address+length); uncovered ranges read live."""
+        hit = self._locate(address, length)
+        if hit is None:
+            return self._emu.read_bytes(address, length)
+        view, off = hit
+        return view[off:off + length].tobytes()
+
+    def u8(self, address: int) -> int:
+        hit = self._locate(address, 1)
+        if hit is None:
+            return self._emu.read_byte(address)
+        view, off = hit
+        return view[off]
+
+    def u16be(self, address: int) -> int:
+        return _U16BE.unpack(self.read(address, 2))[0]
+
+    def u16le(self, address: int) -> int:
+        return _U16LE.unpack(self.read(address, 2))[0]
+
+    def unpack(self, layout: struct.Struct, address: int) -> tuple:
+        """Decode a fixed-layout record (e.g. a party Pokemon) at address."""
+        hit = self._locate(address, layout.size)
+        if hit is None:
+            return layout.unpack(self._emu.read_bytes(address, layout.size))
+        view, off = hit
+        return layout.unpack_from(view, off)
+
+    def invalidate(self) -> None:
+        """Force the next access to re-copy (e.g. after out-of-band RAM writes)."""
+        self._epoch = None
@@ -46,6 +46,8 @@ class RedAgent(CrystalAgent):
     and Red warp/connection tables for cross-map navigation.
     """
 
+    screenshot_name = "red_screenshot"
+
     def __init__(
         self,
         emulator: EmulatorControl,
@@ -132,16 +134,3 @@ class RedAgent(CrystalAgent):
         except Exception:
             pass  # Non-critical
 
-    def _capture_screenshot(self) -> Optional[str]:
-        """Capture screenshot with Red-specific naming."""
-        try:
-            from prompts import encode_screenshot_b64
-            self.emulator.screenshot("red_screenshot")
-            path = self.emulator._state_path("red_screenshot", ext=".png")
-            if os.path.exists(path):
-                with open(path, "rb") as f:
-                    data = f.read()
-                return encode_screenshot_b64(data)
-        except Exception:
-            pass
-        return None
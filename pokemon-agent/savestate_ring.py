@@ -0,0 +1,213 @@
+"""In-memory savestate ring with delta compression, plus an async disk writer.
+
+A full mGBA savestate is tens of KB, and between two agent steps almost
+all of it (WRAM, VRAM, cartridge RAM) is unchanged. SavestateRing stores
+each state as the zlib-compressed XOR against the previous one — long
+runs of zero bytes that compress to a few hundred bytes — with a full
+keyframe every keyframe_interval entries so a restore never replays more
+than that many deltas. The newest state is also kept uncompressed, so
+rewinding to it is a plain copy.
+
+AsyncStateWriter moves the disk writes for milestone checkpoints off the
+agent loop: states are handed over as bytes and written by a daemon
+thread (tmp file + rename, so a crash never leaves a torn .state).
+
+Usage:
+    from savestate_ring import SavestateRing, AsyncStateWriter
+
+    ring = SavestateRing(capacity=64)
+    rid = ring.push(emu.snapshot_state(), step=12, label="press_buttons")
+    emu.restore_state(ring.get(rid))
+
+    writer = AsyncStateWriter()
+    writer.submit("states/checkpoint.state", ring.get(rid))
+    writer.flush()
+
+Stdlib only. No external dependencies beyond project modules.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import threading
+import zlib
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+RING_CAPACITY = 64        # states kept in memory
+KEYFRAME_INTERVAL = 16    # full state every N entries (bounds restore cost)
+COMPRESS_LEVEL = 1        # zlib level: deltas are mostly zeros, speed matters more
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    """Bytewise XOR of two equal-length buffers (via big ints — runs in C)."""
+    n = len(a)
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(n, "little")
+
+
+class _Entry:
+    __slots__ = ("id", "step", "label", "key", "payload", "size")
+
+    def __init__(self, rid: int, step: int, label: str, key: bool, payload: bytes, size: int):
+        self.id = rid
+        self.step = step
+        self.label = label
+        self.key = key          # payload is zlib(state) rather than zlib(prev ^ state)
+        self.payload = payload
+        self.size = size        # uncompressed state length
+
+
+class SavestateRing:
+    """Bounded, delta-compressed history of raw savestates."""
+
+    def __init__(self, capacity: int = RING_CAPACITY, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.capacity = max(1, capacity)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._entries: Deque[_Entry] = deque()
+        self._last_raw: Optional[bytes] = None  # uncompressed copy of the newest entry
+        self._since_key = 0
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, rid: int) -> bool:
+        return self._index(rid) is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Compressed bytes held by the ring (excluding the newest raw copy)."""
+        return sum(len(e.payload) for e in self._entries)
+
+    def push(self, state: bytes, step: int = 0, label: str = "") -> int:
+        """Append a state and return its ring id."""
+        state = bytes(state)
+        prev = self._last_raw
+        key = (prev is None or len(prev) != len(state)
+               or self._since_key + 1 >= self.keyframe_interval)
+        body = state if key else _xor(prev, state)
+        entry = _Entry(self._next_id, step, label, key,
+                       zlib.compress(body, COMPRESS_LEVEL), len(state))
+        self._next_id += 1
+        self._since_key = 0 if key else self._since_key + 1
+        self._entries.append(entry)
+        self._last_raw = state
+        while len(self._entries) > self.capacity:
+            self._evict_oldest()
+        return entry.id
+
+    def _evict_oldest(self) -> None:
+        oldest = self._entries.popleft()  # the head is always a keyframe
+        if self._entries and not self._entries[0].key:
+            # The new head was a delta against the evicted state: make it a keyframe
+            head = self._entries[0]
+            raw = _xor(zlib.decompress(oldest.payload), zlib.decompress(head.payload))
+            head.payload = zlib.compress(raw, COMPRESS_LEVEL)
+            head.key = True
+
+    def _raw_at(self, index: int) -> bytes:
+        """Materialize the state at deque index: nearest keyframe, then its deltas."""
+        start = index
+        while not self._entries[start].key:
+            start -= 1
+        raw = zlib.decompress(self._entries[start].payload)
+        for i in range(start + 1, index + 1):
+            raw = _xor(raw, zlib.decompress(self._entries[i].payload))
+        return raw
+
+    def _index(self, rid: int) -> Optional[int]:
+        for i, entry in enumerate(self._entries):
+            if entry.id == rid:
+                return i
+        return None
+
+    def get(self, rid: int) -> Optional[bytes]:
+        """Raw state for a ring id, or None if it has been evicted or discarded."""
+        if self._entries and self._entries[-1].id == rid:
+            return self._last_raw
+        index = self._index(rid)
+        return None if index is None else self._raw_at(index)
+
+    def latest(self) -> Optional[Tuple[int, bytes]]:
+        if not self._entries:
+            return None
+        return self._entries[-1].id, self._last_raw
+
+    def nth_latest(self, n: int) -> Optional[int]:
+        """Ring id of the nth most recent state (1 = newest), or None."""
+        if n < 1 or n > len(self._entries):
+            return None
+        return self._entries[-n].id
+
+    def truncate_after(self, rid: int) -> None:
+        """Drop every state newer than rid (a rewind discards the abandoned future)."""
+        index = self._index(rid)
+        if index is None:
+            return
+        while len(self._entries) > index + 1:
+            self._entries.pop()
+        self._last_raw = self._raw_at(index)
+        self._since_key = 0
+        for entry in reversed(self._entries):
+            if entry.key:
+                break
+            self._since_key += 1
+
+    def describe(self) -> List[dict]:
+        return [{"id": e.id, "step": e.step, "label": e.label, "keyframe": e.key,
+                 "bytes": len(e.payload), "raw_bytes": e.size} for e in self._entries]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._last_raw = None
+        self._since_key = 0
+
+
+class AsyncStateWriter:
+    """Write savestate bytes to disk on a daemon thread, in submission order."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Tuple[str, bytes]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.errors: List[str] = []
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="state-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)  # don't lose queued milestones on exit
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                path, data = job
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                tmp = path + ".tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError as e:
+                self.errors.append(f"{job[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, path: str, data: bytes) -> None:
+        self._start()
+        self._queue.put((path, bytes(data)))
+
+    def flush(self) -> None:
+        """Block until every submitted state is on disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._queue.join()
+            self._thread = None
@@ -5,10 +5,16 @@ During screen transitions (map changes, battle intros, fade effects),
 the game disables joypad input (JOY_DISABLED flag). We detect this
 and auto-wait instead of burning an API call.
 
+The raw framebuffer adds a second signal: an exact digest of its bytes
+(framebuffer.frame_digest). Consecutive frames with the same digest are
+the same screen, so the agent can skip re-encoding and re-sending the
+screenshot. It never changes the classification — RAM decides that.
+
 Usage:
     from screen_detector import ScreenDetector, ScreenState
 
     sd = ScreenDetector()
+    sd.observe_frame(emu.framebuffer())  # sets sd.frame_digest, sd.frame_changed
     state = sd.classify(joy_disabled=1, battle_mode=0, window_stack=0)
     action = sd.recommended_action(state)  # "wait" or None
     sd.update(state)  # track consecutive transitions
@@ -18,7 +24,9 @@ Stdlib only. No external dependencies.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
+
+from framebuffer import frame_digest
 
 
 class ScreenState(Enum):
@@ -44,6 +52,31 @@ class ScreenDetector:
         self.consecutive_transitions: int = 0
         self._total_transitions: int = 0
         self._total_active: int = 0
+        self.frame_digest: Optional[int] = None
+        self.frame_changed: bool = True
+        self._frames_seen: int = 0
+        self._frames_unchanged: int = 0
+
+    def observe_frame(self, frame: Optional[Tuple[int, int, bytes]]) -> Optional[int]:
+        """Digest the current framebuffer and note whether the screen changed.
+
+        Args:
+            frame: (width, height, RGB bytes) from EmulatorControl.framebuffer(),
+                or None when the backend can't provide one.
+
+        Returns:
+            The frame's digest, or None without a frame (frame_changed stays True).
+        """
+        if frame is None:
+            self.frame_digest = None
+            self.frame_changed = True
+            return None
+        value = frame_digest(frame)
+        self.frame_changed = value != self.frame_digest
+        self.frame_digest = value
+        self._frames_seen += 1
+        self._frames_unchanged += not self.frame_changed
+        return value
 
     def classify(
         self,
@@ -102,4 +135,6 @@ class ScreenDetector:
             "total_active": self._total_active,
             "llm_calls_saved": self._total_transitions,
             "consecutive_transitions": self.consecutive_transitions,
+            "frames_hashed": self._frames_seen,
+            "frames_unchanged": self._frames_unchanged,
         }
@@ -0,0 +1,182 @@
+"""Tests for action_store.py — persistent, merge-on-write action knowledge."""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from action_cache import ActionCache
+from action_store import (
+    ActionStore, HALF_LIFE_S, decode_buttons, encode_buttons, state_hash,
+)
+from batch_eval import EpisodeSpec, run_episode, summarize
+
+KEY = "overworld:24:5,7:no_battle"
+
+
+class TestEncoding(unittest.TestCase):
+
+    def test_buttons_round_trip(self):
+        buttons = ["up", "up", "a", "start", "b", "select", "left", "right"]
+        self.assertEqual(decode_buttons(encode_buttons(buttons)), buttons)
+
+    def test_unstorable_buttons(self):
+        self.assertIsNone(encode_buttons([]))
+        self.assertIsNone(encode_buttons(["a"] * 9))
+        self.assertIsNone(encode_buttons(["l"]))
+
+    def test_state_hash_is_stable_u64(self):
+        self.assertEqual(state_hash(KEY), state_hash(KEY))
+        self.assertNotEqual(state_hash(KEY), state_hash(KEY + "x"))
+        self.assertLess(state_hash(KEY), 1 << 64)
+
+
+class TestActionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "store.bin")
+
+    def test_record_lookup_and_reload(self):
+        store = ActionStore(self.path, sync_every=0)
+        self.assertIsNone(store.lookup(KEY))
+        store.record(KEY, ["up", "a"])
+        self.assertEqual(store.lookup(KEY), ["up", "a"])
+        store.save()
+
+        reloaded = ActionStore(self.path)
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(reloaded.lookup(KEY), ["up", "a"])
+        self.assertEqual(reloaded.stats()["llm_calls_saved_all_runs"], 2)
+
+    def test_failures_lower_confidence(self):
+        store = ActionStore(self.path, sync_every=0)
+        store.record(KEY, ["a"])
+        store.record_outcome(KEY, False)
+        self.assertIsNone(store.lookup(KEY))
+        store.record_outcome(KEY, True)
+        store.record_outcome(KEY, True)
+        self.assertEqual(store.lookup(KEY), ["a"])
+
+    def test_different_action_replaces(self):
+        store = ActionStore(self.path, sync_every=0)
+        store.record(KEY, ["a"])
+        store.record_outcome(KEY, True)
+        store.record(KEY, ["b"])
+        self.assertEqual(store.lookup(KEY), ["b"])
+
+    def test_counts_decay(self):
+        store = ActionStore(self.path, sync_every=0)
+        store.record(KEY, ["a"])
+        store.save()
+        rec = store._disk_record(state_hash(KEY))
+        later = rec.updated + HALF_LIFE_S
+        self.assertAlmostEqual(rec.decayed(later, HALF_LIFE_S)[0], 0.5)
+        self.assertLess(rec.confidence(later, HALF_LIFE_S), rec.confidence(rec.updated, HALF_LIFE_S))
+
+    def test_concurrent_writers_merge(self):
+        first = ActionStore(self.path, sync_every=0)
+        second = ActionStore(self.path, sync_every=0)
+        first.record(KEY, ["a"])
+        second.record(KEY, ["a"])
+        second.record("menu:1:0,0:no_battle", ["b"])
+        first.save()
+        second.save()  # must add to, not overwrite, first's counts
+
+        merged = ActionStore(self.path)
+        self.assertEqual(len(merged), 2)
+        rec = merged._disk_record(state_hash(KEY))
+        self.assertAlmostEqual(rec.successes, 2.0, places=3)
+
+    def test_conflicting_actions_keep_more_confident(self):
+        first = ActionStore(self.path, sync_every=0)
+        second = ActionStore(self.path, sync_every=0)
+        for _ in range(3):
+            first.record(KEY, ["a"])
+        second.record(KEY, ["b"])
+        first.save()
+        second.save()
+        self.assertEqual(ActionStore(self.path).lookup(KEY), ["a"])
+
+    def test_auto_sync_after_n_changes(self):
+        store = ActionStore(self.path, sync_every=2)
+        store.record(KEY, ["a"])
+        self.assertFalse(os.path.exists(self.path))
+        store.record_outcome(KEY, True)
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(store.saves, 1)
+
+    def test_corrupt_file_starts_empty(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a store at all")
+        store = ActionStore(self.path, sync_every=0)
+        self.assertEqual(len(store), 0)
+        store.record(KEY, ["a"])
+        store.save()
+        self.assertEqual(ActionStore(self.path).lookup(KEY), ["a"])
+
+
+class TestActionCacheWithStore(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "store.bin")
+
+    def test_new_run_starts_warm(self):
+        cache = ActionCache(store=ActionStore(self.path))
+        cache.put(KEY, ["up"])
+        cache.sync()
+
+        fresh = ActionCache(store=ActionStore(self.path))
+        self.assertEqual(fresh.get(KEY), ["up"])
+        self.assertEqual(fresh.get(KEY), ["up"])  # now served from memory
+        stats = fresh.stats()
+        self.assertEqual(stats["store_hits"], 1)
+        self.assertEqual(stats["llm_calls_saved"], 2)
+        self.assertEqual(fresh.store.lookups, 1)
+
+    def test_outcomes_written_through(self):
+        cache = ActionCache(store=ActionStore(self.path, sync_every=0))
+        cache.put(KEY, ["a"])
+        cache.record_outcome(KEY, False)
+        cache.record_outcome(KEY, False)
+        cache.clear()
+        self.assertIsNone(cache.get(KEY))
+
+    def test_expired_entry_not_refilled_from_store(self):
+        cache = ActionCache(max_hits=3, store=ActionStore(self.path, sync_every=0))
+        cache.put(KEY, ["up"])
+        for _ in range(3):
+            self.assertEqual(cache.get(KEY), ["up"])
+        self.assertIsNone(cache.get(KEY))  # hit max_hits + 1
+        self.assertIsNone(cache.get(KEY))
+        self.assertEqual(cache.stats()["store_hits"], 0)
+        cache.put(KEY, ["down"])  # the LLM decided again
+        self.assertEqual(cache.get(KEY), ["down"])
+
+    def test_without_store_unchanged(self):
+        cache = ActionCache()
+        self.assertIsNone(cache.get(KEY))
+        cache.sync()
+        self.assertEqual(cache.stats()["store_hits"], 0)
+
+
+class TestBatchEvalStore(unittest.TestCase):
+
+    def test_episodes_share_store(self):
+        path = os.path.join(tempfile.mkdtemp(), "store.bin")
+        # One step: the LLM's choice is stored but never replayed (on MockBackend
+        # a replay changes nothing and would count as a failure)
+        spec = EpisodeSpec(policy="mock_llm", steps=1, script=["a"], action_store=path)
+        first = run_episode(spec, 0)
+        second = run_episode(spec, 1)
+        self.assertEqual(first.error, "")
+        self.assertEqual(second.error, "")
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual((first.store_hits, second.store_hits), (0, 1))
+        summary = summarize([first, second])
+        self.assertIn("cache_hit_rate", summary)
+        self.assertEqual(summary["llm_calls_saved"], first.cache_hits + second.cache_hits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -480,6 +480,89 @@ class TestMessageHistory(unittest.TestCase):
         self.assertIn("tool_use", types)
 
 
+class TestStateDeltaPrompts(unittest.TestCase):
+    """Game state is sent in full on a cadence and as changes in between."""
+
+    def _state_texts(self, agent):
+        return [block["text"] for m in agent.messages if m["role"] == "user"
+                for block in m["content"]
+                if block.get("type") == "text" and block["text"].startswith("[Step")]
+
+    def test_second_turn_is_delta(self):
+        agent, _ = _make_agent(max_history=100)
+        agent.step()
+        agent.step()
+        texts = self._state_texts(agent)
+        self.assertIn("GAME STATE", texts[0])
+        self.assertIn("NO STATE CHANGES since step 1", texts[1])
+
+    def test_full_snapshot_after_summarization(self):
+        agent, _ = _make_agent(max_history=6)
+        agent.step()
+        agent.step()  # summarizes: the first full snapshot is gone
+        agent.step()
+        self.assertTrue(self._state_texts(agent)[-1].startswith("[Step 3]\n=== GAME STATE"))
+
+    def test_token_usage_reports_state_savings(self):
+        agent, _ = _make_agent(max_history=100)
+        for _ in range(3):
+            agent.step()
+        usage = agent.token_usage
+        self.assertEqual(usage["llm_calls"], 3)
+        self.assertEqual(usage["state_prompt"]["full_snapshots"], 1)
+        self.assertEqual(usage["state_prompt"]["delta_turns"], 2)
+        self.assertGreater(usage["state_prompt"]["est_tokens_saved"], 0)
+
+    def test_always_full_when_disabled(self):
+        emu = _setup_mock_emu()
+        agent = CrystalAgent(emulator=emu, reader=MemoryReader(emu),
+                             llm=MockLLMClient(), state_full_every=1)
+        from action_cache import ActionCache
+        agent.action_cache = ActionCache(max_size=0)
+        agent.step()
+        agent.step()
+        self.assertTrue(all("GAME STATE" in t for t in self._state_texts(agent)[:2]))
+
+
+class TestScreenshotDedup(unittest.TestCase):
+    """Screenshots come from the framebuffer and are not re-sent for the same screen."""
+
+    def _images(self, agent):
+        return [block for m in agent.messages if m["role"] == "user"
+                for block in m["content"] if block.get("type") == "image"]
+
+    def test_unchanged_screen_sent_once(self):
+        agent, _ = _make_agent(max_history=100)
+        agent.step()
+        agent.step()
+        self.assertEqual(len(self._images(agent)), 1)
+        self.assertEqual(agent.token_usage["screenshots_skipped"], 1)
+        last_text = agent.messages[-3]["content"][-1]["text"]
+        self.assertIn("SCREEN: unchanged", last_text)
+
+    def test_changed_screen_sent_again(self):
+        agent, _ = _make_agent(max_history=100)
+        agent.step()
+        frame = agent.emulator._backend._frame
+        frame[:] = bytes(range(256)) * (len(frame) // 256) + bytes(len(frame) % 256)
+        agent.step()
+        self.assertEqual(len(self._images(agent)), 2)
+
+    def test_small_screen_change_sent_again(self):
+        # A menu cursor moving one row changes a few pixels, not the overall picture
+        agent, _ = _make_agent(max_history=100)
+        agent.step()
+        agent.emulator._backend._frame[(40 * 160 + 8) * 3] = 0xFF
+        agent.step()
+        self.assertEqual(len(self._images(agent)), 2)
+        self.assertEqual(agent.token_usage["screenshots_skipped"], 0)
+
+    def test_blank_screen_with_joypad_enabled_calls_llm(self):
+        agent, llm = _make_agent(max_history=100)
+        agent.step()  # the mock's default frame is blank; RAM says interactive
+        self.assertEqual(llm.call_count, 1)
+
+
 class TestActionCacheIntegration(unittest.TestCase):
     """Test action cache integration with the agent loop."""
 
@@ -690,6 +773,27 @@ if __name__ == "__main__":
     unittest.main()
 
 
+class TestRewindableActions(unittest.TestCase):
+    """Game-advancing tools snapshot into the checkpoint ring first."""
+
+    def test_press_buttons_snapshots_before_acting(self):
+        agent, _ = _make_agent()
+        agent._execute_tool(ToolUse(id="t1", name="press_buttons", input={"buttons": ["a"]}))
+        self.assertEqual([e["label"] for e in agent.checkpoint_mgr.ring.describe()],
+                         ["press_buttons"])
+
+    def test_reload_checkpoint_restores_from_memory(self):
+        agent, _ = _make_agent()
+        agent.checkpoint_mgr.state_dir = tempfile.mkdtemp()
+        agent.emulator.write_byte(0xD000, 5)
+        agent.checkpoint_mgr.save_checkpoint(step=1, reasons=[])
+        agent.emulator.write_byte(0xD000, 6)
+        result = agent._execute_tool(ToolUse(id="t1", name="reload_checkpoint",
+                                             input={"reason": "wipe"}))
+        self.assertTrue(result["reloaded"])
+        self.assertEqual(agent.emulator.read_byte(0xD000), 5)
+
+
 class TestPersistentToolExecution(unittest.TestCase):
     """Persistent tool execution uses the existing agent_memory subsystem."""
 
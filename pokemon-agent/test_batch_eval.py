@@ -0,0 +1,105 @@
+"""Tests for batch_eval.py — batch headless evaluation harness (MockBackend)."""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from batch_eval import EpisodeResult, EpisodeSpec, main, run_batch, run_episode, summarize
+from emulator_control import EmulatorControl, MGBABackend
+
+
+class TestRunEpisode(unittest.TestCase):
+
+    def test_scripted_counts_steps_and_frames(self):
+        res = run_episode(EpisodeSpec(policy="scripted", steps=5, script=["up", "a"]))
+        self.assertEqual(res.error, "")
+        self.assertEqual(res.steps, 5)
+        self.assertEqual(res.frames, 5 * 130)  # default press timing: 10 hold + 120 wait
+        self.assertEqual(res.maps_visited, [0])
+        self.assertFalse(res.frameskip_active)
+
+    def test_goal_stops_episode(self):
+        res = run_episode(EpisodeSpec(policy="scripted", steps=50, goal_map=0))
+        self.assertTrue(res.reached_goal)
+        self.assertEqual(res.steps_to_goal, 1)
+        self.assertEqual(res.steps, 1)
+
+    def test_goal_badges_unmet(self):
+        res = run_episode(EpisodeSpec(policy="scripted", steps=3, goal_badges=1))
+        self.assertFalse(res.reached_goal)
+        self.assertEqual(res.steps, 3)
+
+    def test_agent_policies_run_offline(self):
+        for policy in ("battle_ai", "mock_llm"):
+            res = run_episode(EpisodeSpec(policy=policy, steps=4))
+            self.assertEqual(res.error, "", policy)
+            self.assertEqual(res.steps, 4)
+
+    def test_crystal_rom_name_selects_crystal(self):
+        self.assertEqual(EpisodeSpec(rom="x.gbc").game, "crystal")
+        self.assertEqual(EpisodeSpec(rom="x.gb").game, "red")
+
+    def test_errors_are_captured(self):
+        res = run_episode(EpisodeSpec(policy="bogus"))
+        self.assertIn("Unknown policy", res.error)
+        res = run_episode(EpisodeSpec(state="/nonexistent/start.state"))
+        self.assertIn("FileNotFoundError", res.error)
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_pool_results_in_spec_order(self):
+        specs = [EpisodeSpec(policy="scripted", steps=n, seed=n) for n in (3, 1, 2)]
+        results = run_batch(specs, workers=2)
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual([r.steps for r in results], [3, 1, 2])
+
+    def test_summarize(self):
+        results = [
+            EpisodeResult(index=0, policy="scripted", seed=0, steps=10, frames=1000, wall_s=1.0,
+                          badges_end=1, maps_visited=[1, 2], steps_to_goal=4, reached_goal=True),
+            EpisodeResult(index=1, policy="scripted", seed=1, steps=20, frames=1000, wall_s=1.0,
+                          maps_visited=[2, 3, 4], steps_to_goal=8, reached_goal=True,
+                          boot_success=False),
+            EpisodeResult(index=2, policy="scripted", seed=2, steps=20, maps_visited=[1]),
+            EpisodeResult(index=3, policy="scripted", seed=3, error="RuntimeError: boom"),
+        ]
+        summary = summarize(results)
+        self.assertEqual(summary["errors"], 1)
+        self.assertAlmostEqual(summary["goal_rate"], 0.667)
+        self.assertEqual(summary["steps_to_goal"], {"min": 4, "median": 6.0, "max": 8})
+        self.assertEqual(summary["maps_visited_union"], 4)
+        self.assertEqual(summary["badges_max"], 1)
+        self.assertEqual(summary["fps_per_worker"], 1000.0)
+        self.assertEqual(summary["boot_success_rate"], 0.0)
+
+    def test_cli_writes_json(self):
+        out = os.path.join(tempfile.mkdtemp(), "results.json")
+        rc = main(["--policy", "scripted", "--episodes", "2", "--steps", "2",
+                   "--workers", "1", "--json", out])
+        self.assertEqual(rc, 0)
+        with open(out) as f:
+            data = json.load(f)
+        self.assertEqual(data["summary"]["episodes"], 2)
+        self.assertEqual(len(data["episodes"]), 2)
+
+
+class TestFrameskip(unittest.TestCase):
+
+    def test_mock_backend_unsupported(self):
+        self.assertFalse(EmulatorControl.mock().set_frameskip(4))
+
+    def test_mgba_sets_video_frameskip(self):
+        backend = MGBABackend.__new__(MGBABackend)
+        video = type("Video", (), {"frameskip": 0})()
+        backend._core = type("Core", (), {"_native": type("GB", (), {"video": video})()})()
+        backend._ffi = type("FFI", (), {"error": RuntimeError})()
+        self.assertTrue(EmulatorControl(backend).set_frameskip(8))
+        self.assertEqual(video.frameskip, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,6 +141,15 @@ class TestBridgeActionExec(unittest.TestCase):
         result = bridge.execute_action(self.emu, {"type": "save", "name": "test_save"})
         self.assertEqual(result["executed"], "save")
 
+    def test_save_load_reject_paths(self):
+        state_dir = tempfile.mkdtemp()
+        self.emu.set_state_dir(state_dir)
+        for name in ("../../x", "/tmp/x", "sub/x", "x.state", "..", "", 7):
+            for kind in ("save", "load"):
+                result = bridge.execute_action(self.emu, {"type": kind, "name": name})
+                self.assertIn("error", result, (kind, name))
+        self.assertEqual(self.emu._backend._states, {})
+
     def test_load_nonexistent(self):
         self.emu.set_state_dir(tempfile.mkdtemp())
         result = bridge.execute_action(self.emu, {"type": "load", "name": "nope"})
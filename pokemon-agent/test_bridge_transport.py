@@ -0,0 +1,228 @@
+"""Tests for bridge_transport.py — HTTP stream transport for the bridge."""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+import zlib
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from emulator_control import SCREEN_HEIGHT, SCREEN_WIDTH, EmulatorControl
+from bridge_transport import BridgeClient, BridgeHub, HttpTransport, start_stream_server
+import bridge
+
+
+def _png_pixels(png):
+    """Decode the unfiltered RGB PNG produced by framebuffer.encode_png."""
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, {}
+    while pos < len(png):
+        length = int.from_bytes(png[pos:pos + 4], "big")
+        tag = png[pos + 4:pos + 8]
+        chunks[tag] = chunks.get(tag, b"") + png[pos + 8:pos + 8 + length]
+        pos += 12 + length
+    width = int.from_bytes(chunks[b"IHDR"][:4], "big")
+    height = int.from_bytes(chunks[b"IHDR"][4:8], "big")
+    raw = zlib.decompress(chunks[b"IDAT"])
+    row = width * 3 + 1
+    return width, height, b"".join(raw[y * row + 1:(y + 1) * row] for y in range(height))
+
+
+class TestBridgeHub(unittest.TestCase):
+
+    def test_wait_state_wakes_on_publish(self):
+        hub = BridgeHub()
+        threading.Timer(0.05, hub.publish, args=({"step": 1},)).start()
+        start = time.monotonic()
+        self.assertEqual(hub.wait_state(0, timeout=5), (1, {"step": 1}))
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_wait_state_times_out(self):
+        hub = BridgeHub()
+        hub.publish({"step": 1})
+        self.assertIsNone(hub.wait_state(1, timeout=0.01))
+
+    def test_actions_fifo_with_ids(self):
+        hub = BridgeHub()
+        first = hub.submit({"type": "wait"})
+        hub.submit({"type": "save"}, action_id="mine")
+        self.assertEqual(hub.next_action(0), (first, {"type": "wait"}))
+        self.assertEqual(hub.next_action(0), ("mine", {"type": "save"}))
+        self.assertIsNone(hub.next_action(0.01))
+
+    def test_png_encoded_once_per_seq(self):
+        hub = BridgeHub()
+        self.assertIsNone(hub.png())
+        hub.publish({}, (1, 1, b"\x01\x02\x03"))
+        seq, png = hub.png()
+        self.assertIs(hub.png()[1], png)
+        hub.publish({}, (1, 1, b"\x04\x05\x06"))
+        self.assertEqual(_png_pixels(hub.png()[1])[2], b"\x04\x05\x06")
+
+    def test_stop_wakes_next_action(self):
+        hub = BridgeHub()
+        threading.Timer(0.05, hub.request_stop).start()
+        self.assertIsNone(hub.next_action(5))
+        self.assertTrue(hub.stop_requested)
+
+
+class TestHttpTransport(unittest.TestCase):
+    """Round trips through a real server on a random port."""
+
+    def setUp(self):
+        self.hub = BridgeHub()
+        self.tmpdir = tempfile.mkdtemp()
+        with open(os.path.join(self.tmpdir, "viewer.html"), "w") as f:
+            f.write("<html></html>")
+        self.thread = start_stream_server(self.hub, port=0, directory=self.tmpdir)
+        self.url = f"http://127.0.0.1:{self.thread.actual_port}"
+        self.client = BridgeClient(self.url)
+        self.emu = EmulatorControl.mock()
+        self.transport = HttpTransport(self.hub)
+
+    def tearDown(self):
+        self.hub.close()
+        self.thread.server.shutdown()
+        self.thread.server.server_close()
+
+    def test_state_long_poll(self):
+        self.assertIsNone(self.client.state())
+        threading.Timer(0.05, self.transport.publish, args=({"step": 7}, self.emu)).start()
+        self.assertEqual(self.client.state(after=0, timeout=5), {"seq": 1, "state": {"step": 7}})
+
+    def test_state_is_compact_json(self):
+        self.transport.publish({"step": 1, "party": []}, self.emu)
+        with urllib.request.urlopen(self.url + "/state") as resp:
+            self.assertEqual(resp.read(), b'{"seq":1,"state":{"step":1,"party":[]}}')
+
+    def test_action_result_correlated(self):
+        def bridge_loop():
+            action_id, action = self.transport.next_action(5)
+            self.transport.complete(action_id, {"executed": action["type"]}, step=3)
+
+        threading.Thread(target=bridge_loop, daemon=True).start()
+        out = self.client.act({"type": "wait"}, wait=5, action_id="abc")
+        self.assertEqual(out, {"id": "abc", "step": 3, "result": {"executed": "wait"}})
+        self.assertEqual(self.client.result("abc"), out)
+        self.assertIsNone(self.client.result("nope"))
+
+    def test_action_without_wait_returns_id(self):
+        out = self.client.act({"type": "wait"}, wait=0)
+        self.assertEqual(self.hub.next_action(0), (out["id"], {"type": "wait"}))
+
+    def test_frame_raw_and_png(self):
+        self.emu._backend._frame[:3] = b"\xff\x00\x80"
+        self.transport.publish({"step": 1}, self.emu)
+        width, height, rgb = self.client.frame()
+        self.assertEqual((width, height), (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.assertEqual(rgb[:3], b"\xff\x00\x80")
+        self.assertEqual(_png_pixels(self.client.png()), (width, height, rgb))
+
+    def test_events_stream(self):
+        self.transport.publish({"step": 1}, self.emu)
+        with urllib.request.urlopen(self.url + "/events", timeout=5) as resp:
+            self.assertEqual(resp.headers["Content-Type"], "text/event-stream")
+            lines = [resp.readline() for _ in range(3)]
+        self.assertEqual(lines, [b"id: 1\n", b"event: state\n", b'data: {"step":1}\n'])
+
+    def test_stop_endpoint(self):
+        self.client.stop()
+        self.assertTrue(self.transport.stop_requested())
+
+    def test_static_files_still_served(self):
+        with urllib.request.urlopen(self.url + "/viewer.html") as resp:
+            self.assertEqual(resp.read(), b"<html></html>")
+
+    def _post(self, path, body=b'{"type": "wait"}', ctype="text/plain"):
+        req = urllib.request.Request(self.url + path, data=body, headers={"Content-Type": ctype})
+        return urllib.request.urlopen(req, timeout=5)
+
+    def test_post_requires_json_content_type(self):
+        for path in ("/action", "/stop"):
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                self._post(path)
+            self.assertEqual(ctx.exception.code, 415)
+        self.assertIsNone(self.hub.next_action(0))
+        self.assertFalse(self.transport.stop_requested())
+        with self._post("/action", ctype="application/json; charset=utf-8") as resp:
+            self.assertEqual(resp.status, 202)
+
+    def test_cors_only_on_get(self):
+        self.transport.publish({"step": 1}, self.emu)
+        with urllib.request.urlopen(self.url + "/state") as resp:
+            self.assertEqual(resp.headers["Access-Control-Allow-Origin"], "*")
+        with self._post("/action", ctype="application/json") as resp:
+            self.assertIsNone(resp.headers["Access-Control-Allow-Origin"])
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._post("/stop")
+        self.assertIsNone(ctx.exception.headers["Access-Control-Allow-Origin"])
+
+    def test_viewer_only_server_rejects_actions(self):
+        thread = start_stream_server(self.hub, port=0, directory=self.tmpdir, accept_actions=False)
+        try:
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                BridgeClient(f"http://127.0.0.1:{thread.actual_port}").act({"type": "wait"}, wait=0)
+            self.assertEqual(ctx.exception.code, 404)
+        finally:
+            thread.server.shutdown()
+            thread.server.server_close()
+
+
+class TestFileTransport(unittest.TestCase):
+    """The file fallback keeps the bridge_io/ contract and mirrors into the hub."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        bridge.BRIDGE_DIR = self.tmpdir
+        bridge.STATE_FILE = os.path.join(self.tmpdir, "state.json")
+        bridge.SCREENSHOT_FILE = os.path.join(self.tmpdir, "screenshot.png")
+        bridge.READY_FILE = os.path.join(self.tmpdir, ".ready")
+        bridge.ACTION_FILE = os.path.join(self.tmpdir, "action.json")
+        bridge.STOP_FILE = os.path.join(self.tmpdir, ".stop")
+
+    def test_publish_writes_files_and_mirrors(self):
+        hub = BridgeHub()
+        transport = bridge.FileTransport(hub)
+        transport.publish({"step": 2}, EmulatorControl.mock())
+        with open(bridge.STATE_FILE) as f:
+            self.assertEqual(json.load(f), {"step": 2})
+        self.assertTrue(os.path.exists(bridge.READY_FILE))
+        self.assertEqual(hub.wait_state(0, 0), (1, {"step": 2}))
+        transport.close()
+        self.assertFalse(os.path.exists(bridge.READY_FILE))
+
+    def test_unchanged_screen_not_rewritten(self):
+        transport = bridge.FileTransport()
+        emu = EmulatorControl.mock()
+        transport.publish({"step": 1}, emu)
+        first = os.path.getmtime(bridge.SCREENSHOT_FILE)
+        os.utime(bridge.SCREENSHOT_FILE, (first - 10, first - 10))
+        transport.publish({"step": 2}, emu)
+        self.assertEqual(os.path.getmtime(bridge.SCREENSHOT_FILE), first - 10)
+        self.assertEqual(transport.screenshots_skipped, 1)
+        emu._backend._frame[(40 * SCREEN_WIDTH + 8) * 3] = 0xFF  # one pixel
+        transport.publish({"step": 3}, emu)
+        self.assertNotEqual(os.path.getmtime(bridge.SCREENSHOT_FILE), first - 10)
+        self.assertEqual(transport.screenshots_skipped, 1)
+
+    def test_next_action_polls_file(self):
+        transport = bridge.FileTransport(poll_interval=0.01)
+        self.assertIsNone(transport.next_action(0.03))
+        with open(bridge.ACTION_FILE, "w") as f:
+            json.dump({"type": "wait"}, f)
+        self.assertEqual(transport.next_action(1), (None, {"type": "wait"}))
+
+    def test_stop_file(self):
+        transport = bridge.FileTransport()
+        self.assertFalse(transport.stop_requested())
+        open(bridge.STOP_FILE, "w").close()
+        self.assertTrue(transport.stop_requested())
+
+
+if __name__ == "__main__":
+    unittest.main()
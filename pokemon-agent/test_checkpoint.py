@@ -9,7 +9,9 @@ The checkpoint system auto-saves emulator state before:
 Uses MockBackend so no ROM needed.
 """
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 
 sys.path.insert(0, os.path.dirname(__file__))
@@ -201,5 +203,86 @@ class TestCheckpointManager(unittest.TestCase):
         self.assertNotIn(CheckpointReason.BADGE_EARNED, reasons)
 
 
+class TestInMemoryCheckpoints(unittest.TestCase):
+    """Checkpoints live in their own savestate ring; only milestones hit disk."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.emu = EmulatorControl.mock()
+        self.mgr = CheckpointManager(self.emu, state_dir=self.tmpdir, ring_capacity=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_restore_from_memory(self):
+        self.emu.write_byte(0xD000, 7)
+        self.mgr.save_checkpoint(step=1, reasons=[CheckpointReason.TRAINER_BATTLE])
+        self.emu.write_byte(0xD000, 9)
+        self.assertEqual(self.mgr.restore_checkpoint(), "memory")
+        self.assertEqual(self.emu.read_byte(0xD000), 7)
+
+    def test_only_milestones_flushed(self):
+        low = self.mgr.save_checkpoint(step=1, reasons=[CheckpointReason.LOW_HP])
+        gym = self.mgr.save_checkpoint(step=2, reasons=[CheckpointReason.TRAINER_BATTLE,
+                                                        CheckpointReason.GYM_LEADER])
+        self.mgr.flush()
+        self.assertFalse(os.path.exists(low))
+        self.assertTrue(os.path.exists(gym))
+        self.assertEqual([e["on_disk"] for e in self.mgr.checkpoint_history], [False, True])
+
+    def test_snapshots_do_not_evict_checkpoints(self):
+        self.emu.write_byte(0xD000, 4)
+        self.mgr.save_checkpoint(step=1, reasons=[CheckpointReason.LOW_HP])
+        for step in range(2, 8):
+            self.mgr.snapshot(step)
+        self.emu.write_byte(0xD000, 0)
+        self.assertEqual(self.mgr.restore_checkpoint(), "memory")
+        self.assertEqual(self.emu.read_byte(0xD000), 4)
+
+    def test_checkpoint_history_fits_checkpoint_ring(self):
+        mgr = CheckpointManager(self.emu, state_dir=self.tmpdir, max_checkpoints=3)
+        for step in range(1, 6):
+            self.emu.write_byte(0xD000, step)
+            mgr.save_checkpoint(step=step, reasons=[CheckpointReason.TRAINER_BATTLE])
+        self.emu.write_byte(0xD000, 0)
+        self.assertEqual(mgr.restore_checkpoint(mgr.checkpoint_history[0]), "memory")
+        self.assertEqual(self.emu.read_byte(0xD000), 3)
+
+    def test_restore_discards_later_snapshots(self):
+        self.mgr.snapshot(step=1, label="before")
+        self.mgr.save_checkpoint(step=2, reasons=[CheckpointReason.LOW_HP])
+        self.mgr.snapshot(step=3, label="after")
+        self.mgr.restore_checkpoint()
+        self.assertEqual([e["label"] for e in self.mgr.ring.describe()],
+                         ["before", "checkpoint_step_2_low_hp"])
+
+    def test_disk_fallback_after_eviction(self):
+        self.emu.write_byte(0xD000, 3)
+        self.mgr.save_checkpoint(step=1, reasons=[CheckpointReason.MAP_TRANSITION])
+        entry = self.mgr.latest_checkpoint()
+        self.mgr.checkpoint_ring.clear()
+        self.emu.write_byte(0xD000, 0)
+        self.assertEqual(self.mgr.restore_checkpoint(entry), "disk")
+        self.assertEqual(self.emu.read_byte(0xD000), 3)
+
+    def test_evicted_memory_only_checkpoint_raises(self):
+        self.mgr.save_checkpoint(step=1, reasons=[CheckpointReason.LOW_HP])
+        entry = self.mgr.latest_checkpoint()
+        self.mgr.checkpoint_ring.clear()
+        with self.assertRaises(FileNotFoundError):
+            self.mgr.restore_checkpoint(entry)
+
+    def test_rewind_discards_newer_snapshots(self):
+        for value in (1, 2, 3):
+            self.emu.write_byte(0xD000, value)
+            self.mgr.snapshot(step=value, label=f"s{value}")
+        self.emu.write_byte(0xD000, 99)
+        info = self.mgr.rewind(2)
+        self.assertEqual((info["step"], info["label"]), (2, "s2"))
+        self.assertEqual(self.emu.read_byte(0xD000), 2)
+        self.assertEqual(len(self.mgr.ring), 2)
+        self.assertIsNone(self.mgr.rewind(5))
+
+
 if __name__ == "__main__":
     unittest.main()
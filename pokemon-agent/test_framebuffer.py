@@ -0,0 +1,48 @@
+"""Tests for framebuffer.py — PNG encoding and exact frame digests."""
+import os
+import sys
+import unittest
+import zlib
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from emulator_control import EmulatorControl
+from framebuffer import encode_png, frame_digest
+
+
+class TestEncodePng(unittest.TestCase):
+
+    def test_round_trip(self):
+        rgb = bytes(i * 7 % 256 for i in range(6 * 4 * 3))
+        png = encode_png(6, 4, rgb)
+        self.assertEqual(png[:8], b"\x89PNG\r\n\x1a\n")
+        self.assertEqual(png[16:24], (6).to_bytes(4, "big") + (4).to_bytes(4, "big"))
+        idat = png.index(b"IDAT")
+        length = int.from_bytes(png[idat - 4:idat], "big")
+        raw = zlib.decompress(png[idat + 4:idat + 4 + length])
+        self.assertEqual(b"".join(raw[y * 19 + 1:(y + 1) * 19] for y in range(4)), rgb)
+
+
+class TestFrameDigest(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = EmulatorControl.mock().framebuffer()
+
+    def test_identical_frames_match(self):
+        w, h, rgb = self.frame
+        self.assertEqual(frame_digest(self.frame), frame_digest((w, h, bytes(rgb))))
+
+    def test_single_pixel_changes_digest(self):
+        # A menu cursor moving one row differs by a handful of pixels
+        w, h, rgb = self.frame
+        edited = bytearray(rgb)
+        edited[(40 * w + 8) * 3] ^= 0xFF
+        self.assertNotEqual(frame_digest(self.frame), frame_digest((w, h, bytes(edited))))
+
+    def test_size_is_part_of_digest(self):
+        rgb = bytes(6 * 4 * 3)
+        self.assertNotEqual(frame_digest((6, 4, rgb)), frame_digest((4, 6, rgb)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -425,5 +425,126 @@ class TestEdgeCases(unittest.TestCase):
         self.assertLess(elapsed, 1.0)  # Should be well under 1 second
 
 
+def _open_map(map_id, width=5, height=5):
+    m = MapData(map_id=map_id, name=f"Map {map_id}", width=width, height=height)
+    for y in range(height):
+        for x in range(width):
+            m.set_tile(x, y, TileType.FLOOR)
+    return m
+
+
+class TestNavigatorCaching(unittest.TestCase):
+    """Grid compilation, path cache and invalidation."""
+
+    def setUp(self):
+        self.map_data = _open_map(1)
+        self.navigator = Navigator()
+        self.navigator.add_map(self.map_data)
+        self.start = MapPosition(map_id=1, x=0, y=2)
+        self.goal = MapPosition(map_id=1, x=4, y=2)
+
+    def test_grid_codes(self):
+        self.map_data.set_tile(1, 1, TileType.WALL)
+        self.map_data.set_tile(2, 1, TileType.GRASS)
+        grid = self.map_data.grid()
+        self.assertEqual(grid.codes[grid.index(1, 1)], 0)
+        self.assertNotEqual(grid.codes[grid.index(2, 1)], grid.codes[grid.index(0, 0)])
+        self.assertEqual(grid.codes[grid.index(-1, 0)], 0)  # border
+        self.assertEqual(grid.xy(grid.index(3, 4)), (3, 4))
+
+    def test_repeat_query_served_from_cache(self):
+        first = self.navigator.find_path(self.start, self.goal)
+        self.assertEqual(len(self.navigator._path_cache), 1)
+        first.clear()  # callers get their own list
+        self.assertEqual(len(self.navigator.find_path(self.start, self.goal)), 4)
+
+    def test_tile_change_invalidates(self):
+        self.assertEqual(len(self.navigator.find_path(self.start, self.goal)), 4)
+        self.map_data.set_tile(2, 2, TileType.WALL)
+        path = self.navigator.find_path(self.start, self.goal)
+        self.assertEqual(len(path), 6)
+        self.assertNotIn((2, 2), [(s.x, s.y) for s in path])
+
+    def test_readding_same_tiles_keeps_cache(self):
+        self.navigator.find_path(self.start, self.goal)
+        self.navigator.add_map(_open_map(1))
+        self.navigator._sync_caches()
+        self.assertEqual(len(self.navigator._path_cache), 1)
+        changed = _open_map(1)
+        changed.set_tile(2, 2, TileType.WALL)
+        self.navigator.add_map(changed)
+        self.navigator._sync_caches()
+        self.assertEqual(len(self.navigator._path_cache), 0)
+
+    def test_avoid_encounters_cached_separately(self):
+        for x in range(1, 4):
+            for y in range(4):
+                self.map_data.set_tile(x, y, TileType.GRASS)
+        plain = self.navigator.find_path(self.start, self.goal)
+        avoid = self.navigator.find_path(self.start, self.goal, avoid_encounters=True)
+        self.assertEqual(len(plain), 4)
+        self.assertEqual(len(avoid), 8)  # detours along the grass-free bottom row
+
+
+class TestCrossMapAbstraction(unittest.TestCase):
+    """Entrance graph used for cross-map searches."""
+
+    def test_long_connection_chain(self):
+        nav = Navigator()
+        count = 30
+        for map_id in range(count):
+            nav.add_map(_open_map(map_id, width=20, height=18))
+        for map_id in range(count - 1):
+            nav.add_connection(Connection("east", map_id, map_id + 1))
+            nav.add_connection(Connection("west", map_id + 1, map_id))
+        path = nav.find_path(MapPosition(map_id=0, x=10, y=9),
+                             MapPosition(map_id=count - 1, x=10, y=9))
+        self.assertIsNotNone(path)
+        self.assertEqual(path[-1].target_position(), MapPosition(map_id=count - 1, x=10, y=9))
+        self.assertGreaterEqual(len(path), 20 * (count - 1))
+
+    def test_edge_runs_become_entrances(self):
+        nav = Navigator()
+        a, b = _open_map(1, width=10, height=10), _open_map(2, width=10, height=10)
+        b.set_tile(3, 9, TileType.WALL)  # splits B's south edge into runs 0-2 and 4-9
+        nav.add_map(a)
+        nav.add_map(b)
+        nav.add_connection(Connection("north", 1, 2))
+        xs = sorted(p.dest_x for p in nav._portals(1))
+        self.assertEqual(xs, [1, 4, 9])  # short run: middle; long run: both ends
+
+    def test_edge_runs_need_both_sides_open(self):
+        nav = Navigator()
+        a, b = _open_map(1, width=10, height=10), _open_map(2, width=10, height=10)
+        for x in range(10):
+            if x != 6:
+                a.set_tile(x, 0, TileType.WALL)  # one-tile opening in A's north edge
+        nav.add_map(a)
+        nav.add_map(b)
+        nav.add_connection(Connection("north", 1, 2))
+        self.assertEqual([(p.dest_x, p.dest_y) for p in nav._portals(1)], [(6, 9)])
+        path = nav.find_path(MapPosition(map_id=1, x=6, y=3), MapPosition(map_id=2, x=5, y=7))
+        self.assertIsNotNone(path)
+        self.assertEqual(len(path), 7)
+
+    def test_warp_to_goal_on_unloaded_map(self):
+        nav = Navigator()
+        nav.add_map(_open_map(1))
+        nav.add_warp(Warp(source_map=1, source_x=4, source_y=4, dest_map=7, dest_x=3, dest_y=6))
+        path = nav.find_path(MapPosition(map_id=1, x=0, y=4), MapPosition(map_id=7, x=3, y=6))
+        self.assertEqual(Navigator.path_to_directions(path), ["right"] * 4 + ["warp"])
+        self.assertIsNone(nav.find_path(MapPosition(map_id=1, x=0, y=4),
+                                        MapPosition(map_id=7, x=1, y=1)))
+
+    def test_picks_shorter_of_two_warps(self):
+        nav = Navigator()
+        nav.add_map(_open_map(1, width=9, height=1))
+        nav.add_map(_open_map(2))
+        nav.add_warp(Warp(1, 0, 0, 2, 0, 0))
+        nav.add_warp(Warp(1, 8, 0, 2, 4, 4))
+        path = nav.find_path(MapPosition(map_id=1, x=6, y=0), MapPosition(map_id=2, x=4, y=3))
+        self.assertEqual(len(path), 2 + 1 + 1)
+
+
 if __name__ == "__main__":
     unittest.main()
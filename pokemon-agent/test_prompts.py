@@ -7,7 +7,7 @@ from game_state import (
 from prompts import (
     SYSTEM_PROMPT, SUMMARY_PROMPT, STUCK_PROMPT,
     format_game_state, build_user_message, build_summary_request,
-    encode_screenshot_b64,
+    encode_screenshot_b64, StateDeltaEncoder,
 )
 
 
@@ -203,6 +203,59 @@ class TestFormatGameState(unittest.TestCase):
         self.assertIn("0%", text)
 
 
+class TestStateDeltaEncoder(unittest.TestCase):
+    """Full snapshots on a cadence, changed sections in between."""
+
+    def test_first_turn_is_full(self):
+        enc = StateDeltaEncoder(full_every=5)
+        state = _make_game_state()
+        self.assertEqual(enc.encode(state, 1), format_game_state(state))
+
+    def test_unchanged_state(self):
+        enc = StateDeltaEncoder(full_every=5)
+        enc.encode(_make_game_state(), 1)
+        text = enc.encode(_make_game_state(play_time_minutes=96), 2)
+        self.assertEqual(text, "=== NO STATE CHANGES since step 1 ===")
+
+    def test_only_changed_sections_sent(self):
+        enc = StateDeltaEncoder(full_every=5)
+        enc.encode(_make_game_state(), 1)
+        moved = MapPosition(map_id=0x0301, map_name="New Bark Town", x=6, y=4)
+        text = enc.encode(_make_game_state(position=moved, money=2900), 2)
+        self.assertIn("STATE CHANGES since step 1", text)
+        self.assertIn("X=6", text)
+        self.assertIn("$2900", text)
+        self.assertNotIn("PARTY", text)
+        self.assertNotIn("Badges", text)
+
+    def test_full_snapshot_cadence(self):
+        enc = StateDeltaEncoder(full_every=3)
+        state = _make_game_state()
+        texts = [enc.encode(state, n) for n in range(1, 7)]
+        full = [t.startswith("=== GAME STATE") for t in texts]
+        self.assertEqual(full, [True, False, False, True, False, False])
+        self.assertEqual(enc.stats()["full_snapshots"], 2)
+        self.assertEqual(enc.stats()["delta_turns"], 4)
+        self.assertGreater(enc.stats()["est_tokens_saved"], 0)
+
+    def test_reset_forces_full(self):
+        enc = StateDeltaEncoder(full_every=10)
+        enc.encode(_make_game_state(), 1)
+        enc.reset()
+        self.assertIn("GAME STATE", enc.encode(_make_game_state(), 2))
+
+    def test_full_every_one_disables_deltas(self):
+        enc = StateDeltaEncoder(full_every=1)
+        for n in range(3):
+            self.assertIn("PARTY", enc.encode(_make_game_state(), n))
+
+    def test_stable_sections_lead(self):
+        text = format_game_state(_make_game_state())
+        self.assertLess(text.index("Badges"), text.index("Location"))
+        self.assertLess(text.index("Location"), text.index("Play time"))
+        self.assertTrue(text.endswith("Play time: 1h 35m"))
+
+
 class TestBuildUserMessage(unittest.TestCase):
     """Validate user message construction."""
 
@@ -0,0 +1,169 @@
+"""Tests for ram_snapshot.py — frame-keyed bulk RAM reads for the memory readers."""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from emulator_control import EmulatorControl, MGBABackend, MockBackend
+from memory_reader import (
+    BATTLE_MODE,
+    PARTY_COUNT,
+    PARTY_DATA_START,
+    OFF_HP_HI,
+    OFF_LEVEL,
+    OFF_SPECIES,
+    MemoryReader,
+)
+from memory_reader_red import MemoryReaderRed
+from ram_snapshot import RamSnapshot, merge_spans
+
+
+class CountingBackend(MockBackend):
+    """MockBackend that counts RAM round trips."""
+
+    def __init__(self, bulk=True):
+        super().__init__()
+        self.calls = 0
+        self.bulk_reads = bulk
+
+    def read_byte(self, address):
+        self.calls += 1
+        return super().read_byte(address)
+
+    def read_bytes(self, address, length):
+        self.calls += 1
+        return super().read_bytes(address, length)
+
+
+class TestMergeSpans(unittest.TestCase):
+
+    def test_merges_within_gap(self):
+        spans = [(30, 40), (0, 10), (12, 20)]
+        self.assertEqual(merge_spans(spans, 2), [(0, 20), (30, 40)])
+        self.assertEqual(merge_spans(spans, 10), [(0, 40)])
+        self.assertEqual(merge_spans(spans, 0), [(0, 10), (12, 20), (30, 40)])
+
+    def test_overlapping(self):
+        self.assertEqual(merge_spans([(0, 50), (10, 20)], 0), [(0, 50)])
+
+
+class TestRamSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = CountingBackend()
+        self.emu = EmulatorControl(self.backend)
+        self.emu.write_byte(0x100, 0x12)
+        self.emu.write_byte(0x101, 0x34)
+
+    def test_reuses_copy_within_epoch(self):
+        snap = RamSnapshot(self.emu, [(0x100, 0x110), (0x180, 0x190)])
+        self.assertEqual(snap.spans, [(0x100, 0x190)])
+        self.assertEqual(snap.u16be(0x100), 0x1234)
+        self.assertEqual(snap.u16le(0x100), 0x3412)
+        snap.u8(0x18F)
+        self.assertEqual(snap.reads, 1)
+
+    def test_tick_and_write_invalidate(self):
+        snap = RamSnapshot(self.emu, [(0x100, 0x110)])
+        self.assertEqual(snap.u8(0x100), 0x12)
+        self.emu.write_byte(0x100, 0x99)
+        self.assertEqual(snap.u8(0x100), 0x99)
+        self.emu.tick(1)
+        snap.u8(0x100)
+        self.assertEqual(snap.reads, 3)
+
+    def test_spans_load_lazily(self):
+        snap = RamSnapshot(self.emu, [(0x100, 0x110), (0x800, 0x810)], max_gap=16)
+        snap.u8(0x100)
+        self.assertEqual(snap.reads, 1)
+
+    def test_uncovered_reads_live(self):
+        snap = RamSnapshot(self.emu, [(0x100, 0x102)])
+        self.emu.write_byte(0x200, 7)
+        self.assertEqual(snap.u8(0x200), 7)
+        self.assertEqual(snap.read(0x101, 2), bytes([0x34, 0]))  # straddles the span end
+        self.assertEqual(snap.reads, 0)
+
+    def test_bytewise_backend_keeps_spans_tight(self):
+        emu = EmulatorControl(CountingBackend(bulk=False))
+        snap = RamSnapshot(emu, [(0x100, 0x110), (0x180, 0x190)])
+        self.assertEqual(len(snap.spans), 2)
+
+
+class TestReaderRoundTrips(unittest.TestCase):
+
+    def _crystal(self):
+        backend = CountingBackend()
+        emu = EmulatorControl(backend)
+        emu.write_byte(PARTY_COUNT, 2)
+        for slot in range(2):
+            base = PARTY_DATA_START + slot * 48
+            emu.write_byte(base + OFF_SPECIES, 155)
+            emu.write_byte(base + OFF_LEVEL, 5 + slot)
+            emu.write_byte(base + OFF_HP_HI, 0x01)
+            emu.write_byte(base + OFF_HP_HI + 1, 0x02)
+        emu.write_byte(BATTLE_MODE, 1)
+        return backend, emu
+
+    def test_crystal_game_state_is_one_round_trip(self):
+        backend, emu = self._crystal()
+        reader = MemoryReader(emu)
+        backend.calls = 0
+        state = reader.read_game_state()
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual([p.level for p in state.party.pokemon], [5, 6])
+        self.assertEqual(state.party.pokemon[0].hp, 0x0102)
+        self.assertTrue(state.battle.in_battle)
+        reader.read_position()
+        reader.peek(BATTLE_MODE)
+        self.assertEqual(backend.calls, 1)
+
+    def test_crystal_state_tracks_frames(self):
+        backend, emu = self._crystal()
+        reader = MemoryReader(emu)
+        reader.read_game_state()
+        emu.write_byte(PARTY_COUNT, 1)
+        self.assertEqual(len(reader.read_party().pokemon), 1)
+
+    def test_red_game_state_is_one_round_trip(self):
+        backend = CountingBackend()
+        reader = MemoryReaderRed(EmulatorControl(backend))
+        reader.read_game_state()
+        self.assertEqual(backend.calls, 1)
+
+
+class FakeU8:
+    def __init__(self, ram):
+        self.ram = ram
+
+    def __getitem__(self, address):
+        return self.ram[address]
+
+
+class TestMGBAWramCopy(unittest.TestCase):
+    """Bank mapping of the mGBA WRAM block copy (no ROM needed)."""
+
+    def _backend(self, banked, svbk=3):
+        backend = MGBABackend.__new__(MGBABackend)
+        block = bytearray(0x8000 if banked else 0x2000)
+        for bank in range(len(block) // 0x1000):
+            block[bank * 0x1000:(bank + 1) * 0x1000] = bytes([bank]) * 0x1000
+        ram = {0xFF70: 0xF8 | svbk}
+        backend._core = type("Core", (), {"memory": type("Mem", (), {"u8": FakeU8(ram)})()})()
+        backend._wram = (memoryview(block), banked)
+        return backend
+
+    def test_cgb_switchable_bank(self):
+        data = self._backend(banked=True).read_bytes(0xCFFE, 4)
+        self.assertEqual(data, bytes([0, 0, 3, 3]))
+
+    def test_bank_zero_selects_one(self):
+        self.assertEqual(self._backend(banked=True, svbk=0).read_bytes(0xD000, 1), b"\x01")
+
+    def test_dmg_unbanked(self):
+        self.assertEqual(self._backend(banked=False).read_bytes(0xD100, 2), b"\x01\x01")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Tests for savestate_ring.py — delta-compressed in-memory savestates."""
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from savestate_ring import AsyncStateWriter, SavestateRing
+
+
+def _states(count, size=0x4000, seed=1):
+    """A run of states that differ by a handful of bytes each (like WRAM per step)."""
+    rng = random.Random(seed)
+    state = bytearray(rng.randbytes(size))
+    out = []
+    for _ in range(count):
+        for _ in range(8):
+            state[rng.randrange(size)] = rng.randrange(256)
+        out.append(bytes(state))
+    return out
+
+
+class TestSavestateRing(unittest.TestCase):
+
+    def test_round_trip_every_entry(self):
+        ring = SavestateRing(capacity=40, keyframe_interval=8)
+        states = _states(30)
+        ids = [ring.push(s, step=i) for i, s in enumerate(states)]
+        for rid, state in zip(ids, states):
+            self.assertEqual(ring.get(rid), state)
+
+    def test_deltas_are_small(self):
+        ring = SavestateRing(capacity=16, keyframe_interval=16)
+        for s in _states(10):
+            ring.push(s)
+        sizes = [e["bytes"] for e in ring.describe()]
+        self.assertTrue(ring.describe()[0]["keyframe"])
+        self.assertGreater(sizes[0], 0x3000)          # random keyframe barely compresses
+        self.assertLess(max(sizes[1:]), 200)          # 8 changed bytes per delta
+
+    def test_keyframe_interval(self):
+        ring = SavestateRing(capacity=32, keyframe_interval=4)
+        for s in _states(9):
+            ring.push(s)
+        self.assertEqual([e["keyframe"] for e in ring.describe()],
+                         [True, False, False, False, True, False, False, False, True])
+
+    def test_eviction_rebases_head(self):
+        ring = SavestateRing(capacity=5, keyframe_interval=100)
+        states = _states(12)
+        ids = [ring.push(s) for s in states]
+        self.assertEqual(len(ring), 5)
+        self.assertIsNone(ring.get(ids[6]))
+        self.assertTrue(ring.describe()[0]["keyframe"])
+        for rid, state in zip(ids[7:], states[7:]):
+            self.assertEqual(ring.get(rid), state)
+
+    def test_truncate_after(self):
+        ring = SavestateRing(capacity=10, keyframe_interval=100)
+        states = _states(6)
+        ids = [ring.push(s) for s in states]
+        ring.truncate_after(ids[2])
+        self.assertEqual(ring.latest(), (ids[2], states[2]))
+        self.assertIsNone(ring.get(ids[3]))
+        new_id = ring.push(states[5])
+        self.assertEqual(ring.get(new_id), states[5])
+        self.assertEqual(ring.get(ids[1]), states[1])
+
+    def test_size_change_forces_keyframe(self):
+        ring = SavestateRing()
+        ring.push(b"\x00" * 16)
+        rid = ring.push(b"\x01" * 32)
+        self.assertTrue(ring.describe()[-1]["keyframe"])
+        self.assertEqual(ring.get(rid), b"\x01" * 32)
+
+    def test_nth_latest(self):
+        ring = SavestateRing()
+        ids = [ring.push(s) for s in _states(3)]
+        self.assertEqual(ring.nth_latest(1), ids[2])
+        self.assertEqual(ring.nth_latest(3), ids[0])
+        self.assertIsNone(ring.nth_latest(4))
+
+    def test_contains(self):
+        ring = SavestateRing(capacity=2)
+        ids = [ring.push(s) for s in _states(3)]
+        self.assertNotIn(ids[0], ring)
+        self.assertIn(ids[2], ring)
+
+
+class TestAsyncStateWriter(unittest.TestCase):
+
+    def test_writes_in_background(self):
+        tmpdir = tempfile.mkdtemp()
+        writer = AsyncStateWriter()
+        path = os.path.join(tmpdir, "sub", "a.state")
+        writer.submit(path, b"one")
+        writer.submit(path, b"two")
+        writer.flush()
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"two")
+        self.assertFalse(os.path.exists(path + ".tmp"))
+        writer.close()
+
+    def test_errors_recorded(self):
+        writer = AsyncStateWriter()
+        blocker = tempfile.NamedTemporaryFile(delete=False)
+        writer.submit(os.path.join(blocker.name, "x.state"), b"data")  # parent is a file
+        writer.flush()
+        self.assertEqual(len(writer.errors), 1)
+        writer.close()
+        os.unlink(blocker.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
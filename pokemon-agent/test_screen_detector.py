@@ -6,6 +6,19 @@ the game disables joypad input. We detect this and auto-wait.
 """
 import unittest
 from screen_detector import ScreenDetector, ScreenState
+from emulator_control import SCREEN_HEIGHT, SCREEN_WIDTH, EmulatorControl
+
+
+def _frame(fill=0):
+    return SCREEN_WIDTH, SCREEN_HEIGHT, bytes([fill]) * (SCREEN_WIDTH * SCREEN_HEIGHT * 3)
+
+
+def _gradient_frame(reverse=False):
+    row = bytearray()
+    for x in range(SCREEN_WIDTH):
+        v = 255 - x if reverse else x
+        row += bytes((v, v, v))
+    return SCREEN_WIDTH, SCREEN_HEIGHT, bytes(row) * SCREEN_HEIGHT
 
 
 class TestScreenDetector(unittest.TestCase):
@@ -100,5 +113,42 @@ class TestScreenDetector(unittest.TestCase):
         self.assertEqual(stats["llm_calls_saved"], 2)
 
 
+
+class TestFrameObservation(unittest.TestCase):
+
+    def setUp(self):
+        self.sd = ScreenDetector()
+        self.screen = EmulatorControl.mock().framebuffer()
+
+    def test_unchanged_frames(self):
+        self.sd.observe_frame(self.screen)
+        self.assertTrue(self.sd.frame_changed)
+        self.sd.observe_frame(self.screen)
+        self.assertFalse(self.sd.frame_changed)
+        self.sd.observe_frame(_gradient_frame(reverse=True))
+        self.assertTrue(self.sd.frame_changed)
+        self.assertEqual(self.sd.stats()["frames_unchanged"], 1)
+
+    def test_one_pixel_is_a_change(self):
+        w, h, rgb = self.screen
+        edited = bytearray(rgb)
+        edited[(40 * w + 8) * 3] = 0xFF
+        self.sd.observe_frame(self.screen)
+        self.sd.observe_frame((w, h, bytes(edited)))
+        self.assertTrue(self.sd.frame_changed)
+
+    def test_no_framebuffer(self):
+        self.assertIsNone(self.sd.observe_frame(None))
+        self.assertTrue(self.sd.frame_changed)
+
+    def test_frame_does_not_override_ram(self):
+        # Black screen, white screen: RAM alone decides the state
+        for fill in (0, 255):
+            self.sd.observe_frame(_frame(fill))
+            self.assertEqual(self.sd.classify(0, 0, 0), ScreenState.ACTIVE)
+            self.assertEqual(self.sd.classify(1, 0, 0), ScreenState.TRANSITION)
+            self.assertEqual(self.sd.classify(1, 1, 0), ScreenState.BATTLE_TRANSITION)
+
+
 if __name__ == "__main__":
     unittest.main()
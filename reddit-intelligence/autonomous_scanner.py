@@ -30,6 +30,7 @@ Usage:
     python3 autonomous_scanner.py status              # Show safety gate status
     python3 autonomous_scanner.py pick                # Pick next target
     python3 autonomous_scanner.py pick --domain claude # Pick from specific domain
+    python3 autonomous_scanner.py overnight --count 4  # Pipelined scan of 4 subs (scan_pipeline.py)
 
 Stdlib only. No external dependencies.
 """
@@ -76,6 +77,8 @@ class ScanReport:
     hay: int
     blocked_reasons: list = field(default_factory=list)
     timestamp: str = ""
+    # Pipelined scans only: {stage: {"posts", "seconds", "posts_per_sec"}}
+    stage_metrics: dict = field(default_factory=dict)
 
     def __post_init__(self):
         if not self.timestamp:
@@ -95,6 +98,10 @@ class ScanReport:
         if self.blocked_reasons:
             unique = list(set(self.blocked_reasons))[:5]
             lines.append(f"  Block reasons: {', '.join(unique)}")
+        if self.stage_metrics:
+            timings = ", ".join(f"{name} {m['seconds']:.2f}s"
+                                for name, m in self.stage_metrics.items())
+            lines.append(f"  Stage times: {timings}")
         if include_apf:
             try:
                 sys.path.insert(0, str(_PROJECT_DIR / "self-learning"))
@@ -336,7 +343,7 @@ class SafetyGate:
         Returns (allowed: bool, reason: str).
         """
         # Kill switch
-        if os.path.exists(self.kill_switch_path):
+        if self.is_paused():
             return False, "Kill switch active — ~/.cca-autonomous-pause exists. Remove to resume."
 
         # Session scan limit
@@ -352,6 +359,10 @@ class SafetyGate:
 
         return True, "Scanning allowed."
 
+    def is_paused(self) -> bool:
+        """True while the kill switch file exists."""
+        return os.path.exists(self.kill_switch_path)
+
     def record_scan(self, slug: str):
         """Record that a scan was performed."""
         self.scans_this_session += 1
@@ -438,6 +449,45 @@ class AutonomousScanner:
             p["triage"] = classify_post(p)
         return posts
 
+    def resolve_fetch_params(self, subreddit: str, fetch_limit: int = None,
+                             timeframe: str = None) -> tuple:
+        """Fill in (fetch_limit, timeframe) from the sub's profile where not given."""
+        if fetch_limit is None or timeframe is None:
+            try:
+                profile = get_profile(subreddit)
+                params = merge_scout_nuclear(subreddit, "full", profile)
+                fetch_limit = fetch_limit or params.get("fetch_limit", 100)
+                timeframe = timeframe or params.get("timeframe", "year")
+            except Exception:
+                fetch_limit = fetch_limit or 100
+                timeframe = timeframe or "year"
+        return fetch_limit, timeframe
+
+    def resolve_daily_target(self, sub: str) -> tuple:
+        """(slug, domain) for a daily-scan subreddit name."""
+        slug = sub.lower().replace("/", "").replace("r", "", 1) if sub.startswith("r/") else sub.lower()
+        try:
+            profile = get_profile(sub)
+            scan_domain = profile.domain if hasattr(profile, "domain") else "unknown"
+            slug_clean = slug.replace(" ", "")
+        except Exception:
+            scan_domain = "unknown"
+            slug_clean = slug
+        return slug_clean, scan_domain
+
+    def fetch_daily_posts(self, sub: str, hot_limit: int = 25, rising_limit: int = 10) -> list:
+        """Hot + rising posts for a sub, deduplicated by post ID."""
+        hot_posts = fetch_hot_posts(sub, hot_limit)
+        rising_posts = fetch_rising_posts(sub, rising_limit)
+
+        seen_ids = set()
+        all_posts = []
+        for p in hot_posts + rising_posts:
+            if p["id"] not in seen_ids:
+                seen_ids.add(p["id"])
+                all_posts.append(p)
+        return all_posts
+
     def execute_scan(
         self,
         subreddit: str,
@@ -465,16 +515,7 @@ class AutonomousScanner:
         if not allowed:
             return None
 
-        # Resolve fetch parameters from profile if not custom
-        if fetch_limit is None or timeframe is None:
-            try:
-                profile = get_profile(subreddit)
-                params = merge_scout_nuclear(subreddit, "full", profile)
-                fetch_limit = fetch_limit or params.get("fetch_limit", 100)
-                timeframe = timeframe or params.get("timeframe", "year")
-            except Exception:
-                fetch_limit = fetch_limit or 100
-                timeframe = timeframe or "year"
+        fetch_limit, timeframe = self.resolve_fetch_params(subreddit, fetch_limit, timeframe)
 
         # Fetch posts (zero Claude tokens — pure Reddit API)
         posts = fetch_top_posts(subreddit, fetch_limit, timeframe)
@@ -547,27 +588,10 @@ class AutonomousScanner:
             if not allowed:
                 break
 
-            # Resolve slug and domain
-            slug = sub.lower().replace("/", "").replace("r", "", 1) if sub.startswith("r/") else sub.lower()
-            try:
-                profile = get_profile(sub)
-                scan_domain = profile.domain if hasattr(profile, "domain") else "unknown"
-                slug_clean = slug.replace(" ", "")
-            except Exception:
-                scan_domain = "unknown"
-                slug_clean = slug
+            slug_clean, scan_domain = self.resolve_daily_target(sub)
 
             # Fetch hot + rising (zero Claude tokens)
-            hot_posts = fetch_hot_posts(sub, hot_limit)
-            rising_posts = fetch_rising_posts(sub, rising_limit)
-
-            # Merge and deduplicate by post ID
-            seen_ids = set()
-            all_posts = []
-            for p in hot_posts + rising_posts:
-                if p["id"] not in seen_ids:
-                    seen_ids.add(p["id"])
-                    all_posts.append(p)
+            all_posts = self.fetch_daily_posts(sub, hot_limit, rising_limit)
 
             # Filter unsafe
             safe, blocked = self.filter_posts(all_posts)
@@ -848,7 +872,7 @@ def cli_main(args: list = None):
         args = sys.argv[1:]
 
     if not args:
-        print("Usage: python3 autonomous_scanner.py [rank|status|pick|scan|daily|rescan|rescan-all|stale|github-trending]")
+        print("Usage: python3 autonomous_scanner.py [rank|status|pick|scan|daily|overnight|rescan|rescan-all|stale|github-trending]")
         print("  rank                    Show prioritized sub list")
         print("  status                  Show safety gate status")
         print("  pick [--domain <d>]     Pick next target sub")
@@ -860,6 +884,12 @@ def cli_main(args: list = None):
         print("        [--hot-limit N]   Max hot posts per sub (default 25)")
         print("        [--rising-limit N] Max rising posts per sub (default 10)")
         print("        [--include-rescan] Also rescan stale subs (MT-14 Phase 3)")
+        print("        [--pipeline]      Run the subs through the staged scan pipeline")
+        print("  overnight [--count N]   Pipelined scan of the N top-priority subs (default 3)")
+        print("        [--domain <d>]    Only pick subs from this domain")
+        print("        [--deep-read N]   Deep-read up to N triaged posts per sub")
+        print("        [--output-dir D]  Write one <slug>.json result per sub")
+        print("        [--json]          Output JSON")
         print("  rescan [--target <sub>] MT-14: Delta-rescan stale sub (only new posts)")
         print("  rescan-all              MT-14 Phase 3: Auto-rescan ALL stale subs")
         print("        [--max-age <N>]   Staleness threshold in days (default 14)")
@@ -890,11 +920,27 @@ def cli_main(args: list = None):
     days = 7
     max_age = 14
     include_rescan = False
+    use_pipeline = False
+    count = 3
+    deep_read = 0
+    output_dir = None
     i = 1
     while i < len(args):
         if args[i] == "--include-rescan":
             include_rescan = True
             i += 1
+        elif args[i] == "--pipeline":
+            use_pipeline = True
+            i += 1
+        elif args[i] == "--count" and i + 1 < len(args):
+            count = int(args[i + 1])
+            i += 2
+        elif args[i] == "--deep-read" and i + 1 < len(args):
+            deep_read = int(args[i + 1])
+            i += 2
+        elif args[i] == "--output-dir" and i + 1 < len(args):
+            output_dir = args[i + 1]
+            i += 2
         elif args[i] == "--max-age" and i + 1 < len(args):
             max_age = int(args[i + 1])
             i += 2
@@ -1037,12 +1083,20 @@ def cli_main(args: list = None):
             findings_path=findings_path,
         )
 
-        results = scanner.execute_daily_scan(
-            subs=daily_subs,
-            hot_limit=hot_limit,
-            rising_limit=rising_limit,
-            include_rescan=include_rescan,
-        )
+        if use_pipeline:
+            from scan_pipeline import ScanPipeline, daily_targets
+            run = ScanPipeline(scanner, output_dir=output_dir).run(
+                daily_targets(scanner, daily_subs, hot_limit, rising_limit))
+            results = run.results
+            if include_rescan:
+                results.extend(scanner.execute_rescan_stale())
+        else:
+            results = scanner.execute_daily_scan(
+                subs=daily_subs,
+                hot_limit=hot_limit,
+                rising_limit=rising_limit,
+                include_rescan=include_rescan,
+            )
 
         if output_json:
             print(json.dumps([r.to_dict() for r in results], indent=2))
@@ -1069,6 +1123,26 @@ def cli_main(args: list = None):
                     print(f"  {i:2d}. [{p['score']:4d}pts] r/{p['subreddit']} — {p['title'][:80]}")
                     print(f"      {p['permalink']}")
 
+    elif cmd == "overnight":
+        from scan_pipeline import ScanPipeline, pick_targets
+        scanner = AutonomousScanner(
+            registry_path=registry_path,
+            kill_switch_path=kill_switch_path,
+            state_path=state_path,
+            findings_path=findings_path,
+        )
+        targets = pick_targets(scanner, count=count, domain=domain)
+        pipeline = ScanPipeline(scanner, deep_read_count=deep_read, output_dir=output_dir)
+        run = pipeline.run(targets)
+
+        if output_json:
+            print(json.dumps(run.to_dict(), indent=2))
+        else:
+            for r in run.results:
+                print(r.report.summary(include_apf=False))
+                print()
+            print(run.summary())
+
     elif cmd == "rescan":
         scanner = AutonomousScanner(
             registry_path=registry_path,
@@ -30,7 +30,6 @@ import json
 import os
 import re
 import sys
-import urllib.request
 import urllib.parse
 import urllib.error
 from dataclasses import dataclass, field, asdict
@@ -41,8 +40,10 @@ from pathlib import Path
 _THIS_DIR = Path(__file__).parent
 _PROJECT_DIR = _THIS_DIR.parent
 sys.path.insert(0, str(_PROJECT_DIR / "agent-guard"))
+sys.path.insert(0, str(_THIS_DIR))
 
 from content_scanner import scan_text, scan_repo_metadata, ThreatLevel
+from http_client import get_client
 
 
 # ── Frontier Relevance Keywords ──────────────────────────────────────────────
@@ -442,10 +443,8 @@ def _github_request(url: str, timeout: int = 10) -> dict:
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    req = urllib.request.Request(url, headers=headers)
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+        return get_client().get_json(url, headers=headers, timeout=timeout)
     except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError,
             OSError, TimeoutError):
         return None
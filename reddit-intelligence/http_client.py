@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+http_client.py — Shared HTTP client for the reddit-intelligence fetchers.
+
+Replaces the per-module copies of `urllib.request.urlopen` + fixed
+`time.sleep` rate limiting with one client that:
+
+    - keeps connections alive and reuses them per host (http.client)
+    - rate limits per host with a token bucket, so cache hits and requests
+      to other hosts never wait on a fixed sleep
+    - caches JSON responses on disk, honouring ETag / Last-Modified: a fresh
+      entry is served without a request, a stale one is revalidated with
+      If-None-Match / If-Modified-Since and a 304 costs no body download
+    - picks the cache TTL from the endpoint type (listing, search, repo, ...)
+    - retries 429 and 5xx with jittered exponential backoff (Retry-After wins)
+    - runs batches on a bounded thread pool (fetch_many / map)
+
+Errors surface as urllib.error.HTTPError / URLError / OSError, the same
+types the old urlopen calls raised, so existing callers keep working.
+
+Usage:
+    from http_client import get_client
+    data = get_client().get_json("https://www.reddit.com/r/ClaudeCode/hot.json")
+    pages = get_client().fetch_many([url1, url2, url3])
+
+    # Isolated client (tests, one-off scripts)
+    client = HttpClient(cache_dir="/tmp/cache", rate_limits={"localhost": (50, 10)})
+
+The default cache lives in ~/.cca-http-cache (override with CCA_HTTP_CACHE;
+set it to an empty string to disable caching).
+
+Stdlib only. No external dependencies.
+"""
+
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cca-http-cache")
+DEFAULT_TIMEOUT = 15
+MAX_WORKERS = 4
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0          # seconds; doubled per attempt, then jittered
+BACKOFF_CAP = 60.0
+MAX_REDIRECTS = 5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# host -> (requests per second, burst). Reddit allows roughly one
+# unauthenticated request per second; GitHub's search API is the tightest
+# of its limits.
+HOST_RATE_LIMITS = {
+    "www.reddit.com": (1.0, 3),
+    "old.reddit.com": (1.0, 3),
+    "api.github.com": (1.0, 5),
+}
+DEFAULT_RATE_LIMIT = (5.0, 5)
+
+# (url regex, ttl seconds), first match wins. Hot/new/rising listings move
+# quickly; top-of-year and subreddit search barely change within a day.
+ENDPOINT_TTLS = [
+    (r"/(hot|new|rising)\.json", 300),
+    (r"/top\.json.*[?&]t=(hour|day)\b", 600),
+    (r"/top\.json", 3600),
+    (r"/comments/", 900),
+    (r"/subreddits/search\.json", 86400),
+    (r"api\.github\.com/search/", 1800),
+    (r"api\.github\.com/repos/", 3600),
+]
+DEFAULT_TTL = 300
+
+
+def endpoint_ttl(url: str) -> int:
+    """Cache TTL in seconds for a URL, by endpoint type."""
+    for pattern, ttl in ENDPOINT_TTLS:
+        if re.search(pattern, url):
+            return ttl
+    return DEFAULT_TTL
+
+
+# ── Rate limiting ────────────────────────────────────────────────────────────
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance is a queue of reserved tokens; each waiter
+            # sleeps until its own token has accrued.
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+# ── Disk cache ───────────────────────────────────────────────────────────────
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    stored_at: float
+    etag: str = ""
+    last_modified: str = ""
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class HttpCache:
+    """One JSON file per cached response, keyed by a hash of URL + variant."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + ".json")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(key)) as f:
+                raw = json.load(f)
+            return CacheEntry(url=raw["url"], body=raw["body"].encode("utf-8"),
+                              stored_at=raw["stored_at"], etag=raw.get("etag", ""),
+                              last_modified=raw.get("last_modified", ""))
+        except (OSError, ValueError, KeyError, UnicodeError):
+            return None
+
+    def put(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        try:
+            body = entry.body.decode("utf-8")
+        except UnicodeDecodeError:
+            return  # only text (JSON) responses are cached
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"url": entry.url, "body": body, "stored_at": entry.stored_at,
+                       "etag": entry.etag, "last_modified": entry.last_modified}, f)
+        os.replace(tmp, path)
+
+    def touch(self, key: str, entry: CacheEntry):
+        """Mark a revalidated (304) entry fresh again."""
+        entry.stored_at = time.time()
+        self.put(key, entry)
+
+
+# ── Client ───────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Response:
+    url: str
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8"))
+
+
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                            ConnectionResetError, BrokenPipeError)
+
+
+class HttpClient:
+    """Keep-alive, rate-limited, caching GET client (see module docstring)."""
+
+    def __init__(self, user_agent: str = "ClaudeCodeReader/2.0 (ClaudeCodeAdvancements; read-only)",
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_rate_limit: Tuple[float, int] = DEFAULT_RATE_LIMIT,
+                 max_workers: int = MAX_WORKERS, max_retries: int = MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, timeout: float = DEFAULT_TIMEOUT,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.user_agent = user_agent
+        self.cache = HttpCache(cache_dir) if cache_dir else None
+        self.rate_limits = dict(HOST_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.default_rate_limit = default_rate_limit
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "cache_hits": 0, "revalidated": 0,
+                      "retries": 0, "connections": 0}
+
+    # ── Connections ──────────────────────────────────────────────────────
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.rate_limits.get(host, self.default_rate_limit)
+                bucket = self._buckets[host] = TokenBucket(rate, burst, sleep=self._sleep)
+            return bucket
+
+    def _checkout(self, key, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                return conn, True
+            self.stats["connections"] += 1
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=timeout), False
+
+    def _checkin(self, key, conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_workers:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle keep-alive connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _send(self, url: str, headers: Dict[str, str], timeout: float) -> Response:
+        """One GET over a pooled connection (no retries, redirects or cache)."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        self._bucket(key[1]).acquire()
+        while True:
+            conn, reused = self._checkout(key, timeout)
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue  # server closed an idle keep-alive socket; redial
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        with self._lock:
+            self.stats["requests"] += 1
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        if resp_headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        return Response(url=url, status=resp.status, body=body, headers=resp_headers)
+
+    # ── Requests ─────────────────────────────────────────────────────────
+
+    def _backoff(self, attempt: int, retry_after: str = "") -> float:
+        if retry_after.strip().isdigit():
+            return min(float(retry_after), BACKOFF_CAP)
+        delay = min(self.backoff_base * (2 ** attempt), BACKOFF_CAP)
+        return delay * random.uniform(0.5, 1.5)
+
+    def _fetch(self, url: str, headers: Dict[str, str], timeout: float) -> Response:
+        """GET with redirects and jittered retry on 429 / 5xx / dropped sockets."""
+        for _ in range(MAX_REDIRECTS + 1):
+            attempt = 0
+            while True:
+                try:
+                    resp = self._send(url, headers, timeout)
+                except (OSError, http.client.HTTPException) as e:
+                    if attempt >= self.max_retries:
+                        if isinstance(e, OSError):
+                            raise
+                        raise urllib.error.URLError(e) from e
+                    wait = self._backoff(attempt)
+                else:
+                    if resp.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        break
+                    wait = self._backoff(attempt, resp.headers.get("retry-after", ""))
+                attempt += 1
+                with self._lock:
+                    self.stats["retries"] += 1
+                self._sleep(wait)
+
+            location = resp.headers.get("location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return resp
+        raise urllib.error.URLError(f"too many redirects: {url}")
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            ttl: Optional[float] = None, timeout: Optional[float] = None) -> Response:
+        """GET url through the cache. Raises urllib.error.HTTPError on >= 400.
+
+        ttl: seconds a cached copy is served without revalidation (default:
+        endpoint_ttl(url)); ttl=0 always revalidates.
+        """
+        headers = dict(headers or {})
+        headers.setdefault("User-Agent", self.user_agent)
+        headers.setdefault("Accept-Encoding", "gzip")
+        ttl = endpoint_ttl(url) if ttl is None else ttl
+        timeout = self.timeout if timeout is None else timeout
+
+        # Responses vary by Accept (GitHub media types) but not by token.
+        cache_key = f"{url}\n{headers.get('Accept', '')}"
+        entry = self.cache.get(cache_key) if self.cache else None
+        if entry is not None:
+            if entry.age() < ttl:
+                with self._lock:
+                    self.stats["cache_hits"] += 1
+                return Response(url=url, status=200, body=entry.body, from_cache=True)
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        resp = self._fetch(url, headers, timeout)
+        if resp.status == 304 and entry is not None:
+            with self._lock:
+                self.stats["revalidated"] += 1
+            self.cache.touch(cache_key, entry)
+            return Response(url=url, status=200, body=entry.body,
+                            headers=resp.headers, from_cache=True)
+        if resp.status >= 400:
+            msg = Message()
+            for k, v in resp.headers.items():
+                msg[k] = v
+            raise urllib.error.HTTPError(url, resp.status, http.client.responses.get(resp.status, ""),
+                                         msg, None)
+        if self.cache and resp.status == 200 and (
+                ttl > 0 or resp.headers.get("etag") or resp.headers.get("last-modified")):
+            self.cache.put(cache_key, CacheEntry(
+                url=url, body=resp.body, stored_at=time.time(),
+                etag=resp.headers.get("etag", ""),
+                last_modified=resp.headers.get("last-modified", "")))
+        return resp
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 ttl: Optional[float] = None, timeout: Optional[float] = None):
+        """GET url and decode the JSON body."""
+        return self.get(url, headers=headers, ttl=ttl, timeout=timeout).json()
+
+    # ── Batches ──────────────────────────────────────────────────────────
+
+    def map(self, fn: Callable, items: Iterable) -> list:
+        """fn(item) for each item on the bounded pool, results in input order.
+
+        Exceptions propagate; use fetch_many for per-URL error capture.
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def fetch_many(self, urls: Iterable[str], headers: Optional[Dict[str, str]] = None,
+                   ttl: Optional[float] = None) -> list:
+        """get_json for each URL concurrently; a failed URL yields its exception."""
+        def one(url):
+            try:
+                return self.get_json(url, headers=headers, ttl=ttl)
+            except (OSError, ValueError) as e:
+                return e
+        return self.map(one, urls)
+
+
+_default_client: Optional[HttpClient] = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """Process-wide shared client (one connection pool and rate limiter per host)."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            cache_dir = os.environ.get("CCA_HTTP_CACHE", DEFAULT_CACHE_DIR)
+            _default_client = HttpClient(cache_dir=cache_dir or None)
+        return _default_client
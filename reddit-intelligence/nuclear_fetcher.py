@@ -14,22 +14,21 @@ Outputs JSON array of post metadata, sorted by score descending.
 
 import sys
 import json
-import time
-import urllib.request
 import argparse
 import os
 import re
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from http_client import get_client
+
 HEADERS = {"User-Agent": "ClaudeCodeReader/2.0 (NuclearScan; read-only)"}
 API_BASE = "https://www.reddit.com"
 PAGE_SIZE = 100  # Reddit max per request
 
 
 def fetch_json(url):
-    """Fetch URL and parse JSON. Respects rate limits."""
-    req = urllib.request.Request(url, headers=HEADERS)
-    with urllib.request.urlopen(req, timeout=15) as r:
-        return json.loads(r.read().decode("utf-8"))
+    """Fetch URL and parse JSON via the shared rate-limited, caching client."""
+    return get_client().get_json(url, headers=HEADERS, timeout=15)
 
 
 def _parse_posts(children, subreddit):
@@ -85,7 +84,6 @@ def _paginate_listing(url_template, subreddit, limit, sort_by_score=True):
             break
 
         pages += 1
-        time.sleep(1.0)
 
     if sort_by_score:
         posts.sort(key=lambda p: p["score"], reverse=True)
@@ -120,16 +118,20 @@ def fetch_rising_posts(subreddit, limit=25):
 
 
 def load_findings_urls(findings_path):
-    """Extract all URLs from FINDINGS_LOG.md for deduplication."""
-    urls = set()
+    """Reddit post ids already in FINDINGS_LOG.md, for deduplication.
+
+    Read from the shared findings index, so only newly appended lines are
+    re-scanned between calls.
+    """
     if not os.path.exists(findings_path):
-        return urls
-    with open(findings_path, "r") as f:
-        for line in f:
-            # Extract reddit URLs from findings entries
-            for match in re.finditer(r"https://www\.reddit\.com/r/\w+/comments/(\w+)", line):
-                urls.add(match.group(1))
-    return urls
+        return set()
+    # Appended, not prepended: self-learning/ must not shadow project-root modules
+    learning_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "self-learning")
+    if learning_dir not in sys.path:
+        sys.path.append(learning_dir)
+    from findings_index import FindingsIndex
+    return FindingsIndex.for_path(findings_path).post_ids()
 
 
 def classify_post(post):
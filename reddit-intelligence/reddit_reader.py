@@ -15,8 +15,12 @@ Examples:
 
 import sys
 import json
+import os
 import re
-import urllib.request
+import urllib.error
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from http_client import get_client
 
 HEADERS = {"User-Agent": "ClaudeCodeReader/1.0 (ClaudeCodeAdvancements; read-only)"}
 API_BASE = "https://www.reddit.com"
@@ -24,9 +28,7 @@ API_BASE = "https://www.reddit.com"
 
 def fetch_json(url):
     """Fetch URL and parse JSON response. Raises on HTTP errors."""
-    req = urllib.request.Request(url, headers=HEADERS)
-    with urllib.request.urlopen(req, timeout=15) as r:
-        return json.loads(r.read().decode("utf-8"))
+    return get_client().get_json(url, headers=HEADERS, timeout=15)
 
 
 def normalize_url(raw):
@@ -11,6 +11,10 @@ Components:
   - RepoTester: orchestrates clone → detect → test → score → cleanup
   - RepoTestResult: scored output with verdict (QUALITY/ACCEPTABLE/LOW_QUALITY)
   - clone_repo(): shallow clone into /tmp with safety checks
+  - SandboxLimits: per-sandbox CPU / memory rlimits
+  - DependencyCache: shared wheelhouse, read-only while sandboxes run
+  - BatchEvaluator: evaluates local checkouts concurrently, streaming
+    results to github_evaluations.jsonl
 
 Safety (NON-NEGOTIABLE):
   - Never clones into CCA directory
@@ -24,6 +28,10 @@ Usage:
     python3 repo_tester.py test <owner/repo>     # Clone + test + score
     python3 repo_tester.py local <path>           # Test a local directory
     python3 repo_tester.py results                # Show test result log
+    python3 repo_tester.py batch <path>... [--workers N] [--cpu S] [--memory MB]
+                                                  # Evaluate local checkouts in parallel
+    python3 repo_tester.py warm-cache <requirements.txt>...
+                                                  # Fill the shared wheelhouse (online)
 
 Stdlib only. No external dependencies.
 """
@@ -31,10 +39,14 @@ Stdlib only. No external dependencies.
 import json
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -46,6 +58,9 @@ _CLONE_PREFIX = "cca-repo-test-"
 _DEFAULT_TIMEOUT = 60  # seconds per command
 _DEFAULT_CLONE_TIMEOUT = 30
 _THIS_DIR = Path(__file__).parent
+_EVAL_LOG_PATH = _THIS_DIR / "github_evaluations.jsonl"
+_DEPS_DIRNAME = ".cca-deps"  # per-sandbox pip --target dir
+_SIGXCPU = getattr(signal, "SIGXCPU", None)  # RLIMIT_CPU exceeded (POSIX only)
 
 # Env vars that must NEVER leak into sandbox
 _SENSITIVE_ENV_VARS = {
@@ -130,7 +145,8 @@ class LanguageDetector:
         found = set()
         for pattern in patterns:
             for f in self.project_dir.glob(pattern):
-                if f.is_file() and "__pycache__" not in str(f):
+                if (f.is_file() and "__pycache__" not in str(f)
+                        and _DEPS_DIRNAME not in f.parts):
                     found.add(str(f))
         return list(found)
 
@@ -199,6 +215,51 @@ class LanguageDetector:
         return result
 
 
+# ── SandboxLimits ───────────────────────────────────────────────────────────
+
+# Applies rlimits then execs the real command. Used instead of preexec_fn,
+# which is unsafe when several sandboxes are started from worker threads.
+_RLIMIT_LAUNCHER = """\
+import os, sys
+try:
+    import resource
+except ImportError:
+    resource = None
+# The CPU hard limit sits one second above the soft one: the soft limit
+# raises SIGXCPU, while hitting the hard limit is an uncatchable SIGKILL
+# that can't be told apart from other kills.
+for name, value, slack in (("RLIMIT_CPU", int(sys.argv[1]), 1), ("RLIMIT_AS", int(sys.argv[2]), 0)):
+    if resource is not None and value > 0 and hasattr(resource, name):
+        try:
+            resource.setrlimit(getattr(resource, name), (value, value + slack))
+        except (ValueError, OSError):
+            pass
+try:
+    os.execvp(sys.argv[4], sys.argv[4:])
+except FileNotFoundError:
+    sys.stderr.write("Command not found: " + sys.argv[4])
+    sys.exit(127)
+"""
+
+
+@dataclass
+class SandboxLimits:
+    """Per-sandbox resource limits (0 = unlimited)."""
+    cpu_seconds: int = 0
+    memory_mb: int = 0
+
+    @property
+    def active(self) -> bool:
+        return self.cpu_seconds > 0 or self.memory_mb > 0
+
+    def wrap(self, cmd: list) -> list:
+        """Prefix cmd with a launcher that applies RLIMIT_CPU / RLIMIT_AS."""
+        if not self.active:
+            return list(cmd)
+        return [sys.executable, "-c", _RLIMIT_LAUNCHER,
+                str(self.cpu_seconds), str(self.memory_mb * 1024 * 1024), "--", *cmd]
+
+
 # ── SandboxRunner ───────────────────────────────────────────────────────────
 
 
@@ -207,7 +268,8 @@ class SandboxRunner:
     Executes commands in a sandboxed directory with timeouts and env stripping.
     """
 
-    def __init__(self, work_dir: str, timeout: int = _DEFAULT_TIMEOUT):
+    def __init__(self, work_dir: str, timeout: int = _DEFAULT_TIMEOUT,
+                 limits: SandboxLimits = None, extra_env: dict = None):
         # SAFETY: Never operate inside CCA directory
         abs_work = os.path.abspath(work_dir)
         abs_cca = os.path.abspath(_CCA_DIR)
@@ -217,6 +279,8 @@ class SandboxRunner:
             )
         self.work_dir = abs_work
         self.timeout = timeout
+        self.limits = limits
+        self.extra_env = extra_env or {}
 
     def _safe_env(self) -> dict:
         """Return environment with sensitive vars stripped."""
@@ -231,6 +295,8 @@ class SandboxRunner:
                 to_remove.append(k)
         for k in to_remove:
             env.pop(k, None)
+        # Sandbox-specific settings (offline flags, dependency paths)
+        env.update(self.extra_env)
         return env
 
     def run(self, cmd: list, timeout: int = None) -> dict:
@@ -241,10 +307,11 @@ class SandboxRunner:
         """
         timeout = timeout or self.timeout
         start = time.monotonic()
+        cmd_run = self.limits.wrap(cmd) if self.limits else cmd
 
         try:
             proc = subprocess.run(
-                cmd,
+                cmd_run,
                 cwd=self.work_dir,
                 capture_output=True,
                 text=True,
@@ -389,14 +456,20 @@ class RepoTester:
     Orchestrates repo evaluation: detect language → run tests → score quality.
     """
 
-    def __init__(self, log_path: str = None, timeout: int = _DEFAULT_TIMEOUT):
+    def __init__(self, log_path: str = None, timeout: int = _DEFAULT_TIMEOUT,
+                 limits: SandboxLimits = None):
         self.log_path = log_path or str(_THIS_DIR / "repo_test_results.jsonl")
         self.timeout = timeout
+        self.limits = limits
 
-    def evaluate_local(self, project_dir: str, repo_name: str = "local/project") -> RepoTestResult:
+    def evaluate_local(self, project_dir: str, repo_name: str = "local/project",
+                       env: dict = None) -> RepoTestResult:
         """
         Evaluate a local directory (already cloned or local project).
 
+        env: extra environment for the test command (applied after the
+        sensitive-var strip), e.g. offline flags or PYTHONPATH for deps.
+
         Returns RepoTestResult with quality score and test results.
         """
         start = time.monotonic()
@@ -437,12 +510,16 @@ class RepoTester:
 
         if test_command and can_sandbox:
             try:
-                runner = SandboxRunner(project_dir, timeout=self.timeout)
+                runner = SandboxRunner(project_dir, timeout=self.timeout,
+                                       limits=self.limits, extra_env=env)
                 test_result = runner.run(test_command)
 
                 if test_result["timed_out"]:
                     warnings.append("Tests timed out")
                     tests_failed = tests_found
+                elif _SIGXCPU and test_result["returncode"] == -_SIGXCPU:
+                    warnings.append("Tests exceeded sandbox CPU limit")
+                    tests_failed = tests_found
                 elif test_result["returncode"] == 0:
                     test_success = True
                     tests_passed = tests_found  # Approximate — passed if exit 0
@@ -549,7 +626,8 @@ class RepoTester:
         source_files = [f for f in source_files
                         if "__pycache__" not in str(f)
                         and "node_modules" not in str(f)
-                        and ".git" not in str(f)]
+                        and ".git" not in str(f)
+                        and _DEPS_DIRNAME not in f.parts]
         count = len(source_files)
 
         if count >= 20:
@@ -632,6 +710,208 @@ class RepoTester:
             self.cleanup(clone_path)
 
 
+# ── DependencyCache ─────────────────────────────────────────────────────────
+
+# Keeps package managers off the network inside batch sandboxes
+_OFFLINE_ENV = {
+    "PIP_NO_INDEX": "1",
+    "PIP_NO_CACHE_DIR": "1",
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "npm_config_offline": "true",
+    "CARGO_NET_OFFLINE": "true",
+    "GOPROXY": "off",
+}
+
+
+def _default_cache_dir() -> str:
+    """~/.cca-repo-cache, overridable with CCA_REPO_CACHE."""
+    return os.environ.get("CCA_REPO_CACHE") or os.path.expanduser("~/.cca-repo-cache")
+
+
+class DependencyCache:
+    """
+    Shared wheelhouse reused by every sandbox in a batch.
+
+    warm() fills <root>/wheels with `pip wheel` (online, single writer, with
+    <root>/pip as pip's download cache). Sandboxes only read it: pip runs
+    with --no-index --find-links <wheels> and its own cache disabled, and
+    read_only() drops write permission on the wheelhouse while a batch runs.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = os.path.abspath(root or _default_cache_dir())
+        self.wheel_dir = os.path.join(self.root, "wheels")
+        self.pip_cache_dir = os.path.join(self.root, "pip")
+
+    def has_wheels(self) -> bool:
+        return os.path.isdir(self.wheel_dir) and any(
+            name.endswith(".whl") for name in os.listdir(self.wheel_dir))
+
+    def sandbox_env(self, sandbox_dir: str) -> dict:
+        """Env for commands in a sandbox: offline pip + installed deps on PYTHONPATH."""
+        env = dict(_OFFLINE_ENV)
+        env["PIP_FIND_LINKS"] = self.wheel_dir
+        env["PYTHONPATH"] = os.path.join(sandbox_dir, _DEPS_DIRNAME)
+        return env
+
+    def install_command(self, project_dir: str) -> list:
+        """pip command installing a Python project's deps into the sandbox, or None."""
+        if not self.has_wheels():
+            return None
+        p = Path(project_dir)
+        base = ["python3", "-m", "pip", "install", "--quiet", "--no-index",
+                "--find-links", self.wheel_dir, "--target", _DEPS_DIRNAME]
+        if (p / "requirements.txt").exists():
+            return base + ["-r", "requirements.txt"]
+        if (p / "pyproject.toml").exists() or (p / "setup.py").exists():
+            return base + ["--no-build-isolation", "."]
+        return None
+
+    def warm(self, requirement_files: list, timeout: int = 600) -> dict:
+        """Build wheels for requirement files into the wheelhouse (needs network)."""
+        os.makedirs(self.wheel_dir, exist_ok=True)
+        cmd = ["python3", "-m", "pip", "wheel", "--quiet",
+               "--wheel-dir", self.wheel_dir, "--cache-dir", self.pip_cache_dir]
+        for req in requirement_files:
+            cmd += ["-r", os.path.abspath(req)]
+        return SandboxRunner(self.root, timeout=timeout).run(cmd)
+
+    @contextmanager
+    def read_only(self):
+        """Remove write bits from the wheelhouse for the duration of a batch."""
+        mode = None
+        if os.path.isdir(self.wheel_dir):
+            mode = os.stat(self.wheel_dir).st_mode
+            os.chmod(self.wheel_dir, mode & ~0o222)
+        try:
+            yield self
+        finally:
+            if mode is not None:
+                os.chmod(self.wheel_dir, mode)
+
+
+# ── BatchEvaluator ──────────────────────────────────────────────────────────
+
+
+def default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 2))
+
+
+@dataclass
+class BatchTarget:
+    """A pre-fetched local checkout to evaluate."""
+    path: str
+    repo_name: str
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "BatchTarget":
+        """'owner/repo=path' or just 'path' (named local/<dirname>)."""
+        name, sep, path = spec.partition("=")
+        if not sep:
+            path = spec
+            name = f"local/{Path(os.path.abspath(spec)).name}"
+        return cls(path=os.path.abspath(path), repo_name=name)
+
+
+class BatchEvaluator:
+    """
+    Evaluates many local checkouts concurrently, fully offline.
+
+    Each checkout is copied into its own temp sandbox (the original is never
+    modified), Python deps are installed there from the shared
+    DependencyCache, tests run under the tester's SandboxLimits, and each
+    result is appended to github_evaluations.jsonl as soon as it completes.
+    """
+
+    def __init__(self, tester: RepoTester = None, workers: int = None,
+                 limits: SandboxLimits = None, dep_cache: DependencyCache = None,
+                 eval_log_path: str = None, install_timeout: int = 120):
+        self.tester = tester or RepoTester()
+        if limits is not None:
+            self.tester.limits = limits
+        self.workers = max(1, workers or default_workers())
+        self.dep_cache = dep_cache
+        self.eval_log_path = eval_log_path or str(_EVAL_LOG_PATH)
+        self.install_timeout = install_timeout
+        self._log_lock = threading.Lock()
+
+    def evaluate_one(self, target: BatchTarget) -> RepoTestResult:
+        """Copy → install deps → evaluate → cleanup for a single checkout."""
+        start = time.monotonic()
+        sandbox = tempfile.mkdtemp(prefix=_CLONE_PREFIX)
+        work = os.path.join(sandbox, "repo")
+        try:
+            shutil.copytree(target.path, work, symlinks=True,
+                            ignore=shutil.ignore_patterns(".git", "__pycache__"))
+        except OSError as e:
+            shutil.rmtree(sandbox, ignore_errors=True)
+            return RepoTestResult(
+                repo_name=target.repo_name, language="unknown", test_framework="unknown",
+                tests_found=0, tests_passed=0, tests_failed=0,
+                build_success=False, test_success=False, quality_score=0,
+                quality_components={}, warnings=[], errors=[f"Cannot copy checkout: {e}"],
+                duration_s=round(time.monotonic() - start, 2),
+            )
+
+        try:
+            env = dict(_OFFLINE_ENV)
+            warnings = []
+            install = self.dep_cache.install_command(work) if self.dep_cache else None
+            if install:
+                env = self.dep_cache.sandbox_env(work)
+                runner = SandboxRunner(work, timeout=self.install_timeout,
+                                       limits=self.tester.limits, extra_env=env)
+                installed = runner.run(install)
+                if installed["returncode"] != 0:
+                    lines = installed["stderr"].strip().splitlines() or ["no output"]
+                    reason = next((l for l in lines if l.startswith("ERROR:")), lines[-1])
+                    warnings.append(f"Dependency install failed: {reason}")
+            result = self.tester.evaluate_local(work, repo_name=target.repo_name, env=env)
+            result.warnings = warnings + result.warnings
+            result.duration_s = round(time.monotonic() - start, 2)
+            return result
+        finally:
+            shutil.rmtree(sandbox, ignore_errors=True)
+
+    def log_evaluation(self, target: BatchTarget, result: RepoTestResult):
+        """Append one result to github_evaluations.jsonl (thread-safe)."""
+        entry = {
+            "repo": target.repo_name,
+            "source": "repo_tester",
+            "path": target.path,
+            "score": result.quality_score,
+        }
+        entry.update(result.to_dict())
+        entry["evaluated_at"] = datetime.now(timezone.utc).isoformat()
+        line = json.dumps(entry) + "\n"
+        with self._log_lock:
+            with open(self.eval_log_path, "a") as f:
+                f.write(line)
+
+    def run(self, targets: list, on_result=None) -> list:
+        """
+        Evaluate targets (BatchTarget or spec strings) with up to `workers`
+        sandboxes at once. Results are logged (and passed to on_result) in
+        completion order; the returned list is in input order.
+        """
+        targets = [t if isinstance(t, BatchTarget) else BatchTarget.from_spec(t)
+                   for t in targets]
+        results = [None] * len(targets)
+        if not targets:
+            return results
+
+        cache_guard = self.dep_cache.read_only() if self.dep_cache else nullcontext()
+        with cache_guard, ThreadPoolExecutor(max_workers=min(self.workers, len(targets))) as pool:
+            futures = {pool.submit(self.evaluate_one, t): i for i, t in enumerate(targets)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                self.log_evaluation(targets[i], results[i])
+                if on_result is not None:
+                    on_result(results[i])
+        return results
+
+
 # ── CLI ─────────────────────────────────────────────────────────────────────
 
 
@@ -641,10 +921,12 @@ def cli_main(args: list = None):
         args = sys.argv[1:]
 
     if not args:
-        print("Usage: python3 repo_tester.py [test|local|results] ...")
+        print("Usage: python3 repo_tester.py [test|local|results|batch|warm-cache] ...")
         print("  test <owner/repo>   Clone + test + score a GitHub repo")
         print("  local <path>        Test a local directory")
         print("  results             Show test result log")
+        print("  batch <path>...     Evaluate local checkouts in parallel (offline)")
+        print("  warm-cache <req>... Fill the shared wheelhouse from requirements files")
         return
 
     cmd = args[0]
@@ -694,9 +976,53 @@ def cli_main(args: list = None):
             marker = ">>>" if verdict == "QUALITY" else "   "
             print(f"  {marker} [{score:4.0f}] {verdict:<12} {name} ({lang}, {tests} tests)")
 
+    elif cmd == "batch":
+        _cli_batch(args[1:])
+
+    elif cmd == "warm-cache":
+        if len(args) < 2:
+            print("Usage: python3 repo_tester.py warm-cache <requirements.txt>... [--cache DIR]")
+            return
+        files, cache_dir = list(args[1:]), None
+        if "--cache" in files:
+            i = files.index("--cache")
+            cache_dir = files[i + 1] if i + 1 < len(files) else None
+            del files[i:i + 2]
+        cache = DependencyCache(cache_dir)
+        result = cache.warm(files)
+        status = "OK" if result["returncode"] == 0 else f"FAILED: {result['stderr'].strip()[-200:]}"
+        print(f"Wheelhouse {cache.wheel_dir}: {status}")
+
     else:
         print(f"Unknown command: {cmd}")
-        print("Usage: python3 repo_tester.py [test|local|results]")
+        print("Usage: python3 repo_tester.py [test|local|results|batch|warm-cache]")
+
+
+def _cli_batch(argv: list):
+    """`batch` subcommand: parallel offline evaluation of local checkouts."""
+    import argparse
+    parser = argparse.ArgumentParser(prog="repo_tester.py batch")
+    parser.add_argument("targets", nargs="+", help="path or owner/repo=path")
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--cpu", type=int, default=0, help="CPU seconds per sandbox (0 = no limit)")
+    parser.add_argument("--memory", type=int, default=0, help="Address space MB per sandbox")
+    parser.add_argument("--timeout", type=int, default=_DEFAULT_TIMEOUT)
+    parser.add_argument("--cache", default=None, help="Dependency cache dir (default ~/.cca-repo-cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Skip dependency installs")
+    parser.add_argument("--log", default=str(_EVAL_LOG_PATH), help="Evaluation JSONL log")
+    args = parser.parse_args(argv)
+
+    batch = BatchEvaluator(
+        tester=RepoTester(timeout=args.timeout),
+        workers=args.workers,
+        limits=SandboxLimits(cpu_seconds=args.cpu, memory_mb=args.memory),
+        dep_cache=None if args.no_cache else DependencyCache(args.cache),
+        eval_log_path=args.log,
+    )
+    start = time.monotonic()
+    results = batch.run(args.targets, on_result=_print_result)
+    print(f"\nEvaluated {len(results)} repos in {time.monotonic() - start:.1f}s "
+          f"({batch.workers} workers) -> {args.log}")
 
 
 def _print_result(result: RepoTestResult):
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+scan_pipeline.py — Pipelined multi-subreddit scans for autonomous_scanner.
+
+AutonomousScanner.execute_scan runs one subreddit at a time, end to end:
+the listing fetch, then triage, safety checks and classification, then the
+next subreddit's fetch. ScanPipeline runs the same steps as asyncio stages
+joined by bounded queues, so one sub's listing download overlaps another
+sub's classification:
+
+    fetch -> triage -> safety -> deep_read -> classify -> write
+
+  fetch      listing pages (top, or hot+rising for daily targets); network,
+             runs on a thread pool
+  triage     profiles.quick_scan_triage picks the deep-read candidates
+  safety     SafetyGate/content_scanner filtering + FINDINGS_LOG dedup
+  deep_read  post body + comments for safe candidates (reddit_reader);
+             network, fanned out on the thread pool. Off unless
+             deep_read_count > 0.
+  classify   NEEDLE/MAYBE/HAY triage labels
+  write      ScanReport, safety gate + scan registry records, optional
+             per-sub JSON under output_dir
+
+Requests still go through http_client, whose per-host token bucket paces
+Reddit traffic. The safety gate is checked once per run (kill switch,
+session budget, delay since the last run); the kill switch is re-checked
+before every listing fetch, and at most the remaining session budget of
+targets is admitted.
+
+Each ScanReport carries stage_metrics ({stage: posts, seconds,
+posts_per_sec}); PipelineRun.stages aggregates them across the run.
+
+Usage:
+    from autonomous_scanner import AutonomousScanner
+    from scan_pipeline import ScanPipeline, pick_targets, daily_targets
+
+    scanner = AutonomousScanner()
+    pipeline = ScanPipeline(scanner, deep_read_count=5)
+    run = pipeline.run(pick_targets(scanner, count=4))
+    print(run.summary())
+
+Stdlib only. No external dependencies.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+_THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(_THIS_DIR))
+
+import autonomous_scanner
+from autonomous_scanner import ScanResult
+from profiles import ScanRegistry, quick_scan_triage
+
+STAGES = ("fetch", "triage", "safety", "deep_read", "classify", "write")
+QUEUE_SIZE = 2          # jobs buffered between stages
+FETCH_WORKERS = 3       # subreddits whose listings download concurrently
+DEEP_READ_WORKERS = 4   # posts deep-read concurrently
+
+
+@dataclass
+class ScanTarget:
+    """One subreddit to scan. mode is "top" (execute_scan) or "daily" (hot+rising)."""
+    subreddit: str
+    slug: str
+    domain: str
+    mode: str = "top"
+    fetch_limit: Optional[int] = None
+    timeframe: Optional[str] = None
+    hot_limit: int = 25
+    rising_limit: int = 10
+
+
+@dataclass
+class StageMetrics:
+    """Work done by one stage across a run."""
+    name: str
+    jobs: int = 0
+    posts: int = 0
+    seconds: float = 0.0
+    errors: int = 0
+
+    @property
+    def posts_per_sec(self) -> float:
+        return self.posts / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {"jobs": self.jobs, "posts": self.posts, "seconds": round(self.seconds, 3),
+                "posts_per_sec": round(self.posts_per_sec, 1), "errors": self.errors}
+
+
+@dataclass
+class PipelineRun:
+    """Results of a pipeline run, in target order, plus per-stage metrics."""
+    results: List[ScanResult] = field(default_factory=list)
+    stages: Dict[str, StageMetrics] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    skipped: List[dict] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "results": [r.to_dict() for r in self.results],
+            "stages": {name: m.to_dict() for name, m in self.stages.items()},
+            "wall_seconds": round(self.wall_seconds, 3),
+            "skipped": self.skipped,
+        }
+
+    def summary(self) -> str:
+        busy = sum(m.seconds for m in self.stages.values())
+        lines = [f"PIPELINE SCAN — {len(self.results)} subs in {self.wall_seconds:.1f}s "
+                 f"({busy:.1f}s of stage work)"]
+        for name, m in self.stages.items():
+            lines.append(f"  {name:<10} {m.jobs:3d} jobs {m.posts:5d} posts "
+                         f"{m.seconds:7.2f}s {m.posts_per_sec:8.1f} posts/s"
+                         + (f"  {m.errors} errors" if m.errors else ""))
+        for skip in self.skipped:
+            lines.append(f"  skipped r/{skip['subreddit']}: {skip['reason']}")
+        return "\n".join(lines)
+
+
+@dataclass
+class _Job:
+    index: int
+    target: ScanTarget
+    posts: list = field(default_factory=list)
+    deep_ids: set = field(default_factory=set)
+    safe: list = field(default_factory=list)
+    blocked: list = field(default_factory=list)
+    result: Optional[ScanResult] = None
+    error: str = ""
+    metrics: dict = field(default_factory=dict)
+
+
+_DONE = object()
+
+
+def pick_targets(scanner, count: int = 3, domain: str = None) -> List[ScanTarget]:
+    """The `count` highest-priority distinct subs from the scanner's prioritizer."""
+    ranked = [e for e in scanner.prioritizer.rank_all() if not domain or e["domain"] == domain]
+    return [ScanTarget(e["subreddit"], e["slug"], e["domain"]) for e in ranked[:count]]
+
+
+def daily_targets(scanner, subs: list = None, hot_limit: int = 25,
+                  rising_limit: int = 10) -> List[ScanTarget]:
+    """Daily hot+rising targets (same defaults as execute_daily_scan)."""
+    if subs is None:
+        subs = ["ClaudeCode", "ClaudeAI", "vibecoding"]
+    targets = []
+    for sub in subs:
+        slug, domain = scanner.resolve_daily_target(sub)
+        targets.append(ScanTarget(sub, slug, domain, mode="daily",
+                                  hot_limit=hot_limit, rising_limit=rising_limit))
+    return targets
+
+
+def _default_deep_reader(subreddit: str, post_id: str) -> str:
+    from reddit_reader import read_post
+    return read_post(subreddit, post_id)
+
+
+class ScanPipeline:
+    """Runs ScanTargets through the staged fetch → ... → write pipeline."""
+
+    def __init__(self, scanner, queue_size: int = QUEUE_SIZE,
+                 fetch_workers: int = FETCH_WORKERS,
+                 deep_read_workers: int = DEEP_READ_WORKERS,
+                 deep_read_count: int = 0, output_dir: str = None,
+                 deep_reader: Callable[[str, str], str] = None):
+        self.scanner = scanner
+        self.queue_size = max(1, queue_size)
+        self.fetch_workers = max(1, fetch_workers)
+        self.deep_read_workers = max(1, deep_read_workers)
+        self.deep_read_count = deep_read_count
+        self.output_dir = output_dir
+        self.deep_reader = deep_reader or _default_deep_reader
+
+    # ── Stage bodies (one job each) ─────────────────────────────────────
+
+    def _fetch(self, job: _Job):
+        t = job.target
+        if t.mode == "daily":
+            job.posts = self.scanner.fetch_daily_posts(t.subreddit, t.hot_limit, t.rising_limit)
+        else:
+            limit, timeframe = self.scanner.resolve_fetch_params(
+                t.subreddit, t.fetch_limit, t.timeframe)
+            job.posts = autonomous_scanner.fetch_top_posts(t.subreddit, limit, timeframe)
+
+    def _triage(self, job: _Job):
+        if self.deep_read_count <= 0:
+            return
+        # quick_scan_triage always keeps every NEEDLE; cap at the highest
+        # scoring deep_read_count so a NEEDLE-heavy sub stays bounded.
+        deep, _ = quick_scan_triage(job.posts, self.deep_read_count)
+        job.deep_ids = {p["id"] for p in deep[:self.deep_read_count]}
+
+    def _safety(self, job: _Job):
+        job.safe, job.blocked = self.scanner.filter_posts(job.posts)
+        job.safe = self.scanner.dedup_posts(job.safe)
+
+    def _deep_read_one(self, job: _Job, post: dict):
+        try:
+            post["deep_read"] = self.deep_reader(job.target.subreddit, post["id"])
+        except Exception as e:
+            post["deep_read_error"] = str(e)
+
+    def _classify(self, job: _Job):
+        job.safe = self.scanner.classify_posts(job.safe)
+
+    def _write(self, job: _Job):
+        t = job.target
+        safe = job.safe
+        report = self.scanner.build_report(t.subreddit, t.slug, t.domain,
+                                           job.posts, safe, job.blocked)
+        report.stage_metrics = job.metrics
+        self.scanner.safety_gate.record_scan(t.slug)
+        if t.mode == "top":
+            registry = ScanRegistry(self.scanner.prioritizer._registry._path)
+            registry.record_scan(t.slug, posts_scanned=len(job.posts), builds=0, adapts=0)
+        job.result = ScanResult(
+            report=report,
+            needles=[p for p in safe if p.get("triage") == "NEEDLE"],
+            maybes=[p for p in safe if p.get("triage") == "MAYBE"],
+            hay=[p for p in safe if p.get("triage") == "HAY"],
+        )
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            job.result.save_json(os.path.join(self.output_dir, f"{t.slug}.json"))
+
+    # ── Plumbing ────────────────────────────────────────────────────────
+
+    def _deep_candidates(self, job: _Job) -> list:
+        return [p for p in job.safe if p["id"] in job.deep_ids]
+
+    def _stage_posts(self, name: str, job: _Job) -> int:
+        if name == "deep_read":
+            return len(self._deep_candidates(job))
+        if name in ("classify", "write"):
+            return len(job.safe)
+        return len(job.posts)
+
+    async def _run_stage(self, name: str, body, inbox: asyncio.Queue,
+                         outbox: Optional[asyncio.Queue], workers: int,
+                         downstream_workers: int, totals: Dict[str, StageMetrics]):
+        metrics = totals[name]
+
+        async def worker():
+            while True:
+                job = await inbox.get()
+                if job is _DONE:
+                    return
+                if not job.error:
+                    start = time.perf_counter()
+                    try:
+                        await body(job)
+                    except Exception as e:
+                        job.error = f"{name}: {e}"
+                        metrics.errors += 1
+                    elapsed = time.perf_counter() - start
+                    posts = self._stage_posts(name, job)
+                    job.metrics[name] = {
+                        "posts": posts, "seconds": round(elapsed, 4),
+                        "posts_per_sec": round(posts / elapsed, 1) if elapsed > 0 else 0.0,
+                    }
+                    metrics.jobs += 1
+                    metrics.posts += posts
+                    metrics.seconds += elapsed
+                if outbox is not None:
+                    await outbox.put(job)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        if outbox is not None:
+            for _ in range(downstream_workers):
+                await outbox.put(_DONE)
+
+    async def run_async(self, targets: List[ScanTarget]) -> PipelineRun:
+        run = PipelineRun(stages={name: StageMetrics(name) for name in STAGES})
+        started = time.perf_counter()
+        gate = self.scanner.safety_gate
+
+        allowed, reason = gate.can_scan()
+        if not allowed:
+            run.skipped = [{"subreddit": t.subreddit, "reason": reason} for t in targets]
+            return run
+        budget = max(0, gate.max_scans_per_session - gate.scans_this_session)
+        admitted = targets[:budget]
+        run.skipped = [{"subreddit": t.subreddit, "reason": "session scan limit"}
+                       for t in targets[budget:]]
+
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(max_workers=self.fetch_workers + self.deep_read_workers)
+        deep_slots = asyncio.Semaphore(self.deep_read_workers)
+
+        async def fetch(job):
+            if gate.is_paused():
+                raise RuntimeError("kill switch active")
+            await loop.run_in_executor(pool, self._fetch, job)
+
+        async def deep_read(job):
+            async def one(post):
+                async with deep_slots:
+                    await loop.run_in_executor(pool, self._deep_read_one, job, post)
+            await asyncio.gather(*(one(p) for p in self._deep_candidates(job)))
+
+        def inline(fn):
+            # CPU-bound stages run on the event loop itself; the fetch and
+            # deep-read threads keep downloading meanwhile.
+            async def body(job):
+                fn(job)
+            return body
+
+        bodies = {
+            "fetch": fetch,
+            "triage": inline(self._triage),
+            "safety": inline(self._safety),
+            "deep_read": deep_read,
+            "classify": inline(self._classify),
+            "write": inline(self._write),
+        }
+        # fetch gets several workers so listings download side by side; the
+        # other stages need one each (deep_read parallelises within a job).
+        workers = {name: 1 for name in STAGES}
+        workers["fetch"] = self.fetch_workers
+        workers["deep_read"] = min(2, self.deep_read_workers)
+
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in STAGES]
+        done: asyncio.Queue = asyncio.Queue()
+        jobs = [_Job(index=i, target=t) for i, t in enumerate(admitted)]
+
+        async def feed():
+            for job in jobs:
+                await queues[0].put(job)
+            for _ in range(workers["fetch"]):
+                await queues[0].put(_DONE)
+
+        tasks = [feed()]
+        for i, name in enumerate(STAGES):
+            outbox = queues[i + 1] if i + 1 < len(STAGES) else done
+            downstream = workers[STAGES[i + 1]] if i + 1 < len(STAGES) else 0
+            tasks.append(self._run_stage(name, bodies[name], queues[i], outbox,
+                                         workers[name], downstream, run.stages))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            pool.shutdown(wait=True)
+
+        for job in jobs:
+            if job.result is not None:
+                run.results.append(job.result)
+            else:
+                run.skipped.append({"subreddit": job.target.subreddit, "reason": job.error})
+        run.wall_seconds = time.perf_counter() - started
+        return run
+
+    def run(self, targets: List[ScanTarget]) -> PipelineRun:
+        """Scan targets through the pipeline. Results come back in target order."""
+        return asyncio.run(self.run_async(targets))
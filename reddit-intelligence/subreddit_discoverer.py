@@ -21,9 +21,8 @@ import math
 import os
 import re
 import sys
-import time
-import urllib.request
 import urllib.error
+import urllib.parse
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -34,6 +33,7 @@ sys.path.insert(0, str(_THIS_DIR))
 
 # Import existing profiles to know what we already track
 from profiles import BUILTIN_PROFILES
+from http_client import get_client
 
 # ── Project Domains ──────────────────────────────────────────────────────────
 
@@ -114,7 +114,6 @@ DOMAIN_QUERIES = {
 # ── User-Agent for Reddit API ────────────────────────────────────────────────
 
 _USER_AGENT = "CCA-SubredditDiscoverer/1.0 (research-only; stdlib-only)"
-_RATE_LIMIT_SEC = 2.0  # Be polite to Reddit API
 
 
 # ── SubredditCandidate ───────────────────────────────────────────────────────
@@ -178,10 +177,8 @@ def _already_tracked_slugs() -> set:
 
 def _fetch_json(url: str) -> Optional[dict]:
     """Fetch JSON from Reddit's public API with rate limiting."""
-    req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+        return get_client().get_json(url, headers={"User-Agent": _USER_AGENT}, timeout=15)
     except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, OSError) as e:
         return None
 
@@ -254,10 +251,11 @@ def discover_subreddits(
             continue
 
         config = DOMAIN_QUERIES[domain]
-        for query in config["search_terms"]:
-            results = _search_subreddits(query, limit=10)
-            time.sleep(_RATE_LIMIT_SEC)  # Rate limit
-
+        # Searches run on the shared client's pool; its per-host token
+        # bucket keeps the request rate polite.
+        batches = get_client().map(lambda q: _search_subreddits(q, limit=10),
+                                   config["search_terms"])
+        for results in batches:
             for item in results:
                 sub = item.get("data", {})
                 name = sub.get("display_name", "")
@@ -15,19 +15,19 @@ Usage:
 Stdlib only — no external dependencies.
 """
 
+import os
 import sys
 import json
 import re
-import time
-import urllib.request
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from http_client import get_client
+
 HEADERS = {"User-Agent": "ClaudeCodeScanner/1.0 (ClaudeCodeAdvancements; read-only)"}
 API_BASE = "https://www.reddit.com"
 MAX_PER_PAGE = 100
-# Reddit rate limit: ~1 request per second for unauthenticated
-RATE_LIMIT_DELAY = 1.2
 
 
 @dataclass
@@ -105,18 +105,8 @@ def build_listing_url(subreddit: str, sort: str = "hot", limit: int = 100,
 
 
 def fetch_json(url: str) -> dict:
-    """Fetch URL and parse JSON. Handles rate limiting."""
-    req = urllib.request.Request(url, headers=HEADERS)
-    try:
-        with urllib.request.urlopen(req, timeout=30) as r:
-            return json.loads(r.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        if e.code == 429:
-            print(f"  Rate limited — waiting 5s...", file=sys.stderr)
-            time.sleep(5)
-            with urllib.request.urlopen(req, timeout=30) as r:
-                return json.loads(r.read().decode("utf-8"))
-        raise
+    """Fetch URL and parse JSON. Rate limiting and 429 retries live in http_client."""
+    return get_client().get_json(url, headers=HEADERS, timeout=30)
 
 
 def parse_listing_response(data: dict) -> tuple:
@@ -245,9 +235,6 @@ def scan_subreddit(subreddit: str, sort: str = "new", timeframe: str = "all",
                 print(f"  No more pages — scan complete.", file=sys.stderr)
             break
 
-        # Rate limit
-        time.sleep(RATE_LIMIT_DELAY)
-
     return ScanResult(
         subreddit=subreddit,
         total_posts=len(all_posts),
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Tests for http_client.py against a local stub HTTP server (no live requests)."""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_client import HttpClient, TokenBucket, endpoint_ttl
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits.append(self.path)
+            server.ports.add(self.client_address[1])
+            server.seen_headers.append(dict(self.headers))
+        path = self.path.split("?")[0]
+        if path == "/etag.json":
+            if self.headers.get("If-None-Match") == '"v1"':
+                return self._send(304, headers={"ETag": '"v1"'})
+            return self._send(200, json.dumps({"version": 1}).encode(), {"ETag": '"v1"'})
+        if path == "/flaky.json":
+            server.flaky -= 1
+            if server.flaky >= 0:
+                return self._send(server.flaky_status, b"busy", {"Retry-After": "0"})
+            return self._send(200, b'{"ok": true}')
+        if path == "/gzip.json":
+            return self._send(200, gzip.compress(b'{"zipped": true}'), {"Content-Encoding": "gzip"})
+        if path == "/moved.json":
+            return self._send(301, headers={"Location": "/etag.json"})
+        if path == "/missing.json":
+            return self._send(404, b"nope")
+        if path == "/slow.json":
+            time.sleep(0.1)
+        self._send(200, json.dumps({"path": self.path}).encode())
+
+
+class StubServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.hits = []
+        self.server.ports = set()
+        self.server.seen_headers = []
+        self.server.flaky = 0
+        self.server.flaky_status = 503
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.cache_dir = tempfile.mkdtemp()
+        self.sleeps = []
+        self.client = self.make_client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.cache_dir)
+
+    def make_client(self, **kwargs):
+        kwargs.setdefault("cache_dir", self.cache_dir)
+        kwargs.setdefault("rate_limits", {"127.0.0.1": (1000, 100)})
+        kwargs.setdefault("sleep", self.sleeps.append)
+        return HttpClient(**kwargs)
+
+
+class TestCaching(StubServerTestCase):
+
+    def test_fresh_entry_served_without_request(self):
+        url = self.base + "/listing.json"
+        self.assertEqual(self.client.get_json(url, ttl=60), {"path": "/listing.json"})
+        resp = self.client.get(url, ttl=60)
+        self.assertTrue(resp.from_cache)
+        self.assertEqual(len(self.server.hits), 1)
+
+    def test_stale_entry_revalidated_with_etag(self):
+        url = self.base + "/etag.json"
+        self.client.get_json(url, ttl=0)
+        resp = self.client.get(url, ttl=0)
+        self.assertTrue(resp.from_cache)
+        self.assertEqual(resp.json(), {"version": 1})
+        self.assertEqual(self.server.seen_headers[-1].get("If-None-Match"), '"v1"')
+        self.assertEqual(self.client.stats["revalidated"], 1)
+
+    def test_cache_shared_across_clients(self):
+        url = self.base + "/listing.json"
+        self.client.get_json(url, ttl=60)
+        other = self.make_client()
+        self.assertTrue(other.get(url, ttl=60).from_cache)
+        other.close()
+
+    def test_no_cache_dir_always_fetches(self):
+        client = self.make_client(cache_dir=None)
+        client.get_json(self.base + "/listing.json")
+        client.get_json(self.base + "/listing.json")
+        client.close()
+        self.assertEqual(len(self.server.hits), 2)
+
+    def test_endpoint_ttls(self):
+        self.assertEqual(endpoint_ttl("https://www.reddit.com/r/x/hot.json?limit=5"), 300)
+        self.assertEqual(endpoint_ttl("https://www.reddit.com/r/x/top.json?t=year"), 3600)
+        self.assertEqual(endpoint_ttl("https://www.reddit.com/subreddits/search.json?q=a"), 86400)
+        self.assertEqual(endpoint_ttl("https://api.github.com/repos/a/b"), 3600)
+
+
+class TestTransport(StubServerTestCase):
+
+    def test_keep_alive_reuses_connection(self):
+        for i in range(5):
+            self.client.get_json(f"{self.base}/page{i}.json", ttl=0)
+        self.assertEqual(len(self.server.ports), 1)
+        self.assertEqual(self.client.stats["connections"], 1)
+
+    def test_retries_503_then_succeeds(self):
+        self.server.flaky = 2
+        self.assertEqual(self.client.get_json(self.base + "/flaky.json", ttl=0), {"ok": True})
+        self.assertEqual(self.client.stats["retries"], 2)
+        self.assertEqual(self.sleeps, [0.0, 0.0])  # Retry-After: 0
+
+    def test_429_exhausts_retries(self):
+        self.server.flaky = 10
+        self.server.flaky_status = 429
+        client = self.make_client(max_retries=2)
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            client.get_json(self.base + "/flaky.json", ttl=0)
+        client.close()
+        self.assertEqual(ctx.exception.code, 429)
+        self.assertEqual(len(self.server.hits), 3)
+
+    def test_404_raises_http_error_without_retry(self):
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.client.get_json(self.base + "/missing.json")
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertEqual(len(self.server.hits), 1)
+
+    def test_gzip_and_redirect(self):
+        self.assertEqual(self.client.get_json(self.base + "/gzip.json"), {"zipped": True})
+        self.assertEqual(self.client.get_json(self.base + "/moved.json"), {"version": 1})
+
+    def test_connection_refused_raises_oserror(self):
+        client = self.make_client(max_retries=1)
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(OSError):
+            client.get_json(self.base + "/gone.json", ttl=0)
+        self.assertEqual(len(self.sleeps), 1)
+
+
+class TestConcurrency(StubServerTestCase):
+
+    def test_fetch_many_preserves_order_and_captures_errors(self):
+        urls = [f"{self.base}/slow.json?i={i}" for i in range(4)] + [self.base + "/missing.json"]
+        start = time.monotonic()
+        results = self.client.fetch_many(urls, ttl=0)
+        elapsed = time.monotonic() - start
+        self.assertEqual([r["path"] for r in results[:4]], [f"/slow.json?i={i}" for i in range(4)])
+        self.assertIsInstance(results[4], urllib.error.HTTPError)
+        self.assertLess(elapsed, 0.35)  # four 0.1s requests overlapped
+
+    def test_token_bucket_paces_requests(self):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0], sleep=sleep)
+        waits = [bucket.acquire() for _ in range(4)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.5)
+        self.assertAlmostEqual(waits[3], 0.5)
+        self.assertAlmostEqual(now[0], 1.0)
+
+    def test_host_rate_limit_applies_per_request(self):
+        client = self.make_client(rate_limits={"127.0.0.1": (1, 1)})
+        client.get_json(self.base + "/a.json", ttl=0)
+        client.get_json(self.base + "/b.json", ttl=60)
+        client.get_json(self.base + "/b.json", ttl=60)  # cache hit: no token needed
+        client.close()
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertGreater(self.sleeps[0], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -696,5 +696,209 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(result.warnings)  # Should warn about empty project
 
 
+# ── Batch evaluation ────────────────────────────────────────────────────────
+
+
+def _make_python_repo(root, name, test_body="self.assertTrue(True)", extra=None):
+    proj = os.path.join(root, name)
+    os.makedirs(os.path.join(proj, "tests"))
+    Path(proj, "setup.py").write_text("")
+    Path(proj, "tests", "test_it.py").write_text(
+        "import unittest\nclass T(unittest.TestCase):\n"
+        f"    def test_it(self): {test_body}\n"
+    )
+    for rel, content in (extra or {}).items():
+        Path(proj, rel).write_text(content)
+    os.makedirs(os.path.join(proj, ".git"))
+    return proj
+
+
+def _make_wheel(wheel_dir, dist="tinydep", version="1.0"):
+    """Hand-built pure-Python wheel so installs need no network or build backend."""
+    import zipfile
+    os.makedirs(wheel_dir, exist_ok=True)
+    info = f"{dist}-{version}.dist-info"
+    path = os.path.join(wheel_dir, f"{dist}-{version}-py3-none-any.whl")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(f"{dist}/__init__.py", "VALUE = 42\n")
+        zf.writestr(f"{info}/METADATA",
+                    f"Metadata-Version: 2.1\nName: {dist}\nVersion: {version}\n")
+        zf.writestr(f"{info}/WHEEL",
+                    "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n")
+        zf.writestr(f"{info}/RECORD", "")
+    return path
+
+
+class TestSandboxLimits(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_inactive_limits_leave_command_alone(self):
+        from repo_tester import SandboxLimits
+        self.assertEqual(SandboxLimits().wrap(["echo", "hi"]), ["echo", "hi"])
+
+    def test_cpu_limit_kills_busy_loop(self):
+        import signal
+        from repo_tester import SandboxLimits, SandboxRunner
+        runner = SandboxRunner(self.tmpdir, timeout=20, limits=SandboxLimits(cpu_seconds=1))
+        result = runner.run(["python3", "-c", "while True: pass"])
+        self.assertFalse(result["timed_out"])
+        self.assertEqual(result["returncode"], -signal.SIGXCPU)
+
+    def test_cpu_limit_reported_as_warning(self):
+        from repo_tester import RepoTester, SandboxLimits
+        proj = _make_python_repo(self.tmpdir, "busy", test_body="\n        while True: pass")
+        tester = RepoTester(log_path=os.path.join(self.tmpdir, "log.jsonl"),
+                            timeout=30, limits=SandboxLimits(cpu_seconds=1))
+        result = tester.evaluate_local(proj, repo_name="test/busy")
+        self.assertIn("Tests exceeded sandbox CPU limit", result.warnings)
+
+    def test_memory_limit(self):
+        from repo_tester import SandboxLimits, SandboxRunner
+        runner = SandboxRunner(self.tmpdir, limits=SandboxLimits(memory_mb=256))
+        result = runner.run(["python3", "-c", "x = bytearray(1024 * 1024 * 1024)"])
+        self.assertNotEqual(result["returncode"], 0)
+        self.assertIn("MemoryError", result["stderr"])
+
+    def test_missing_command_under_limits(self):
+        from repo_tester import SandboxLimits, SandboxRunner
+        runner = SandboxRunner(self.tmpdir, limits=SandboxLimits(cpu_seconds=5))
+        result = runner.run(["definitely_not_a_real_command_xyz"])
+        self.assertEqual(result["returncode"], 127)
+
+    def test_extra_env_applied_after_strip(self):
+        from repo_tester import SandboxRunner
+        runner = SandboxRunner(self.tmpdir, extra_env={"PIP_NO_INDEX": "1"})
+        result = runner.run(["python3", "-c", "import os; print(os.environ['PIP_NO_INDEX'])"])
+        self.assertEqual(result["stdout"].strip(), "1")
+
+
+class TestDependencyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_install_command_by_project_type(self):
+        from repo_tester import DependencyCache
+        cache = DependencyCache(os.path.join(self.tmpdir, "cache"))
+        proj = os.path.join(self.tmpdir, "p")
+        os.makedirs(proj)
+        Path(proj, "requirements.txt").write_text("tinydep\n")
+        self.assertIsNone(cache.install_command(proj))  # no wheelhouse yet
+        os.remove(os.path.join(proj, "requirements.txt"))
+        _make_wheel(cache.wheel_dir)
+        self.assertIsNone(cache.install_command(proj))
+        Path(proj, "pyproject.toml").write_text("")
+        self.assertEqual(cache.install_command(proj)[-1], ".")
+        Path(proj, "requirements.txt").write_text("tinydep\n")
+        cmd = cache.install_command(proj)
+        self.assertEqual(cmd[-2:], ["-r", "requirements.txt"])
+        self.assertIn("--no-index", cmd)
+        self.assertIn(cache.wheel_dir, cmd)
+
+    def test_read_only_restores_mode(self):
+        from repo_tester import DependencyCache
+        cache = DependencyCache(os.path.join(self.tmpdir, "cache"))
+        os.makedirs(cache.wheel_dir)
+        before = os.stat(cache.wheel_dir).st_mode
+        with cache.read_only():
+            self.assertEqual(os.stat(cache.wheel_dir).st_mode & 0o222, 0)
+        self.assertEqual(os.stat(cache.wheel_dir).st_mode, before)
+
+    def test_sandbox_env_is_offline(self):
+        from repo_tester import DependencyCache
+        env = DependencyCache(self.tmpdir).sandbox_env("/tmp/sb")
+        self.assertEqual(env["PIP_NO_INDEX"], "1")
+        self.assertEqual(env["CARGO_NET_OFFLINE"], "true")
+        self.assertEqual(env["PYTHONPATH"], os.path.join("/tmp/sb", ".cca-deps"))
+
+
+class TestBatchEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.tmpdir, "github_evaluations.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def read_log(self):
+        with open(self.log_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_target_spec(self):
+        from repo_tester import BatchTarget
+        t = BatchTarget.from_spec("owner/repo=" + self.tmpdir)
+        self.assertEqual((t.repo_name, t.path), ("owner/repo", self.tmpdir))
+        t = BatchTarget.from_spec(os.path.join(self.tmpdir, "checkout"))
+        self.assertEqual(t.repo_name, "local/checkout")
+
+    def test_parallel_run_streams_results(self):
+        from repo_tester import BatchEvaluator
+        import time
+        paths = [_make_python_repo(self.tmpdir, f"r{i}", "import time; time.sleep(0.5)")
+                 for i in range(4)]
+        seen = []
+        batch = BatchEvaluator(workers=4, eval_log_path=self.log_path)
+        start = time.monotonic()
+        results = batch.run([f"o/r{i}={p}" for i, p in enumerate(paths)], on_result=seen.append)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.5)  # sequential: >= 2s
+        self.assertEqual([r.repo_name for r in results], ["o/r0", "o/r1", "o/r2", "o/r3"])
+        self.assertTrue(all(r.test_success for r in results))
+        self.assertEqual(len(seen), 4)
+        entries = self.read_log()
+        self.assertEqual(sorted(e["repo"] for e in entries), ["o/r0", "o/r1", "o/r2", "o/r3"])
+        self.assertEqual({e["source"] for e in entries}, {"repo_tester"})
+
+    def test_checkout_is_not_modified(self):
+        from repo_tester import BatchEvaluator
+        proj = _make_python_repo(self.tmpdir, "clean")
+        before = sorted(os.listdir(proj))
+        BatchEvaluator(workers=1, eval_log_path=self.log_path).run([proj])
+        self.assertEqual(sorted(os.listdir(proj)), before)
+        self.assertFalse(os.path.exists(os.path.join(proj, "tests", "__pycache__")))
+
+    def test_deps_installed_offline_from_shared_wheelhouse(self):
+        from repo_tester import BatchEvaluator, DependencyCache
+        cache = DependencyCache(os.path.join(self.tmpdir, "cache"))
+        _make_wheel(cache.wheel_dir)
+        paths = [_make_python_repo(self.tmpdir, f"dep{i}",
+                                   "import tinydep; self.assertEqual(tinydep.VALUE, 42)",
+                                   extra={"requirements.txt": "tinydep\n"})
+                 for i in range(2)]
+        batch = BatchEvaluator(workers=2, dep_cache=cache, eval_log_path=self.log_path)
+        results = batch.run(paths)
+        for r in results:
+            self.assertTrue(r.test_success, r.warnings)
+            self.assertEqual(r.tests_found, 1)  # installed package files not counted
+        self.assertEqual(os.listdir(cache.wheel_dir), ["tinydep-1.0-py3-none-any.whl"])
+        self.assertTrue(os.access(cache.wheel_dir, os.W_OK))
+
+    def test_missing_dependency_warns(self):
+        from repo_tester import BatchEvaluator, DependencyCache
+        cache = DependencyCache(os.path.join(self.tmpdir, "cache"))
+        _make_wheel(cache.wheel_dir, dist="otherdep")
+        proj = _make_python_repo(self.tmpdir, "nodep", extra={"requirements.txt": "tinydep\n"})
+        [result] = BatchEvaluator(workers=1, dep_cache=cache, eval_log_path=self.log_path).run([proj])
+        [warning] = [w for w in result.warnings if "Dependency install failed" in w]
+        self.assertIn("ERROR:", warning)
+
+    def test_missing_checkout_logged_as_error(self):
+        from repo_tester import BatchEvaluator
+        [result] = BatchEvaluator(eval_log_path=self.log_path).run(
+            [os.path.join(self.tmpdir, "nope")])
+        self.assertTrue(result.errors)
+        self.assertEqual(self.read_log()[0]["repo"], "local/nope")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Tests for scan_pipeline.py — staged asyncio scans across several subreddits."""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(_THIS_DIR.parent))
+
+from autonomous_scanner import AutonomousScanner, cli_main
+from profiles import ScanRegistry
+from scan_pipeline import STAGES, ScanPipeline, ScanTarget, daily_targets
+
+
+def _posts(subreddit, n=8):
+    return [
+        {
+            "id": f"{subreddit}_{i}",
+            "title": f"My Claude Code workflow tip #{i}" if i % 3 else f"Funny meme #{i}",
+            "author": f"user_{i}",
+            "score": 300 - i * 20 if i != 5 else -3,
+            "upvote_ratio": 0.95,
+            "num_comments": 30 + i,
+            "created_utc": 1710000000 + i * 3600,
+            "flair": "showcase" if i % 4 == 0 else "",
+            "is_self": True,
+            "url": f"https://reddit.com/r/{subreddit}/comments/{subreddit}_{i}/",
+            "permalink": f"https://www.reddit.com/r/{subreddit}/comments/{subreddit}_{i}/t/",
+            "selftext_length": 800 + i * 50,
+            "subreddit": subreddit,
+        }
+        for i in range(n)
+    ]
+
+
+def _fake_fetch_top(delay=0.0):
+    def fetch(subreddit, limit, timeframe):
+        time.sleep(delay)
+        return _posts(subreddit)
+    return fetch
+
+
+TARGETS = [ScanTarget("ClaudeCode", "claudecode", "claude"),
+           ScanTarget("ClaudeAI", "claudeai", "claude"),
+           ScanTarget("vibecoding", "vibecoding", "dev")]
+
+
+class PipelineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def make_scanner(self, name="run"):
+        base = os.path.join(self.tmpdir, name)
+        os.makedirs(base, exist_ok=True)
+        return AutonomousScanner(
+            registry_path=os.path.join(base, "scan_registry.json"),
+            kill_switch_path=os.path.join(base, ".cca-autonomous-pause"),
+            state_path=os.path.join(base, "autonomous_state.json"),
+            findings_path=os.path.join(base, "FINDINGS_LOG.md"),
+        )
+
+
+class TestPipelineResults(PipelineTestCase):
+
+    def test_matches_sequential_execute_scan(self):
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()):
+            run = ScanPipeline(self.make_scanner()).run(TARGETS)
+            expected = [self.make_scanner(t.slug).execute_scan(t.subreddit, t.slug, t.domain)
+                        for t in TARGETS]
+        self.assertEqual([r.report.subreddit for r in run.results],
+                         ["ClaudeCode", "ClaudeAI", "vibecoding"])
+        for got, want in zip(run.results, expected):
+            self.assertEqual(got.needles, want.needles)
+            self.assertEqual(got.maybes, want.maybes)
+            self.assertEqual(got.hay, want.hay)
+            self.assertEqual(got.report.posts_blocked, want.report.posts_blocked)
+
+    def test_stage_metrics_on_reports_and_run(self):
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()):
+            run = ScanPipeline(self.make_scanner()).run(TARGETS)
+        report = run.results[0].report
+        self.assertEqual(list(report.stage_metrics), list(STAGES))
+        self.assertEqual(report.stage_metrics["fetch"]["posts"], 8)
+        self.assertEqual(report.stage_metrics["classify"]["posts"], report.posts_safe)
+        self.assertEqual(run.stages["fetch"].jobs, 3)
+        self.assertEqual(run.stages["fetch"].posts, 24)
+        self.assertIn("Stage times:", report.summary(include_apf=False))
+        self.assertIn("posts/s", run.summary())
+        json.dumps(run.to_dict())
+
+    def test_records_scans_in_gate_and_registry(self):
+        scanner = self.make_scanner()
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()):
+            ScanPipeline(scanner).run(TARGETS)
+        self.assertEqual(scanner.safety_gate.scans_this_session, 3)
+        registry = ScanRegistry(scanner.prioritizer._registry._path)
+        self.assertEqual(set(registry.list_scans()), {"claudecode", "claudeai", "vibecoding"})
+
+    def test_output_dir_gets_one_file_per_sub(self):
+        out = os.path.join(self.tmpdir, "out")
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()):
+            ScanPipeline(self.make_scanner(), output_dir=out).run(TARGETS)
+        self.assertEqual(sorted(os.listdir(out)),
+                         ["claudeai.json", "claudecode.json", "vibecoding.json"])
+
+    def test_daily_targets_use_hot_and_rising(self):
+        scanner = self.make_scanner()
+        with patch("autonomous_scanner.fetch_hot_posts", side_effect=lambda s, n: _posts(s)[:4]), \
+             patch("autonomous_scanner.fetch_rising_posts", side_effect=lambda s, n: _posts(s)[2:6]):
+            run = ScanPipeline(scanner).run(daily_targets(scanner, ["ClaudeCode"]))
+        self.assertEqual(run.results[0].report.posts_fetched, 6)
+        self.assertFalse(os.path.exists(scanner.prioritizer._registry._path))
+
+
+class TestPipelineConcurrency(PipelineTestCase):
+
+    def test_listing_fetches_overlap(self):
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top(0.2)):
+            run = ScanPipeline(self.make_scanner(), fetch_workers=3).run(TARGETS)
+        self.assertEqual(len(run.results), 3)
+        self.assertLess(run.wall_seconds, 0.5)  # sequential: >= 0.6s
+        self.assertGreaterEqual(run.stages["fetch"].seconds, 0.6)
+
+    def test_deep_read_only_safe_triaged_posts(self):
+        calls = []
+        lock = threading.Lock()
+
+        def reader(subreddit, post_id):
+            with lock:
+                calls.append(post_id)
+            if post_id.endswith("_1"):
+                raise OSError("timed out")
+            return f"body of {post_id}"
+
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()):
+            run = ScanPipeline(self.make_scanner(), deep_read_count=3,
+                               deep_reader=reader).run(TARGETS[:1])
+        result = run.results[0]
+        safe = result.needles + result.maybes + result.hay
+        read = [p for p in safe if "deep_read" in p]
+        self.assertEqual(len(calls), 3)
+        self.assertNotIn("ClaudeCode_5", calls)  # negative score: blocked by safety
+        self.assertEqual(len(read), 2)
+        self.assertEqual([p["deep_read_error"] for p in safe if "deep_read_error" in p],
+                         ["timed out"])
+        self.assertEqual(result.report.stage_metrics["deep_read"]["posts"], 3)
+
+    def test_fetch_error_skips_only_that_sub(self):
+        def fetch(subreddit, limit, timeframe):
+            if subreddit == "ClaudeAI":
+                raise ValueError("bad listing")
+            return _posts(subreddit)
+
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=fetch):
+            run = ScanPipeline(self.make_scanner()).run(TARGETS)
+        self.assertEqual([r.report.subreddit for r in run.results], ["ClaudeCode", "vibecoding"])
+        self.assertEqual(run.skipped, [{"subreddit": "ClaudeAI", "reason": "fetch: bad listing"}])
+        self.assertEqual(run.stages["fetch"].errors, 1)
+
+
+class TestPipelineSafety(PipelineTestCase):
+
+    def test_kill_switch_blocks_run(self):
+        scanner = self.make_scanner()
+        Path(scanner.safety_gate.kill_switch_path).touch()
+        with patch("autonomous_scanner.fetch_top_posts") as fetch:
+            run = ScanPipeline(scanner).run(TARGETS)
+        fetch.assert_not_called()
+        self.assertEqual(run.results, [])
+        self.assertEqual(len(run.skipped), 3)
+
+    def test_session_budget_limits_targets(self):
+        scanner = self.make_scanner()
+        scanner.safety_gate.scans_this_session = scanner.safety_gate.max_scans_per_session - 2
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()):
+            run = ScanPipeline(scanner).run(TARGETS)
+        self.assertEqual(len(run.results), 2)
+        self.assertEqual(run.skipped, [{"subreddit": "vibecoding", "reason": "session scan limit"}])
+
+
+class TestOvernightCli(PipelineTestCase):
+
+    def test_overnight_json(self):
+        base = os.path.join(self.tmpdir, "cli")
+        os.makedirs(base)
+        args = ["overnight", "--count", "2", "--json",
+                "--registry", os.path.join(base, "scan_registry.json"),
+                "--state", os.path.join(base, "state.json"),
+                "--kill-switch", os.path.join(base, "pause"),
+                "--findings", os.path.join(base, "FINDINGS_LOG.md")]
+        buf = io.StringIO()
+        with patch("autonomous_scanner.fetch_top_posts", side_effect=_fake_fetch_top()), \
+             patch("sys.stdout", buf):
+            cli_main(args)
+        out = json.loads(buf.getvalue())
+        self.assertEqual(len(out["results"]), 2)
+        self.assertEqual(set(out["stages"]), set(STAGES))
+
+
+if __name__ == "__main__":
+    unittest.main()
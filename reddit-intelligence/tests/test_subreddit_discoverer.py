@@ -174,8 +174,7 @@ class TestDiscoverSubreddits(unittest.TestCase):
         return {"data": {"children": children}}
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")  # Don't actually sleep in tests
-    def test_basic_discovery(self, mock_sleep, mock_fetch):
+    def test_basic_discovery(self, mock_fetch):
         mock_fetch.return_value = self._mock_response([
             {"name": "NewAISub", "subs": 50000, "desc": "AI agent tools and Claude code"},
         ])
@@ -184,8 +183,7 @@ class TestDiscoverSubreddits(unittest.TestCase):
         self.assertIsInstance(results[0], SubredditCandidate)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_filters_nsfw(self, mock_sleep, mock_fetch):
+    def test_filters_nsfw(self, mock_fetch):
         mock_fetch.return_value = self._mock_response([
             {"name": "NSFWSub", "subs": 50000, "desc": "test", "nsfw": True},
         ])
@@ -194,8 +192,7 @@ class TestDiscoverSubreddits(unittest.TestCase):
         self.assertEqual(len(nsfw), 0)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_filters_tiny_subs(self, mock_sleep, mock_fetch):
+    def test_filters_tiny_subs(self, mock_fetch):
         mock_fetch.return_value = self._mock_response([
             {"name": "TinySub", "subs": 50, "desc": "too small"},
         ])
@@ -204,8 +201,7 @@ class TestDiscoverSubreddits(unittest.TestCase):
         self.assertEqual(len(tiny), 0)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_deduplicates(self, mock_sleep, mock_fetch):
+    def test_deduplicates(self, mock_fetch):
         mock_fetch.return_value = self._mock_response([
             {"name": "DupeSub", "subs": 50000, "desc": "test"},
             {"name": "DupeSub", "subs": 50000, "desc": "test"},
@@ -215,8 +211,7 @@ class TestDiscoverSubreddits(unittest.TestCase):
         self.assertLessEqual(dupe_count, 1)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_marks_tracked_subs(self, mock_sleep, mock_fetch):
+    def test_marks_tracked_subs(self, mock_fetch):
         mock_fetch.return_value = self._mock_response([
             {"name": "ClaudeCode", "subs": 100000, "desc": "Claude Code"},
         ])
@@ -226,8 +221,7 @@ class TestDiscoverSubreddits(unittest.TestCase):
             self.assertTrue(tracked[0].already_tracked)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_sorted_by_relevance(self, mock_sleep, mock_fetch):
+    def test_sorted_by_relevance(self, mock_fetch):
         mock_fetch.return_value = self._mock_response([
             {"name": "LowRel", "subs": 5000, "desc": "cats"},
             {"name": "HighRel", "subs": 100000, "desc": "Claude AI agent automation workflow MCP hook"},
@@ -237,24 +231,21 @@ class TestDiscoverSubreddits(unittest.TestCase):
             self.assertGreaterEqual(results[0].relevance_score, results[1].relevance_score)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_respects_top_n(self, mock_sleep, mock_fetch):
+    def test_respects_top_n(self, mock_fetch):
         subs = [{"name": f"Sub{i}", "subs": 10000, "desc": "test"} for i in range(20)]
         mock_fetch.return_value = self._mock_response(subs)
         results = discover_subreddits(domains=["claude"], top_n=3)
         self.assertLessEqual(len(results), 3)
 
     @patch("subreddit_discoverer._fetch_json")
-    @patch("subreddit_discoverer.time.sleep")
-    def test_handles_api_failure(self, mock_sleep, mock_fetch):
+    def test_handles_api_failure(self, mock_fetch):
         mock_fetch.return_value = None
         results = discover_subreddits(domains=["claude"], top_n=5)
         self.assertEqual(len(results), 0)
 
     def test_invalid_domain_ignored(self):
         # Should not crash on unknown domain
-        with patch("subreddit_discoverer._fetch_json") as mock_fetch, \
-             patch("subreddit_discoverer.time.sleep"):
+        with patch("subreddit_discoverer._fetch_json") as mock_fetch:
             mock_fetch.return_value = None
             results = discover_subreddits(domains=["nonexistent"], top_n=5)
             self.assertEqual(len(results), 0)
@@ -24,6 +24,8 @@ Stdlib only. No external dependencies.
 import math
 from typing import Optional
 
+from rolling_stats import RollingMoments
+
 
 # ---------------------------------------------------------------------------
 # Logit Transform
@@ -219,17 +221,25 @@ class RealizedVolEstimator:
         """
         if len(prices) < window:
             return []
+        if window <= 1:
+            return [{"timestamp": ts, "vol": 0.0, "window": window}
+                    for ts in timestamps[:len(prices)]]
 
+        # Each window of `window` prices spans window-1 log-odds changes;
+        # slide an O(1)-update accumulator over the change series.
+        changes = RollingMoments(window - 1)
         results = []
-        for i in range(window, len(prices) + 1):
-            chunk_prices = prices[i - window:i]
-            chunk_ts = timestamps[i - window:i]
-            vol = self.estimate(chunk_prices, chunk_ts)
-            results.append({
-                "timestamp": chunk_ts[-1],
-                "vol": vol,
-                "window": window,
-            })
+        prev = LogitTransform.logit(LogitTransform.clamp(prices[0]))
+        for i in range(1, len(prices)):
+            x = LogitTransform.logit(LogitTransform.clamp(prices[i]))
+            changes.push(x - prev)
+            prev = x
+            if i >= window - 1:
+                results.append({
+                    "timestamp": timestamps[i],
+                    "vol": changes.std(ddof=1) if changes.count > 1 else 0.0,
+                    "window": window,
+                })
 
         return results
 
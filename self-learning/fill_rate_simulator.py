@@ -24,11 +24,12 @@ import json
 import math
 import os
 import random
-import sqlite3
 import statistics
 from dataclasses import dataclass, field
 from typing import Optional
 
+from trade_repository import get_repository
+
 
 # ── Data classes ──────────────────────────────────────────────────────────────
 
@@ -167,16 +168,10 @@ class FillRateSimulator:
         if not os.path.exists(db_path):
             raise FileNotFoundError(f"DB not found: {db_path}")
 
-        conn = sqlite3.connect(db_path)
-        try:
-            rows = conn.execute(
-                "SELECT price_cents FROM trades WHERE strategy = ? AND is_paper = 0 AND price_cents BETWEEN 85 AND 99",
-                (strategy,),
-            ).fetchall()
-        finally:
-            conn.close()
-
-        prices = [r[0] for r in rows]
+        trades = get_repository(db_path).trades(
+            strategy=strategy, live_only=True, min_price=85, max_price=99
+        )
+        prices = list(trades.price_cents)
 
         if not prices:
             # No data — use conservative defaults
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+findings_index.py — Incremental SQLite index over FINDINGS_LOG.md
+
+FINDINGS_LOG.md is an append-mostly markdown log of ~1k one-line entries:
+
+    [2026-03-20] [BUILD] [Frontier 1: Memory] "Title" (87pts, ...) — desc — https://...
+
+Several readers used to re-read and regex the whole file on every call:
+the resurfacer hook (every prompt, several queries each), hit_rate_tracker,
+mt_originator and the reddit-intelligence dedup step. This module owns the
+one line parser and keeps the parsed entries in a SQLite side file so those
+readers share a single incremental parse and query it instead.
+
+Tables:
+- findings       one row per entry line (raw tag string, parsed tags,
+                 resurfacer title/description/url, mt_originator headline,
+                 quoted title, points)
+- finding_tags   (finding_id, tag) for Frontier N / MT-N / category lookups
+- findings_fts   FTS5 trigram index over title, description and tags for
+                 substring keyword search (LIKE-style fallback when FTS5 or
+                 the trigram tokenizer is unavailable)
+- post_ids       reddit post ids seen anywhere in the log (scanner dedup)
+- meta           schema version + checkpoint
+
+Persistence: <log>.index.sqlite next to the log (in-memory when that
+directory is not writable). The checkpoint is the byte offset of the last
+fully parsed line plus a hash of everything before it. refresh() costs one
+stat() when the log is unchanged; otherwise it re-hashes the indexed prefix
+and parses only the appended bytes. Any edit to earlier lines, a shrink, or
+an INDEX_SCHEMA_VERSION bump triggers a full rebuild. A trailing line
+without a newline is indexed provisionally and re-parsed on the next
+refresh.
+
+Usage:
+    from findings_index import FindingsIndex
+
+    idx = FindingsIndex.for_path("FINDINGS_LOG.md")
+    idx.match(frontier=3, keywords=["compaction"])   # refreshes, then queries
+    idx.rows(verdicts={"BUILD", "ADAPT"})
+    idx.post_ids()
+
+CLI:
+    python3 self-learning/findings_index.py              # stats for FINDINGS_LOG.md
+    python3 self-learning/findings_index.py rebuild
+    python3 self-learning/findings_index.py search compaction --frontier 3
+
+Stdlib only. No external dependencies.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+INDEX_SCHEMA_VERSION = 1
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FINDINGS_LOG_PATH = os.path.join(PROJECT_ROOT, "FINDINGS_LOG.md")
+
+# Verdict sort order for match() results (BUILD first)
+VERDICT_PRIORITY = {
+    "BUILD": 0,
+    "ADAPT": 1,
+    "REFERENCE": 2,
+    "REFERENCE-PERSONAL": 3,
+    "SKIP": 4,
+}
+
+
+# ── Line parsing ─────────────────────────────────────────────────────────────
+
+# Pattern: [date] [VERDICT] [tags] rest. Tags and rest may be empty here;
+# readers that require them filter on the parsed fields.
+ENTRY_RE = re.compile(
+    r'^\[(\d{4}-\d{2}-\d{2})\]\s+'     # date
+    r'\[([A-Z][-A-Z]*)\]\s+'            # verdict (BUILD, ADAPT, REFERENCE, etc.)
+    r'\[([^\]]*)\]'                      # tags in brackets
+    r'(?:\s+(.*))?$'                     # rest (title + description + url)
+)
+
+# Reddit post ids anywhere on a line (used for scan dedup)
+POST_ID_RE = re.compile(r"https://www\.reddit\.com/r/\w+/comments/(\w+)")
+
+_FRONTIER_RE = re.compile(r'Frontier\s+(\d+)')
+_MT_RE = re.compile(r'MT-(\d+)')
+_URL_TAIL_RE = re.compile(r'https?://\S+$')
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_POINTS_RE = re.compile(r'\((\d+)pts?')
+
+# Common tag keywords that map to known categories
+_TAG_CATEGORIES = {
+    "Trading": "Trading",
+    "Kalshi": "Trading",
+    "Memory": "Frontier 1",
+    "Spec": "Frontier 2",
+    "Context": "Frontier 3",
+    "Agent": "Frontier 4",
+    "Usage": "Frontier 5",
+}
+
+
+def parse_tags(raw_tags):
+    """Extract structured tags from a raw tag string.
+
+    "Frontier 5: Usage Dashboard + Frontier 3: Context" -> ["Frontier 5", "Frontier 3"]
+    "MT-17: Design" -> ["MT-17"]
+    "Trading/Kalshi" -> ["Trading"]
+    Anything unrecognised is kept as-is.
+    """
+    tags = []
+    for m in _FRONTIER_RE.finditer(raw_tags):
+        tags.append(f"Frontier {m.group(1)}")
+    for m in _MT_RE.finditer(raw_tags):
+        tags.append(f"MT-{m.group(1)}")
+    lowered = raw_tags.lower()
+    for keyword, tag in _TAG_CATEGORIES.items():
+        if keyword.lower() in lowered and tag not in tags:
+            tags.append(tag)
+    if not tags:
+        tags.append(raw_tags.strip())
+    return tags
+
+
+def parse_body(body):
+    """Split the text after the tags into (title, description, url).
+
+    'CShip — Rust statusline for CC — https://reddit.com/...' ->
+    ('CShip', 'Rust statusline for CC', 'https://reddit.com/...')
+    The description falls back to the title when there is no ' — '.
+    A trailing URL counts whether or not a dash precedes it (the
+    resurfacer's rule); mt_originator and principle_seeder used to
+    require ' — url' and left url empty for the few bare-URL entries.
+    """
+    url = ""
+    url_match = _URL_TAIL_RE.search(body.strip())
+    if url_match:
+        url = url_match.group(0)
+        body = body[:url_match.start()].strip()
+        body = body.rstrip(" —-").strip()
+
+    parts = body.split(" — ", 1)
+    title = parts[0].strip()
+    description = parts[1].strip() if len(parts) > 1 else title
+    return title.strip('"'), description, url
+
+
+def _headline(rest, url):
+    """Short title used by mt_originator: text before the first dash, <=120 chars."""
+    if url and rest.endswith(url):
+        rest = rest[:-len(url)].rstrip(" —-")
+    headline = rest.split("—")[0].strip().rstrip(".")
+    if len(headline) > 120:
+        headline = headline[:117] + "..."
+    return headline
+
+
+def parse_line(line):
+    """Parse one FINDINGS_LOG.md line into a dict, or None if it isn't an entry.
+
+    Keys: date, verdict, frontier (raw tag string), tags, rest, title,
+    description, url, headline, quoted_title, points.
+    """
+    m = ENTRY_RE.match(line.strip())
+    if not m:
+        return None
+    rest = (m.group(4) or "").strip()
+    title, description, url = parse_body(rest)
+    quoted = _QUOTED_RE.search(rest)
+    points = _POINTS_RE.search(rest)
+    return {
+        "date": m.group(1),
+        "verdict": m.group(2),
+        "frontier": m.group(3),
+        "tags": parse_tags(m.group(3)),
+        "rest": rest,
+        "title": title,
+        "description": description,
+        "url": url,
+        "headline": _headline(rest, url),
+        "quoted_title": quoted.group(1) if quoted else None,
+        "points": int(points.group(1)) if points else 0,
+    }
+
+
+def parse_text(text):
+    """Parse a whole log into entry dicts (no index; for in-memory text)."""
+    entries = []
+    for line in text.splitlines():
+        entry = parse_line(line)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+# ── Index ────────────────────────────────────────────────────────────────────
+
+_COLUMNS = ("date", "verdict", "frontier", "tags", "rest", "title",
+            "description", "url", "headline", "quoted_title", "points")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    frontier TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    rest TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    url TEXT NOT NULL,
+    headline TEXT NOT NULL,
+    quoted_title TEXT,
+    points INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_verdict ON findings(verdict);
+CREATE INDEX IF NOT EXISTS findings_offset ON findings(offset);
+CREATE TABLE IF NOT EXISTS finding_tags (
+    finding_id INTEGER NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS finding_tags_tag ON finding_tags(tag, finding_id);
+CREATE TABLE IF NOT EXISTS post_ids (
+    post_id TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5(
+    title, description, frontier,
+    content='findings', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS findings_fts_ai AFTER INSERT ON findings BEGIN
+    INSERT INTO findings_fts(rowid, title, description, frontier)
+    VALUES (new.id, new.title, new.description, new.frontier);
+END;
+CREATE TRIGGER IF NOT EXISTS findings_fts_ad AFTER DELETE ON findings BEGIN
+    INSERT INTO findings_fts(findings_fts, rowid, title, description, frontier)
+    VALUES ('delete', old.id, old.title, old.description, old.frontier);
+END;
+"""
+
+_DROP = """
+DROP TRIGGER IF EXISTS findings_fts_ai;
+DROP TRIGGER IF EXISTS findings_fts_ad;
+DROP TABLE IF EXISTS findings_fts;
+DROP TABLE IF EXISTS finding_tags;
+DROP TABLE IF EXISTS post_ids;
+DROP TABLE IF EXISTS findings;
+DROP TABLE IF EXISTS meta;
+"""
+
+# Trigram FTS needs at least 3 characters per phrase
+_FTS_MIN_CHARS = 3
+
+
+class FindingsIndex:
+    """Parsed FINDINGS_LOG.md entries in SQLite, kept current from the log."""
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, log_path=FINDINGS_LOG_PATH, db_path=None):
+        self.log_path = os.fspath(log_path)
+        self.db_path = os.fspath(db_path) if db_path else self.log_path + ".index.sqlite"
+        self._lock = threading.RLock()
+        self._stat_key = None
+        try:
+            self._conn = self._connect(self.db_path)
+        except sqlite3.OperationalError:
+            # Read-only checkout or missing directory: index in memory only
+            self.db_path = ":memory:"
+            self._conn = self._connect(self.db_path)
+        self.fts = self._has_fts()
+
+    @classmethod
+    def for_path(cls, log_path=FINDINGS_LOG_PATH, db_path=None):
+        """Process-wide shared index for a log (one connection per log path)."""
+        key = (os.path.abspath(os.fspath(log_path)),
+               os.path.abspath(os.fspath(db_path)) if db_path else None)
+        with cls._instances_lock:
+            inst = cls._instances.get(key)
+            if inst is None:
+                inst = cls._instances[key] = cls(log_path, db_path)
+            return inst
+
+    def _connect(self, path):
+        conn = sqlite3.connect(path, timeout=10, isolation_level=None,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = None
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'meta'").fetchone():
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+                version = row[0] if row else None
+            if version != str(INDEX_SCHEMA_VERSION):
+                for stmt in _split_sql(_DROP):
+                    conn.execute(stmt)
+                self._create(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _create(self, conn):
+        for stmt in _split_sql(_SCHEMA):
+            conn.execute(stmt)
+        try:
+            for stmt in _split_sql(_FTS_SCHEMA):
+                conn.execute(stmt)
+        except sqlite3.OperationalError:
+            pass  # no FTS5 / trigram tokenizer: keyword search uses instr()
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("schema_version", str(INDEX_SCHEMA_VERSION)),
+             ("offset", "0"), ("prefix_hash", "")])
+
+    def _has_fts(self):
+        return self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'findings_fts'").fetchone() is not None
+
+    # ── Maintenance ──────────────────────────────────────────────────────────
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                           (key, str(value)))
+
+    def _clear(self):
+        # Row-by-row deletes keep the external-content FTS table in sync
+        self._conn.execute("DELETE FROM findings")
+        self._conn.execute("DELETE FROM finding_tags")
+        self._conn.execute("DELETE FROM post_ids")
+        self._set_meta("offset", 0)
+        self._set_meta("prefix_hash", "")
+
+    def _drop_from(self, offset):
+        """Remove rows parsed at or after a byte offset (provisional tail)."""
+        ids = [r[0] for r in self._conn.execute(
+            "SELECT id FROM findings WHERE offset >= ?", (offset,))]
+        if ids:
+            self._conn.executemany("DELETE FROM finding_tags WHERE finding_id = ?",
+                                   [(i,) for i in ids])
+            self._conn.execute("DELETE FROM findings WHERE offset >= ?", (offset,))
+        self._conn.execute("DELETE FROM post_ids WHERE offset >= ?", (offset,))
+
+    def _apply_line(self, raw, pos):
+        try:
+            line = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            line = raw.decode("utf-8", errors="replace")
+        for m in POST_ID_RE.finditer(line):
+            self._conn.execute("INSERT OR IGNORE INTO post_ids (post_id, offset) VALUES (?, ?)",
+                               (m.group(1), pos))
+        entry = parse_line(line)
+        if entry is None:
+            return
+        values = [json.dumps(entry["tags"]) if c == "tags" else entry[c] for c in _COLUMNS]
+        cur = self._conn.execute(
+            f"INSERT INTO findings (offset, {', '.join(_COLUMNS)}) "
+            f"VALUES (?{', ?' * len(_COLUMNS)})",
+            [pos] + values)
+        self._conn.executemany("INSERT INTO finding_tags (finding_id, tag) VALUES (?, ?)",
+                               [(cur.lastrowid, t) for t in dict.fromkeys(entry["tags"])])
+
+    def refresh(self):
+        """Bring the index up to date with the log file.
+
+        Cost is one stat() when nothing changed, otherwise a hash of the
+        indexed prefix plus parsing of the bytes appended since the last
+        checkpoint.
+        """
+        with self._lock:
+            try:
+                st = os.stat(self.log_path)
+            except OSError:
+                if self._stat_key is not None or self._meta("offset") != "0":
+                    self._write(lambda: self._clear())
+                    self._stat_key = None
+                return self
+
+            stat_key = (st.st_size, st.st_mtime_ns, st.st_ino)
+            if stat_key == self._stat_key:
+                return self
+
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+            self._write(lambda: self._apply(data))
+            self._stat_key = stat_key
+        return self
+
+    def _write(self, fn):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            fn()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _apply(self, data):
+        # Checkpoint is re-read inside the write lock so concurrent
+        # processes sharing the side file never double-apply a range.
+        offset = int(self._meta("offset") or 0)
+        if offset:
+            prefix_ok = (len(data) >= offset and
+                         hashlib.sha1(data[:offset]).hexdigest() == self._meta("prefix_hash"))
+            if not prefix_ok:
+                self._clear()
+                offset = 0
+        self._drop_from(offset)
+
+        chunk = data[offset:]
+        pos = offset
+        for raw in chunk.split(b"\n"):
+            if raw.strip():
+                self._apply_line(raw.rstrip(b"\r"), pos)
+            pos += len(raw) + 1
+
+        # Only complete lines advance the checkpoint; a partial trailing
+        # line was indexed above and is dropped/re-parsed next time.
+        new_offset = offset + chunk.rfind(b"\n") + 1
+        if new_offset != offset:
+            self._set_meta("offset", new_offset)
+            self._set_meta("prefix_hash", hashlib.sha1(data[:new_offset]).hexdigest())
+
+    def rebuild(self):
+        """Drop everything and re-parse the whole log."""
+        with self._lock:
+            self._write(lambda: self._clear())
+            self._stat_key = None
+            return self.refresh()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+        with FindingsIndex._instances_lock:
+            for key, inst in list(FindingsIndex._instances.items()):
+                if inst is self:
+                    del FindingsIndex._instances[key]
+
+    # ── Queries (each refreshes first) ───────────────────────────────────────
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            self.refresh()
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _row_dict(row):
+        d = dict(row)
+        d["tags"] = json.loads(d["tags"])
+        return d
+
+    def rows(self, verdicts=None):
+        """All entries in file order, optionally limited to a verdict set."""
+        sql = "SELECT * FROM findings"
+        params = []
+        if verdicts is not None:
+            verdicts = list(verdicts)
+            sql += f" WHERE verdict IN ({', '.join('?' * len(verdicts))})"
+            params = verdicts
+        return [self._row_dict(r) for r in self._query(sql + " ORDER BY id", params)]
+
+    def _keyword_clause(self, keywords):
+        clauses, params, phrases = [], [], []
+        for kw in keywords:
+            if self.fts and len(kw) >= _FTS_MIN_CHARS:
+                phrases.append('"' + kw.replace('"', '""') + '"')
+            else:
+                clauses.append(
+                    "instr(lower(f.title || ' ' || f.description || ' ' || f.frontier), ?) > 0")
+                params.append(kw.lower())
+        if phrases:
+            clauses.append("f.id IN (SELECT rowid FROM findings_fts WHERE findings_fts MATCH ?)")
+            params.append(" OR ".join(phrases))
+        return clauses, params
+
+    def match(self, *, frontier=None, keywords=None, mt_task=None,
+              include_skip=False, limit=None):
+        """Entries matching any of the filters, ordered by verdict priority.
+
+        frontier=0 matches every entry; otherwise frontier / mt_task match the
+        parsed tags and keywords are case-insensitive substrings of title,
+        description or raw tags. Entries without tags or text are skipped.
+        """
+        clauses, params = [], []
+        if frontier == 0:
+            clauses.append("1")
+        elif frontier is not None:
+            clauses.append("f.id IN (SELECT finding_id FROM finding_tags WHERE tag = ?)")
+            params.append(f"Frontier {frontier}")
+        if mt_task is not None:
+            clauses.append("f.id IN (SELECT finding_id FROM finding_tags WHERE tag = ?)")
+            params.append(mt_task)
+        if keywords:
+            kw_clauses, kw_params = self._keyword_clause(keywords)
+            clauses += kw_clauses
+            params += kw_params
+        if not clauses:
+            return []
+
+        order = " ".join(f"WHEN ? THEN {p}" for p in VERDICT_PRIORITY.values())
+        sql = (
+            "SELECT f.* FROM findings f WHERE f.frontier != '' AND f.rest != ''"
+            + ("" if include_skip else " AND f.verdict != 'SKIP'")
+            + f" AND ({' OR '.join(clauses)})"
+            + f" ORDER BY CASE f.verdict {order} ELSE {len(VERDICT_PRIORITY)} END, f.id"
+        )
+        params += list(VERDICT_PRIORITY)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._row_dict(r) for r in self._query(sql, params)]
+
+    def post_ids(self):
+        """Set of reddit post ids referenced anywhere in the log."""
+        return {r[0] for r in self._query("SELECT post_id FROM post_ids")}
+
+    def verdict_counts(self):
+        return {r[0]: r[1] for r in self._query(
+            "SELECT verdict, COUNT(*) FROM findings GROUP BY verdict ORDER BY verdict")}
+
+    def stats(self):
+        counts = self.verdict_counts()
+        with self._lock:
+            offset = int(self._meta("offset") or 0)
+        return {
+            "log_path": self.log_path,
+            "db_path": self.db_path,
+            "entries": sum(counts.values()),
+            "by_verdict": counts,
+            "post_ids": len(self.post_ids()),
+            "indexed_bytes": offset,
+            "fts": self.fts,
+        }
+
+
+def _split_sql(script):
+    """Split a schema script into statements (trigger bodies kept whole)."""
+    statements, current = [], []
+    for line in script.strip().splitlines():
+        current.append(line)
+        text = "\n".join(current).strip()
+        if text.endswith(";") and (not text.upper().startswith("CREATE TRIGGER")
+                                   or text.upper().endswith("END;")):
+            statements.append(text)
+            current = []
+    return statements
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Incremental FINDINGS_LOG.md index")
+    parser.add_argument("command", nargs="?", default="stats",
+                        choices=["stats", "rebuild", "search"])
+    parser.add_argument("keywords", nargs="*", help="Keywords for search")
+    parser.add_argument("--log", default=FINDINGS_LOG_PATH, help="Path to FINDINGS_LOG.md")
+    parser.add_argument("--frontier", type=int, default=None)
+    parser.add_argument("--mt", default=None, help="MT task tag, e.g. MT-17")
+    parser.add_argument("--include-skip", action="store_true")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    idx = FindingsIndex.for_path(args.log)
+    if args.command == "rebuild":
+        idx.rebuild()
+    if args.command == "search":
+        rows = idx.match(frontier=args.frontier, keywords=args.keywords or None,
+                         mt_task=args.mt, include_skip=args.include_skip, limit=args.limit)
+        for r in rows:
+            print(f"[{r['date']}] [{r['verdict']}] {r['title']}")
+        return 0
+    print(json.dumps(idx.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
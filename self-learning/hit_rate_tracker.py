@@ -23,6 +23,9 @@ import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from findings_index import FindingsIndex
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 FINDINGS_LOG_PATH = PROJECT_ROOT / "FINDINGS_LOG.md"
 
@@ -85,45 +88,23 @@ def parse_findings(log_path: Path = FINDINGS_LOG_PATH) -> list[dict]:
     """Parse FINDINGS_LOG.md into structured entries.
 
     Each entry starts with a date [YYYY-MM-DD] and verdict [VERDICT].
+    Entries come from the shared FindingsIndex, so repeated calls only
+    re-parse newly appended lines.
     """
     if not log_path.exists():
         return []
 
-    entries = []
-    content = log_path.read_text()
-
     # Pattern: [date] [VERDICT] [frontier] "title" (score, comments, subreddit)
-    line_pattern = re.compile(
-        r"^\[(\d{4}-\d{2}-\d{2})\]\s+\[([A-Z\-]+)\]\s+\[([^\]]*)\]\s+(.*)",
-        re.MULTILINE,
-    )
-
-    for m in line_pattern.finditer(content):
-        date = m.group(1)
-        verdict = m.group(2)
-        frontier_tag = m.group(3)
-        rest = m.group(4)
-
-        if verdict not in VALID_VERDICTS:
-            continue
-
-        # Extract title (in quotes)
-        title_m = re.search(r'"([^"]+)"', rest)
-        title = title_m.group(1) if title_m else rest[:60]
-
-        # Extract score
-        score_m = re.search(r"\((\d+)pts?", rest)
-        score = int(score_m.group(1)) if score_m else 0
-
-        entries.append({
-            "date": date,
-            "verdict": verdict,
-            "frontier": frontier_tag,
-            "title": title,
-            "score": score,
-        })
-
-    return entries
+    return [
+        {
+            "date": row["date"],
+            "verdict": row["verdict"],
+            "frontier": row["frontier"],
+            "title": row["quoted_title"] or row["rest"][:60],
+            "score": row["points"],
+        }
+        for row in FindingsIndex.for_path(log_path).rows(verdicts=VALID_VERDICTS)
+    ]
 
 
 def compute_apf(entries: list[dict]) -> dict:
@@ -35,9 +35,14 @@ import sys
 import os
 import json
 import argparse
+import copy
+import math
 from collections import Counter
 from datetime import datetime, timezone
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from journal_index import JournalIndex, read_tail
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 JOURNAL_PATH = os.path.join(SCRIPT_DIR, "journal.jsonl")
 STRATEGY_PATH = os.path.join(SCRIPT_DIR, "strategy.json")
@@ -108,6 +113,11 @@ def _append_entry(entry):
         f.write(json.dumps(entry, separators=(",", ":")) + "\n")
 
 
+def _index():
+    """Materialized aggregates for the current JOURNAL_PATH, caught up to EOF."""
+    return JournalIndex.for_path(JOURNAL_PATH).refresh()
+
+
 def _load_strategy():
     """Load strategy config."""
     if not os.path.exists(STRATEGY_PATH):
@@ -156,51 +166,34 @@ def log_event(event_type, session_id=None, domain="general", outcome=None,
     entry = {k: v for k, v in entry.items() if v is not None}
 
     _append_entry(entry)
+    _index()
     return entry
 
 
 def get_stats():
     """Aggregate journal stats."""
-    entries = _load_journal()
-    if not entries:
+    idx = _index()
+    d = idx.data
+    if not d["total_entries"]:
         return {"total_entries": 0}
 
-    stats = {
-        "total_entries": len(entries),
-        "by_event_type": {},
-        "by_domain": {},
-        "by_outcome": {},
-        "sessions_logged": set(),
-        "first_entry": entries[0].get("timestamp", "unknown"),
-        "last_entry": entries[-1].get("timestamp", "unknown"),
-        "total_learnings": 0,
+    return {
+        "total_entries": d["total_entries"],
+        "by_event_type": dict(d["by_event_type"]),
+        "by_domain": dict(d["by_domain"]),
+        "by_outcome": dict(d["by_outcome"]),
+        "sessions_logged": sorted(idx.sessions(), key=lambda x: str(x)),
+        "first_entry": d["first_entry"],
+        "last_entry": d["last_entry"],
+        "total_learnings": d["total_learnings"],
     }
 
-    for e in entries:
-        et = e.get("event_type", "unknown")
-        stats["by_event_type"][et] = stats["by_event_type"].get(et, 0) + 1
-
-        d = e.get("domain", "unknown")
-        stats["by_domain"][d] = stats["by_domain"].get(d, 0) + 1
-
-        o = e.get("outcome")
-        if o:
-            stats["by_outcome"][o] = stats["by_outcome"].get(o, 0) + 1
-
-        sid = e.get("session_id")
-        if sid is not None:
-            stats["sessions_logged"].add(sid)
-
-        stats["total_learnings"] += len(e.get("learnings", []))
-
-    stats["sessions_logged"] = sorted(stats["sessions_logged"], key=lambda x: str(x))
-    return stats
-
 
 def get_recent(n=10):
     """Get the N most recent entries."""
-    entries = _load_journal()
-    return entries[-n:]
+    if n <= 0:
+        return _load_journal()[-n:]
+    return read_tail(JOURNAL_PATH, n)
 
 
 def get_entries_by_domain(domain):
@@ -224,25 +217,15 @@ def get_all_learnings():
 
 def get_nuclear_metrics():
     """Aggregate nuclear scan specific metrics."""
-    entries = [e for e in _load_journal() if e.get("event_type") == "nuclear_batch"]
-    if not entries:
+    nuc = _index().data["nuclear"]
+    if not nuc["batches"]:
         return None
 
     total = {
-        "sessions": len(set(e.get("session_id", 0) for e in entries)),
-        "batches": len(entries),
-        "posts_reviewed": 0,
-        "build": 0,
-        "adapt": 0,
-        "reference": 0,
-        "skip": 0,
-        "fast_skip": 0,
+        "sessions": len(nuc["sessions"]),
+        "batches": nuc["batches"],
     }
-
-    for e in entries:
-        m = e.get("metrics", {})
-        for key in ["posts_reviewed", "build", "adapt", "reference", "skip", "fast_skip"]:
-            total[key] += m.get(key, 0)
+    total.update(nuc["totals"])
 
     if total["posts_reviewed"] > 0:
         total["build_rate"] = round(total["build"] / total["posts_reviewed"], 3)
@@ -264,78 +247,33 @@ def get_trading_metrics():
     - by_strategy: {name: {bets, wins, losses, pnl_cents}}
     - research: {total_sessions, actionable, actionable_rate, edges_discovered, edges_rejected}
     """
-    entries = _load_journal()
-    outcomes = [e for e in entries if e.get("event_type") == "bet_outcome"]
-    research = [e for e in entries if e.get("event_type") == "market_research"]
-    edges_found = [e for e in entries if e.get("event_type") == "edge_discovered"]
-    edges_nope = [e for e in entries if e.get("event_type") == "edge_rejected"]
-
-    if not outcomes and not research and not edges_found and not edges_nope:
+    tr = _index().data["trading"]
+    if not (tr["total_bets"] or tr["research_sessions"]
+            or tr["edges_discovered"] or tr["edges_rejected"]):
         return None
 
     total = {
-        "total_bets": len(outcomes),
-        "wins": 0,
-        "losses": 0,
-        "voids": 0,
-        "total_pnl_cents": 0,
-        "by_market_type": {},
-        "by_strategy": {},
+        "total_bets": tr["total_bets"],
+        "wins": tr["wins"],
+        "losses": tr["losses"],
+        "voids": tr["voids"],
+        "total_pnl_cents": tr["total_pnl_cents"],
+        "by_market_type": copy.deepcopy(tr["by_market_type"]),
+        "by_strategy": copy.deepcopy(tr["by_strategy"]),
         "research": {
-            "total_sessions": len(research),
-            "actionable": 0,
-            "edges_discovered": len(edges_found),
-            "edges_rejected": len(edges_nope),
+            "total_sessions": tr["research_sessions"],
+            "actionable": tr["research_actionable"],
+            "edges_discovered": tr["edges_discovered"],
+            "edges_rejected": tr["edges_rejected"],
         },
     }
 
-    for e in outcomes:
-        m = e.get("metrics", {})
-        result = m.get("result", "unknown")
-        pnl = m.get("pnl_cents", 0)
-        mtype = m.get("market_type", "unknown")
-        strat = m.get("strategy_name", "unknown")
-
-        if result == "win":
-            total["wins"] += 1
-        elif result == "loss":
-            total["losses"] += 1
-        elif result == "void":
-            total["voids"] += 1
-
-        total["total_pnl_cents"] += pnl
-
-        # By market type
-        if mtype not in total["by_market_type"]:
-            total["by_market_type"][mtype] = {"bets": 0, "wins": 0, "losses": 0, "pnl_cents": 0}
-        mt = total["by_market_type"][mtype]
-        mt["bets"] += 1
-        if result == "win":
-            mt["wins"] += 1
-        elif result == "loss":
-            mt["losses"] += 1
-        mt["pnl_cents"] += pnl
-
-        # By strategy
-        if strat not in total["by_strategy"]:
-            total["by_strategy"][strat] = {"bets": 0, "wins": 0, "losses": 0, "pnl_cents": 0}
-        st = total["by_strategy"][strat]
-        st["bets"] += 1
-        if result == "win":
-            st["wins"] += 1
-        elif result == "loss":
-            st["losses"] += 1
-        st["pnl_cents"] += pnl
-
     # Win rate (exclude voids)
     decided = total["wins"] + total["losses"]
     if decided > 0:
         total["win_rate"] = round(total["wins"] / decided, 3)
 
     # Research effectiveness
-    for e in research:
-        if e.get("metrics", {}).get("actionable"):
-            total["research"]["actionable"] += 1
     if total["research"]["total_sessions"] > 0:
         total["research"]["actionable_rate"] = round(
             total["research"]["actionable"] / total["research"]["total_sessions"], 3
@@ -374,53 +312,22 @@ def get_time_stratified_trading_metrics(time_buckets=None):
             ("evening", 20, 24),
         ]
 
-    entries = _load_journal()
-    outcomes = [e for e in entries if e.get("event_type") == "bet_outcome"]
-
-    if not outcomes:
+    tr = _index().data["trading"]
+    if not tr["total_bets"]:
         return None
 
-    # Initialize buckets
+    # Hourly tallies are materialized; buckets are sums of their hours
+    by_hour = {h: dict(tr["by_hour"][h]) for h in range(24)}
+
     by_bucket = {}
     for label, _, _ in time_buckets:
         by_bucket[label] = {"bets": 0, "wins": 0, "losses": 0, "pnl_cents": 0}
 
-    by_hour = {}
-    for h in range(24):
-        by_hour[h] = {"bets": 0, "wins": 0, "losses": 0, "pnl_cents": 0}
-
-    for e in outcomes:
-        ts = e.get("timestamp", "")
-        m = e.get("metrics", {})
-        result = m.get("result", "unknown")
-        pnl = m.get("pnl_cents", 0)
-
-        # Extract hour from ISO timestamp
-        try:
-            hour = int(ts[11:13]) if len(ts) >= 13 else -1
-        except (ValueError, IndexError):
-            continue
-
-        if hour < 0 or hour > 23:
-            continue
-
-        # Update hourly stats
-        by_hour[hour]["bets"] += 1
-        if result == "win":
-            by_hour[hour]["wins"] += 1
-        elif result == "loss":
-            by_hour[hour]["losses"] += 1
-        by_hour[hour]["pnl_cents"] += pnl
-
-        # Update bucket stats
+    for hour in range(24):
         for label, start, end in time_buckets:
             if start <= hour < end:
-                by_bucket[label]["bets"] += 1
-                if result == "win":
-                    by_bucket[label]["wins"] += 1
-                elif result == "loss":
-                    by_bucket[label]["losses"] += 1
-                by_bucket[label]["pnl_cents"] += pnl
+                for key in ("bets", "wins", "losses", "pnl_cents"):
+                    by_bucket[label][key] += by_hour[hour][key]
                 break
 
     # Compute win rates per bucket
@@ -460,7 +367,6 @@ def get_time_stratified_trading_metrics(time_buckets=None):
         day_decided = daytime["wins"] + daytime["losses"]
         if on_decided >= 10 and day_decided >= 10:
             # Wilson CI check — 95% confidence
-            import math
             z = 1.96
 
             def _wilson_ci(n, k):
@@ -495,7 +401,7 @@ def get_time_stratified_trading_metrics(time_buckets=None):
             "significant": significant,
         },
         "worst_hours": worst_hours[:5],  # Top 5 worst
-        "total_bets_analyzed": len(outcomes),
+        "total_bets_analyzed": tr["total_bets"],
     }
 
 
@@ -508,9 +414,9 @@ def get_pain_win_summary():
     - pain_entries, win_entries (raw entries for deeper analysis)
     - ratio: win_count / (pain_count + win_count) if any, else None
     """
-    entries = _load_journal()
-    pains = [e for e in entries if e.get("event_type") == "pain"]
-    wins = [e for e in entries if e.get("event_type") == "win"]
+    idx = _index()
+    pains = idx.entries_of_type("pain")
+    wins = idx.entries_of_type("win")
 
     pain_domains = Counter(e.get("domain", "unknown") for e in pains)
     win_domains = Counter(e.get("domain", "unknown") for e in wins)
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+journal_index.py — Materialized aggregates over journal.jsonl
+
+journal.jsonl is append-only, so its stats can be maintained incrementally
+instead of re-parsing ~3k entries on every get_stats() / get_trading_metrics()
+call. The index keeps:
+
+- counts by event type, domain and outcome; sessions; learnings
+- nuclear_batch metric sums
+- bet_outcome tallies per UTC hour (time buckets and Wilson CI inputs are
+  derived from these at read time, so any bucket layout works)
+- trading totals by market type / strategy, research + edge counters
+- byte offsets of pain / win / correction_captured lines, so callers that
+  need those raw entries seek to them instead of scanning the file
+
+Persistence: <journal>.index.json next to the JSONL, holding the aggregates
+plus a checkpoint (byte offset of the last fully parsed line, and a hash of
+the file head). refresh() parses only bytes past the checkpoint. A full
+rebuild happens only when the file shrank, its head changed (rewritten),
+or INDEX_SCHEMA_VERSION changed.
+
+Usage:
+    from journal_index import JournalIndex
+
+    idx = JournalIndex.for_path("self-learning/journal.jsonl")
+    idx.refresh()              # O(new bytes)
+    idx.data["by_event_type"]  # O(1)
+    idx.entries_of_type("pain")
+
+Stdlib only. No external dependencies.
+"""
+
+import hashlib
+import json
+import os
+
+INDEX_SCHEMA_VERSION = 1
+
+# Event types whose raw entries are needed by readers (pain/win summary,
+# correction resurfacing). Their line offsets are kept in the index.
+OFFSET_TRACKED_TYPES = ("pain", "win", "correction_captured")
+
+NUCLEAR_KEYS = ("posts_reviewed", "build", "adapt", "reference", "skip", "fast_skip")
+
+# Bytes of the file head hashed to detect rewrites
+_HEAD_BYTES = 4096
+
+
+def _empty_tally():
+    return {"bets": 0, "wins": 0, "losses": 0, "pnl_cents": 0}
+
+
+def _empty_data():
+    return {
+        "total_entries": 0,
+        "first_entry": None,
+        "last_entry": None,
+        "by_event_type": {},
+        "by_domain": {},
+        "by_outcome": {},
+        # _session_key(session id) -> session id
+        "sessions": {},
+        "total_learnings": 0,
+        "nuclear": {
+            "batches": 0,
+            "sessions": {},
+            "totals": {k: 0 for k in NUCLEAR_KEYS},
+        },
+        "trading": {
+            "total_bets": 0,
+            "wins": 0,
+            "losses": 0,
+            "voids": 0,
+            "total_pnl_cents": 0,
+            "by_market_type": {},
+            "by_strategy": {},
+            "research_sessions": 0,
+            "research_actionable": 0,
+            "edges_discovered": 0,
+            "edges_rejected": 0,
+            "by_hour": [_empty_tally() for _ in range(24)],
+        },
+        "offsets": {t: [] for t in OFFSET_TRACKED_TYPES},
+    }
+
+
+def _session_key(sid):
+    """Key with set() semantics: 1, 1.0 and True collapse, 1 and "1" don't."""
+    if isinstance(sid, (int, float)) and float(sid).is_integer():
+        return str(int(sid))
+    return json.dumps(sid, sort_keys=True)
+
+
+def _tally(bucket, result, pnl):
+    bucket["bets"] += 1
+    if result == "win":
+        bucket["wins"] += 1
+    elif result == "loss":
+        bucket["losses"] += 1
+    bucket["pnl_cents"] += pnl
+
+
+class JournalIndex:
+    """Incrementally maintained aggregates for one journal file."""
+
+    _instances = {}
+
+    def __init__(self, journal_path, index_path=None, persist=True):
+        self.journal_path = journal_path
+        self.index_path = index_path or journal_path + ".index.json"
+        self.persist = persist
+        self.offset = 0
+        self.head_hash = ""
+        self.data = _empty_data()
+        self._stat_key = None
+        self._load()
+
+    @classmethod
+    def for_path(cls, journal_path, persist=True):
+        """Return the process-wide index instance for a journal path.
+
+        Readers that don't own the journal pass persist=False: a saved
+        checkpoint is still loaded, but nothing is written next to the file.
+        """
+        inst = cls._instances.get(journal_path)
+        if inst is None:
+            inst = cls._instances[journal_path] = cls(journal_path, persist=persist)
+        return inst
+
+    # ── Persistence ──────────────────────────────────────────────────────
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "r") as f:
+                saved = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if saved.get("schema_version") != INDEX_SCHEMA_VERSION:
+            return
+        self.offset = saved.get("offset", 0)
+        self.head_hash = saved.get("head_hash", "")
+        self.data = saved.get("data") or _empty_data()
+
+    def _save(self):
+        if not self.persist:
+            return
+        payload = {
+            "schema_version": INDEX_SCHEMA_VERSION,
+            "offset": self.offset,
+            "head_hash": self.head_hash,
+            "data": self.data,
+        }
+        tmp = self.index_path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass  # Read-only location: the in-memory index still works
+
+    def _reset(self):
+        self.offset = 0
+        self.head_hash = ""
+        self.data = _empty_data()
+
+    # ── Refresh ──────────────────────────────────────────────────────────
+
+    def refresh(self):
+        """Bring the aggregates up to date with the journal file.
+
+        Cost is one stat() when nothing changed, otherwise proportional to
+        the bytes appended since the last checkpoint.
+        """
+        try:
+            st = os.stat(self.journal_path)
+        except OSError:
+            if self.offset or self.data["total_entries"]:
+                self._reset()
+                self._stat_key = None
+                self._save()
+            return self
+
+        stat_key = (st.st_size, st.st_mtime_ns, st.st_ino)
+        if stat_key == self._stat_key:
+            return self
+
+        with open(self.journal_path, "rb") as f:
+            if st.st_size < self.offset:
+                self._reset()
+            elif self.offset:
+                f.seek(0)
+                head = f.read(min(self.offset, _HEAD_BYTES))
+                if hashlib.sha1(head).hexdigest() != self.head_hash:
+                    self._reset()
+
+            start = self.offset
+            f.seek(start)
+            chunk = f.read()
+            # Only consume complete lines; a partial trailing write is
+            # picked up on the next refresh.
+            end = chunk.rfind(b"\n") + 1
+            pos = start
+            for raw in chunk[:end].split(b"\n")[:-1]:
+                self._apply_line(raw, pos)
+                pos += len(raw) + 1
+            self.offset = start + end
+
+            if start < _HEAD_BYTES and self.offset:
+                f.seek(0)
+                self.head_hash = hashlib.sha1(
+                    f.read(min(self.offset, _HEAD_BYTES))).hexdigest()
+
+        self._stat_key = stat_key
+        if end:
+            self._save()
+        return self
+
+    def _apply_line(self, raw, pos):
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if not isinstance(entry, dict):
+            return
+        self.apply(entry, pos)
+
+    def apply(self, entry, pos=None):
+        """Fold one parsed entry into the aggregates."""
+        d = self.data
+        d["total_entries"] += 1
+        if d["total_entries"] == 1:
+            d["first_entry"] = entry.get("timestamp", "unknown")
+        d["last_entry"] = entry.get("timestamp", "unknown")
+
+        et = entry.get("event_type", "unknown")
+        d["by_event_type"][et] = d["by_event_type"].get(et, 0) + 1
+        dom = entry.get("domain", "unknown")
+        d["by_domain"][dom] = d["by_domain"].get(dom, 0) + 1
+        outcome = entry.get("outcome")
+        if outcome:
+            d["by_outcome"][outcome] = d["by_outcome"].get(outcome, 0) + 1
+        sid = entry.get("session_id")
+        if sid is not None:
+            d["sessions"].setdefault(_session_key(sid), sid)
+        d["total_learnings"] += len(entry.get("learnings", []))
+
+        if et in d["offsets"] and pos is not None:
+            d["offsets"][et].append(pos)
+
+        metrics = entry.get("metrics", {})
+        if et == "nuclear_batch":
+            nuc = d["nuclear"]
+            nuc["batches"] += 1
+            nsid = entry.get("session_id", 0)
+            nuc["sessions"].setdefault(_session_key(nsid), nsid)
+            for key in NUCLEAR_KEYS:
+                nuc["totals"][key] += metrics.get(key, 0)
+        elif et == "bet_outcome":
+            self._apply_bet_outcome(entry, metrics)
+        elif et == "market_research":
+            d["trading"]["research_sessions"] += 1
+            if metrics.get("actionable"):
+                d["trading"]["research_actionable"] += 1
+        elif et == "edge_discovered":
+            d["trading"]["edges_discovered"] += 1
+        elif et == "edge_rejected":
+            d["trading"]["edges_rejected"] += 1
+
+    def _apply_bet_outcome(self, entry, metrics):
+        tr = self.data["trading"]
+        result = metrics.get("result", "unknown")
+        pnl = metrics.get("pnl_cents", 0)
+        tr["total_bets"] += 1
+        if result == "win":
+            tr["wins"] += 1
+        elif result == "loss":
+            tr["losses"] += 1
+        elif result == "void":
+            tr["voids"] += 1
+        tr["total_pnl_cents"] += pnl
+
+        mtype = metrics.get("market_type", "unknown")
+        strat = metrics.get("strategy_name", "unknown")
+        _tally(tr["by_market_type"].setdefault(mtype, _empty_tally()), result, pnl)
+        _tally(tr["by_strategy"].setdefault(strat, _empty_tally()), result, pnl)
+
+        ts = entry.get("timestamp", "")
+        try:
+            hour = int(ts[11:13]) if len(ts) >= 13 else -1
+        except (ValueError, IndexError, TypeError):
+            return
+        if 0 <= hour <= 23:
+            _tally(tr["by_hour"][hour], result, pnl)
+
+    # ── Readers ──────────────────────────────────────────────────────────
+
+    def entries_of_type(self, event_type):
+        """Raw entries for an offset-tracked event type, in file order."""
+        offsets = self.data["offsets"].get(event_type)
+        if offsets is None:
+            raise KeyError(f"event type '{event_type}' is not offset-tracked")
+        entries = []
+        if not offsets:
+            return entries
+        with open(self.journal_path, "rb") as f:
+            for pos in offsets:
+                f.seek(pos)
+                try:
+                    entries.append(json.loads(f.readline()))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+        return entries
+
+    def sessions(self):
+        return list(self.data["sessions"].values())
+
+
+def read_tail(journal_path, n):
+    """Return the last n parseable entries, reading the file backwards."""
+    if n <= 0 or not os.path.exists(journal_path):
+        return []
+    with open(journal_path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        block = 8192
+        while True:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            lines = buf.split(b"\n")
+            if pos > 0:
+                lines = lines[1:]  # first piece may be a partial line
+            entries = []
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+            if len(entries) >= n or pos == 0:
+                return entries[-n:]
+            block *= 2
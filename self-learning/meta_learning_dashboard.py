@@ -66,7 +66,25 @@ class PrincipleAnalyzer:
     """Analyze principle registry effectiveness."""
 
     def __init__(self, filepath: str):
-        self._entries = _load_jsonl_dedup(filepath)
+        self._entries = self._load(filepath)
+
+    @staticmethod
+    def _load(filepath: str) -> list[dict]:
+        """Latest principle rows, with usage-log counters folded in.
+
+        Rows come from the raw JSONL (partial rows included); counters for
+        principles the registry can parse are overlaid from it, since
+        record_usage() writes them to the usage log, not to this file.
+        """
+        try:
+            import sys as _sys
+            _dir = os.path.dirname(os.path.abspath(__file__))
+            if _dir not in _sys.path:
+                _sys.path.insert(0, _dir)
+            from principle_registry import load_principle_rows
+        except ImportError:
+            return _load_jsonl_dedup(filepath)
+        return list(load_principle_rows(filepath).values())
 
     @property
     def total_principles(self) -> int:
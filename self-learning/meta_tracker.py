@@ -35,26 +35,16 @@ ZOMBIE_SESSION_THRESHOLD = 30
 
 
 def _load_principles(path):
-    """Load principles from JSONL, latest version wins."""
-    principles = {}
-    if not os.path.exists(path):
-        return principles
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                pid = data.get("id", "")
-                if pid:
-                    if data.get("pruned", False):
-                        principles.pop(pid, None)
-                    else:
-                        principles[pid] = data
-            except (json.JSONDecodeError, TypeError):
-                continue
-    return principles
+    """Active principles as dicts, latest version wins.
+
+    Counters come from the registry, which folds in the usage log;
+    principles.jsonl alone holds stale usage_count values.
+    """
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    from principle_registry import load_principle_rows
+    return {pid: p for pid, p in load_principle_rows(path).items()
+            if not p.get("pruned", False)}
 
 
 def _load_snapshots(path):
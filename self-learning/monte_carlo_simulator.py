@@ -27,6 +27,8 @@ import statistics
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+from trade_repository import get_repository
+
 
 @dataclass
 class BetDistribution:
@@ -88,52 +90,35 @@ class BetDistribution:
         if not os.path.exists(db_path):
             raise FileNotFoundError(f"DB not found: {db_path}")
 
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        repo = get_repository(db_path)
+        # Settled live trades, from the shared columnar cache ("" = all strategies)
+        settled = repo.trades(strategy=strategy or None, live_only=True, settled_only=True)
+        with_pnl = settled.filter(require_pnl=True)
+        if not len(with_pnl):
+            return cls(total_bets=0)
+
+        outcomes = with_pnl.pnl_usd()  # cents to USD
+
+        # Estimate daily volume from data if not provided
+        if daily_volume is None:
+            daily_counts = list(settled.daily_counts().values())
+            if daily_counts:
+                daily_volume = round(statistics.mean(daily_counts))
+            else:
+                daily_volume = 30  # fallback
+
+        # Get current bankroll
         try:
-            # Get settled live trade P&L values
-            query = """
-                SELECT pnl_cents FROM trades
-                WHERE is_paper = 0 AND result IS NOT NULL AND pnl_cents IS NOT NULL
-            """
-            params = []
-            if strategy:
-                query += " AND strategy = ?"
-                params.append(strategy)
-
-            rows = conn.execute(query, params).fetchall()
-            if not rows:
-                return cls(total_bets=0)
-
-            outcomes = [r[0] / 100.0 for r in rows]  # cents to USD
-
-            # Estimate daily volume from data if not provided
-            if daily_volume is None:
-                date_query = """
-                    SELECT COUNT(*) as n, date(timestamp, 'unixepoch') as d
-                    FROM trades
-                    WHERE is_paper = 0 AND result IS NOT NULL
-                """
-                if strategy:
-                    date_query += " AND strategy = ?"
-                date_query += " GROUP BY d HAVING n > 0"
-                day_rows = conn.execute(date_query, params).fetchall()
-                if day_rows:
-                    daily_counts = [r[0] for r in day_rows]
-                    daily_volume = round(statistics.mean(daily_counts))
-                else:
-                    daily_volume = 30  # fallback
-
-            # Get current bankroll
-            bankroll_row = conn.execute(
+            bankroll_rows = repo.query(
                 "SELECT balance_usd FROM bankroll_history WHERE source = 'api' ORDER BY timestamp DESC LIMIT 1"
-            ).fetchone()
-            current_bankroll = bankroll_row[0] if bankroll_row else None
-
-            dist = cls.from_outcomes(outcomes, daily_volume)
-            dist._current_bankroll = current_bankroll
-            return dist
-        finally:
-            conn.close()
+            )
+        except sqlite3.OperationalError:
+            bankroll_rows = []
+        current_bankroll = bankroll_rows[0][0] if bankroll_rows else None
+
+        dist = cls.from_outcomes(outcomes, daily_volume)
+        dist._current_bankroll = current_bankroll
+        return dist
 
     def with_loss_cap(self, max_loss_usd: float) -> "BetDistribution":
         """Return a new BetDistribution with losses capped at -max_loss_usd.
@@ -52,11 +52,7 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
 from research_outcomes import OutcomeTracker
-from principle_registry import (
-    Principle,
-    _load_principles,
-    _save_principle,
-)
+from principle_registry import record_usage
 
 DEFAULT_OUTCOMES_PATH = os.path.join(SCRIPT_DIR, "research_outcomes.jsonl")
 DEFAULT_PRINCIPLES_PATH = os.path.join(SCRIPT_DIR, "principles.jsonl")
@@ -144,21 +140,13 @@ class OutcomeFeedback:
         # 2. Update principle scores
         skipped = []
         if principle_ids:
-            principles = _load_principles(path=self.principles_path)
-
             for pid in principle_ids:
-                if pid not in principles:
+                try:
+                    record_usage(pid, success=outcome == "profitable",
+                                 path=self.principles_path)
+                except (KeyError, ValueError):
+                    # Unknown or pruned principle
                     skipped.append(pid)
-                    continue
-
-                p = principles[pid]
-                p.usage_count += 1
-                if outcome == "profitable":
-                    p.success_count += 1
-                p.updated_at = datetime.now(timezone.utc).isoformat()
-
-                # Save updated principle (append — latest version wins)
-                _save_principle(p, path=self.principles_path)
 
         # 3. Log the feedback event
         event = FeedbackEvent(
@@ -49,7 +49,7 @@ sys.path.insert(0, SCRIPT_DIR)
 from principle_registry import (
     Principle,
     VALID_DOMAINS,
-    _load_principles,
+    get_active_principles,
     REINFORCE_SCORE,
 )
 from principle_transfer import DOMAIN_AFFINITY_MAP
@@ -134,8 +134,9 @@ class PredictiveRecommender:
 
     def _get_principles(self) -> dict[str, Principle]:
         """Load all non-pruned principles."""
-        all_principles = _load_principles(self._principles_path) if self._principles_path else _load_principles()
-        return {pid: p for pid, p in all_principles.items() if not p.pruned}
+        if self._principles_path:
+            return get_active_principles(self._principles_path)
+        return get_active_principles()
 
     def _get_session_profiles(self, limit: int = 50) -> list[SessionProfile]:
         """Extract session profiles from journal."""
@@ -7,6 +7,16 @@ trajectories. Principles are domain-tagged and scored using Laplace-smoothed
 success rates. Cross-domain transfer happens in Phase 3.
 
 Storage: self-learning/principles.jsonl (append-only entries, latest wins)
+         self-learning/principles.usage.jsonl (usage counter events)
+Compaction: record_usage() appends a small counter event instead of a whole
+         principle row. Once the usage log or duplicate rows pile up, the
+         registry folds everything into a one-row-per-principle snapshot
+         (principles.jsonl is rewritten atomically). Each row carries
+         usage_seq, the last usage event folded into it, so replaying the
+         usage log never double-counts.
+Index:   an in-process store per path tails both files and keeps
+         domain/score and token indexes, so reads and dedup checks don't
+         replay the JSONL.
 Scoring: s(p) = (success_count + 1) / (usage_count + 2)  [Laplace-smoothed]
 Pruning: Principles below 0.3 score with 10+ usages get pruned.
 
@@ -20,6 +30,7 @@ Usage:
     python3 self-learning/principle_registry.py prune [--dry-run]
     python3 self-learning/principle_registry.py top [N] [--domain X]
     python3 self-learning/principle_registry.py stats
+    python3 self-learning/principle_registry.py compact
 """
 
 import json
@@ -27,6 +38,7 @@ import os
 import sys
 import hashlib
 import argparse
+from collections import defaultdict
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
 from typing import Optional
@@ -44,6 +56,11 @@ PRUNE_MIN_USAGES = get_metric("principle_registry.prune_min_usages", 10)
 REINFORCE_SCORE = get_metric("principle_registry.reinforce_score", 0.7)
 MAX_PRINCIPLES_PER_DOMAIN = get_metric("principle_registry.max_principles_per_domain", 100)
 
+# Compaction triggers (loaded from metric_config, user-overridable)
+COMPACT_USAGE_EVENTS = get_metric("principle_registry.compact_usage_events", 200)
+COMPACT_DUPLICATE_RATIO = get_metric("principle_registry.compact_duplicate_ratio", 2.0)
+COMPACT_MIN_ROWS = 50
+
 VALID_DOMAINS = [
     "cca_operations",
     "trading_research",
@@ -70,6 +87,7 @@ class Principle:
     updated_at: str = ""
     pruned: bool = False
     source_context: str = ""  # What session/event spawned this principle
+    usage_seq: int = 0  # Last usage-log event folded into these counts
 
     @property
     def score(self) -> float:
@@ -104,29 +122,270 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _usage_path(path: str) -> str:
+    """principles.jsonl -> principles.usage.jsonl"""
+    base, ext = os.path.splitext(path)
+    return f"{base}.usage{ext or '.jsonl'}"
+
+
+def _tokens(text: str) -> set:
+    return set(text.lower().split())
+
+
+def _copy(p: Principle) -> Principle:
+    """Detached copy, so callers can mutate without touching the store."""
+    c = Principle(**{k: getattr(p, k) for k in Principle.__dataclass_fields__})
+    c.applicable_domains = list(p.applicable_domains)
+    return c
+
+
+class _JsonlTail:
+    """Reads lines appended to a JSONL file since the last call.
+
+    Detects rewrites (inode change, shrink, or a changed head) so the
+    caller can rebuild from scratch.
+    """
+
+    _HEAD_BYTES = 4096
+
+    def __init__(self, path: str):
+        self.path = path
+        self.reset()
+
+    def reset(self) -> None:
+        self.ino = None
+        self.mtime = None
+        self.offset = 0
+        self.head = b""
+
+    def read(self):
+        """Return (new_lines, rewritten)."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return [], self.offset > 0
+        if self.offset and (st.st_ino != self.ino or st.st_size < self.offset):
+            return [], True
+        if st.st_size == self.offset and st.st_mtime_ns == self.mtime:
+            return [], False
+        with open(self.path, "rb") as f:
+            if self.offset:
+                if f.read(len(self.head)) != self.head:
+                    return [], True
+                f.seek(self.offset)
+            chunk = f.read()
+            end = chunk.rfind(b"\n") + 1
+            if self.offset < self._HEAD_BYTES:
+                f.seek(0)
+                self.head = f.read(min(self.offset + end, self._HEAD_BYTES))
+        self.ino = st.st_ino
+        self.mtime = st.st_mtime_ns
+        self.offset += end
+        return chunk[:end].decode("utf-8", errors="replace").splitlines(), False
+
+
+class _PrincipleStore:
+    """Incrementally refreshed, indexed view of one principles file.
+
+    Holds the latest version of every principle with usage events folded
+    in, plus indexes by applicable domain, by source domain, and by token
+    (for dedup). refresh() costs two stat() calls when nothing changed.
+    """
+
+    _stores: dict = {}
+
+    @classmethod
+    def for_path(cls, path: str) -> "_PrincipleStore":
+        store = cls._stores.get(path)
+        if store is None:
+            store = cls._stores[path] = cls(path)
+        return store.refresh()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.usage_path = _usage_path(path)
+        self._log = _JsonlTail(path)
+        self._usage = _JsonlTail(self.usage_path)
+        self._clear()
+
+    def _clear(self) -> None:
+        self.principles: dict = {}
+        self.log_rows = 0
+        self.usage_events = 0
+        self.max_seq = 0
+        self._order: dict = {}
+        self._by_domain = defaultdict(set)
+        self._by_source = defaultdict(set)
+        self._by_token = defaultdict(set)
+        self._ranked: dict = {}
+
+    def refresh(self) -> "_PrincipleStore":
+        rows, rows_rewritten = self._log.read()
+        events, events_rewritten = self._usage.read()
+        if rows_rewritten or events_rewritten:
+            self._clear()
+            self._log.reset()
+            self._usage.reset()
+            rows, _ = self._log.read()
+            events, _ = self._usage.read()
+        for line in rows:
+            self._apply_row(line)
+        for line in events:
+            self._apply_usage(line)
+        return self
+
+    # ── Applying log lines ───────────────────────────────────────────────
+
+    def _apply_row(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+        try:
+            data = json.loads(line)
+            pid = data.get("id", "")
+            if not pid:
+                return
+            p = Principle(**{
+                k: v for k, v in data.items()
+                if k in Principle.__dataclass_fields__
+            })
+        except (json.JSONDecodeError, TypeError, AttributeError):
+            return
+        self.log_rows += 1
+        # After compaction the usage log is empty; the folded rows still
+        # carry the highest sequence number handed out so far.
+        self.max_seq = max(self.max_seq, p.usage_seq)
+        self._unindex(pid)
+        self.principles[pid] = p
+        self._order.setdefault(pid, len(self._order))
+        for d in p.applicable_domains:
+            self._by_domain[d].add(pid)
+        self._by_source[p.source_domain].add(pid)
+        for tok in _tokens(p.text):
+            self._by_token[tok].add(pid)
+        self._ranked.clear()
+
+    def _unindex(self, pid: str) -> None:
+        old = self.principles.get(pid)
+        if old is None:
+            return
+        for d in old.applicable_domains:
+            self._by_domain[d].discard(pid)
+        self._by_source[old.source_domain].discard(pid)
+        for tok in _tokens(old.text):
+            self._by_token[tok].discard(pid)
+
+    def _apply_usage(self, line: str) -> None:
+        try:
+            ev = json.loads(line)
+            seq = int(ev["seq"])
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return
+        self.usage_events += 1
+        self.max_seq = max(self.max_seq, seq)
+        p = self.principles.get(ev.get("id"))
+        if p is None or seq <= p.usage_seq:
+            return
+        p.usage_count += 1
+        if ev.get("success"):
+            p.success_count += 1
+        if ev.get("session", 0) > 0:
+            p.last_used_session = ev["session"]
+        p.updated_at = ev.get("at", p.updated_at)
+        p.usage_seq = seq
+        self._ranked.clear()
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def snapshot(self) -> dict:
+        return {pid: _copy(p) for pid, p in self.principles.items()}
+
+    def ranked(self, domain: Optional[str] = None) -> list:
+        """Principles (store objects) sorted by score desc, file order on ties."""
+        key = domain or ""
+        cached = self._ranked.get(key)
+        if cached is None:
+            ids = self._by_domain.get(domain, ()) if domain else self.principles
+            cached = sorted(
+                (self.principles[pid] for pid in ids),
+                key=lambda p: (-p.score, self._order[p.id]),
+            )
+            self._ranked[key] = cached
+        return cached
+
+    def active_in_source(self, domain: str) -> list:
+        return [self.principles[pid] for pid in self._by_source.get(domain, ())
+                if not self.principles[pid].pruned]
+
+    def dedup_candidates(self, text: str, source_domain: str) -> list:
+        """Active same-domain principles sharing at least one token with text.
+
+        Jaccard similarity is 0 without a shared token, so this is an exact
+        prefilter for the _text_similarity check.
+        """
+        same_domain = self._by_source.get(source_domain, set())
+        ids = set()
+        for tok in _tokens(text):
+            ids |= self._by_token.get(tok, set()) & same_domain
+        return [self.principles[pid] for pid in sorted(ids, key=self._order.get)
+                if not self.principles[pid].pruned]
+
+    def needs_compaction(self) -> bool:
+        if self.usage_events >= COMPACT_USAGE_EVENTS:
+            return True
+        return (self.log_rows >= COMPACT_MIN_ROWS and
+                self.log_rows > COMPACT_DUPLICATE_RATIO * max(len(self.principles), 1))
+
+
 def _load_principles(path: str = PRINCIPLES_PATH) -> dict:
-    """Load all principles, latest version wins (append-only JSONL)."""
-    principles = {}
-    if not os.path.exists(path):
-        return principles
-
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                pid = data.get("id", "")
-                if pid:
-                    principles[pid] = Principle(**{
-                        k: v for k, v in data.items()
-                        if k in Principle.__dataclass_fields__
-                    })
-            except (json.JSONDecodeError, TypeError):
-                continue
-
-    return principles
+    """Load all principles, latest version wins (append-only JSONL).
+
+    Backed by the incremental store: only bytes appended since the last
+    call are parsed. Returns detached copies.
+    """
+    return _PrincipleStore.for_path(path).snapshot()
+
+
+def load_principle_rows(path: str = PRINCIPLES_PATH) -> dict:
+    """Latest raw row per principle ID, with usage-log counters folded in.
+
+    For readers that work on dicts: rows come straight from the JSONL
+    (partial rows included), and usage_count / success_count /
+    last_used_session are overlaid from the store for every principle it
+    can parse, since record_usage() writes them to the usage log rather
+    than to principles.jsonl. usage_seq is overlaid too, so a row written
+    back from here does not get the same events applied twice. Pruned rows
+    are kept.
+    """
+    rows: dict = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(row, dict) and row.get("id"):
+                    rows[row["id"]] = row
+    store = _PrincipleStore.for_path(path)
+    for pid, row in rows.items():
+        p = store.principles.get(pid)
+        if p is not None:
+            row["usage_count"] = p.usage_count
+            row["success_count"] = p.success_count
+            row["last_used_session"] = p.last_used_session
+            row["usage_seq"] = p.usage_seq
+            row["score"] = p.score
+    return rows
+
+
+def get_active_principles(path: str = PRINCIPLES_PATH) -> dict:
+    """Non-pruned principles by ID (detached copies), in registry order."""
+    store = _PrincipleStore.for_path(path)
+    return {pid: _copy(p) for pid, p in store.principles.items() if not p.pruned}
 
 
 def _save_principle(principle: Principle, path: str = PRINCIPLES_PATH) -> None:
@@ -135,6 +394,12 @@ def _save_principle(principle: Principle, path: str = PRINCIPLES_PATH) -> None:
         f.write(json.dumps(principle.to_dict()) + "\n")
 
 
+def _append_usage(event: dict, path: str = PRINCIPLES_PATH) -> None:
+    """Append a usage counter event to the usage log."""
+    with open(_usage_path(path), "a") as f:
+        f.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+
 def _atomic_rewrite(principles: dict, path: str = PRINCIPLES_PATH) -> None:
     """Rewrite the full file (for pruning operations only)."""
     tmp = path + ".tmp"
@@ -144,6 +409,47 @@ def _atomic_rewrite(principles: dict, path: str = PRINCIPLES_PATH) -> None:
     os.replace(tmp, path)
 
 
+def compact_principles(path: str = PRINCIPLES_PATH) -> dict:
+    """Fold the usage log and duplicate rows into a one-row-per-principle snapshot.
+
+    Returns {"rows_before", "usage_events_folded", "principles"}.
+    """
+    store = _PrincipleStore.for_path(path)
+    result = {
+        "rows_before": store.log_rows,
+        "usage_events_folded": store.usage_events,
+        "principles": len(store.principles),
+    }
+    if not os.path.exists(path):
+        return result
+    folded_seq = store.max_seq
+    _atomic_rewrite(store.principles, path)
+
+    # Keep any usage events appended after our refresh (seq > folded_seq)
+    usage_path = store.usage_path
+    if os.path.exists(usage_path):
+        pending = []
+        with open(usage_path, "r") as f:
+            for line in f:
+                try:
+                    if int(json.loads(line)["seq"]) > folded_seq:
+                        pending.append(line if line.endswith("\n") else line + "\n")
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+        tmp = usage_path + ".tmp"
+        with open(tmp, "w") as f:
+            f.writelines(pending)
+        os.replace(tmp, usage_path)
+
+    store.refresh()
+    return result
+
+
+def _maybe_compact(path: str) -> None:
+    if _PrincipleStore.for_path(path).needs_compaction():
+        compact_principles(path)
+
+
 def _text_similarity(a: str, b: str) -> float:
     """Simple word-overlap similarity for dedup. Returns 0-1."""
     words_a = set(a.lower().split())
@@ -177,11 +483,8 @@ def add_principle(
             raise ValueError(f"Invalid applicable domain: {d}")
 
     # Check domain cap
-    existing = _load_principles(path)
-    domain_count = sum(
-        1 for p in existing.values()
-        if p.source_domain == source_domain and not p.pruned
-    )
+    store = _PrincipleStore.for_path(path)
+    domain_count = len(store.active_in_source(source_domain))
     if domain_count >= MAX_PRINCIPLES_PER_DOMAIN:
         raise ValueError(
             f"Domain '{source_domain}' has {domain_count} principles "
@@ -189,11 +492,7 @@ def add_principle(
         )
 
     # Dedup: reject if >80% word overlap with existing active principle in same domain
-    for p in existing.values():
-        if p.pruned:
-            continue
-        if p.source_domain != source_domain:
-            continue
+    for p in store.dedup_candidates(text, source_domain):
         if _text_similarity(text, p.text) > 0.8:
             raise ValueError(
                 f"Duplicate principle detected (similarity >{80}% with {p.id}): "
@@ -213,6 +512,8 @@ def add_principle(
         created_at=now,
         updated_at=now,
         source_context=source_context,
+        # Stale usage events for a re-added ID must not count
+        usage_seq=store.max_seq,
     )
 
     _save_principle(principle, path)
@@ -225,23 +526,27 @@ def record_usage(
     session: int = 0,
     path: str = PRINCIPLES_PATH,
 ) -> Principle:
-    """Record a usage of a principle (success or failure)."""
-    principles = _load_principles(path)
-    if principle_id not in principles:
+    """Record a usage of a principle (success or failure).
+
+    Appends a counter event to the usage log rather than a whole row.
+    """
+    store = _PrincipleStore.for_path(path)
+    if principle_id not in store.principles:
         raise KeyError(f"Principle not found: {principle_id}")
 
-    p = principles[principle_id]
-    if p.pruned:
+    if store.principles[principle_id].pruned:
         raise ValueError(f"Principle {principle_id} is pruned")
 
-    p.usage_count += 1
-    if success:
-        p.success_count += 1
-    if session > 0:
-        p.last_used_session = session
-    p.updated_at = _now_iso()
-
-    _save_principle(p, path)
+    event = {
+        "id": principle_id,
+        "seq": store.max_seq + 1,
+        "success": bool(success),
+        "session": session,
+        "at": _now_iso(),
+    }
+    _append_usage(event, path)
+    p = _copy(store.refresh().principles[principle_id])
+    _maybe_compact(path)
     return p
 
 
@@ -252,19 +557,13 @@ def get_principles(
     path: str = PRINCIPLES_PATH,
 ) -> list:
     """Get principles, optionally filtered by domain and min score."""
-    principles = _load_principles(path)
     result = []
-
-    for p in principles.values():
-        if p.pruned and not include_pruned:
-            continue
-        if domain and domain not in p.applicable_domains:
-            continue
+    for p in _PrincipleStore.for_path(path).ranked(domain):
         if p.score < min_score:
+            break  # ranked by score: nothing further qualifies
+        if p.pruned and not include_pruned:
             continue
-        result.append(p)
-
-    result.sort(key=lambda x: x.score, reverse=True)
+        result.append(_copy(p))
     return result
 
 
@@ -274,7 +573,13 @@ def get_top_principles(
     path: str = PRINCIPLES_PATH,
 ) -> list:
     """Get top N principles by score for a domain."""
-    return get_principles(domain=domain, path=path)[:n]
+    result = []
+    for p in _PrincipleStore.for_path(path).ranked(domain):
+        if len(result) >= n:
+            break
+        if not p.pruned:
+            result.append(_copy(p))
+    return result
 
 
 def prune_principles(
@@ -417,7 +722,7 @@ def get_bet_advice(
 
 def get_stats(path: str = PRINCIPLES_PATH) -> dict:
     """Get summary statistics about the principle registry."""
-    principles = _load_principles(path)
+    principles = _PrincipleStore.for_path(path).principles
     active = [p for p in principles.values() if not p.pruned]
     pruned = [p for p in principles.values() if p.pruned]
 
@@ -445,8 +750,8 @@ def get_principle_by_id(
     path: str = PRINCIPLES_PATH,
 ) -> Optional[Principle]:
     """Get a single principle by ID."""
-    principles = _load_principles(path)
-    return principles.get(principle_id)
+    p = _PrincipleStore.for_path(path).principles.get(principle_id)
+    return _copy(p) if p is not None else None
 
 
 # === CLI ===
@@ -488,6 +793,9 @@ def main():
     # stats
     sub.add_parser("stats", help="Show statistics")
 
+    # compact
+    sub.add_parser("compact", help="Fold usage log and duplicate rows into a snapshot")
+
     # advise
     advise_p = sub.add_parser("advise", help="Get principle-based bet advice")
     advise_p.add_argument("--market", required=True, help="Market ticker (e.g. KXBTC)")
@@ -564,6 +872,11 @@ def main():
             for d, c in sorted(stats["domain_counts"].items()):
                 print(f"  {d}: {c}")
 
+    elif args.cmd == "compact":
+        result = compact_principles()
+        print(f"Compacted {result['rows_before']} rows + {result['usage_events_folded']} "
+              f"usage events -> {result['principles']} principles")
+
     elif args.cmd == "advise":
         advice = get_bet_advice(
             market=args.market,
@@ -24,13 +24,21 @@ import re
 import sys
 from collections import Counter
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 sys.path.insert(0, SCRIPT_DIR)
 
-from principle_registry import add_principle, _load_principles, VALID_DOMAINS
+from principle_registry import (
+    add_principle,
+    load_principle_rows,
+    _load_principles,
+    _save_principle,
+    VALID_DOMAINS,
+)
+from findings_index import FindingsIndex, parse_text
 
 DEFAULT_LEARNINGS_PATH = os.path.join(PROJECT_ROOT, "LEARNINGS.md")
 DEFAULT_JOURNAL_PATH = os.path.join(SCRIPT_DIR, "journal.jsonl")
@@ -225,17 +233,7 @@ def _existing_principle_texts(path: str) -> set:
     """Load existing principle texts to prevent duplicates."""
     if not os.path.isfile(path):
         return set()
-    texts = set()
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    p = json.loads(line)
-                    texts.add(p.get("text", ""))
-                except json.JSONDecodeError:
-                    continue
-    return texts
+    return {p.get("text", "") for p in load_principle_rows(path).values()}
 
 
 def seed_principles_from_learnings(
@@ -294,30 +292,20 @@ def seed_principles_from_learnings(
 
 
 def _update_principle_usage(path: str, text: str, count: int):
-    """Update a principle's usage_count and success_count in the file.
+    """Update a principle's usage_count and success_count in the registry.
 
     For learnings with count > 1, we set usage = count and success = count
-    (the learning has been validated count times).
+    (the learning has been validated count times). The updated row is
+    appended, so counters already in the usage log are kept.
     """
     if not os.path.isfile(path):
         return
-    lines = []
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    p = json.loads(line)
-                    if p.get("text") == text:
-                        p["usage_count"] = count
-                        p["success_count"] = count
-                    lines.append(json.dumps(p))
-                except json.JSONDecodeError:
-                    lines.append(line)
-
-    with open(path, "w") as f:
-        for line in lines:
-            f.write(line + "\n")
+    for p in _load_principles(path).values():
+        if p.text == text:
+            p.usage_count = count
+            p.success_count = count
+            p.updated_at = datetime.now(timezone.utc).isoformat()
+            _save_principle(p, path=path)
 
 
 def extract_journal_patterns(entries: list) -> list:
@@ -443,15 +431,6 @@ def seed_principles_from_journal(
 
 # --- Phase: Findings seeder (MT-28 growth) ---
 
-# Reuse FINDING_RE from mt_originator pattern
-FINDING_RE = re.compile(
-    r'^\[(\d{4}-\d{2}-\d{2})\]\s+'
-    r'\[(\w+(?:-\w+)?)\]\s+'
-    r'\[([^\]]+)\]\s+'
-    r'(.+?)(?:\s*—\s*(https?://\S+))?$'
-)
-POINTS_RE = re.compile(r'\((\d+)pts')
-
 # Frontier -> domain mapping for findings
 FRONTIER_DOMAIN_MAP = {
     "memory": "cca_operations",
@@ -471,39 +450,23 @@ def parse_findings_for_seeding(text: str, min_points: int = 0) -> list:
     """
     if not text:
         return []
+    return _seedable(parse_text(text), min_points)
 
-    results = []
-    for line in text.splitlines():
-        line = line.strip()
-        m = FINDING_RE.match(line)
-        if not m:
-            continue
-        date_str, verdict, frontier, title, url = m.groups()
-        url = url or ""
-
-        if verdict not in ("BUILD", "ADAPT"):
-            continue
-
-        pm = POINTS_RE.search(title)
-        points = int(pm.group(1)) if pm else 0
 
-        if points < min_points:
-            continue
-
-        # Clean title
-        title_clean = title.split("—")[0].strip().rstrip(".")
-        if len(title_clean) > 120:
-            title_clean = title_clean[:117] + "..."
-
-        results.append({
-            "date": date_str,
-            "verdict": verdict,
-            "frontier": frontier,
-            "title": title_clean,
-            "url": url,
-            "points": points,
-        })
-    return results
+def _seedable(entries, min_points: int) -> list:
+    return [
+        {
+            "date": e["date"],
+            "verdict": e["verdict"],
+            "frontier": e["frontier"],
+            "title": e["headline"],
+            "url": e["url"],
+            "points": e["points"],
+        }
+        for e in entries
+        if e["verdict"] in ("BUILD", "ADAPT") and e["frontier"] and e["rest"]
+        and e["points"] >= min_points
+    ]
 
 
 def map_finding_to_domain(frontier: str, title: str) -> str:
@@ -562,14 +525,13 @@ def seed_principles_from_findings(
 
     Returns list of dicts describing what was seeded.
     """
-    if findings_text is None:
-        if os.path.isfile(findings_path):
-            with open(findings_path) as f:
-                findings_text = f.read()
-        else:
-            return []
-
-    parsed = parse_findings_for_seeding(findings_text, min_points=min_points)
+    if findings_text is not None:
+        parsed = parse_findings_for_seeding(findings_text, min_points=min_points)
+    elif os.path.isfile(findings_path):
+        rows = FindingsIndex.for_path(findings_path).rows(verdicts=("BUILD", "ADAPT"))
+        parsed = _seedable(rows, min_points)
+    else:
+        return []
     if not parsed:
         return []
 
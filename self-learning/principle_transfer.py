@@ -49,6 +49,7 @@ from principle_registry import (
     VALID_DOMAINS,
     _load_principles,
     _save_principle,
+    get_principle_by_id,
 )
 
 
@@ -504,12 +505,10 @@ class PrincipleTransfer:
             from principle_registry import PRINCIPLES_PATH
             principles_path = PRINCIPLES_PATH
 
-        principles = _load_principles(principles_path)
-        if principle_id not in principles:
+        p = get_principle_by_id(principle_id, principles_path)
+        if p is None:
             raise KeyError(f"Principle not found: {principle_id}")
 
-        p = principles[principle_id]
-
         if target_domain not in p.applicable_domains:
             p.applicable_domains.append(target_domain)
             from principle_registry import _now_iso
@@ -40,6 +40,7 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from metric_config import get_metric
+from rolling_stats import RollingHurst, RollingMoments, RollingRegression
 
 
 class RegimeDetector:
@@ -82,6 +83,10 @@ class RegimeDetector:
         trend_strength = self._compute_trend_strength(closes)
         mr_score = self._compute_hurst_approx(closes)
 
+        return self._build_result(volatility, trend_strength, mr_score)
+
+    def _build_result(self, volatility, trend_strength, mr_score):
+        """Assemble the classify() result dict from the three metrics."""
         metrics = {
             "volatility": round(volatility, 6),
             "trend_strength": round(trend_strength, 4),
@@ -114,6 +119,24 @@ class RegimeDetector:
                    for p in prices]
         return self.classify(candles)
 
+    def classify_rolling(self, prices, window):
+        """Classify every full window of `window` prices in one linear pass.
+
+        Equivalent to calling classify_from_prices() on each slice
+        prices[i - window:i], but each step is an O(1) update of streaming
+        accumulators (rolling_stats) instead of a recompute.
+
+        Returns:
+            List of classify() dicts, one per full window.
+        """
+        stream = RegimeStream(window, detector=self)
+        results = []
+        for p in prices:
+            result = stream.update(p)
+            if result is not None:
+                results.append(result)
+        return results
+
     def _compute_volatility(self, closes):
         """Compute annualized volatility from log returns.
 
@@ -258,6 +281,45 @@ class RegimeDetector:
                 f"candles for regime detection.")
 
 
+class RegimeStream:
+    """Incremental regime classification over a sliding window of closes.
+
+    Feed one close per candle (or per settled trade) via update(); once the
+    window is full, each call returns the classify() dict for the latest
+    `window` closes.
+    """
+
+    def __init__(self, window, detector=None):
+        self.detector = detector or RegimeDetector()
+        self.window = window
+        self._last = None
+        # `window` closes span window-1 returns
+        self._log_returns = RollingMoments(max(window - 1, 1))
+        self._hurst = RollingHurst(max(window - 1, 1))
+        self._trend = RollingRegression(window)
+
+    def update(self, close):
+        """Add one close. Returns a classify() dict, or None until full."""
+        if self._last is not None:
+            if close > 0 and self._last > 0:
+                self._log_returns.push(math.log(close / self._last))
+            else:
+                self._log_returns.push(None)
+            self._hurst.push(close - self._last)
+        self._last = close
+        self._trend.push(close)
+
+        if not self._trend.full:
+            return None
+        if self.window < self.detector.MIN_CANDLES:
+            return self.detector.classify([])
+
+        volatility = self._log_returns.std(ddof=0)
+        trend_strength = self._trend.r_squared()
+        mr_score = self._hurst.mean_reversion_score()
+        return self.detector._build_result(volatility, trend_strength, mr_score)
+
+
 def _cli():
     """CLI: pipe JSON price list to classify."""
     import argparse
@@ -31,13 +31,16 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from journal_index import JournalIndex
+from findings_index import VERDICT_PRIORITY, FindingsIndex, parse_text
+
 
 # ── Data structures ──────────────────────────────────────────────────────────
 
@@ -77,90 +80,19 @@ def module_to_frontier(module_name: str) -> int | None:
 
 # ── Parsing ──────────────────────────────────────────────────────────────────
 
-# Pattern: [date] [VERDICT] [tags] title — description — url
-_ENTRY_RE = re.compile(
-    r'^\[(\d{4}-\d{2}-\d{2})\]\s+'     # date
-    r'\[([A-Z][-A-Z]*)\]\s+'            # verdict (BUILD, ADAPT, REFERENCE, etc.)
-    r'\[([^\]]+)\]\s+'                   # tags in brackets
-    r'(.+)$'                             # rest (title + description + url)
-)
-
-# Extract frontier numbers and MT task numbers from tag strings
-_FRONTIER_RE = re.compile(r'Frontier\s+(\d+)')
-_MT_RE = re.compile(r'MT-(\d+)')
-
-# Common tag keywords that map to known categories
-_TAG_CATEGORIES = {
-    "Trading": "Trading",
-    "Kalshi": "Trading",
-    "Memory": "Frontier 1",
-    "Spec": "Frontier 2",
-    "Context": "Frontier 3",
-    "Agent": "Frontier 4",
-    "Usage": "Frontier 5",
-}
-
-
-def _parse_tags(raw_tags: str) -> list[str]:
-    """Extract structured tags from raw tag string.
-
-    Input: "Frontier 5: Usage Dashboard + Frontier 3: Context Health"
-    Output: ["Frontier 5", "Frontier 3"]
-
-    Input: "MT-17: Design"
-    Output: ["MT-17"]
-
-    Input: "Trading/Kalshi"
-    Output: ["Trading"]
-    """
-    tags = []
-
-    # Extract Frontier N references
-    for m in _FRONTIER_RE.finditer(raw_tags):
-        tags.append(f"Frontier {m.group(1)}")
-
-    # Extract MT-N references
-    for m in _MT_RE.finditer(raw_tags):
-        tags.append(f"MT-{m.group(1)}")
-
-    # Extract category keywords
-    for keyword, tag in _TAG_CATEGORIES.items():
-        if keyword.lower() in raw_tags.lower() and tag not in tags:
-            tags.append(tag)
-
-    # If nothing matched, use raw as-is
-    if not tags:
-        tags.append(raw_tags.strip())
-
-    return tags
-
-
-def _parse_body(body: str) -> tuple[str, str, str]:
-    """Split the body into title, description, and URL.
-
-    The body after the tags looks like:
-    'CShip — Rust statusline for CC with cost... — https://reddit.com/...'
-
-    We split on ' — ' and take the last segment starting with http as URL.
-    """
-    url = ""
-    # Extract URL from end
-    url_match = re.search(r'https?://\S+$', body.strip())
-    if url_match:
-        url = url_match.group(0)
-        body = body[:url_match.start()].strip()
-        # Remove trailing separator
-        body = body.rstrip(" —-").strip()
-
-    # Split title from description on first ' — '
-    parts = body.split(" — ", 1)
-    title = parts[0].strip()
-    description = parts[1].strip() if len(parts) > 1 else title
+# The line format and parser live in findings_index.py, shared with
+# hit_rate_tracker, mt_originator and the scanner dedup.
 
-    # Clean up title — remove leading/trailing quotes and point counts
-    title = title.strip('"')
-
-    return title, description, url
+def _finding(entry: dict) -> Finding:
+    return Finding(
+        date=entry["date"],
+        verdict=entry["verdict"],
+        tags=entry["tags"],
+        raw_tags=entry["frontier"],
+        title=entry["title"],
+        description=entry["description"],
+        url=entry["url"],
+    )
 
 
 def parse_findings_log(content: str) -> list[Finding]:
@@ -169,49 +101,11 @@ def parse_findings_log(content: str) -> list[Finding]:
     Each line is one finding in the format:
     [date] [VERDICT] [tags] title — description — url
     """
-    findings = []
-
-    for line in content.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-
-        match = _ENTRY_RE.match(line)
-        if not match:
-            continue
-
-        date = match.group(1)
-        verdict = match.group(2)
-        raw_tags = match.group(3)
-        body = match.group(4)
-
-        tags = _parse_tags(raw_tags)
-        title, description, url = _parse_body(body)
-
-        findings.append(Finding(
-            date=date,
-            verdict=verdict,
-            tags=tags,
-            raw_tags=raw_tags,
-            title=title,
-            description=description,
-            url=url,
-        ))
-
-    return findings
+    return [_finding(e) for e in parse_text(content) if e["frontier"] and e["rest"]]
 
 
 # ── Matching ─────────────────────────────────────────────────────────────────
 
-VERDICT_PRIORITY = {
-    "BUILD": 0,
-    "ADAPT": 1,
-    "REFERENCE": 2,
-    "REFERENCE-PERSONAL": 3,
-    "SKIP": 4,
-}
-
-
 def match_findings(
     findings: list[Finding],
     *,
@@ -294,23 +188,22 @@ def resurface(
 ) -> list[Finding]:
     """Load FINDINGS_LOG.md and return matched findings.
 
-    Safe: returns empty list if file doesn't exist.
+    Safe: returns empty list if file doesn't exist. Queries the shared
+    FindingsIndex, so repeated calls only re-parse newly appended lines.
     """
-    path = Path(log_path)
-    if not path.exists():
+    if not Path(log_path).exists():
         return []
 
-    content = path.read_text()
-    findings = parse_findings_log(content)
-    return match_findings(
-        findings,
+    if module and frontier is None:
+        frontier = module_to_frontier(module)
+    rows = FindingsIndex.for_path(log_path).match(
         frontier=frontier,
         keywords=keywords,
-        module=module,
         mt_task=mt_task,
         include_skip=include_skip,
         limit=limit,
     )
+    return [_finding(r) for r in rows]
 
 
 def format_resurface_report(findings: list[Finding], context: str = "") -> str:
@@ -517,13 +410,13 @@ def get_recent_corrections(days=DEFAULT_LOOKBACK_DAYS):
       error_pattern, error_tool, fix_tool, count, last_seen, time_to_fix_avg, resources
     Grouped by (error_pattern, error_tool) to deduplicate repeat mistakes.
     """
-    entries = _load_journal_entries()
+    # Correction lines are offset-indexed; no need to parse the whole journal
+    entries = JournalIndex.for_path(JOURNAL_PATH, persist=False).refresh().entries_of_type(
+        "correction_captured")
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
     corrections = []
     for entry in entries:
-        if entry.get("event_type") != "correction_captured":
-            continue
         ts = _parse_timestamp(entry.get("timestamp"))
         if ts is None or ts < cutoff:
             continue
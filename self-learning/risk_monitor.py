@@ -30,7 +30,9 @@ import math
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import List, Optional
+
+from rolling_stats import RollingMoments
 
 
 class RiskLevel(Enum):
@@ -102,38 +104,27 @@ class VolatilityMonitor:
 
     def __init__(self, window: int = 20):
         self.window = window
-        self._values: List[float] = []
+        self._last: Optional[float] = None
+        # `window` values span window-1 returns; invalid returns are gaps
+        self._returns = RollingMoments(max(window - 1, 1))
 
     def update(self, value: float):
         """Update with new portfolio value."""
-        self._values.append(value)
+        if self._last is not None and self.window > 1:
+            if self._last > 0 and value > 0:
+                self._returns.push(math.log(value / self._last))
+            else:
+                self._returns.push(None)
+        self._last = value
 
     @property
     def current_volatility(self) -> float:
         """Compute rolling volatility (annualized std of returns)."""
-        if len(self._values) < 2:
-            return 0.0
-
-        # Use last `window` values
-        recent = self._values[-self.window:]
-        if len(recent) < 2:
+        if self._returns.count < 2:
             return 0.0
 
-        # Compute log returns
-        returns = []
-        for i in range(1, len(recent)):
-            if recent[i - 1] > 0 and recent[i] > 0:
-                returns.append(math.log(recent[i] / recent[i - 1]))
-
-        if len(returns) < 2:
-            return 0.0
-
-        # Standard deviation of returns
-        mean = sum(returns) / len(returns)
-        variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
-        daily_vol = math.sqrt(variance)
-
-        # Annualize (252 trading days)
+        # Standard deviation of returns, annualized (252 trading days)
+        daily_vol = self._returns.std(ddof=1)
         return daily_vol * math.sqrt(252)
 
     @property
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+rolling_stats.py — Streaming rolling-window statistics with O(1) updates.
+
+Shared online-statistics library for the edge decay, regime and volatility
+detectors. Each accumulator keeps a fixed-size ring buffer (allocated once)
+and updates its sums in O(1) per append, so sliding a window across years of
+1-minute candles is linear time instead of O(n·w).
+
+Components:
+- RollingMoments: mean / variance / std (Welford add + remove, Chan-style)
+- RollingRegression: OLS slope and R² of values against their position
+- RollingWinRate: win count / win rate over the last N outcomes
+- RollingHurst: R/S Hurst approximation over a window of increments
+
+Windows may contain gaps: push(None) occupies a slot but is excluded from
+the statistics. This mirrors detectors that skip invalid log returns
+(non-positive prices) while still windowing on observation count.
+
+Incremental sums drift under long add/remove sequences, so each accumulator
+recomputes exactly from its buffer every RESYNC_EVERY × window pushes —
+amortized O(1), bounded error.
+
+Usage:
+    from rolling_stats import RollingMoments, RollingRegression
+
+    vol = RollingMoments(window=20)
+    for r in returns:
+        vol.push(r)
+        if vol.full:
+            print(vol.std(ddof=1))
+
+    for mean, std in RollingMoments.sliding(values, window=20):
+        ...
+
+Stdlib only. No external dependencies.
+"""
+
+import math
+
+# Full recompute cadence, in multiples of the window size
+RESYNC_EVERY = 64
+
+
+class _Ring:
+    """Fixed-capacity ring buffer. Allocated once, overwritten in place."""
+
+    __slots__ = ("capacity", "_buf", "_head", "_size")
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError(f"window must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self._buf = [None] * capacity
+        self._head = 0  # index of the oldest element
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, value):
+        """Append value. Returns (evicted, True) if full, else (None, False)."""
+        if self._size < self.capacity:
+            self._buf[(self._head + self._size) % self.capacity] = value
+            self._size += 1
+            return None, False
+        evicted = self._buf[self._head]
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        return evicted, True
+
+    def __iter__(self):
+        buf, cap, head = self._buf, self.capacity, self._head
+        for i in range(self._size):
+            yield buf[(head + i) % cap]
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+
+class RollingMoments:
+    """Rolling count / mean / variance over the last `window` observations."""
+
+    def __init__(self, window):
+        self.window = window
+        self._ring = _Ring(window)
+        self._n = 0  # non-gap values in window
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    @property
+    def count(self):
+        """Number of non-gap values currently in the window."""
+        return self._n
+
+    @property
+    def full(self):
+        """True once `window` observations (including gaps) have been pushed."""
+        return len(self._ring) == self.window
+
+    def push(self, value):
+        """Append an observation (None = gap), evicting the oldest if full."""
+        evicted, did_evict = self._ring.push(value)
+        if did_evict and evicted is not None:
+            self._remove(evicted)
+        if value is not None:
+            self._add(value)
+        self._since_resync += 1
+        if self._since_resync >= RESYNC_EVERY * self.window:
+            self._resync()
+
+    def extend(self, values):
+        for v in values:
+            self.push(v)
+
+    def clear(self):
+        self._ring.clear()
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    def mean(self):
+        return self._mean if self._n else 0.0
+
+    def variance(self, ddof=0):
+        """Variance with the given delta degrees of freedom (0 = population)."""
+        denom = self._n - ddof
+        if denom <= 0:
+            return 0.0
+        return max(self._m2, 0.0) / denom
+
+    def std(self, ddof=0):
+        return math.sqrt(self.variance(ddof))
+
+    def _add(self, x):
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+
+    def _remove(self, x):
+        if self._n <= 1:
+            self._n = 0
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        old_mean = self._mean
+        self._n -= 1
+        self._mean = (old_mean * (self._n + 1) - x) / self._n
+        self._m2 -= (x - old_mean) * (x - self._mean)
+
+    def _resync(self):
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        for v in self._ring:
+            if v is not None:
+                self._add(v)
+        self._since_resync = 0
+
+    @classmethod
+    def sliding(cls, values, window, ddof=0):
+        """Yield (mean, std) for every full window over `values`."""
+        acc = cls(window)
+        for v in values:
+            acc.push(v)
+            if acc.full:
+                yield acc.mean(), acc.std(ddof)
+
+
+class RollingRegression:
+    """Rolling OLS of y against position 0..n-1 within the window.
+
+    Matches the slope / R² the detectors compute with x = range(len(window)).
+    Gaps are not supported: every pushed value is a point.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._ring = _Ring(window)
+        self._moments = RollingMoments(window)
+        self._sxy = 0.0  # sum(i * y_i) with i relative to the window start
+        self._since_resync = 0
+
+    @property
+    def count(self):
+        return len(self._ring)
+
+    @property
+    def full(self):
+        return len(self._ring) == self.window
+
+    def push(self, y):
+        n_before = len(self._ring)
+        evicted, did_evict = self._ring.push(y)
+        if did_evict:
+            # Drop the point at position 0, shift the rest down by one
+            self._sxy -= self._moments._mean * self._moments._n - evicted
+            self._moments.push(y)
+            self._sxy += (self.window - 1) * y
+        else:
+            self._moments.push(y)
+            self._sxy += n_before * y
+        self._since_resync += 1
+        if self._since_resync >= RESYNC_EVERY * self.window:
+            self._sxy = sum(i * v for i, v in enumerate(self._ring))
+            self._since_resync = 0
+
+    def extend(self, values):
+        for v in values:
+            self.push(v)
+
+    def _ss(self):
+        n = len(self._ring)
+        x_mean = (n - 1) / 2.0
+        ss_xx = n * (n * n - 1) / 12.0
+        ss_xy = self._sxy - x_mean * self._moments._mean * n
+        ss_yy = max(self._moments._m2, 0.0)
+        return ss_xx, ss_xy, ss_yy
+
+    def slope(self):
+        if len(self._ring) < 2:
+            return 0.0
+        ss_xx, ss_xy, _ = self._ss()
+        return ss_xy / ss_xx if ss_xx else 0.0
+
+    def r_squared(self):
+        if len(self._ring) < 2:
+            return 0.0
+        ss_xx, ss_xy, ss_yy = self._ss()
+        if ss_xx == 0 or ss_yy <= 1e-15 * max(1.0, self._moments._mean ** 2) * len(self._ring):
+            return 0.0
+        return min(max(ss_xy * ss_xy / (ss_xx * ss_yy), 0.0), 1.0)
+
+    def mean(self):
+        return self._moments.mean()
+
+
+class RollingWinRate:
+    """Rolling win count over the last `window` outcomes."""
+
+    def __init__(self, window):
+        self.window = window
+        self._ring = _Ring(window)
+        self._wins = 0
+
+    @property
+    def count(self):
+        return len(self._ring)
+
+    @property
+    def full(self):
+        return len(self._ring) == self.window
+
+    @property
+    def wins(self):
+        return self._wins
+
+    def push(self, is_win):
+        is_win = bool(is_win)
+        evicted, did_evict = self._ring.push(is_win)
+        if did_evict and evicted:
+            self._wins -= 1
+        if is_win:
+            self._wins += 1
+
+    def win_rate(self):
+        n = len(self._ring)
+        return self._wins / n if n else 0.0
+
+
+class RollingHurst:
+    """Rolling R/S Hurst approximation over a window of increments.
+
+    Mirrors RegimeDetector._compute_hurst_approx on a window of returns:
+    H = log(R/S) / log(n), clamped to [0, 1]. The std term updates in O(1);
+    the range of cumulative deviations needs the window mean, so it is
+    recomputed in one allocation-free pass over the ring when queried and
+    cached until the next push.
+    """
+
+    MIN_RETURNS = 9
+
+    def __init__(self, window):
+        self.window = window
+        self._moments = RollingMoments(window)
+        self._cached = None
+
+    @property
+    def count(self):
+        return self._moments.count
+
+    @property
+    def full(self):
+        return self._moments.full
+
+    def push(self, increment):
+        self._moments.push(increment)
+        self._cached = None
+
+    def hurst(self):
+        """Hurst exponent estimate (0.5 when undetermined)."""
+        if self._cached is not None:
+            return self._cached
+        n = self._moments.count
+        if n < self.MIN_RETURNS:
+            return 0.5
+        mean = self._moments.mean()
+        s = hi = lo = 0.0
+        first = True
+        for r in self._moments._ring:
+            if r is None:
+                continue
+            s += r - mean
+            if first:
+                hi = lo = s
+                first = False
+            elif s > hi:
+                hi = s
+            elif s < lo:
+                lo = s
+        r_range = hi - lo
+        variance = self._moments.variance(ddof=0)
+        std = math.sqrt(variance) if variance > 0 else 1e-10
+        rs = r_range / std
+        if rs > 0 and n > 1:
+            hurst = max(0.0, min(1.0, math.log(rs) / math.log(n)))
+        else:
+            hurst = 0.5
+        self._cached = hurst
+        return hurst
+
+    def mean_reversion_score(self):
+        """1 - H, the score RegimeDetector reports."""
+        return 1.0 - self.hurst()
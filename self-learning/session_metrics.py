@@ -247,25 +247,20 @@ class SessionMetricsTracker:
         return ratios
 
     def _load_principles(self) -> Dict[str, int]:
-        """Count active and pruned principles."""
+        """Count active and pruned principles (latest version of each)."""
         if not os.path.exists(self.principles_path):
             return {"active": 0, "pruned": 0}
 
+        if SCRIPT_DIR not in sys.path:
+            sys.path.insert(0, SCRIPT_DIR)
+        from principle_registry import load_principle_rows
         active = 0
         pruned = 0
-        with open(self.principles_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    p = json.loads(line)
-                    if p.get("pruned", False):
-                        pruned += 1
-                    else:
-                        active += 1
-                except json.JSONDecodeError:
-                    continue
+        for p in load_principle_rows(self.principles_path).values():
+            if p.get("pruned", False):
+                pruned += 1
+            else:
+                active += 1
         return {"active": active, "pruned": pruned}
 
     def summary_report(self) -> dict:
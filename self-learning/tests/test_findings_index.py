@@ -0,0 +1,182 @@
+"""Tests for findings_index — incremental SQLite index over FINDINGS_LOG.md."""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import findings_index
+from findings_index import FindingsIndex, parse_line
+from principle_seeder import parse_findings_for_seeding
+from resurfacer import match_findings, parse_findings_log
+
+LOG = """# Findings Log
+
+[2026-03-20] [BUILD] [Frontier 1: Memory] "Memory store v2" (87pts, 12c) — persistent memory — https://www.reddit.com/r/ClaudeCode/comments/aaa111/memory/
+[2026-03-20] [SKIP] [Frontier 3: Context] Context meme — nothing here — https://www.reddit.com/r/ClaudeCode/comments/bbb222/meme/
+[2026-03-19] [ADAPT] [MT-17: Design] Compaction trick for long sessions — https://www.reddit.com/r/ClaudeAI/comments/ccc333/x/
+[2026-03-19] [REFERENCE] [Trading/Kalshi] Kalshi fee model (12pts)
+[2026-03-18] [REFERENCE] [] Untagged entry
+Seen elsewhere: https://www.reddit.com/r/ClaudeCode/comments/ddd444/notes/
+"""
+
+APPENDED = ("[2026-03-21] [BUILD] [Frontier 3: Context] Context compaction monitor"
+            " — https://www.reddit.com/r/ClaudeCode/comments/eee555/c/\n")
+
+
+class FindingsIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "FINDINGS_LOG.md")
+        self.write(LOG, "w")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def write(self, text, mode="a"):
+        with open(self.path, mode, encoding="utf-8") as f:
+            f.write(text)
+
+    def index(self):
+        idx = FindingsIndex(self.path)
+        self.addCleanup(idx.close)
+        return idx
+
+
+class TestParseLine(unittest.TestCase):
+
+    def test_fields(self):
+        e = parse_line('[2026-03-20] [BUILD] [Frontier 1: Memory] "Store v2" (87pts, 12c)'
+                       ' — persistent memory — https://x.test/p')
+        self.assertEqual(e["verdict"], "BUILD")
+        self.assertEqual(e["frontier"], "Frontier 1: Memory")
+        self.assertEqual(e["tags"], ["Frontier 1"])
+        self.assertEqual(e["url"], "https://x.test/p")
+        self.assertEqual(e["description"], "persistent memory")
+        self.assertEqual(e["quoted_title"], "Store v2")
+        self.assertEqual(e["headline"], '"Store v2" (87pts, 12c)')
+        self.assertEqual(e["points"], 87)
+
+    def test_bare_trailing_url(self):
+        line = ('[2026-04-11] [ADAPT] [Frontier 3] "Cache TTL downgrade" (65pts, 24c).'
+                ' Writeup with a fix https://github.com/x/cache-fix')
+        e = parse_line(line)
+        self.assertEqual(e["url"], "https://github.com/x/cache-fix")
+        self.assertNotIn("https://", e["headline"])
+        seeded = parse_findings_for_seeding(line)
+        self.assertEqual(seeded[0]["url"], "https://github.com/x/cache-fix")
+
+    def test_non_entries(self):
+        self.assertIsNone(parse_line("# Findings Log"))
+        self.assertIsNone(parse_line("[2026-03-20] [build] [x] lowercase verdict"))
+
+
+class TestRefresh(FindingsIndexTestCase):
+
+    def test_indexes_entries_and_post_ids(self):
+        idx = self.index()
+        self.assertEqual(len(idx.rows()), 5)
+        self.assertEqual(idx.post_ids(), {"aaa111", "bbb222", "ccc333", "ddd444"})
+        self.assertEqual(idx.verdict_counts()["REFERENCE"], 2)
+
+    def test_append_parses_only_new_bytes(self):
+        idx = self.index()
+        idx.refresh()
+        self.write(APPENDED)
+        with patch.object(findings_index, "parse_line", wraps=parse_line) as spy:
+            idx.refresh()
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(idx.rows()[-1]["headline"], "Context compaction monitor")
+        self.assertIn("eee555", idx.post_ids())
+
+    def test_unchanged_file_skips_reparse(self):
+        idx = self.index()
+        idx.refresh()
+        with patch.object(findings_index, "parse_line") as spy:
+            idx.rows()
+            idx.match(frontier=0)
+        spy.assert_not_called()
+
+    def test_edit_of_earlier_line_rebuilds(self):
+        idx = self.index()
+        idx.refresh()
+        self.write(LOG.replace("Memory store v2", "Memory store v3"), "w")
+        self.write(APPENDED)
+        titles = [r["quoted_title"] for r in idx.rows()]
+        self.assertIn("Memory store v3", titles)
+        self.assertNotIn("Memory store v2", titles)
+        self.assertEqual(len(titles), 6)
+
+    def test_partial_trailing_line_is_reparsed(self):
+        idx = self.index()
+        self.write("[2026-03-22] [ADAPT] [Frontier 2: Spec] Half writ")
+        self.assertEqual(idx.rows()[-1]["title"], "Half writ")
+        self.write("ten spec tool\n")
+        rows = idx.rows()
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[-1]["title"], "Half written spec tool")
+
+    def test_persists_across_instances(self):
+        self.index().refresh()
+        with patch.object(findings_index, "parse_line") as spy:
+            rows = self.index().rows()
+        spy.assert_not_called()
+        self.assertEqual(len(rows), 5)
+
+    def test_shrunk_or_missing_log(self):
+        idx = self.index()
+        idx.refresh()
+        self.write(LOG.splitlines(keepends=True)[2], "w")
+        self.assertEqual(len(idx.rows()), 1)
+        os.remove(self.path)
+        self.assertEqual(idx.rows(), [])
+        self.assertEqual(idx.post_ids(), set())
+
+    def test_schema_version_change_rebuilds(self):
+        self.index().refresh()
+        with patch.object(findings_index, "INDEX_SCHEMA_VERSION", 99):
+            idx = self.index()
+            self.assertEqual(len(idx.rows()), 5)
+
+
+class TestMatch(FindingsIndexTestCase):
+
+    def assert_same_as_scan(self, **kwargs):
+        with open(self.path, encoding="utf-8") as f:
+            expected = match_findings(parse_findings_log(f.read()), **kwargs)
+        got = self.index().match(**kwargs)
+        self.assertEqual([(r["title"], r["verdict"]) for r in got],
+                         [(f.title, f.verdict) for f in expected])
+        return got
+
+    def test_frontier_keyword_and_mt(self):
+        self.write(APPENDED)
+        self.assert_same_as_scan(frontier=1)
+        self.assert_same_as_scan(frontier=3, include_skip=True)
+        self.assert_same_as_scan(mt_task="MT-17")
+        got = self.assert_same_as_scan(keywords=["COMPACTION", "kalshi"])
+        self.assertEqual([r["verdict"] for r in got], ["BUILD", "ADAPT", "REFERENCE"])
+
+    def test_short_keyword_falls_back_to_substring(self):
+        self.assert_same_as_scan(keywords=["v2"])
+
+    def test_without_fts(self):
+        idx = self.index()
+        idx.fts = False
+        self.assertEqual(len(idx.match(keywords=["compaction"])), 1)
+
+    def test_frontier_zero_limit_and_untagged(self):
+        got = self.assert_same_as_scan(frontier=0, limit=2)
+        self.assertEqual(len(got), 2)
+        titles = [r["title"] for r in self.index().match(frontier=0, include_skip=True)]
+        self.assertNotIn("Untagged entry", titles)
+
+    def test_no_filters_matches_nothing(self):
+        self.assertEqual(self.index().match(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
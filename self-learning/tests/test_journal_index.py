@@ -0,0 +1,139 @@
+"""Tests for journal_index — incremental materialized journal aggregates."""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import journal_index
+from journal_index import JournalIndex, read_tail
+
+
+def _write(path, entries, mode="a"):
+    with open(path, mode) as f:
+        for e in entries:
+            f.write(json.dumps(e) + "\n")
+
+
+def _bet(result, pnl, ts="2026-03-20T03:00:00Z", strategy="sniper"):
+    return {"timestamp": ts, "event_type": "bet_outcome", "domain": "trading",
+            "metrics": {"result": result, "pnl_cents": pnl, "strategy_name": strategy}}
+
+
+class TestJournalIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "journal.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_missing_journal_is_empty(self):
+        idx = JournalIndex(self.path).refresh()
+        self.assertEqual(idx.data["total_entries"], 0)
+
+    def test_counts(self):
+        _write(self.path, [
+            {"timestamp": "t1", "event_type": "win", "domain": "general", "session_id": 1,
+             "learnings": ["a", "b"]},
+            {"timestamp": "t2", "event_type": "pain", "domain": "trading", "session_id": 1.0},
+            {"timestamp": "t3", "event_type": "win", "domain": "general", "session_id": "1",
+             "outcome": "success"},
+        ])
+        idx = JournalIndex(self.path).refresh()
+        d = idx.data
+        self.assertEqual(d["total_entries"], 3)
+        self.assertEqual(d["by_event_type"], {"win": 2, "pain": 1})
+        self.assertEqual(d["by_outcome"], {"success": 1})
+        self.assertEqual(d["first_entry"], "t1")
+        self.assertEqual(d["last_entry"], "t3")
+        self.assertEqual(d["total_learnings"], 2)
+        self.assertEqual(sorted(idx.sessions(), key=str), [1, "1"])
+
+    def test_incremental_append_only_parses_new_bytes(self):
+        _write(self.path, [_bet("win", 10)])
+        idx = JournalIndex(self.path).refresh()
+        first_offset = idx.offset
+        _write(self.path, [_bet("loss", -90)])
+        idx.refresh()
+        self.assertGreater(idx.offset, first_offset)
+        self.assertEqual(idx.data["trading"]["total_bets"], 2)
+        self.assertEqual(idx.data["trading"]["by_hour"][3]["losses"], 1)
+
+    def test_partial_trailing_line_deferred(self):
+        _write(self.path, [_bet("win", 10)])
+        with open(self.path, "a") as f:
+            f.write('{"event_type": "win"')
+        idx = JournalIndex(self.path).refresh()
+        self.assertEqual(idx.data["total_entries"], 1)
+        with open(self.path, "a") as f:
+            f.write("}\n")
+        idx.refresh()
+        self.assertEqual(idx.data["total_entries"], 2)
+
+    def test_checkpoint_persisted_and_reloaded(self):
+        _write(self.path, [_bet("win", 10), _bet("win", 5)])
+        JournalIndex(self.path).refresh()
+        self.assertTrue(os.path.exists(self.path + ".index.json"))
+        reloaded = JournalIndex(self.path)
+        self.assertEqual(reloaded.data["trading"]["total_pnl_cents"], 15)
+        self.assertGreater(reloaded.offset, 0)
+
+    def test_no_persist_writes_nothing(self):
+        _write(self.path, [_bet("win", 10)])
+        JournalIndex(self.path, persist=False).refresh()
+        self.assertFalse(os.path.exists(self.path + ".index.json"))
+
+    def test_rewritten_file_triggers_rebuild(self):
+        _write(self.path, [_bet("win", 10), _bet("win", 10)])
+        idx = JournalIndex(self.path).refresh()
+        _write(self.path, [_bet("loss", -50, strategy="other"), _bet("loss", -50), _bet("loss", -1)], mode="w")
+        idx.refresh()
+        self.assertEqual(idx.data["trading"]["wins"], 0)
+        self.assertEqual(idx.data["trading"]["losses"], 3)
+
+    def test_truncated_file_triggers_rebuild(self):
+        _write(self.path, [_bet("win", 10), _bet("win", 10)])
+        idx = JournalIndex(self.path).refresh()
+        _write(self.path, [_bet("loss", -5)], mode="w")
+        idx.refresh()
+        self.assertEqual(idx.data["trading"]["total_bets"], 1)
+
+    def test_schema_change_discards_saved_index(self):
+        _write(self.path, [_bet("win", 10)])
+        JournalIndex(self.path).refresh()
+        orig = journal_index.INDEX_SCHEMA_VERSION
+        journal_index.INDEX_SCHEMA_VERSION = orig + 1
+        try:
+            idx = JournalIndex(self.path)
+            self.assertEqual(idx.offset, 0)
+            self.assertEqual(idx.refresh().data["trading"]["total_bets"], 1)
+        finally:
+            journal_index.INDEX_SCHEMA_VERSION = orig
+
+    def test_entries_of_type_seeks_offsets(self):
+        _write(self.path, [
+            {"event_type": "pain", "notes": "p1"},
+            _bet("win", 1),
+            "not a dict",
+            {"event_type": "pain", "notes": "p2"},
+        ])
+        with open(self.path, "a") as f:
+            f.write("garbage\n")
+        idx = JournalIndex(self.path).refresh()
+        self.assertEqual([e["notes"] for e in idx.entries_of_type("pain")], ["p1", "p2"])
+        with self.assertRaises(KeyError):
+            idx.entries_of_type("bet_outcome")
+
+    def test_read_tail(self):
+        _write(self.path, [{"i": i} for i in range(2000)])
+        self.assertEqual(read_tail(self.path, 3), [{"i": 1997}, {"i": 1998}, {"i": 1999}])
+        self.assertEqual(len(read_tail(self.path, 5000)), 2000)
+        self.assertEqual(read_tail(self.path, 0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
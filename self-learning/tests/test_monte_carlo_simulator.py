@@ -598,6 +598,10 @@ class TestFromDB(unittest.TestCase):
         dist = BetDistribution.from_db(db_path=self.db_path, strategy="expiry_sniper_v1")
         self.assertEqual(dist.total_bets, 20)
 
+    def test_from_db_empty_strategy_means_all(self):
+        dist = BetDistribution.from_db(db_path=self.db_path, strategy="")
+        self.assertEqual(dist.total_bets, 20)
+
     def test_from_db_nonexistent_strategy(self):
         dist = BetDistribution.from_db(db_path=self.db_path, strategy="nonexistent")
         self.assertEqual(dist.total_bets, 0)
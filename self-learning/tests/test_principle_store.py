@@ -0,0 +1,150 @@
+"""Tests for the principle registry's indexed store, usage log and compaction."""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import principle_registry as pr
+from principle_registry import (
+    _load_principles,
+    _usage_path,
+    add_principle,
+    compact_principles,
+    get_principle_by_id,
+    get_principles,
+    get_top_principles,
+    prune_principles,
+    record_usage,
+)
+
+
+def _lines(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestPrincipleStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "principles.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_usage_path(self):
+        self.assertEqual(_usage_path("/x/principles.jsonl"), "/x/principles.usage.jsonl")
+
+    def test_record_usage_appends_compact_event(self):
+        p = add_principle("Check liquidity first", "trading_execution", ["trading_execution"], path=self.path)
+        updated = record_usage(p.id, success=True, session=12, path=self.path)
+        self.assertEqual((updated.usage_count, updated.success_count), (1, 1))
+        self.assertEqual(updated.last_used_session, 12)
+        self.assertEqual(len(_lines(self.path)), 1)  # no full row appended
+        events = _lines(_usage_path(self.path))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["id"], p.id)
+
+    def test_usage_visible_to_fresh_load(self):
+        p = add_principle("Size by Kelly", "trading_execution", ["trading_execution"], path=self.path)
+        record_usage(p.id, success=False, path=self.path)
+        pr._PrincipleStore._stores.clear()
+        loaded = _load_principles(self.path)[p.id]
+        self.assertEqual((loaded.usage_count, loaded.success_count), (1, 0))
+
+    def test_external_append_picked_up(self):
+        p = add_principle("Avoid thin books", "trading_execution", ["trading_execution"], path=self.path)
+        _load_principles(self.path)
+        p.text = "Avoid thin order books"
+        with open(self.path, "a") as f:
+            f.write(json.dumps(p.to_dict()) + "\n")
+        self.assertEqual(get_principle_by_id(p.id, self.path).text, "Avoid thin order books")
+
+    def test_returned_objects_are_detached(self):
+        p = add_principle("Test before commit", "general", ["general"], path=self.path)
+        loaded = _load_principles(self.path)[p.id]
+        loaded.applicable_domains.append("trading_execution")
+        self.assertEqual(get_principle_by_id(p.id, self.path).applicable_domains, ["general"])
+
+    def test_compaction_folds_usage_and_duplicates(self):
+        p = add_principle("Read the docs", "general", ["general"], path=self.path)
+        for i in range(3):
+            record_usage(p.id, success=i != 1, path=self.path)
+        prune_principles(path=self.path)  # full rewrite keeps usage_seq
+        with open(self.path, "a") as f:
+            f.write(json.dumps(_load_principles(self.path)[p.id].to_dict()) + "\n")
+        result = compact_principles(self.path)
+        self.assertEqual(result["principles"], 1)
+        rows = _lines(self.path)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]["usage_count"], rows[0]["success_count"]), (3, 2))
+        self.assertEqual(_lines(_usage_path(self.path)), [])
+        pr._PrincipleStore._stores.clear()
+        self.assertEqual(_load_principles(self.path)[p.id].usage_count, 3)
+
+    def test_folded_events_not_double_counted(self):
+        p = add_principle("Measure twice", "general", ["general"], path=self.path)
+        record_usage(p.id, success=True, path=self.path)
+        usage = _usage_path(self.path)
+        with open(usage) as f:
+            stale = f.read()
+        compact_principles(self.path)
+        with open(usage, "w") as f:
+            f.write(stale)  # e.g. a usage log restored from an older copy
+        pr._PrincipleStore._stores.clear()
+        self.assertEqual(_load_principles(self.path)[p.id].usage_count, 1)
+
+    def test_usage_after_compaction_counts(self):
+        p = add_principle("Log every fill", "general", ["general"], path=self.path)
+        record_usage(p.id, success=True, path=self.path)
+        record_usage(p.id, success=True, path=self.path)
+        compact_principles(self.path)
+        updated = record_usage(p.id, success=False, path=self.path)
+        self.assertEqual((updated.usage_count, updated.success_count), (3, 2))
+        self.assertEqual(_lines(_usage_path(self.path))[0]["seq"], 3)
+        pr._PrincipleStore._stores.clear()
+        self.assertEqual(_load_principles(self.path)[p.id].usage_count, 3)
+
+    def test_auto_compaction_threshold(self):
+        p = add_principle("Cut losers early", "trading_execution", ["trading_execution"], path=self.path)
+        orig = pr.COMPACT_USAGE_EVENTS
+        pr.COMPACT_USAGE_EVENTS = 5
+        try:
+            for _ in range(5):
+                record_usage(p.id, success=True, path=self.path)
+        finally:
+            pr.COMPACT_USAGE_EVENTS = orig
+        self.assertEqual(_lines(_usage_path(self.path)), [])
+        self.assertEqual(_lines(self.path)[0]["usage_count"], 5)
+
+    def test_ranked_queries_use_domain_index(self):
+        a = add_principle("alpha rule", "trading_execution", ["trading_execution"], path=self.path)
+        b = add_principle("beta rule", "general", ["general", "trading_execution"], path=self.path)
+        add_principle("gamma rule", "general", ["general"], path=self.path)
+        record_usage(b.id, success=True, path=self.path)
+        record_usage(a.id, success=False, path=self.path)
+        self.assertEqual([p.id for p in get_principles(domain="trading_execution", path=self.path)], [b.id, a.id])
+        self.assertEqual([p.id for p in get_top_principles(1, "trading_execution", path=self.path)], [b.id])
+        self.assertEqual(get_principles(domain="trading_execution", min_score=0.6, path=self.path)[0].id, b.id)
+
+    def test_dedup_uses_token_index(self):
+        add_principle("always check the order book depth", "trading_execution", ["trading_execution"], path=self.path)
+        with self.assertRaises(ValueError):
+            add_principle("always check the order book depth first", "trading_execution", ["trading_execution"], path=self.path)
+        # Same text in a different source domain is allowed
+        add_principle("always check the order book depth first", "general", ["general"], path=self.path)
+
+    def test_rewritten_file_reloads(self):
+        add_principle("one", "general", ["general"], path=self.path)
+        _load_principles(self.path)
+        open(self.path, "w").close()
+        self.assertEqual(_load_principles(self.path), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
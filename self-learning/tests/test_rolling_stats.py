@@ -0,0 +1,155 @@
+"""Tests for rolling_stats — O(1)-update rolling window statistics."""
+import os
+import random
+import statistics
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import rolling_stats
+from rolling_stats import RollingHurst, RollingMoments, RollingRegression, RollingWinRate
+from regime_detector import RegimeDetector, RegimeStream
+
+
+def _ols(ys):
+    n = len(ys)
+    x_mean = (n - 1) / 2.0
+    y_mean = sum(ys) / n
+    ss_xy = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(ys))
+    ss_xx = sum((i - x_mean) ** 2 for i in range(n))
+    ss_yy = sum((y - y_mean) ** 2 for y in ys)
+    slope = ss_xy / ss_xx
+    r2 = ss_xy ** 2 / (ss_xx * ss_yy) if ss_yy else 0.0
+    return slope, r2
+
+
+class TestRollingMoments(unittest.TestCase):
+
+    def test_matches_statistics_module(self):
+        random.seed(1)
+        values = [random.gauss(5, 2) for _ in range(300)]
+        acc = RollingMoments(25)
+        for i, v in enumerate(values):
+            acc.push(v)
+            chunk = values[max(0, i - 24):i + 1]
+            self.assertAlmostEqual(acc.mean(), statistics.mean(chunk), places=9)
+            if len(chunk) > 1:
+                self.assertAlmostEqual(acc.std(ddof=1), statistics.stdev(chunk), places=9)
+                self.assertAlmostEqual(acc.std(), statistics.pstdev(chunk), places=9)
+
+    def test_gaps_excluded(self):
+        acc = RollingMoments(3)
+        acc.extend([1.0, None, 3.0])
+        self.assertEqual(acc.count, 2)
+        self.assertAlmostEqual(acc.mean(), 2.0)
+        acc.push(5.0)  # evicts 1.0
+        self.assertAlmostEqual(acc.mean(), 4.0)
+        acc.push(None)  # evicts the gap
+        self.assertEqual(acc.count, 2)
+
+    def test_empty_and_single(self):
+        acc = RollingMoments(5)
+        self.assertEqual(acc.mean(), 0.0)
+        self.assertEqual(acc.variance(ddof=1), 0.0)
+        acc.push(7.0)
+        self.assertEqual(acc.variance(ddof=1), 0.0)
+        self.assertFalse(acc.full)
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            RollingMoments(0)
+
+    def test_sliding_yields_full_windows(self):
+        out = list(RollingMoments.sliding([1, 2, 3, 4, 5], window=3))
+        self.assertEqual(len(out), 3)
+        self.assertAlmostEqual(out[-1][0], 4.0)
+
+    def test_long_stream_stays_accurate(self):
+        random.seed(2)
+        acc = RollingMoments(10)
+        values = [1e6 + random.random() for _ in range(10 * rolling_stats.RESYNC_EVERY + 37)]
+        acc.extend(values)
+        self.assertAlmostEqual(acc.std(ddof=1), statistics.stdev(values[-10:]), places=6)
+
+
+class TestRollingRegression(unittest.TestCase):
+
+    def test_matches_batch_ols(self):
+        random.seed(3)
+        values = [i * 0.3 + random.gauss(0, 1) for i in range(200)]
+        reg = RollingRegression(30)
+        for i, v in enumerate(values):
+            reg.push(v)
+            if reg.full:
+                slope, r2 = _ols(values[i - 29:i + 1])
+                self.assertAlmostEqual(reg.slope(), slope, places=9)
+                self.assertAlmostEqual(reg.r_squared(), r2, places=9)
+
+    def test_flat_series_zero_r2(self):
+        reg = RollingRegression(5)
+        reg.extend([2.0] * 12)
+        self.assertEqual(reg.r_squared(), 0.0)
+        self.assertAlmostEqual(reg.slope(), 0.0)
+
+    def test_perfect_line(self):
+        reg = RollingRegression(4)
+        reg.extend([10, 12, 14, 16, 18, 20])
+        self.assertAlmostEqual(reg.slope(), 2.0)
+        self.assertAlmostEqual(reg.r_squared(), 1.0)
+
+
+class TestRollingWinRate(unittest.TestCase):
+
+    def test_window(self):
+        wr = RollingWinRate(4)
+        for outcome in [True, True, False, True, False, False]:
+            wr.push(outcome)
+        self.assertEqual(wr.wins, 1)
+        self.assertAlmostEqual(wr.win_rate(), 0.25)
+
+    def test_empty(self):
+        self.assertEqual(RollingWinRate(3).win_rate(), 0.0)
+
+
+class TestRollingHurst(unittest.TestCase):
+
+    def test_matches_regime_detector(self):
+        random.seed(4)
+        closes = [100.0]
+        for _ in range(120):
+            closes.append(closes[-1] + random.gauss(0, 1))
+        hurst = RollingHurst(40)
+        detector = RegimeDetector()
+        for i in range(1, len(closes)):
+            hurst.push(closes[i] - closes[i - 1])
+            if hurst.full:
+                expected = detector._compute_hurst_approx(closes[i - 40:i + 1])
+                self.assertAlmostEqual(hurst.mean_reversion_score(), expected, places=9)
+
+    def test_insufficient_data(self):
+        hurst = RollingHurst(20)
+        hurst.push(1.0)
+        self.assertEqual(hurst.hurst(), 0.5)
+
+
+class TestRegimeStream(unittest.TestCase):
+
+    def test_classify_rolling_matches_batch(self):
+        random.seed(5)
+        prices = [100.0]
+        for _ in range(400):
+            prices.append(prices[-1] * (1 + random.gauss(0.0005, 0.01)))
+        detector = RegimeDetector()
+        rolling = detector.classify_rolling(prices, 30)
+        batch = [detector.classify_from_prices(prices[i - 30:i]) for i in range(30, len(prices) + 1)]
+        self.assertEqual(rolling, batch)
+
+    def test_stream_returns_none_until_full(self):
+        stream = RegimeStream(12)
+        results = [stream.update(100 + i) for i in range(12)]
+        self.assertTrue(all(r is None for r in results[:-1]))
+        self.assertEqual(results[-1]["regime"], "TRENDING")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""Tests for trade_repository — pooled read-only columnar access to polybot.db."""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from trade_repository import TradeColumns, TradeRepository, clear_pool, get_repository
+
+DAY = 86400
+
+
+def _make_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE trades (
+            id INTEGER PRIMARY KEY,
+            timestamp REAL,
+            strategy TEXT,
+            price_cents INTEGER,
+            pnl_cents INTEGER,
+            is_paper INTEGER,
+            result TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO trades (timestamp, strategy, price_cents, pnl_cents, is_paper, result) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestTradeRepository(unittest.TestCase):
+
+    def setUp(self):
+        clear_pool()
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "polybot.db")
+        _make_db(self.db_path, [
+            (1 * DAY + 10, "sniper", 92, 8, 0, "yes"),
+            (1 * DAY + 20, "sniper", 95, -95, 0, "no"),
+            (2 * DAY + 10, "sniper", 80, 20, 0, "yes"),
+            (2 * DAY + 20, "lag", 50, None, 0, None),
+            (3 * DAY + 10, "lag", 60, 40, 1, "yes"),
+        ])
+
+    def tearDown(self):
+        clear_pool()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_missing_db_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            get_repository(os.path.join(self.tmpdir, "nope.db"))
+
+    def test_pool_returns_same_instance(self):
+        self.assertIs(get_repository(self.db_path), get_repository(self.db_path))
+
+    def test_columns_extracted(self):
+        cols = get_repository(self.db_path).columns()
+        self.assertEqual(len(cols), 5)
+        self.assertEqual(list(cols.price_cents), [92, 95, 80, 50, 60])
+        self.assertEqual(list(cols.has_pnl), [1, 1, 1, 0, 1])
+        self.assertEqual(sorted(cols.strategy_names()), ["lag", "sniper"])
+
+    def test_filters(self):
+        repo = get_repository(self.db_path)
+        live = repo.trades(live_only=True, settled_only=True, require_pnl=True)
+        self.assertEqual(len(live), 3)
+        self.assertEqual(live.pnl_usd(), [0.08, -0.95, 0.20])
+        band = live.filter(strategy="sniper", min_price=85, max_price=99)
+        self.assertEqual(list(band.price_cents), [92, 95])
+        windowed = repo.trades(since=2 * DAY, until=2 * DAY + 15)
+        self.assertEqual(len(windowed), 1)
+
+    def test_unknown_strategy_is_empty(self):
+        self.assertEqual(len(get_repository(self.db_path).trades(strategy="nope")), 0)
+
+    def test_daily_counts(self):
+        counts = get_repository(self.db_path).trades(live_only=True).daily_counts()
+        self.assertEqual(counts, {1: 2, 2: 2})
+
+    def test_cache_reused_until_db_changes(self):
+        repo = get_repository(self.db_path)
+        first = repo.columns()
+        self.assertIs(repo.columns(), first)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE trades SET result = 'yes', pnl_cents = 50 WHERE id = 4")
+        conn.commit()
+        conn.close()
+        second = repo.columns()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.has_pnl[3], 1)
+
+    def test_connection_is_read_only(self):
+        repo = get_repository(self.db_path)
+        with self.assertRaises(sqlite3.OperationalError):
+            repo.query("DELETE FROM trades")
+
+    def test_query_shared_across_threads(self):
+        repo = get_repository(self.db_path)
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(200):
+                    self.assertEqual(repo.query("SELECT COUNT(*) FROM trades"), [(5,)])
+                    repo.columns()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def test_real_pnl_not_truncated(self):
+        path = os.path.join(self.tmpdir, "real.db")
+        _make_db(path, [(DAY, "sniper", 90, 12.7, 0, "yes"), (DAY, "sniper", 90, -0.6, 0, "no")])
+        self.assertEqual(get_repository(path).trades().pnl_usd(), [0.127, -0.006])
+
+    def test_missing_trades_table(self):
+        path = os.path.join(self.tmpdir, "empty.db")
+        sqlite3.connect(path).close()
+        repo = TradeRepository(path)
+        self.assertIsInstance(repo.columns(), TradeColumns)
+        self.assertEqual(len(repo.columns()), 0)
+        repo.close()
+
+    def test_legacy_schema_missing_columns(self):
+        path = os.path.join(self.tmpdir, "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE trades (id INTEGER PRIMARY KEY, strategy TEXT, result TEXT)")
+        conn.execute("INSERT INTO trades (strategy, result) VALUES ('x', 'yes')")
+        conn.commit()
+        conn.close()
+        cols = get_repository(path).columns()
+        self.assertEqual(len(cols), 1)
+        self.assertEqual(cols.has_pnl[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+"""trade_repository.py — Shared read-only trade data access for polybot.db.
+
+Every analyzer that needs trade history (BetDistribution.from_db,
+FillRateSimulator.from_db, the nightly analytics batch) goes through one
+pooled read-only connection per DB file and one cached columnar extract of
+the `trades` table. Filters (strategy, time range, price band, live/settled)
+run on the cached arrays, so a batch of analyzers hits SQLite once.
+
+The cache is keyed by (PRAGMA data_version, MAX(rowid), COUNT(*)):
+data_version changes whenever another connection commits (the bot settling
+trades in place), and rowid/count catch appends.
+
+SAFETY:
+- Read-only DB access (sqlite3 URI mode=ro)
+- No writes, no schema changes, no credential access
+
+Usage:
+    from trade_repository import get_repository
+
+    repo = get_repository("/path/to/polybot.db")
+    live = repo.trades(live_only=True, settled_only=True, require_pnl=True)
+    pnl_usd = live.pnl_usd()
+    sniper = live.filter(strategy="expiry_sniper_v1", min_price=85, max_price=99)
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from array import array
+from dataclasses import dataclass, field
+
+DEFAULT_DB_PATH = os.path.expanduser("~/Projects/polymarket-bot/data/polybot.db")
+
+SECONDS_PER_DAY = 86400
+
+# Columns extracted into the columnar cache. Missing columns (legacy schemas)
+# are filled with defaults rather than failing the whole extract.
+_EXTRACT_COLUMNS = ("timestamp", "strategy", "price_cents", "pnl_cents", "is_paper", "result")
+
+
+@dataclass
+class TradeColumns:
+    """Columnar extract of the trades table.
+
+    All arrays are parallel: index i describes the same trade. Strategy names
+    are interned — `strategy_ids[i]` indexes into `strategies`.
+    """
+
+    rowids: array = field(default_factory=lambda: array("q"))
+    timestamps: array = field(default_factory=lambda: array("d"))
+    strategy_ids: array = field(default_factory=lambda: array("i"))
+    price_cents: array = field(default_factory=lambda: array("i"))
+    pnl_cents: array = field(default_factory=lambda: array("d"))  # REAL in some DBs
+    is_paper: bytearray = field(default_factory=bytearray)
+    settled: bytearray = field(default_factory=bytearray)
+    has_pnl: bytearray = field(default_factory=bytearray)
+    strategies: tuple = ()
+
+    def __len__(self) -> int:
+        return len(self.rowids)
+
+    def strategy_id(self, name: str) -> int:
+        """Return the interned id for a strategy name, or -1 if unknown."""
+        try:
+            return self.strategies.index(name)
+        except ValueError:
+            return -1
+
+    def strategy_names(self) -> list[str]:
+        """Distinct non-null strategy names present in this extract."""
+        present = set(self.strategy_ids)
+        return [s for i, s in enumerate(self.strategies) if i in present and s is not None]
+
+    def select(self, indices) -> "TradeColumns":
+        """Return a new extract containing only the given row indices."""
+        out = TradeColumns(strategies=self.strategies)
+        for i in indices:
+            out.rowids.append(self.rowids[i])
+            out.timestamps.append(self.timestamps[i])
+            out.strategy_ids.append(self.strategy_ids[i])
+            out.price_cents.append(self.price_cents[i])
+            out.pnl_cents.append(self.pnl_cents[i])
+            out.is_paper.append(self.is_paper[i])
+            out.settled.append(self.settled[i])
+            out.has_pnl.append(self.has_pnl[i])
+        return out
+
+    def filter(
+        self,
+        strategy: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        live_only: bool = False,
+        settled_only: bool = False,
+        require_pnl: bool = False,
+        min_price: int | None = None,
+        max_price: int | None = None,
+    ) -> "TradeColumns":
+        """Filter on the cached arrays.
+
+        Args:
+            strategy: exact strategy name (None = all)
+            since/until: inclusive epoch-second bounds on timestamp
+            live_only: exclude paper trades
+            settled_only: only trades with a non-null result
+            require_pnl: only trades with a non-null pnl_cents
+            min_price/max_price: inclusive price_cents band
+        """
+        sid = None
+        if strategy is not None:
+            sid = self.strategy_id(strategy)
+            if sid < 0:
+                return TradeColumns(strategies=self.strategies)
+
+        keep = []
+        for i in range(len(self.rowids)):
+            if sid is not None and self.strategy_ids[i] != sid:
+                continue
+            if live_only and self.is_paper[i]:
+                continue
+            if settled_only and not self.settled[i]:
+                continue
+            if require_pnl and not self.has_pnl[i]:
+                continue
+            ts = self.timestamps[i]
+            if since is not None and ts < since:
+                continue
+            if until is not None and ts > until:
+                continue
+            price = self.price_cents[i]
+            if min_price is not None and price < min_price:
+                continue
+            if max_price is not None and price > max_price:
+                continue
+            keep.append(i)
+        if len(keep) == len(self.rowids):
+            return self
+        return self.select(keep)
+
+    def pnl_usd(self) -> list[float]:
+        """P&L values in dollars (NULL pnl rows contribute 0.0)."""
+        return [c / 100.0 for c in self.pnl_cents]
+
+    def daily_counts(self) -> dict[int, int]:
+        """Trade counts per UTC day (days since epoch)."""
+        counts: dict[int, int] = {}
+        for ts in self.timestamps:
+            day = int(ts // SECONDS_PER_DAY)
+            counts[day] = counts.get(day, 0) + 1
+        return counts
+
+
+class TradeRepository:
+    """Pooled read-only access to one polybot.db with a cached columnar extract.
+
+    Use get_repository() rather than constructing directly so analyzers in
+    the same process share the connection and cache.
+    """
+
+    def __init__(self, db_path: str):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"DB not found: {db_path}")
+        self.db_path = db_path
+        self._lock = threading.RLock()  # guards the shared connection and cache
+        self._conn = sqlite3.connect(
+            f"file:{db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._cache_key = None
+        self._columns: TradeColumns | None = None
+
+    def query(self, sql: str, params: tuple = ()) -> list:
+        """Run a read-only query outside `trades` on the shared connection.
+
+        The connection is shared across threads, so the statement runs and
+        is fully fetched under the repository lock.
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+            self._columns = None
+            self._cache_key = None
+
+    def has_trades_table(self) -> bool:
+        return bool(self.query(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='trades'"
+        ))
+
+    def cache_key(self) -> tuple:
+        """(data_version, max rowid, row count) — changes on any committed write."""
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if not self.has_trades_table():
+                return (version, None, 0)
+            max_rowid, count = self._conn.execute(
+                "SELECT MAX(rowid), COUNT(*) FROM trades"
+            ).fetchone()
+            return (version, max_rowid, count)
+
+    def columns(self) -> TradeColumns:
+        """Return the cached extract, reloading only if the DB changed."""
+        with self._lock:
+            key = self.cache_key()
+            if self._columns is None or key != self._cache_key:
+                self._columns = self._load_columns()
+                self._cache_key = key
+            return self._columns
+
+    def trades(self, **filters) -> TradeColumns:
+        """Shorthand for columns().filter(**filters)."""
+        return self.columns().filter(**filters)
+
+    def _load_columns(self) -> TradeColumns:
+        if not self.has_trades_table():
+            return TradeColumns()
+        available = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(trades)").fetchall()
+        }
+        select = ", ".join(
+            c if c in available else "NULL" for c in _EXTRACT_COLUMNS
+        )
+        order = "timestamp, rowid" if "timestamp" in available else "rowid"
+        rows = self._conn.execute(
+            f"SELECT rowid, {select} FROM trades ORDER BY {order}"
+        )
+
+        cols = TradeColumns()
+        interned: dict = {}
+        for rowid, ts, strategy, price, pnl, is_paper, result in rows:
+            sid = interned.get(strategy)
+            if sid is None:
+                sid = interned[strategy] = len(interned)
+            cols.rowids.append(rowid)
+            cols.timestamps.append(float(ts or 0.0))
+            cols.strategy_ids.append(sid)
+            cols.price_cents.append(int(price or 0))
+            cols.pnl_cents.append(float(pnl or 0))
+            cols.is_paper.append(1 if is_paper else 0)
+            cols.settled.append(0 if result is None else 1)
+            cols.has_pnl.append(0 if pnl is None else 1)
+        cols.strategies = tuple(interned)
+        return cols
+
+
+_POOL: dict[tuple, TradeRepository] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def get_repository(db_path: str | None = None) -> TradeRepository:
+    """Return the pooled repository for db_path (default: polybot.db).
+
+    Pooled by (realpath, device, inode) so a file recreated at the same path
+    gets a fresh connection instead of a stale handle.
+
+    Raises:
+        FileNotFoundError: if db_path doesn't exist
+    """
+    db_path = db_path or DEFAULT_DB_PATH
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"DB not found: {db_path}")
+    st = os.stat(db_path)
+    key = (os.path.realpath(db_path), st.st_dev, st.st_ino)
+    with _POOL_LOCK:
+        repo = _POOL.get(key)
+        if repo is None:
+            repo = _POOL[key] = TradeRepository(db_path)
+        return repo
+
+
+def clear_pool() -> None:
+    """Close and drop every pooled repository."""
+    with _POOL_LOCK:
+        for repo in _POOL.values():
+            repo.close()
+        _POOL.clear()
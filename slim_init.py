@@ -9,9 +9,18 @@ with a ~1 minute automated startup:
   3. Run priority_picker.py for task recommendation
   4. Output structured init summary
 
+Steps run as a dependency graph (STEP_GRAPH): independent steps run
+concurrently on a thread pool (each is a subprocess, so threads suffice),
+and steps that only write after reading a file wait for their readers.
+Read-only steps declare their input files; with caching on (the CLI
+default), a step whose inputs hash the same as last time returns its
+cached result instantly. Per-step timings are appended to
+init_benchmarker's step log.
+
 CLI:
     python3 slim_init.py              # Run full slim init
     python3 slim_init.py --json       # JSON output
+    python3 slim_init.py --no-cache   # Re-run every step (ignore step cache)
     python3 slim_init.py orient       # Just parse SESSION_STATE
     python3 slim_init.py smoke        # Just run smoke test
     python3 slim_init.py priority     # Just run priority picker
@@ -19,12 +28,18 @@ CLI:
 Stdlib only. No external dependencies.
 """
 
+import glob
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from resume_generator import build_handoff_snapshot, summarize_snapshot_for_init
 from session_id import normalize as normalize_session_id
@@ -36,6 +51,10 @@ DIRECTIVES_PATH = PROJECT_ROOT / "MATTHEW_DIRECTIVES.md"
 
 INIT_STEPS = ["smoke", "priority", "summary"]
 
+STEP_CACHE_PATH = Path.home() / ".cca-init-step-cache.json"
+STEP_CACHE_MAX_AGE_S = 6 * 3600  # Cached step output older than this is re-run
+INIT_MAX_WORKERS = 8
+
 
 def parse_session_state(content: str) -> dict:
     """Parse SESSION_STATE.md for quick orientation."""
@@ -762,6 +781,9 @@ def format_summary(summary: dict) -> str:
         lines.append(f"  {summary['agent_cost_brief']}")
     if summary.get("agent_cost_alert"):
         lines.append(f"  !! {summary['agent_cost_alert']}")
+    if summary.get("init_timings"):
+        it = summary["init_timings"]
+        lines.append(f"  Init: {it['wall_seconds']:.1f}s ({len(it['cached_steps'])}/{len(it['steps'])} steps cached)")
     if summary.get("blockers"):
         lines.append("  BLOCKERS:")
         for b in summary["blockers"]:
@@ -782,67 +804,300 @@ def format_summary(summary: dict) -> str:
     return "\n".join(lines)
 
 
-def run_slim_init(session_state_path: Path = SESSION_STATE_PATH) -> dict:
-    """Run the full slim init sequence."""
-    # Step 1: Parse SESSION_STATE
-    state = {}
-    if session_state_path.exists():
-        content = session_state_path.read_text()
-        state = parse_session_state(content)
-
-    # Step 1.5: Scan TODAYS_TASKS.md (Matthew directive S178 — authoritative daily list)
-    todays = scan_todays_tasks()
-
-    # Step 2: Smoke test
-    smoke = run_smoke()
-
-    # Step 2.5: Seed principles (idempotent — zero cost if already seeded)
-    seeder = run_principle_seeder()
-
-    # Step 3: Priority pick (informational — TODAYS_TASKS takes precedence)
-    priority = run_priority()
-
-    # Step 3.5: MT proposals from findings (MT-41)
-    mt_proposals = run_mt_proposals()
+# ── Step graph ───────────────────────────────────────────────────────────
 
-    # Step 3.6: MT phase extensions for existing MTs (MT-41 Phase 4)
-    mt_extensions = run_mt_extensions()
 
-    # Step 3.6b: Unified origination (MT-52 — 3-source intelligence, S183)
-    unified = run_unified_origination()
+@dataclass(frozen=True)
+class InitStep:
+    """One slim_init step.
 
-    # Step 3.7: Meta-learning health (MT-49)
-    meta_learning = run_meta_learning()
-
-    # Step 3.7b: Meta-tracker (MT-49 Phase 1 — zombie/usage tracking + snapshot)
-    meta_tracker = run_meta_tracker(session_num=state.get("session_num", 0) + 1)
-
-    # Step 3.8: Transfer proposals (MT-49 Phase 2 — auto-propose)
-    transfer = run_transfer_proposals()
-
-    # Step 3.9: Principle discovery (MT-49 Phase 3 — dry-run scan)
-    discoverer = run_principle_discoverer()
+    func is the name of a module-level run_* function, looked up when the
+    step runs. deps lists steps that must finish first: a step that writes
+    a file waits for the steps that read it in the old sequential order,
+    so every step sees the same file state it always did. inputs are glob
+    patterns (relative to PROJECT_ROOT, or ~-prefixed) of the files whose
+    content determines the result; steps with side effects or
+    time-dependent output leave inputs empty and are never cached.
+    """
+    name: str
+    func: str
+    deps: tuple = ()
+    inputs: tuple = ()
+    kwargs: Optional[Callable[[dict], dict]] = None
+
+
+_PRINCIPLE_FILES = ("self-learning/principles.jsonl", "self-learning/principles.usage.jsonl",
+                    "self-learning/principle_registry.py")
+# mt_originator reads FINDINGS_LOG.md through findings_index's parser
+_MT_ORIGINATOR_INPUTS = ("mt_originator.py", "self-learning/findings_index.py",
+                         "FINDINGS_LOG.md", "MASTER_TASKS.md",
+                         "mt_proposals.jsonl", "~/.claude/cross-chat/POLYBOT_TO_CCA.md")
+_CROSS_CHAT_DELIVERY = ("~/.claude/cross-chat/DELIVERY_ACK.md",
+                        "~/.claude/cross-chat/CCA_TO_POLYBOT.md")
+
+STEP_GRAPH = (
+    # Smoke suites and the modules they exercise
+    InitStep("smoke", "run_smoke", inputs=(
+        "init_cache.py", "*.py", "tests/test_hook_chain_integration.py",
+        "tests/test_cca_internal_queue.py", "tests/test_priority_picker.py",
+        "agent-guard/*.py", "agent-guard/tests/test_path_validator.py",
+        "agent-guard/tests/test_bash_guard.py", "agent-guard/tests/test_credential_guard.py",
+        "context-monitor/*.py", "context-monitor/tests/test_meter.py",
+        "context-monitor/tests/test_alert.py", "memory-system/*.py",
+        "memory-system/tests/test_memory.py", "spec-system/*.py",
+        "spec-system/tests/test_spec.py",
+    )),
+    # Idempotent, but writes principles.jsonl — everything reading it waits
+    InitStep("seeder", "run_principle_seeder"),
+    # Uses file ages and wall-clock staleness: never cached
+    InitStep("priority", "run_priority"),
+    InitStep("mt_proposals", "run_mt_proposals", inputs=_MT_ORIGINATOR_INPUTS),
+    InitStep("mt_extensions", "run_mt_extensions", inputs=_MT_ORIGINATOR_INPUTS),
+    InitStep("unified", "run_unified_origination", inputs=_MT_ORIGINATOR_INPUTS),
+    InitStep("meta_learning", "run_meta_learning", deps=("seeder",), inputs=(
+        "self-learning/meta_learning_dashboard.py", "self-learning/research_roi_resolver.py",
+        "session_outcomes.jsonl", "self-learning/improvements.jsonl",
+        "self-learning/research_outcomes.jsonl", "self-learning/journal.jsonl",
+    ) + _PRINCIPLE_FILES + _CROSS_CHAT_DELIVERY),
+    InitStep("meta_tracker", "run_meta_tracker", deps=("seeder",),
+             kwargs=lambda st: {"session_num": st.get("session_num", 0) + 1}),
+    InitStep("transfer", "run_transfer_proposals", deps=("seeder",)),
+    InitStep("discoverer", "run_principle_discoverer", deps=("seeder",), inputs=(
+        "self-learning/principle_discoverer.py", "self-learning/journal.jsonl",
+    ) + _PRINCIPLE_FILES),
+    # Rewrites principle confidence: runs after the steps that read principles before it
+    InitStep("recal", "run_recalibration",
+             deps=("seeder", "meta_learning", "meta_tracker", "transfer", "discoverer"),
+             kwargs=lambda st: {"current_session": st.get("session_num", 0)}),
+    InitStep("roi", "run_research_roi", inputs=(
+        "self-learning/research_roi_resolver.py", "self-learning/research_outcomes.jsonl",
+    ) + _CROSS_CHAT_DELIVERY),
+    # Appends to research_outcomes.jsonl, read by roi and meta_learning
+    InitStep("enricher", "run_outcomes_enricher", deps=("roi", "meta_learning")),
+    InitStep("predictions", "run_predictive_recommendations", deps=("recal",), inputs=(
+        "self-learning/predictive_recommender.py", "self-learning/journal.jsonl",
+    ) + _PRINCIPLE_FILES, kwargs=lambda st: {"session_num": st.get("session_num", 0)}),
+    # Scans recent transcripts outside the repo: never cached
+    InitStep("reflect", "run_reflect_brief"),
+    InitStep("session_metrics", "run_session_metrics", deps=("recal",), inputs=(
+        "self-learning/session_metrics.py", "self-learning/journal.jsonl",
+    ) + _PRINCIPLE_FILES),
+    InitStep("timeline", "run_timeline", inputs=(
+        "session_timeline.py", "wrap_assessments.jsonl", ".cca-trial-results.jsonl",
+        ".cca-loop-health.jsonl", ".cca-init-benchmarks.jsonl",
+    ), kwargs=lambda st: {"n": 5}),
+    # "Spawns today" changes with the date: never cached
+    InitStep("agent_brief", "run_agent_briefing"),
+)
+
+
+class StepCache:
+    """Step results keyed by a fingerprint of their input files.
+
+    File content hashes are memoized per (size, mtime_ns), so a warm
+    lookup is one stat() per input file; a touched-but-unchanged file is
+    re-hashed once and still hits.
+    """
 
-    # Step 3.10: Confidence recalibration (MT-49 Phase 4 — staleness check)
-    recal = run_recalibration(current_session=state.get("session_num", 0))
+    VERSION = 1
+
+    def __init__(self, path: Path = STEP_CACHE_PATH, max_age_s: float = STEP_CACHE_MAX_AGE_S):
+        self.path = path
+        self.max_age_s = max_age_s
+        self._files: dict = {}
+        self._steps: dict = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == self.VERSION:
+                self._files = data.get("files", {})
+                self._steps = data.get("steps", {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            pass
+
+    def _file_hash(self, path: str) -> str:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "missing"
+        memo = self._files.get(path)
+        if memo and memo[0] == st.st_size and memo[1] == st.st_mtime_ns:
+            return memo[2]
+        h = hashlib.sha1()
+        try:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+        except OSError:
+            return "unreadable"
+        digest = h.hexdigest()
+        self._files[path] = [st.st_size, st.st_mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def fingerprint(self, step: InitStep, kwargs: dict, root: Path = PROJECT_ROOT) -> str:
+        h = hashlib.sha1(f"{step.func}:{json.dumps(kwargs, sort_keys=True)}".encode())
+        for pattern in step.inputs:
+            if pattern.startswith("~"):
+                pattern = os.path.expanduser(pattern)
+            elif not os.path.isabs(pattern):
+                pattern = str(root / pattern)
+            matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+            for path in matches:
+                h.update(f"\0{path}\0{self._file_hash(path)}".encode())
+        return h.hexdigest()
+
+    def get(self, name: str, key: str) -> Optional[dict]:
+        entry = self._steps.get(name)
+        if not entry or entry.get("key") != key:
+            return None
+        if time.time() - entry.get("at", 0) > self.max_age_s:
+            return None
+        return entry.get("result")
+
+    def put(self, name: str, key: str, result: dict) -> None:
+        # Errors and timeouts are transient: re-run them next time
+        if not isinstance(result, dict) or result.get("error"):
+            self._steps.pop(name, None)
+        else:
+            self._steps[name] = {"key": key, "at": time.time(), "result": result}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {"version": self.VERSION, "files": self._files, "steps": self._steps}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            pass  # Cache is an optimization; init never fails on it
+
+
+def run_step_graph(
+    state: dict,
+    steps: tuple = STEP_GRAPH,
+    cache: Optional[StepCache] = None,
+    max_workers: int = INIT_MAX_WORKERS,
+) -> tuple[dict, dict]:
+    """Run steps as soon as their deps finish. Returns (results, timings).
+
+    timings maps step name -> {"seconds": float, "cached": bool}. A step
+    that raises is recorded as {"error": ...} so one broken tool never
+    blocks init.
+    """
+    by_name = {s.name: s for s in steps}
+    for s in steps:
+        missing = [d for d in s.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"Step {s.name} depends on unknown step(s): {missing}")
+
+    results: dict = {}
+    timings: dict = {}
+    pending = list(steps)
+    running: dict = {}
+    module = sys.modules[__name__]
+
+    def _run(step: InitStep, kwargs: dict, key: Optional[str]) -> tuple:
+        t0 = time.perf_counter()
+        try:
+            result = getattr(module, step.func)(**kwargs)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        return result, time.perf_counter() - t0, key
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while pending or running:
+            ready = [s for s in pending if all(d in results for d in s.deps)]
+            for step in ready:
+                pending.remove(step)
+                kwargs = step.kwargs(state) if step.kwargs else {}
+                key = None
+                if cache is not None and step.inputs:
+                    t0 = time.perf_counter()
+                    key = cache.fingerprint(step, kwargs)
+                    hit = cache.get(step.name, key)
+                    if hit is not None:
+                        results[step.name] = hit
+                        timings[step.name] = {"seconds": round(time.perf_counter() - t0, 4), "cached": True}
+                        continue
+                running[pool.submit(_run, step, kwargs, key)] = step
+            if any(all(d in results for d in s.deps) for s in pending):
+                continue  # cache hits above unblocked more steps
+            if not running:
+                if pending:
+                    raise ValueError(f"Step graph has a cycle among: {[s.name for s in pending]}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                step = running.pop(fut)
+                result, seconds, key = fut.result()
+                results[step.name] = result
+                timings[step.name] = {"seconds": round(seconds, 4), "cached": False}
+                if cache is not None and key is not None:
+                    cache.put(step.name, key, result)
+
+    if cache is not None:
+        cache.save()
+    return results, timings
+
+
+def _record_step_timings(state: dict, wall_seconds: float, timings: dict) -> None:
+    """Append this run's timings to init_benchmarker's step log (fail-open)."""
+    try:
+        from init_benchmarker import save_step_timings
+        session_num = state.get("session_num")
+        session_id = f"S{session_num + 1}" if session_num is not None else "unknown"
+        save_step_timings(session_id, wall_seconds, timings)
+    except (ImportError, OSError):
+        pass
 
-    # Step 3.11: Research ROI (MT-49 Phase 5 — delivery resolution)
-    roi = run_research_roi()
 
-    # Step 3.12: Outcomes enricher (MT-49 Phase 5 — auto-enrich missing REQs)
-    enricher = run_outcomes_enricher()
+def run_slim_init(
+    session_state_path: Path = SESSION_STATE_PATH,
+    use_cache: bool = False,
+    record_timings: bool = False,
+    max_workers: int = INIT_MAX_WORKERS,
+) -> dict:
+    """Run the full slim init sequence.
 
-    # Step 3.13: Predictive recommendations (MT-28 Phase 5 — pre-session principle ranking)
-    predictions = run_predictive_recommendations(session_num=state.get("session_num", 0))
+    use_cache serves unchanged read-only steps from STEP_CACHE_PATH;
+    record_timings appends per-step timings for init_benchmarker.
+    """
+    t_start = time.perf_counter()
 
-    # Step 3.14: Reflect brief (deferred wrap step 7 — journal pattern analysis)
-    reflect = run_reflect_brief()
+    # Step 1: Parse SESSION_STATE
+    state = {}
+    if session_state_path.exists():
+        content = session_state_path.read_text()
+        state = parse_session_state(content)
 
-    # Step 3.15: Session metrics (MT-49 Phase 6 — session-over-session trends)
-    session_metrics = run_session_metrics()
+    # Step 1.5: Scan TODAYS_TASKS.md (Matthew directive S178 — authoritative daily list)
+    todays = scan_todays_tasks()
 
-    # Step 4: Session timeline (last 5 sessions)
-    timeline = run_timeline(5)
+    # Steps 2-4: smoke, seeder, priority, MT origination, MT-49 self-learning
+    # chain, reflect, session metrics, timeline, agent briefing (STEP_GRAPH)
+    cache = StepCache() if use_cache else None
+    results, timings = run_step_graph(state, cache=cache, max_workers=max_workers)
+    smoke = results["smoke"]
+    seeder = results["seeder"]
+    priority = results["priority"]
+    mt_proposals = results["mt_proposals"]
+    mt_extensions = results["mt_extensions"]
+    unified = results["unified"]
+    meta_learning = results["meta_learning"]
+    meta_tracker = results["meta_tracker"]
+    transfer = results["transfer"]
+    discoverer = results["discoverer"]
+    recal = results["recal"]
+    roi = results["roi"]
+    enricher = results["enricher"]
+    predictions = results["predictions"]
+    reflect = results["reflect"]
+    session_metrics = results["session_metrics"]
+    timeline = results["timeline"]
 
     # Step 5: Build summary
     summary = build_summary(smoke, priority, state)
@@ -898,7 +1153,7 @@ def run_slim_init(session_state_path: Path = SESSION_STATE_PATH) -> dict:
         summary["directive_session"] = directives["latest_session"]
 
     # Step 5.15: Agent registry + spawn cost briefing (20A/20B)
-    agent_brief = run_agent_briefing()
+    agent_brief = results["agent_brief"]
     if agent_brief.get("registry"):
         summary["agent_registry_brief"] = agent_brief["registry"]
     if agent_brief.get("cost"):
@@ -929,15 +1184,27 @@ def run_slim_init(session_state_path: Path = SESSION_STATE_PATH) -> dict:
     except Exception:
         pass  # Non-blocking — orchestrator failure never prevents init
 
+    wall = time.perf_counter() - t_start
+    summary["init_timings"] = {
+        "wall_seconds": round(wall, 3),
+        "cached_steps": sorted(n for n, t in timings.items() if t["cached"]),
+        "steps": timings,
+    }
+    if record_timings:
+        _record_step_timings(state, wall, timings)
+
     return summary
 
 
 if __name__ == "__main__":
     args = sys.argv[1:]
 
+    use_cache = "--no-cache" not in args
+    args = [a for a in args if a != "--no-cache"]
+
     if not args or args[0] not in ("--json", "orient", "smoke", "priority"):
         # Full slim init — compact output to minimize context consumption
-        result = run_slim_init()
+        result = run_slim_init(use_cache=use_cache, record_timings=True)
         if "--json" in args:
             print(json.dumps(result, indent=2))
         elif "--verbose" in args:
@@ -968,7 +1235,7 @@ if __name__ == "__main__":
                     for el in ext_lines[:3]:
                         print(f"  {el.strip()}")
     elif args[0] == "--json":
-        result = run_slim_init()
+        result = run_slim_init(use_cache=use_cache, record_timings=True)
         print(json.dumps(result, indent=2))
     elif args[0] == "orient":
         if SESSION_STATE_PATH.exists():
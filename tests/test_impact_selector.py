@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for impact_selector.py — import-graph test selection and LPT scheduling."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from impact_selector import ImpactSelector, _parse_imports
+from parallel_test_runner import SuiteResult
+
+TREE = {
+    "core.py": "import json\n",
+    "helper.py": "from core import thing\n",
+    "other.py": "",
+    "pkg/shared.py": "",
+    "pkg2/shared.py": "",
+    "pkg/tests/test_helper.py": "import helper\n",
+    "pkg/tests/test_other.py": "import other\n",
+    "pkg/tests/test_shared.py": "import shared\n",
+    "tests/test_core.py": "import core\n",
+}
+
+
+class TestImpactSelector(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.state = Path(self.tmpdir) / "state.json"
+        self.root = os.path.join(self.tmpdir, "proj")
+        for rel, body in TREE.items():
+            self._write(rel, body)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, rel, body):
+        path = os.path.join(self.root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(body)
+
+    def _selector(self):
+        return ImpactSelector(self.root, state_path=self.state)
+
+    def _green(self, durations=None):
+        sel = self._selector()
+        durations = durations or {}
+        sel.record([SuiteResult(path=os.path.join(self.root, rel), passed=True, tests_run=1,
+                                duration_s=durations.get(rel, 1.0), output="")
+                    for rel in sel.test_files()])
+
+    def test_first_run_selects_everything(self):
+        plan = self._selector().plan()
+        self.assertTrue(plan.first_run)
+        self.assertEqual(len(plan.to_run), 4)
+        self.assertEqual(set(plan.reasons.values()), {"no history"})
+
+    def test_transitive_importers_selected(self):
+        self._green()
+        self._write("core.py", "import json  # edited\n")
+        plan = self._selector().plan()
+        self.assertEqual(plan.changed_files, ["core.py"])
+        self.assertEqual(sorted(plan.to_run), ["pkg/tests/test_helper.py", "tests/test_core.py"])
+        self.assertEqual(len(plan.cached), 2)
+
+    def test_touch_without_edit_selects_nothing(self):
+        self._green()
+        path = os.path.join(self.root, "core.py")
+        os.utime(path, ns=(1, 1))
+        plan = self._selector().plan()
+        self.assertEqual(plan.to_run, [])
+        self.assertEqual(plan.changed_files, [])
+
+    def test_ambiguous_name_prefers_local_package(self):
+        self._green()
+        self._write("pkg2/shared.py", "X = 1\n")
+        self.assertEqual(self._selector().plan().to_run, [])
+        self._write("pkg/shared.py", "X = 1\n")
+        self.assertEqual(self._selector().plan().to_run, ["pkg/tests/test_shared.py"])
+
+    def test_deleted_dependency_selects_old_importers(self):
+        self._green()
+        os.remove(os.path.join(self.root, "other.py"))
+        plan = self._selector().plan()
+        self.assertIn("other.py", plan.changed_files)
+        self.assertEqual(plan.to_run, ["pkg/tests/test_other.py"])
+
+    def test_failed_suite_reruns_and_blocks_green(self):
+        self._green()
+        sel = self._selector()
+        self._write("core.py", "# broken\n")
+        green = sel.record([SuiteResult(path=os.path.join(self.root, "tests/test_core.py"),
+                                        passed=False, tests_run=1, duration_s=0.1, output="")])
+        self.assertFalse(green)
+        plan = self._selector().plan()
+        self.assertEqual(plan.reasons.get("tests/test_core.py"), "failed last run")
+
+    def test_longest_first_with_unknown_first(self):
+        self._green({"tests/test_core.py": 1.0, "pkg/tests/test_helper.py": 9.0})
+        self._write("core.py", "# edited\n")
+        self._write("pkg/tests/test_new.py", "import core\n")
+        plan = self._selector().plan()
+        self.assertEqual(plan.to_run, ["pkg/tests/test_new.py", "pkg/tests/test_helper.py",
+                                       "tests/test_core.py"])
+
+    def test_duration_moving_average(self):
+        self._green({"tests/test_core.py": 4.0})
+        sel = self._selector()
+        sel.record([SuiteResult(path=os.path.join(self.root, "tests/test_core.py"),
+                                passed=True, tests_run=1, duration_s=2.0, output="")])
+        self.assertAlmostEqual(sel.estimate("tests/test_core.py"), 3.0)
+
+    def test_fingerprint_stable_and_content_based(self):
+        first = self._selector().content_fingerprint()
+        self.assertEqual(self._selector().content_fingerprint(), first)
+        self._write("helper.py", "from core import other_thing\n")
+        self.assertNotEqual(self._selector().content_fingerprint(), first)
+
+    def test_state_for_other_root_ignored(self):
+        self._green()
+        other = ImpactSelector(self.tmpdir, state_path=self.state)
+        self.assertIsNone(other.state["green"])
+
+    def test_parse_imports(self):
+        src = b"import a.b, c\nfrom d.e import f\nfrom . import g\nfrom .h import i\ndef x():\n    import j\n"
+        self.assertEqual(_parse_imports(src, "x.py"), ["a", "c", "d", "g", "h", "j"])
+        self.assertEqual(_parse_imports(b"def (:", "bad.py"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
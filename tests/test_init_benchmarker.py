@@ -240,5 +240,57 @@ class TestFormatReport(unittest.TestCase):
         self.assertIn("no", table.lower())
 
 
+class TestStepTimings(unittest.TestCase):
+    """Per-step slim_init timings written by slim_init.run_slim_init."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.bench_file = Path(self.tmpdir) / "steps.jsonl"
+
+    def tearDown(self):
+        if self.bench_file.exists():
+            self.bench_file.unlink()
+        os.rmdir(self.tmpdir)
+
+    def test_save_and_load(self):
+        from init_benchmarker import save_step_timings, load_step_timings
+        rec = save_step_timings("S200", 2.5, {
+            "smoke": {"seconds": 2.0, "cached": False},
+            "timeline": {"seconds": 0.5, "cached": False},
+        }, bench_file=self.bench_file)
+        self.assertEqual(rec["serial_seconds"], 2.5)
+        runs = load_step_timings(bench_file=self.bench_file)
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0]["session_id"], "S200")
+
+    def test_load_missing_file(self):
+        from init_benchmarker import load_step_timings
+        self.assertEqual(load_step_timings(bench_file=self.bench_file), [])
+
+    def test_summary_excludes_cached_from_average(self):
+        from init_benchmarker import summarize_step_timings
+        runs = [
+            {"wall_seconds": 4.0, "serial_seconds": 6.0,
+             "steps": {"smoke": {"seconds": 3.0, "cached": False}}},
+            {"wall_seconds": 1.0, "serial_seconds": 0.0,
+             "steps": {"smoke": {"seconds": 0.001, "cached": True}}},
+        ]
+        summary = summarize_step_timings(runs)
+        self.assertEqual(summary["runs"], 2)
+        self.assertEqual(summary["avg_wall_seconds"], 2.5)
+        self.assertEqual(summary["steps"]["smoke"]["avg_seconds"], 3.0)
+        self.assertEqual(summary["steps"]["smoke"]["cache_hit_rate"], 0.5)
+
+    def test_format_step_table(self):
+        from init_benchmarker import format_step_table, summarize_step_timings
+        self.assertIn("No step timings", format_step_table(summarize_step_timings([])))
+        table = format_step_table(summarize_step_timings([
+            {"wall_seconds": 1.0, "serial_seconds": 1.5, "steps": {
+                "smoke": {"seconds": 1.0, "cached": False},
+                "roi": {"seconds": 0.5, "cached": False}}},
+        ]))
+        self.assertLess(table.index("smoke"), table.index("roi"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -350,6 +350,21 @@ class TestMetaTrackerPruning(unittest.TestCase):
         self.assertIn("prin_80s", target_ids)
         self.assertNotIn("prin_40s", target_ids)
 
+    def test_usage_log_counts_are_not_zombies(self):
+        """Usage recorded through the registry lives in the usage log, not the row."""
+        from meta_tracker import MetaTracker
+        from principle_registry import record_usage, _usage_path
+        self._write_principles([
+            _make_principle("prin_used", "Used via registry", "general",
+                            usage=0, created_session=100),
+        ])
+        record_usage("prin_used", success=True, session=190, path=self.principles_path)
+        self.assertTrue(os.path.exists(_usage_path(self.principles_path)))
+        mt = MetaTracker(self.principles_path, self.snapshots_path)
+        self.assertEqual(mt.list_zombies(current_session=200), [])
+        self.assertEqual(mt.prune_zombies(current_session=200, dry_run=False), [])
+        self.assertEqual(mt.health(current_session=200)["zombies"], 0)
+
 
 class TestMetaTrackerBriefing(unittest.TestCase):
     """Test the init-briefing output format."""
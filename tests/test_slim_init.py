@@ -1660,5 +1660,133 @@ class TestHandoffInSummary(unittest.TestCase):
         self.assertIn("Political Markets Volume Probe", output)
 
 
+class TestStepGraph(unittest.TestCase):
+    """Dependency-aware parallel step execution with cached results."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.input_file = self.tmpdir / "input.txt"
+        self.input_file.write_text("v1")
+        self.calls = []
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _steps(self):
+        from slim_init import InitStep
+        return (
+            InitStep("a", "run_a", inputs=(str(self.input_file),)),
+            InitStep("b", "run_b", deps=("a",), kwargs=lambda st: {"n": st["n"]}),
+            InitStep("c", "run_c", inputs=(str(self.tmpdir / "*.txt"),)),
+        )
+
+    def _patched(self):
+        def make(name):
+            def fn(**kwargs):
+                self.calls.append(name)
+                return {"step": name, **kwargs}
+            return fn
+        return patch.multiple("slim_init", create=True,
+                              run_a=make("a"), run_b=make("b"), run_c=make("c"))
+
+    def test_default_graph_is_valid(self):
+        from slim_init import STEP_GRAPH
+        names = [s.name for s in STEP_GRAPH]
+        self.assertEqual(len(names), len(set(names)))
+        for step in STEP_GRAPH:
+            for dep in step.deps:
+                self.assertIn(dep, names)
+        self.assertIn("smoke", names)
+
+    def test_default_graph_lists_module_inputs(self):
+        from slim_init import PROJECT_ROOT, STEP_GRAPH
+        steps = {s.name: s for s in STEP_GRAPH}
+        # The originator parses FINDINGS_LOG.md with findings_index
+        for name in ("mt_proposals", "mt_extensions", "unified"):
+            self.assertIn("self-learning/findings_index.py", steps[name].inputs)
+        for step in STEP_GRAPH:
+            for path in step.inputs:
+                if path.endswith(".py") and "*" not in path:
+                    self.assertTrue((PROJECT_ROOT / path).exists(), path)
+
+    def test_deps_run_first_and_kwargs_from_state(self):
+        from slim_init import run_step_graph
+        with self._patched():
+            results, timings = run_step_graph({"n": 7}, steps=self._steps())
+        self.assertLess(self.calls.index("a"), self.calls.index("b"))
+        self.assertEqual(results["b"], {"step": "b", "n": 7})
+        self.assertFalse(any(t["cached"] for t in timings.values()))
+
+    def test_unknown_dep_rejected(self):
+        from slim_init import InitStep, run_step_graph
+        with self.assertRaises(ValueError):
+            run_step_graph({}, steps=(InitStep("x", "run_a", deps=("nope",)),))
+
+    def test_step_exception_recorded_as_error(self):
+        from slim_init import InitStep, run_step_graph
+        with patch("slim_init.run_a", create=True, side_effect=RuntimeError("boom")):
+            results, _ = run_step_graph({}, steps=(InitStep("a", "run_a"),))
+        self.assertIn("boom", results["a"]["error"])
+
+    def test_cache_hit_until_input_changes(self):
+        from slim_init import StepCache, run_step_graph
+        cache_path = self.tmpdir / "cache.json"
+        with self._patched():
+            run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path))
+            self.calls.clear()
+            _, timings = run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path))
+            self.assertEqual(self.calls, ["b"])  # b has no inputs: never cached
+            self.assertTrue(timings["a"]["cached"])
+
+            self.input_file.write_text("v2")
+            self.calls.clear()
+            run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path))
+            self.assertEqual(sorted(self.calls), ["a", "b", "c"])
+
+    def test_touched_but_unchanged_file_still_hits(self):
+        from slim_init import StepCache, run_step_graph
+        cache_path = self.tmpdir / "cache.json"
+        with self._patched():
+            run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path))
+            st = self.input_file.stat()
+            os.utime(self.input_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self.calls.clear()
+            run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path))
+        self.assertEqual(self.calls, ["b"])
+
+    def test_error_results_not_cached(self):
+        from slim_init import InitStep, StepCache, run_step_graph
+        cache_path = self.tmpdir / "cache.json"
+        steps = (InitStep("a", "run_a", inputs=(str(self.input_file),)),)
+        with patch("slim_init.run_a", create=True, return_value={"error": "Timeout"}) as m:
+            run_step_graph({}, steps=steps, cache=StepCache(cache_path))
+            run_step_graph({}, steps=steps, cache=StepCache(cache_path))
+        self.assertEqual(m.call_count, 2)
+
+    def test_expired_entry_reruns(self):
+        from slim_init import StepCache, run_step_graph
+        cache_path = self.tmpdir / "cache.json"
+        with self._patched():
+            run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path))
+            self.calls.clear()
+            run_step_graph({"n": 1}, steps=self._steps(), cache=StepCache(cache_path, max_age_s=-1))
+        self.assertEqual(sorted(self.calls), ["a", "b", "c"])
+
+    @patch("slim_init.run_step_graph")
+    @patch("slim_init.Path.exists")
+    def test_run_slim_init_reports_timings(self, mock_exists, mock_graph):
+        from slim_init import STEP_GRAPH, run_slim_init
+        mock_exists.return_value = False
+        results = {s.name: {} for s in STEP_GRAPH}
+        results["smoke"] = {"passed": True, "suites_passed": 10, "suites_total": 10}
+        timings = {s.name: {"seconds": 0.1, "cached": s.name == "smoke"} for s in STEP_GRAPH}
+        mock_graph.return_value = (results, timings)
+        with patch("slim_init.subprocess.run"):
+            summary = run_slim_init()
+        self.assertEqual(summary["init_timings"]["cached_steps"], ["smoke"])
+        self.assertIsNone(mock_graph.call_args.kwargs["cache"])
+
+
 if __name__ == "__main__":
     unittest.main()
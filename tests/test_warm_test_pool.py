@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Tests for warm_test_pool.py — fork-per-suite execution from a warm interpreter."""
+
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from warm_test_pool import (
+    WarmTestPool,
+    _count_test_methods,
+    project_warm_modules,
+)
+
+PASSING = """
+import unittest
+
+class TestA(unittest.TestCase):
+    def test_one(self):
+        print("noise from a test")
+        self.assertTrue(True)
+
+    def test_two(self):
+        self.assertEqual(1 + 1, 2)
+
+    @unittest.skip("not today")
+    def test_skipped(self):
+        pass
+
+if __name__ == "__main__":
+    unittest.main()
+"""
+
+FAILING = """
+import unittest
+
+class TestB(unittest.TestCase):
+    def test_ok(self):
+        pass
+
+    def test_bad(self):
+        self.assertEqual(1, 2)
+
+if __name__ == "__main__":
+    unittest.main()
+"""
+
+
+@unittest.skipUnless(WarmTestPool.supported(), "requires os.fork")
+class TestWarmTestPool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _suite(self, name, body):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "w") as f:
+            f.write(textwrap.dedent(body))
+        return path
+
+    def _pool(self, **kw):
+        kw.setdefault("warm_project", False)
+        return WarmTestPool(workers=2, root=self.tmpdir, **kw)
+
+    def test_structured_results(self):
+        path = self._suite("test_pass.py", PASSING)
+        (r,) = self._pool().run([path])
+        self.assertTrue(r.passed)
+        self.assertEqual(r.tests_run, 3)
+        outcomes = {t["name"].rsplit(".", 1)[-1]: t["outcome"] for t in r.tests}
+        self.assertEqual(outcomes, {"test_one": "pass", "test_two": "pass", "test_skipped": "skip"})
+        self.assertIn("noise from a test", r.output)
+        self.assertIn("OK", r.output)
+
+    def test_failure_detail_without_cold_retry(self):
+        path = self._suite("test_fail.py", FAILING)
+        (r,) = self._pool(retry_cold=False).run([path])
+        self.assertFalse(r.passed)
+        bad = [t for t in r.tests if t["outcome"] == "fail"]
+        self.assertEqual(len(bad), 1)
+        self.assertIn("AssertionError", bad[0]["detail"])
+        self.assertIn("test_bad", r.error)
+
+    def test_failure_confirmed_cold(self):
+        path = self._suite("test_fail.py", FAILING)
+        (r,) = self._pool(retry_cold=True).run([path])
+        self.assertFalse(r.passed)
+        self.assertEqual(r.tests, [])  # cold subprocess result
+
+    def test_results_in_input_order(self):
+        paths = [self._suite(f"test_s{i}.py", PASSING) for i in range(5)]
+        results = self._pool().run(paths)
+        self.assertEqual([r.path for r in results], paths)
+
+    def test_suites_isolated(self):
+        a = self._suite("test_set.py", """
+            import os, unittest
+            os.environ["WARM_POOL_LEAK"] = "1"
+            class T(unittest.TestCase):
+                def test_x(self):
+                    pass
+        """)
+        b = self._suite("test_check.py", """
+            import os, unittest
+            class T(unittest.TestCase):
+                def test_no_leak(self):
+                    self.assertNotIn("WARM_POOL_LEAK", os.environ)
+        """)
+        pool = WarmTestPool(workers=1, root=self.tmpdir, warm_project=False, retry_cold=False)
+        results = pool.run([a, b])
+        self.assertTrue(all(r.passed for r in results))
+        self.assertNotIn("WARM_POOL_LEAK", os.environ)
+
+    def test_import_error(self):
+        path = self._suite("test_broken.py", "import module_that_does_not_exist\n")
+        (r,) = self._pool(retry_cold=False).run([path])
+        self.assertFalse(r.passed)
+        self.assertIn("ModuleNotFoundError", r.error)
+
+    def test_script_style_falls_back_to_subprocess(self):
+        path = self._suite("test_script.py", """
+            if __name__ == "__main__":
+                assert 1 + 1 == 2
+                print("Ran 1 test")
+        """)
+        (r,) = self._pool().run([path])
+        self.assertTrue(r.passed)
+
+    def test_timeout(self):
+        path = self._suite("test_slow.py", """
+            import time, unittest
+            class T(unittest.TestCase):
+                def test_sleep(self):
+                    time.sleep(30)
+        """)
+        (r,) = self._pool(timeout_s=0.5).run([path])
+        self.assertFalse(r.passed)
+        self.assertEqual(r.error, "timeout")
+
+    def test_collect_does_not_execute(self):
+        marker = os.path.join(self.tmpdir, "ran.txt")
+        path = self._suite("test_marker.py", f"""
+            import unittest
+            class T(unittest.TestCase):
+                def test_a(self):
+                    open({marker!r}, "w").close()
+                def test_b(self):
+                    pass
+        """)
+        counts = self._pool().collect([path])
+        self.assertEqual(counts, {path: 2})
+        self.assertFalse(os.path.exists(marker))
+
+    def test_empty(self):
+        self.assertEqual(self._pool().run([]), [])
+        self.assertEqual(self._pool().collect([]), {})
+
+
+class TestWarmModuleSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        for rel, body in {
+            "pkg_a/shared.py": "",
+            "pkg_b/shared.py": "",
+            "pkg_a/unique_mod.py": "",
+            "pkg_a/tests/test_x.py": "import shared\nimport unique_mod\nimport json\n",
+            "pkg_b/tests/test_y.py": "from unique_mod import thing\n",
+        }.items():
+            path = os.path.join(self.tmpdir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(body)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_only_unique_project_modules(self):
+        mods = project_warm_modules(self.tmpdir)
+        self.assertEqual(mods, [("unique_mod", os.path.join(self.tmpdir, "pkg_a"))])
+
+    def test_ast_count_fallback(self):
+        path = os.path.join(self.tmpdir, "test_count.py")
+        with open(path, "w") as f:
+            f.write("class A:\n    def test_1(self): pass\n    def helper(self): pass\n"
+                    "class B:\n    def test_2(self): pass\n")
+        self.assertEqual(_count_test_methods(path), 2)
+        self.assertEqual(_count_test_methods(os.path.join(self.tmpdir, "missing.py")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""warm_test_pool.py — Fork-per-suite test execution from a warm interpreter.
+
+Running 400+ suites as `python3 test_*.py` pays interpreter startup and
+re-imports unittest, json, sqlite3, mock and the shared project modules
+every time. WarmTestPool imports those once, then forks a child per suite
+(copy-on-write, ~1ms). The child loads the test module in-process, runs it
+with unittest and sends back structured results: per-test outcome,
+duration and failure text. No "Ran N tests" scraping.
+
+Isolation: every suite runs in its own forked child, so module state,
+patches, cwd and sys.path changes never leak between suites. Only modules
+whose name is unique in the tree are pre-imported, so a suite can't get
+another package's same-named module. A suite that fails in a warm child is
+re-run in a fresh subprocess before it is reported as failed
+(retry_cold=True), so warm-mode quirks can't produce false failures.
+
+Collection: collect() imports each test module in a child and counts test
+cases without running any.
+
+Platforms without os.fork fall back to parallel_test_runner's
+subprocess-per-suite pool.
+
+Usage:
+    from warm_test_pool import WarmTestPool
+
+    pool = WarmTestPool(workers=4)
+    results = pool.run(test_files)          # list[SuiteResult], input order
+    counts = pool.collect(test_files)       # {path: n_tests}
+
+CLI:
+    python3 warm_test_pool.py run tests/test_a.py tests/test_b.py
+    python3 warm_test_pool.py collect       # Count tests in every suite
+    python3 warm_test_pool.py warm-list     # Show modules pre-imported
+
+Stdlib only. No external dependencies.
+"""
+import ast
+import importlib
+import importlib.util
+import json
+import os
+import selectors
+import signal
+import sys
+import tempfile
+import time
+import traceback
+import unittest
+from collections import Counter, defaultdict
+from typing import Optional
+
+from parallel_test_runner import SuiteResult, discover_test_files, run_single_suite
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SUITE_TIMEOUT_S = 120
+OUTPUT_TAIL_CHARS = 500
+
+# Stdlib modules most suites import; cheap to share, expensive to re-import
+WARM_STDLIB = (
+    "argparse", "collections", "concurrent.futures", "csv", "dataclasses",
+    "datetime", "decimal", "hashlib", "json", "math", "pathlib", "random",
+    "re", "shutil", "sqlite3", "statistics", "subprocess", "tempfile",
+    "textwrap", "typing", "unittest", "unittest.mock", "urllib.parse",
+    "urllib.request",
+)
+
+# Project modules imported by the most test files (unique names only)
+WARM_PROJECT_TOP_N = 40
+
+_SKIP_DIRS = ("__pycache__", ".git", "node_modules", ".planning", ".venv", "venv", "reference_repos")
+
+
+# ── Warm module selection ────────────────────────────────────────────────
+
+
+def _imported_names(path: str) -> set:
+    """Top-level module names a file imports (AST only, nothing executed)."""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(a.name.split(".")[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def _project_modules(root: str) -> dict:
+    """Module name -> list of directories defining it (.py files, not tests)."""
+    found = defaultdict(list)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")]
+        for f in filenames:
+            if f.endswith(".py") and not f.startswith("test_"):
+                found[f[:-3]].append(dirpath)
+    return found
+
+
+def project_warm_modules(root: str = SCRIPT_DIR, test_files: Optional[list] = None,
+                         top_n: int = WARM_PROJECT_TOP_N) -> list:
+    """(name, directory) of the project modules most imported by tests.
+
+    Names defined in more than one directory, and names shadowing the
+    stdlib, are excluded: pre-importing one would hand the wrong module
+    to suites from the other package.
+    """
+    modules = _project_modules(root)
+    stdlib = getattr(sys, "stdlib_module_names", frozenset())
+    counts = Counter()
+    for path in test_files if test_files is not None else discover_test_files(root):
+        for name in _imported_names(path):
+            dirs = modules.get(name)
+            if dirs and len(dirs) == 1 and name not in stdlib:
+                counts[name] += 1
+    return [(name, modules[name][0]) for name, _ in counts.most_common(top_n)]
+
+
+# ── In-child execution ───────────────────────────────────────────────────
+
+
+class _RecordingResult(unittest.TestResult):
+    """TestResult that keeps per-test outcome, duration and failure text."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self._started = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started[test.id()] = time.perf_counter()
+
+    def _record(self, test, outcome, detail=""):
+        started = self._started.pop(test.id(), None)
+        duration = time.perf_counter() - started if started is not None else 0.0
+        self.records.append({
+            "name": test.id(),
+            "outcome": outcome,
+            "duration_s": round(duration, 4),
+            "detail": detail,
+        })
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "pass")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "fail", self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        # Class/module fixture errors arrive with a placeholder "test"
+        self._record(test, "error", self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skip", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "xfail")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "xpass")
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            outcome = "fail" if issubclass(err[0], test.failureException) else "error"
+            self.records.append({
+                "name": subtest.id(),
+                "outcome": outcome,
+                "duration_s": 0.0,
+                "detail": self._exc_info_to_string(err, test),
+            })
+
+
+def _load_suite(path: str):
+    """Import a test file the way `python3 path` would, minus __main__."""
+    suite_dir = os.path.dirname(path)
+    os.chdir(suite_dir or ".")
+    sys.argv = [path]
+    sys.path.insert(0, suite_dir)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return unittest.defaultTestLoader.loadTestsFromModule(module)
+
+
+def _child_main(path: str, mode: str) -> dict:
+    """Body of a forked child. Returns the payload sent to the parent."""
+    try:
+        suite = _load_suite(path)
+    except BaseException:
+        return {"status": "import_error", "detail": traceback.format_exc()}
+
+    count = suite.countTestCases()
+    if mode == "collect":
+        return {"status": "ok", "count": count}
+    if count == 0:
+        # Script-style suite (asserts under __main__): needs a real run
+        return {"status": "no_unittest"}
+
+    result = _RecordingResult()
+    t0 = time.perf_counter()
+    try:
+        suite.run(result)
+    except BaseException:
+        return {"status": "import_error", "detail": traceback.format_exc()}
+    return {
+        "status": "ok",
+        "tests_run": result.testsRun,
+        "passed": result.wasSuccessful(),
+        "duration_s": round(time.perf_counter() - t0, 4),
+        "failures": len(result.failures),
+        "errors": len(result.errors),
+        "skipped": len(result.skipped),
+        "tests": result.records,
+    }
+
+
+def _fork_child(path: str, mode: str) -> tuple:
+    """Fork a child running one suite. Returns (pid, read_fd, output_file)."""
+    read_fd, write_fd = os.pipe()
+    out = tempfile.TemporaryFile()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:  # child
+        code = 0
+        try:
+            os.close(read_fd)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            # Capture everything, including output of subprocesses the suite starts
+            os.dup2(out.fileno(), 1)
+            os.dup2(out.fileno(), 2)
+            payload = _child_main(path, mode)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            data = json.dumps(payload).encode()
+            with os.fdopen(write_fd, "wb") as w:
+                w.write(data)
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+    os.close(write_fd)
+    return pid, read_fd, out
+
+
+# ── Pool ─────────────────────────────────────────────────────────────────
+
+
+class WarmTestPool:
+    """Runs suites in forked children of a warm parent interpreter."""
+
+    def __init__(self, workers: int = 4, root: str = SCRIPT_DIR,
+                 warm_project: bool = True, retry_cold: bool = True,
+                 timeout_s: float = SUITE_TIMEOUT_S):
+        self.workers = max(1, workers)
+        self.root = root
+        self.warm_project = warm_project
+        self.retry_cold = retry_cold
+        self.timeout_s = timeout_s
+        self.warmed: list = []
+        self._is_warm = False
+
+    @staticmethod
+    def supported() -> bool:
+        return hasattr(os, "fork")
+
+    def warm(self, test_files: Optional[list] = None) -> list:
+        """Import shared modules once. Returns the names imported."""
+        if self._is_warm:
+            return self.warmed
+        for name in WARM_STDLIB:
+            try:
+                importlib.import_module(name)
+                self.warmed.append(name)
+            except ImportError:
+                continue
+        if self.warm_project:
+            saved_path, saved_cwd = list(sys.path), os.getcwd()
+            before = set(sys.modules)
+            for name, directory in project_warm_modules(self.root, test_files):
+                sys.path.insert(0, directory)
+                try:
+                    importlib.import_module(name)
+                    self.warmed.append(name)
+                except BaseException:
+                    sys.modules.pop(name, None)
+                finally:
+                    sys.path[:] = saved_path
+                    os.chdir(saved_cwd)
+            # Drop transitively imported project modules with ambiguous names
+            ambiguous = {n for n, dirs in _project_modules(self.root).items() if len(dirs) > 1}
+            for name in set(sys.modules) - before:
+                if name.split(".")[0] in ambiguous:
+                    del sys.modules[name]
+        self._is_warm = True
+        return self.warmed
+
+    def _map(self, paths: list, mode: str) -> list:
+        """Run mode ("run" | "collect") for each path; payloads in input order."""
+        payloads: list = [None] * len(paths)
+        queue = list(enumerate(paths))
+        queue.reverse()
+        active: dict = {}  # read_fd -> [index, pid, chunks, started, out]
+        sel = selectors.DefaultSelector()
+        try:
+            while queue or active:
+                while queue and len(active) < self.workers:
+                    i, path = queue.pop()
+                    pid, fd, out = _fork_child(path, mode)
+                    active[fd] = [i, pid, [], time.monotonic(), out]
+                    sel.register(fd, selectors.EVENT_READ)
+                for key, _ in sel.select(timeout=0.25):
+                    fd = key.fd
+                    chunk = os.read(fd, 1 << 16)
+                    if chunk:
+                        active[fd][2].append(chunk)
+                        continue
+                    i, pid, chunks, started, out = active.pop(fd)
+                    sel.unregister(fd)
+                    os.close(fd)
+                    os.waitpid(pid, 0)
+                    payloads[i] = self._finish(chunks, started, out)
+                now = time.monotonic()
+                for fd, (i, pid, _chunks, started, out) in list(active.items()):
+                    if now - started > self.timeout_s:
+                        os.kill(pid, signal.SIGKILL)
+                        os.waitpid(pid, 0)
+                        sel.unregister(fd)
+                        os.close(fd)
+                        out.close()
+                        del active[fd]
+                        payloads[i] = {"status": "timeout", "wall_s": round(now - started, 3)}
+        finally:
+            for fd, (_i, pid, _c, _s, out) in active.items():
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                except OSError:
+                    pass
+                out.close()
+            sel.close()
+        return payloads
+
+    @staticmethod
+    def _finish(chunks: list, started: float, out) -> dict:
+        try:
+            payload = json.loads(b"".join(chunks) or b"{}")
+        except json.JSONDecodeError:
+            payload = {}
+        if "status" not in payload:
+            payload = {"status": "crashed"}
+        out.seek(0)
+        payload["output"] = out.read().decode("utf-8", errors="replace")[-OUTPUT_TAIL_CHARS:]
+        out.close()
+        payload["wall_s"] = round(time.monotonic() - started, 3)
+        return payload
+
+    # ── Public API ──────────────────────────────────────────────────────
+
+    def run(self, paths: list) -> list:
+        """Run suites; returns SuiteResult per path, in input order."""
+        if not paths:
+            return []
+        if not self.supported():
+            from parallel_test_runner import run_all_parallel
+            return run_all_parallel(paths, workers=self.workers)
+        self.warm(paths)
+        results = [self._to_result(p, payload) for p, payload in zip(paths, self._map(paths, "run"))]
+        if self.retry_cold:
+            for i, r in enumerate(results):
+                if not r.passed and r.error != "timeout":
+                    results[i] = run_single_suite(paths[i])
+        return results
+
+    def collect(self, paths: list) -> dict:
+        """Count test cases per suite without running them."""
+        if not paths:
+            return {}
+        if not self.supported():
+            return {p: _count_test_methods(p) for p in paths}
+        self.warm(paths)
+        counts = {}
+        for path, payload in zip(paths, self._map(paths, "collect")):
+            counts[path] = payload.get("count", 0) if payload.get("status") == "ok" else 0
+        return counts
+
+    def _to_result(self, path: str, payload: dict) -> SuiteResult:
+        status = payload.get("status")
+        output = payload.get("output", "")
+        if status == "no_unittest":
+            return run_single_suite(path)
+        if status == "timeout":
+            return SuiteResult(path=path, passed=False, tests_run=0,
+                               duration_s=payload.get("wall_s", self.timeout_s),
+                               output=f"TIMEOUT after {self.timeout_s:.0f}s", error="timeout")
+        if status != "ok":
+            detail = payload.get("detail", "").strip().splitlines()
+            return SuiteResult(path=path, passed=False, tests_run=0,
+                               duration_s=payload.get("wall_s", 0.0),
+                               output=(payload.get("detail", "") + output)[-OUTPUT_TAIL_CHARS:],
+                               error=detail[-1] if detail else status or "crashed")
+        tests = payload.get("tests", [])
+        bad = [t for t in tests if t["outcome"] in ("fail", "error")]
+        error = None
+        if not payload["passed"]:
+            parts = []
+            for t in bad[:3]:
+                last = t["detail"].strip().splitlines()[-1:] or [""]
+                parts.append(f"{t['outcome'].upper()}: {t['name']}: {last[0]}")
+            error = "; ".join(parts) or "unsuccessful"
+        summary = f"Ran {payload['tests_run']} tests in {payload['duration_s']:.3f}s\n\n"
+        if payload["passed"]:
+            summary += "OK"
+        else:
+            summary += f"FAILED (failures={payload['failures']}, errors={payload['errors']})"
+        return SuiteResult(
+            path=path, passed=payload["passed"], tests_run=payload["tests_run"],
+            duration_s=payload.get("wall_s", payload["duration_s"]),
+            output=(output + summary)[-OUTPUT_TAIL_CHARS:], error=error, tests=tests,
+        )
+
+
+def _count_test_methods(path: str) -> int:
+    """AST fallback for collect(): test_* methods on classes in the file."""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return 0
+    return sum(
+        1
+        for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+        for item in node.body
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test")
+    )
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Warm fork-per-suite test pool")
+    sub = parser.add_subparsers(dest="cmd")
+    p_run = sub.add_parser("run", help="Run suites (default: all)")
+    p_run.add_argument("paths", nargs="*")
+    p_run.add_argument("--workers", type=int, default=4)
+    p_run.add_argument("--json", action="store_true")
+    p_collect = sub.add_parser("collect", help="Count tests without running them")
+    p_collect.add_argument("paths", nargs="*")
+    sub.add_parser("warm-list", help="Show modules pre-imported by the pool")
+    args = parser.parse_args()
+
+    if args.cmd == "warm-list":
+        for name, directory in project_warm_modules():
+            print(f"  {name:<32} {os.path.relpath(directory, SCRIPT_DIR)}")
+        return
+
+    if args.cmd not in ("run", "collect"):
+        parser.print_help()
+        sys.exit(1)
+
+    paths = [os.path.abspath(p) for p in args.paths] or discover_test_files(SCRIPT_DIR)
+    if args.cmd == "collect":
+        counts = WarmTestPool().collect(paths)
+        print(f"{sum(counts.values())} tests in {len(counts)} suites")
+        return
+
+    from parallel_test_runner import format_results
+    start = time.monotonic()
+    results = WarmTestPool(workers=args.workers).run(paths)
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        print(format_results(results))
+        print(f"\nWall time: {time.monotonic() - start:.1f}s")
+    sys.exit(0 if all(r.passed for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()